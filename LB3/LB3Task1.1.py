@@ -1,8 +1,10 @@
 import os
-import csv
 import glob
 from operator import itemgetter
 
+from external_sort import atomic_write, external_sorted
+from group_format import TAB_DIALECT, iter_file_rows, write_rows, write_file_rows, append_file_rows, file_dialect
+
 # Каталог для файлів груп
 КАТАЛОГ_ДАНИХ = "групи_студентів"
 os.makedirs(КАТАЛОГ_ДАНИХ, exist_ok=True)
@@ -10,11 +12,7 @@ os.makedirs(КАТАЛОГ_ДАНИХ, exist_ok=True)
 def створити_файл_групи(назва_групи, студенти):
     """Створює файл для групи зі списком студентів та їхніми балами."""
     ім_я_файлу = os.path.join(КАТАЛОГ_ДАНИХ, f"{назва_групи}.txt")
-    with open(ім_я_файлу, 'w', encoding='utf-8') as файл:
-        записувач = csv.writer(файл, delimiter='\t', lineterminator='\n')
-        записувач.writerow(['Ім_я', 'Середній_бал'])
-        for ім_я, бал in студенти:
-            записувач.writerow([ім_я, f"{бал:.1f}"])
+    write_file_rows(ім_я_файлу, студенти, TAB_DIALECT)
     print(f"Створено файл для групи {назва_групи}")
 
 def прочитати_файл_групи(назва_групи):
@@ -25,20 +23,16 @@ def прочитати_файл_групи(назва_групи):
         return []
     
     студенти = []
-    with open(ім_я_файлу, 'r', encoding='utf-8') as файл:
-        читач = csv.reader(файл, delimiter='\t')
-        next(читач)  # Пропустити заголовок
-        for рядок in читач:
-            студенти.append((рядок[0], float(рядок[1])))
-            print(f"Студент: {рядок[0]}, Бал: {рядок[1]}")
+    # Заголовок і діалект файлу визначаються автоматично
+    for ім_я, бал in iter_file_rows(ім_я_файлу):
+        студенти.append((ім_я, бал))
+        print(f"Студент: {ім_я}, Бал: {бал}")
     return студенти
 
 def додати_до_групи(назва_групи, ім_я_студента, бал):
     """Додає нового студента до файлу групи."""
     ім_я_файлу = os.path.join(КАТАЛОГ_ДАНИХ, f"{назва_групи}.txt")
-    with open(ім_я_файлу, 'a', encoding='utf-8') as файл:
-        записувач = csv.writer(файл, delimiter='\t', lineterminator='\n')
-        записувач.writerow([ім_я_студента, f"{бал:.1f}"])
+    append_file_rows(ім_я_файлу, [(ім_я_студента, бал)], TAB_DIALECT)
     print(f"Додано {ім_я_студента} до групи {назва_групи}")
 
 def перелічити_файли_груп():
@@ -58,42 +52,47 @@ def знайти_студента(назва_групи, ім_я_студент
         return []
     
     знайдені_студенти = []
-    with open(ім_я_файлу, 'r', encoding='utf-8') as файл:
-        читач = csv.reader(файл, delimiter='\t')
-        next(читач)  # Пропустити заголовок
-        for рядок in читач:
-            if рядок[0].lower() == ім_я_студента.lower():
-                print(f"Знайдено: {рядок[0]}, Бал: {рядок[1]}")
-                знайдені_студенти.append((рядок[0], float(рядок[1])))
+    for ім_я, бал in iter_file_rows(ім_я_файлу):
+        if ім_я.lower() == ім_я_студента.lower():
+            print(f"Знайдено: {ім_я}, Бал: {бал}")
+            знайдені_студенти.append((ім_я, бал))
     
     if not знайдені_студенти:
         print(f"Студента {ім_я_студента} не знайдено в групі {назва_групи}")
         return []
     return знайдені_студенти
 
-def сортувати_групу_за_балом(назва_групи):
-    """Сортує студентів у файлі групи за середнім балом."""
+def сортувати_групу_за_балом(назва_групи, бюджет_пам_яті=None):
+    """Сортує студентів у файлі групи за середнім балом.
+
+    Якщо задано бюджет_пам_яті (у байтах), файл сортується потоково порціями
+    з тимчасовими файлами, тож він може бути більшим за доступну пам'ять.
+    Результат записується атомарно через тимчасовий файл.
+    """
     ім_я_файлу = os.path.join(КАТАЛОГ_ДАНИХ, f"{назва_групи}.txt")
     if not os.path.exists(ім_я_файлу):
         print(f"Файл для групи {назва_групи} не знайдено")
         return
     
-    # Читання всіх студентів
-    студенти = []
-    with open(ім_я_файлу, 'r', encoding='utf-8') as файл:
-        читач = csv.reader(файл, delimiter='\t')
-        next(читач)  # Пропустити заголовок
-        студенти = [(рядок[0], float(рядок[1])) for рядок in читач]
-    
-    # Сортування за балом (спадання)
-    студенти.sort(key=itemgetter(1), reverse=True)
-    
-    # Перезапис файлу з відсортованими даними
-    with open(ім_я_файлу, 'w', encoding='utf-8') as файл:
-        записувач = csv.writer(файл, delimiter='\t', lineterminator='\n')
-        записувач.writerow(['Ім_я', 'Середній_бал'])
-        for ім_я, бал in студенти:
-            записувач.writerow([ім_я, f"{бал:.1f}"])
+    # Файл перезаписується у своєму ж діалекті
+    діалект = file_dialect(ім_я_файлу, TAB_DIALECT)
+    
+    def записати_відсортовані(вихідний_файл):
+        студенти = iter_file_rows(ім_я_файлу, діалект)
+        try:
+            if бюджет_пам_яті is None:
+                # Сортування за балом (спадання) у пам'яті
+                write_rows(вихідний_файл, sorted(студенти, key=itemgetter(1), reverse=True), діалект)
+                return
+            
+            # Зовнішнє сортування порціями з подальшим злиттям
+            with external_sorted(студенти, reverse=True, memory_budget=бюджет_пам_яті) as відсортовані:
+                write_rows(вихідний_файл, відсортовані, діалект)
+        finally:
+            студенти.close()
+    
+    # Перезапис файлу з відсортованими даними (атомарно)
+    atomic_write(ім_я_файлу, записати_відсортовані)
     print(f"Відсортовано групу {назва_групи} за балами")
 
 # Приклад використання для двох груп
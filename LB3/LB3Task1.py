@@ -9,7 +9,38 @@
 import os
 import re
 import csv
-from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import List, Dict, Tuple, Optional, Iterator
+
+from group_cache import GroupCache, stat_signature
+from name_index import NameIndex, PATH_SCAN
+from external_sort import atomic_write, external_sorted, DEFAULT_MEMORY_BUDGET
+from group_columns import GroupColumns, grade_statistics
+from binary_groups import BinaryGroupFile, write_binary_group, BINARY_EXTENSION
+from group_wal import GroupLog, OP_ADD, OP_UPDATE, OP_DELETE, OP_REPLACE
+from group_format import (Dialect, COLON_DIALECT, iter_file_rows, read_file_rows, write_rows,
+                          write_file_rows, append_file_rows, normalize_rows, file_dialect)
+
+
+def _load_group_file(file_path: str) -> Tuple[Optional[Tuple[int, int]], List[Tuple[str, float]], List[str]]:
+    """
+    Читає один файл групи для паралельного завантаження (функція рівня модуля,
+    щоб її можна було передати у пул процесів).
+    
+    Args:
+        file_path: Шлях до файлу групи
+        
+    Returns:
+        Кортеж (підпис файлу до читання, рядки, повідомлення про помилки)
+    """
+    errors = []
+    signature = stat_signature(file_path)
+    try:
+        rows = read_file_rows(file_path, errors=errors)
+    except (OSError, UnicodeDecodeError, ValueError, csv.Error) as e:
+        errors.append(f"Помилка при читанні файлу: {e}")
+        rows = []
+    return signature, rows, errors
 
 
 class StudentManager:
@@ -18,18 +49,82 @@ class StudentManager:
     Кожен файл представляє окрему групу студентів.
     """
     
-    def __init__(self, directory_path: str):
+    def __init__(self, directory_path: str, cache: Optional[GroupCache] = None,
+                 dialect: Dialect = COLON_DIALECT):
         """
         Ініціалізація менеджера студентів.
         
         Args:
             directory_path: Шлях до директорії з файлами груп
+            cache: Необов'язковий кеш розібраних груп (GroupCache)
+            dialect: Формат нових файлів груп (читаються файли будь-якого діалекту)
         """
         self.directory_path = directory_path
+        self.cache = cache
+        self.dialect = dialect
+        self.name_index = None
+        self.wal = None
+    
+    def enable_name_index(self, index_path: Optional[str] = None, max_age: float = 0.0) -> NameIndex:
+        """
+        Вмикає триграмний індекс імен по всьому каталогу груп.
+        Індекс завантажується з диску (або будується), а далі оновлюється при записі та дозаписі.
+        
+        Args:
+            index_path: Шлях до файлу індексу (за замовчуванням - у каталозі груп)
+            max_age: Скільки секунд пошук довіряє індексу без звірки з каталогом
+            (0 - звіряти перед кожним пошуком)
+            
+        Returns:
+            Об'єкт індексу
+        """
+        self.name_index = NameIndex(self.directory_path, self.read_group_file, index_path, max_age)
+        self.name_index.build()
+        return self.name_index
+    
+    def enable_wal(self, **options) -> GroupLog:
+        """
+        Вмикає журнал змін каталогу: записи, дозаписи та зміни окремих студентів
+        дописуються у журнал, а файли груп перезаписуються фоновим ущільненням.
+        Читання після цього виконується з незмінного знімка в пам'яті без блокувань.
+        
+        Args:
+            options: Параметри GroupLog (sync_interval, compact_interval, compact_threshold, durable)
+            
+        Returns:
+            Об'єкт журналу змін
+        """
+        if self.wal is None:
+            self.wal = GroupLog(self.directory_path, self._read_group_from_disk,
+                                self._write_group_from_wal, **options)
+        return self.wal
+    
+    def disable_wal(self) -> None:
+        """
+        Переносить усі зміни з журналу у файли груп і вимикає журнал.
+        """
+        if self.wal is not None:
+            self.wal.close()
+            self.wal = None
+    
+    def _read_group_from_disk(self, group_name: str) -> List[Tuple[str, float]]:
+        """Читає групу з файлу для журналу змін (в обхід знімка)."""
+        return self._parse_group_file(os.path.join(self.directory_path, f"{group_name}.txt"), group_name)
+    
+    def _write_group_from_wal(self, group_name: str, rows) -> None:
+        """Атомарно перезаписує файл групи під час ущільнення журналу (у діалекті файлу)."""
+        file_path = os.path.join(self.directory_path, f"{group_name}.txt")
+        write_file_rows(file_path, rows, file_dialect(file_path, self.dialect), atomic=True)
+    
+    def _log_rows(self, group_name: str, op: str, students_data: List[Tuple[str, float]]) -> None:
+        """Дописує у журнал додавання чи заміну рядків у вигляді, в якому їх збереже файл групи."""
+        file_path = os.path.join(self.directory_path, f"{group_name}.txt")
+        self.wal.log(group_name, op, rows=normalize_rows(students_data, file_dialect(file_path, self.dialect)))
     
     def read_group_file(self, group_name: str) -> List[Tuple[str, float]]:
         """
-        Читає дані з файлу групи використовуючи модуль csv.
+        Читає дані з файлу групи (діалект файлу визначається автоматично).
+        Якщо журнал змін увімкнено, дані беруться зі знімка.
         
         Args:
             group_name: Назва групи
@@ -38,35 +133,82 @@ class StudentManager:
             Список кортежів (ім'я студента, середній бал)
         """
         file_path = os.path.join(self.directory_path, f"{group_name}.txt")
-        students = []
         
-        try:
-            # Відкриття файлу
-            fd = open(file_path, 'r', encoding='utf-8')
-            
-            # Використання csv.reader з розділювачем ':'
-            reader = csv.reader(fd, delimiter=":")
+        if self.wal is not None:
+            if not self.wal.has_group(group_name):
+                print(f"Файл для групи {group_name} не знайдено.")
+                return []
+            return list(self.wal.rows(group_name))
+        
+        if self.cache is None:
+            return self._parse_group_file(file_path, group_name)
+        
+        cached = self.cache.get(file_path)
+        if cached is not None:
+            return cached
+        
+        # Підпис беремо до читання: якщо файл зміниться під час розбору,
+        # наступна перевірка кешу це помітить
+        signature = stat_signature(file_path)
+        students = self._parse_group_file(file_path, group_name)
+        if signature is not None:
+            self.cache.put(file_path, students, signature)
+        return students
+    
+    def _parse_group_file(self, file_path: str, group_name: str) -> List[Tuple[str, float]]:
+        """
+        Розбирає файл групи з диску без участі кешу.
+        
+        Args:
+            file_path: Шлях до файлу групи
+            group_name: Назва групи (для повідомлень)
             
-            # Читання даних з файлу
-            for row in reader:
-                if len(row) == 2:  # Перевірка, що рядок має два елементи
-                    name = row[0]
-                    try:
-                        avg_grade = float(row[1])
-                        students.append((name, avg_grade))
-                    except ValueError:
-                        print(f"Помилка при конвертації оцінки для студента {name}. Пропускаємо запис.")
+        Returns:
+            Список кортежів (ім'я студента, середній бал)
+        """
+        return list(self._iter_group_file(file_path, group_name))
+    
+    def _iter_group_file(self, file_path: str, group_name: str) -> Iterator[Tuple[str, float]]:
+        """
+        Потоково читає рядки файлу групи, не завантажуючи файл у пам'ять цілком.
+        
+        Args:
+            file_path: Шлях до файлу групи
+            group_name: Назва групи (для повідомлень)
             
-            # Закриття файлу
-            fd.close()
+        Returns:
+            Ітератор кортежів (ім'я студента, середній бал)
+        """
+        rows = iter_file_rows(file_path)
+        try:
+            # Формат файлу визначається при першому зверненні
+            first = next(rows, None)
         except FileNotFoundError:
             print(f"Файл для групи {group_name} не знайдено.")
+            return
         
-        return students
+        if first is not None:
+            yield first
+            yield from rows
+    
+    def _remember_group(self, group_name: str, file_path: str, rows: List[Tuple[str, float]]) -> None:
+        """
+        Передає щойно записаний вміст групи у кеш та індекс імен.
+        
+        Args:
+            group_name: Назва групи
+            file_path: Шлях до файлу групи
+            rows: Рядки, записані у файл
+        """
+        signature = stat_signature(file_path)
+        if self.cache is not None and signature is not None:
+            self.cache.put(file_path, rows, signature)
+        if self.name_index is not None:
+            self.name_index.update_group(group_name, rows, signature)
     
     def write_to_group_file(self, group_name: str, students_data: List[Tuple[str, float]]) -> bool:
         """
-        Записує дані студентів у файл групи (перезаписуючи існуючий файл) використовуючи модуль csv.
+        Записує дані студентів у файл групи (перезаписуючи існуючий файл) у діалекті менеджера.
         
         Args:
             group_name: Назва групи
@@ -78,18 +220,15 @@ class StudentManager:
         file_path = os.path.join(self.directory_path, f"{group_name}.txt")
         
         try:
-            # Відкриття файлу для запису
-            fd = open(file_path, 'w', encoding='utf-8', newline='')
+            if self.wal is not None:
+                self._log_rows(group_name, OP_REPLACE, students_data)
+                return True
             
-            # Використання csv.writer з розділювачем ':'
-            writer = csv.writer(fd, delimiter=":")
+            # Запис даних у файл у форматі менеджера
+            write_file_rows(file_path, students_data, self.dialect)
             
-            # Запис даних у файл
-            for name, avg_grade in students_data:
-                writer.writerow([name, avg_grade])
-                
-            # Закриття файлу
-            fd.close()
+            # Оновлюємо кеш та індекс новими даними замість повторного читання файлу
+            self._remember_group(group_name, file_path, normalize_rows(students_data, self.dialect))
             return True
         except Exception as e:
             print(f"Помилка при записі у файл групи {group_name}: {e}")
@@ -97,7 +236,7 @@ class StudentManager:
             
     def append_to_group_file(self, group_name: str, students_data: List[Tuple[str, float]]) -> bool:
         """
-        Дозаписує дані студентів у файл групи використовуючи модуль csv.
+        Дозаписує дані студентів у файл групи у діалекті цього файлу.
         
         Args:
             group_name: Назва групи
@@ -108,24 +247,100 @@ class StudentManager:
         """
         file_path = os.path.join(self.directory_path, f"{group_name}.txt")
         
+        if self.wal is not None:
+            try:
+                self._log_rows(group_name, OP_ADD, students_data)
+                return True
+            except Exception as e:
+                print(f"Помилка при дозаписі у файл групи {group_name}: {e}")
+                return False
+        
+        old_signature = None
+        if self.cache is not None or self.name_index is not None:
+            old_signature = stat_signature(file_path)
+        
         try:
-            # Відкриття файлу для дозапису
-            fd = open(file_path, 'a', encoding='utf-8', newline='')
+            # Дозапис даних у файл у діалекті самого файлу
+            dialect = append_file_rows(file_path, students_data, self.dialect)
             
-            # Використання csv.writer з розділювачем ':'
-            writer = csv.writer(fd, delimiter=":")
-            
-            # Дозапис даних у файл
-            for name, avg_grade in students_data:
-                writer.writerow([name, avg_grade])
-                
-            # Закриття файлу
-            fd.close()
+            # Доповнюємо закешовану та проіндексовану групу на місці
+            new_rows = normalize_rows(students_data, dialect)
+            if self.cache is not None:
+                self.cache.extend(file_path, old_signature, new_rows)
+            if self.name_index is not None:
+                self.name_index.append_rows(group_name, new_rows, old_signature)
             return True
         except Exception as e:
             print(f"Помилка при дозаписі у файл групи {group_name}: {e}")
             return False
     
+    def add_student(self, group_name: str, student_name: str, avg_grade: float) -> bool:
+        """
+        Додає студента до групи.
+        
+        Args:
+            group_name: Назва групи
+            student_name: Ім'я студента
+            avg_grade: Середній бал
+            
+        Returns:
+            True, якщо студента додано, False - інакше
+        """
+        return self.append_to_group_file(group_name, [(student_name, avg_grade)])
+    
+    def update_student(self, group_name: str, student_name: str, avg_grade: float) -> bool:
+        """
+        Змінює середній бал усіх студентів групи з таким ім'ям.
+        З журналом змін зміна дописується у журнал замість перезапису файлу.
+        
+        Args:
+            group_name: Назва групи
+            student_name: Повне ім'я студента
+            avg_grade: Новий середній бал
+            
+        Returns:
+            True, якщо студента знайдено і змінено, False - інакше
+        """
+        students = self.read_group_file(group_name)
+        if not any(name == student_name for name, _ in students):
+            print(f"Студента {student_name} не знайдено в групі {group_name}.")
+            return False
+        
+        if self.wal is None:
+            return self.write_to_group_file(
+                group_name, [(name, avg_grade if name == student_name else grade) for name, grade in students])
+        
+        file_path = os.path.join(self.directory_path, f"{group_name}.txt")
+        normalized = normalize_rows([(student_name, avg_grade)], file_dialect(file_path, self.dialect))
+        if not normalized:
+            print(f"Помилка при конвертації оцінки для студента {student_name}.")
+            return False
+        self.wal.log(group_name, OP_UPDATE, name=student_name, grade=normalized[0][1])
+        return True
+    
+    def delete_student(self, group_name: str, student_name: str) -> bool:
+        """
+        Видаляє з групи всіх студентів з таким ім'ям.
+        З журналом змін видалення дописується у журнал замість перезапису файлу.
+        
+        Args:
+            group_name: Назва групи
+            student_name: Повне ім'я студента
+            
+        Returns:
+            True, якщо студента знайдено і видалено, False - інакше
+        """
+        students = self.read_group_file(group_name)
+        if not any(name == student_name for name, _ in students):
+            print(f"Студента {student_name} не знайдено в групі {group_name}.")
+            return False
+        
+        if self.wal is None:
+            return self.write_to_group_file(group_name, [row for row in students if row[0] != student_name])
+        
+        self.wal.log(group_name, OP_DELETE, name=student_name)
+        return True
+    
     def find_group_files(self) -> List[str]:
         """
         Знаходить всі файли груп у каталозі.
@@ -142,8 +357,137 @@ class StudentManager:
         except Exception as e:
             print(f"Помилка при пошуку файлів груп: {e}")
         
+        if self.wal is not None:
+            # Групи, створені через журнал і ще не записані на диск
+            known = set(group_files)
+            group_files.extend(name for name in self.wal.group_names() if name not in known)
+        
         return group_files
     
+    def load_all(self, workers: Optional[int] = None,
+                 mode: str = "thread") -> Tuple[Dict[str, List[Tuple[str, float]]], Dict[str, List[str]]]:
+        """
+        Читає та розбирає всі файли груп каталогу паралельно.
+        Помилки розбору не виводяться, а повертаються окремо для кожного файлу.
+        
+        Args:
+            workers: Кількість потоків чи процесів (None - значення пулу за замовчуванням)
+            mode: "thread" - пул потоків, "process" - пул процесів, "serial" - послідовно
+            
+        Returns:
+            Кортеж (словник {назва_групи: [(ім'я_студента, середній_бал), ...]},
+                    словник {назва_групи: [повідомлення про помилки, ...]})
+        """
+        if mode not in ("thread", "process", "serial"):
+            raise ValueError(f"Невідомий режим завантаження: {mode}")
+        
+        if self.wal is not None:
+            # Усі групи з одного знімка, тобто в узгодженому стані
+            group_names = self.find_group_files()
+            for group_name in group_names:
+                self.wal.rows(group_name)
+            snapshot = self.wal.snapshot()
+            return {group_name: list(snapshot.get(group_name, ())) for group_name in group_names}, {}
+        
+        group_names = self.find_group_files()
+        groups = {}
+        errors = {}
+        pending = []
+        for group_name in group_names:
+            file_path = os.path.join(self.directory_path, f"{group_name}.txt")
+            cached = self.cache.get(file_path) if self.cache is not None else None
+            if cached is not None:
+                groups[group_name] = cached
+            else:
+                pending.append((group_name, file_path))
+        
+        paths = [file_path for _, file_path in pending]
+        if mode == "serial" or len(paths) <= 1:
+            results = map(_load_group_file, paths)
+        elif mode == "thread":
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_load_group_file, paths))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # Великі порції зменшують витрати на передачу задач між процесами
+                chunksize = max(1, len(paths) // ((workers or os.cpu_count() or 1) * 4))
+                results = list(executor.map(_load_group_file, paths, chunksize=chunksize))
+        
+        for (group_name, file_path), (signature, rows, file_errors) in zip(pending, results):
+            groups[group_name] = rows
+            if file_errors:
+                errors[group_name] = file_errors
+            if self.cache is not None and signature is not None and not file_errors:
+                self.cache.put(file_path, rows, signature)
+        
+        # Повертаємо групи у порядку find_group_files
+        return {group_name: groups[group_name] for group_name in group_names}, errors
+    
+    def read_group_columns(self, group_name: str) -> GroupColumns:
+        """
+        Читає групу у стовпцевому представленні (імена окремо, бали в array('d')).
+        
+        Args:
+            group_name: Назва групи
+            
+        Returns:
+            Об'єкт GroupColumns
+        """
+        return GroupColumns.from_rows(self.read_group_file(group_name))
+    
+    def group_statistics(self, group_name: Optional[str] = None, percentiles: Tuple[float, ...] = (25, 50, 75),
+                         top_n: int = 5, bins: int = 10, workers: Optional[int] = None) -> Dict:
+        """
+        Рахує статистику середніх балів однієї групи або всіх груп разом:
+        кількість, середнє, мінімум, максимум, медіану, перцентилі, top-N та гістограму.
+        
+        Args:
+            group_name: Назва групи; None - усі групи каталогу
+            percentiles: Перцентилі для обчислення (0..100)
+            top_n: Скільки найкращих студентів повернути
+            bins: Кількість інтервалів гістограми
+            workers: Кількість потоків для читання всіх груп
+            
+        Returns:
+            Словник зі статистикою; для всіх груп top містить кортежі (група, ім'я, бал)
+        """
+        if group_name is not None:
+            columns = self.read_group_columns(group_name)
+        else:
+            groups, _ = self.load_all(workers=workers)
+            columns = GroupColumns.concat({name: GroupColumns.from_rows(rows) for name, rows in groups.items()})
+        return grade_statistics(columns, percentiles, top_n, bins)
+    
+    def export_binary(self, group_name: Optional[str] = None) -> Dict[str, int]:
+        """
+        Зберігає групу (або всі групи) у двійковому форматі .sgb поруч з текстовими файлами.
+        
+        Args:
+            group_name: Назва групи; None - усі групи каталогу
+            
+        Returns:
+            Словник {назва_групи: кількість записаних студентів}
+        """
+        group_names = [group_name] if group_name is not None else self.find_group_files()
+        exported = {}
+        for name in group_names:
+            binary_path = os.path.join(self.directory_path, name + BINARY_EXTENSION)
+            exported[name] = write_binary_group(binary_path, self.read_group_file(name))
+        return exported
+    
+    def open_binary_group(self, group_name: str) -> BinaryGroupFile:
+        """
+        Відкриває двійковий файл групи через mmap (без розбору тексту).
+        Об'єкт слід закрити (close або with) після використання.
+        
+        Args:
+            group_name: Назва групи
+            
+        Returns:
+            Об'єкт BinaryGroupFile
+        """
+        return BinaryGroupFile(os.path.join(self.directory_path, group_name + BINARY_EXTENSION))
+    
     def search_student_in_group(self, group_name: str, student_name: str) -> List[Tuple[str, float]]:
         """
         Шукає студента у файлі групи.
@@ -175,6 +519,25 @@ class StudentManager:
         Returns:
             Словник {назва_групи: [(ім'я_студента, середній_бал), ...]}
         """
+        results, _ = self.search_students_indexed(student_name)
+        return results
+    
+    def search_students_indexed(self, student_name: str) -> Tuple[Dict[str, List[Tuple[str, float]]], str]:
+        """
+        Шукає студента у всіх групах і повідомляє, яким шляхом виконано запит.
+        Якщо індекс імен увімкнено, перевіряються лише рядки-кандидати з індексу,
+        а перебір виконується тільки для виразів без обов'язкового літерала.
+        
+        Args:
+            student_name: Ім'я студента для пошуку (може бути частиною імені або регулярним виразом)
+            
+        Returns:
+            Кортеж (словник {назва_групи: [(ім'я_студента, середній_бал), ...]}, шлях: 'index' або 'scan')
+        """
+        # Індекс будується за файлами, які з журналом змін відстають від знімка
+        if self.name_index is not None and self.wal is None:
+            return self.name_index.search(student_name)
+        
         results = {}
         
         for group_name in self.find_group_files():
@@ -182,11 +545,11 @@ class StudentManager:
             if found_students:
                 results[group_name] = found_students
         
-        return results
+        return results, PATH_SCAN
     
     def sort_group_by_average_grade(self, group_name: str, ascending: bool = True) -> List[Tuple[str, float]]:
         """
-        Сортує дані у файлі групи за середнім балом використовуючи модуль csv.
+        Сортує дані у файлі групи за середнім балом (діалект файлу зберігається).
         
         Args:
             group_name: Назва групи
@@ -201,23 +564,63 @@ class StudentManager:
         # Сортуємо дані за середнім балом
         sorted_students = sorted(students, key=lambda x: x[1], reverse=not ascending)
         
-        # Перезаписуємо файл з відсортованими даними використовуючи csv
+        if self.wal is not None:
+            self.wal.log(group_name, OP_REPLACE, rows=sorted_students)
+            return sorted_students
+        
+        # Перезаписуємо файл з відсортованими даними у його ж діалекті.
+        # Запис атомарний: збій посеред запису не залишить обрізаний файл групи
         file_path = os.path.join(self.directory_path, f"{group_name}.txt")
+        dialect = file_dialect(file_path, self.dialect)
+        write_file_rows(file_path, sorted_students, dialect, atomic=True)
         
-        # Відкриття файлу для запису
-        fd = open(file_path, 'w', encoding='utf-8', newline='')
+        self._remember_group(group_name, file_path, sorted_students)
         
-        # Використання csv.writer з розділювачем ':'
-        writer = csv.writer(fd, delimiter=":")
+        return sorted_students
+    
+    def sort_group_file_external(self, group_name: str, ascending: bool = True,
+                                 memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                                 tmp_dir: Optional[str] = None) -> int:
+        """
+        Сортує файл групи за середнім балом, не завантажуючи його в пам'ять цілком.
+        Файл читається потоком, порції розміром до memory_budget сортуються і скидаються
+        у тимчасові файли, а потім зливаються (heapq.merge) у новий файл, який атомарно
+        замінює старий.
         
-        # Запис відсортованих даних у файл
-        for name, avg_grade in sorted_students:
-            writer.writerow([name, avg_grade])
+        Args:
+            group_name: Назва групи
+            ascending: True для сортування за зростанням, False - за спаданням
+            memory_budget: Приблизний обсяг пам'яті на одну порцію (байти)
+            tmp_dir: Каталог для тимчасових порцій (за замовчуванням - системний)
             
-        # Закриття файлу
-        fd.close()
+        Returns:
+            Кількість записаних рядків
+        """
+        if self.wal is not None:
+            # Група з журналом змін уже повністю в пам'яті
+            return len(self.sort_group_by_average_grade(group_name, ascending))
         
-        return sorted_students
+        file_path = os.path.join(self.directory_path, f"{group_name}.txt")
+        if not os.path.exists(file_path):
+            print(f"Файл для групи {group_name} не знайдено.")
+            return 0
+        
+        dialect = file_dialect(file_path, self.dialect)
+        written = [0]
+        
+        def write_sorted(fd):
+            with external_sorted(self._iter_group_file(file_path, group_name), reverse=not ascending,
+                                 memory_budget=memory_budget, tmp_dir=tmp_dir) as sorted_rows:
+                written[0] = write_rows(fd, sorted_rows, dialect)
+        
+        atomic_write(file_path, write_sorted)
+        
+        # Великий файл не тримаємо в кеші; індекс перечитає лише цю групу
+        if self.cache is not None:
+            self.cache.invalidate(file_path)
+        if self.name_index is not None:
+            self.name_index.refresh()
+        return written[0]
         
 
 
@@ -229,14 +632,16 @@ def main():
     # Шлях до директорії з файлами груп
     directory_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'students_data')
     
-    # Створюємо екземпляр менеджера студентів
-    manager = StudentManager(directory_path)
+    # Створюємо екземпляр менеджера студентів з кешем розібраних груп
+    manager = StudentManager(directory_path, cache=GroupCache())
     
     # 1. Читання файлів
     print("\n1. Читання даних з файлів груп:")
-    for group_name in manager.find_group_files():
-        students = manager.read_group_file(group_name)
+    all_groups, load_errors = manager.load_all(workers=4, mode="thread")
+    for group_name, students in all_groups.items():
         print(f"\nГрупа {group_name}:")
+        for message in load_errors.get(group_name, []):
+            print(f"  ! {message}")
         for name, avg_grade in students:
             print(f"  {name}: {avg_grade}")
     
@@ -278,7 +683,9 @@ def main():
     
     # 5. Пошук даних у файлі
     print("\n5. Пошук студентів з іменем 'Василь':")
-    results = manager.search_student_in_all_groups('Василь')
+    manager.enable_name_index()
+    results, search_path = manager.search_students_indexed('Василь')
+    print(f"(шлях виконання запиту: {search_path})")
     if results:
         for group_name, found_students in results.items():
             print(f"Група {group_name}:")
@@ -293,6 +700,24 @@ def main():
     for name, avg_grade in sorted_students:
         print(f"  {name}: {avg_grade}")
     
+    # 7. Статистика середніх балів
+    print("\n7. Статистика середніх балів усіх груп:")
+    stats = manager.group_statistics(top_n=3, bins=5)
+    print(f"  Кількість: {stats['count']}, середнє: {stats['mean']:.2f}, медіана: {stats['median']:.2f}")
+    for group_name, name, avg_grade in stats['top']:
+        print(f"  {name} ({group_name}): {avg_grade}")
+    
+    # 8. Зміни окремих студентів через журнал змін
+    print("\n8. Зміни Групи_А через журнал змін:")
+    manager.enable_wal()
+    manager.add_student('Група_А', 'Ткаченко Ірина', 4.5)
+    manager.update_student('Група_А', 'Бондаренко Олег', 4.2)
+    manager.delete_student('Група_А', 'Ткаченко Ірина')
+    for name, avg_grade in manager.read_group_file('Група_А'):
+        print(f"  {name}: {avg_grade}")
+    # Ущільнення переносить зміни у файл групи
+    manager.disable_wal()
+    
     print("\nДемонстрація завершена.")
 
 
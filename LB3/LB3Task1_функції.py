@@ -8,15 +8,20 @@
 
 import os
 import re
-import csv
-from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import List, Dict, Tuple, Optional
+
+from group_cache import stat_signature
+from name_index import NameIndex, PATH_SCAN
+from group_format import (COLON_DIALECT, read_file_rows, write_file_rows, append_file_rows,
+                          normalize_rows, file_dialect)
 
 # Шлях до директорії з файлами груп (за замовчуванням)
 КАТАЛОГ_ДАНИХ = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'students_data')
 
 def читати_файл_групи(назва_групи: str, каталог_даних: str = КАТАЛОГ_ДАНИХ) -> List[Tuple[str, float]]:
     """
-    Читає дані з файлу групи використовуючи модуль csv.
+    Читає дані з файлу групи (діалект файлу визначається автоматично).
     
     Args:
         назва_групи: Назва групи
@@ -29,38 +34,23 @@ def читати_файл_групи(назва_групи: str, каталог_
     студенти = []
     
     try:
-        # Відкриття файлу
-        файл = open(шлях_до_файлу, 'r', encoding='utf-8')
-        
-        # Використання csv.reader з розділювачем ':'
-        читач = csv.reader(файл, delimiter=":")
-        
-        # Читання даних з файлу
-        for рядок in читач:
-            if len(рядок) == 2:  # Перевірка, що рядок має два елементи
-                ім_я = рядок[0]
-                try:
-                    середній_бал = float(рядок[1])
-                    студенти.append((ім_я, середній_бал))
-                except ValueError:
-                    print(f"Помилка при конвертації оцінки для студента {ім_я}. Пропускаємо запис.")
-        
-        # Закриття файлу
-        файл.close()
+        # Читання даних з файлу; помилки конвертації оцінок виводяться
+        студенти = read_file_rows(шлях_до_файлу)
     except FileNotFoundError:
         print(f"Файл для групи {назва_групи} не знайдено.")
     
     return студенти
 
 def записати_у_файл_групи(назва_групи: str, дані_студентів: List[Tuple[str, float]], 
-                          каталог_даних: str = КАТАЛОГ_ДАНИХ) -> bool:
+                          каталог_даних: str = КАТАЛОГ_ДАНИХ, індекс: Optional[NameIndex] = None) -> bool:
     """
-    Записує дані студентів у файл групи (перезаписуючи існуючий файл) використовуючи модуль csv.
+    Записує дані студентів у файл групи (перезаписуючи існуючий файл) з розділювачем ':'.
     
     Args:
         назва_групи: Назва групи
         дані_студентів: Список кортежів (ім'я студента, середній бал)
         каталог_даних: Шлях до каталогу з файлами груп
+        індекс: Необов'язковий індекс імен, який треба оновити після запису
         
     Returns:
         True, якщо запис успішний, False - інакше
@@ -68,32 +58,27 @@ def записати_у_файл_групи(назва_групи: str, дані
     шлях_до_файлу = os.path.join(каталог_даних, f"{назва_групи}.txt")
     
     try:
-        # Відкриття файлу для запису
-        файл = open(шлях_до_файлу, 'w', encoding='utf-8', newline='')
-        
-        # Використання csv.writer з розділювачем ':'
-        записувач = csv.writer(файл, delimiter=":")
-        
         # Запис даних у файл
-        for ім_я, середній_бал in дані_студентів:
-            записувач.writerow([ім_я, середній_бал])
-            
-        # Закриття файлу
-        файл.close()
+        write_file_rows(шлях_до_файлу, дані_студентів, COLON_DIALECT)
+        
+        # Оновлення індексу без повторного читання файлу
+        if індекс is not None:
+            індекс.update_group(назва_групи, нормалізувати_рядки(дані_студентів))
         return True
     except Exception as e:
         print(f"Помилка при записі у файл групи {назва_групи}: {e}")
         return False
 
 def дозаписати_у_файл_групи(назва_групи: str, дані_студентів: List[Tuple[str, float]], 
-                           каталог_даних: str = КАТАЛОГ_ДАНИХ) -> bool:
+                           каталог_даних: str = КАТАЛОГ_ДАНИХ, індекс: Optional[NameIndex] = None) -> bool:
     """
-    Дозаписує дані студентів у файл групи використовуючи модуль csv.
+    Дозаписує дані студентів у файл групи у діалекті цього файлу.
     
     Args:
         назва_групи: Назва групи
         дані_студентів: Список кортежів (ім'я студента, середній бал)
         каталог_даних: Шлях до каталогу з файлами груп
+        індекс: Необов'язковий індекс імен, який треба оновити після дозапису
         
     Returns:
         True, якщо дозапис успішний, False - інакше
@@ -103,26 +88,53 @@ def дозаписати_у_файл_групи(назва_групи: str, да
     # Перевірка, чи існує файл
     if not os.path.exists(шлях_до_файлу):
         print(f"Файл для групи {назва_групи} не знайдено. Створюємо новий файл.")
-        return записати_у_файл_групи(назва_групи, дані_студентів, каталог_даних)
+        return записати_у_файл_групи(назва_групи, дані_студентів, каталог_даних, індекс)
+    
+    старий_підпис = stat_signature(шлях_до_файлу) if індекс is not None else None
     
     try:
-        # Відкриття файлу для дозапису
-        файл = open(шлях_до_файлу, 'a', encoding='utf-8', newline='')
-        
-        # Використання csv.writer з розділювачем ':'
-        записувач = csv.writer(файл, delimiter=":")
-        
         # Дозапис даних у файл
-        for ім_я, середній_бал in дані_студентів:
-            записувач.writerow([ім_я, середній_бал])
-            
-        # Закриття файлу
-        файл.close()
+        діалект = append_file_rows(шлях_до_файлу, дані_студентів, COLON_DIALECT)
+        
+        # Доповнення індексу лише дописаними рядками
+        if індекс is not None:
+            індекс.append_rows(назва_групи, нормалізувати_рядки(дані_студентів, діалект), старий_підпис)
         return True
     except Exception as e:
         print(f"Помилка при дозаписі у файл групи {назва_групи}: {e}")
         return False
 
+def нормалізувати_рядки(дані_студентів: List[Tuple[str, float]],
+                        діалект=COLON_DIALECT) -> List[Tuple[str, float]]:
+    """
+    Приводить дані до вигляду, у якому їх поверне читати_файл_групи після запису.
+    
+    Args:
+        дані_студентів: Список кортежів (ім'я студента, середній бал)
+        діалект: Діалект, у якому дані записано у файл
+        
+    Returns:
+        Список кортежів (ім'я студента, середній бал) з рядковими іменами та float-балами
+    """
+    return normalize_rows(дані_студентів, діалект)
+
+def створити_індекс_імен(каталог_даних: str = КАТАЛОГ_ДАНИХ, max_age: float = 0.0) -> NameIndex:
+    """
+    Створює (або завантажує з диску) триграмний індекс імен для каталогу груп.
+    
+    Args:
+        каталог_даних: Шлях до каталогу з файлами груп
+        max_age: Скільки секунд пошук довіряє індексу без звірки з каталогом
+            (0 - звіряти перед кожним пошуком)
+        
+    Returns:
+        Об'єкт індексу, який можна передавати у функції запису та пошуку
+    """
+    індекс = NameIndex(каталог_даних, lambda назва_групи: читати_файл_групи(назва_групи, каталог_даних),
+                       max_age=max_age)
+    індекс.build()
+    return індекс
+
 def знайти_файли_груп(каталог_даних: str = КАТАЛОГ_ДАНИХ) -> List[str]:
     """
     Знаходить всі файли груп у каталозі.
@@ -146,6 +158,62 @@ def знайти_файли_груп(каталог_даних: str = КАТАЛ
     
     return групи
 
+def _завантажити_файл_групи(шлях_до_файлу: str) -> Tuple[List[Tuple[str, float]], List[str]]:
+    """
+    Читає один файл групи для паралельного завантаження, збираючи помилки замість виведення.
+    
+    Args:
+        шлях_до_файлу: Шлях до файлу групи
+        
+    Returns:
+        Кортеж (список кортежів (ім'я студента, середній бал), список повідомлень про помилки)
+    """
+    студенти = []
+    помилки = []
+    try:
+        студенти = read_file_rows(шлях_до_файлу, errors=помилки)
+    except (OSError, UnicodeDecodeError, ValueError) as e:
+        помилки.append(f"Помилка при читанні файлу: {e}")
+    return студенти, помилки
+
+def завантажити_всі_групи(каталог_даних: str = КАТАЛОГ_ДАНИХ, кількість_виконавців: Optional[int] = None,
+                          режим: str = "thread") -> Tuple[Dict[str, List[Tuple[str, float]]], Dict[str, List[str]]]:
+    """
+    Читає та розбирає всі файли груп каталогу паралельно.
+    
+    Args:
+        каталог_даних: Шлях до каталогу з файлами груп
+        кількість_виконавців: Кількість потоків чи процесів (None - значення пулу за замовчуванням)
+        режим: "thread" - пул потоків, "process" - пул процесів, "serial" - послідовно
+        
+    Returns:
+        Кортеж (словник {назва_групи: [(ім'я_студента, середній_бал), ...]},
+                словник {назва_групи: [повідомлення про помилки, ...]})
+    """
+    if режим not in ("thread", "process", "serial"):
+        raise ValueError(f"Невідомий режим завантаження: {режим}")
+    
+    групи = знайти_файли_груп(каталог_даних)
+    шляхи = [os.path.join(каталог_даних, f"{група}.txt") for група in групи]
+    
+    if режим == "serial" or len(шляхи) <= 1:
+        результати = list(map(_завантажити_файл_групи, шляхи))
+    elif режим == "thread":
+        with ThreadPoolExecutor(max_workers=кількість_виконавців) as виконавець:
+            результати = list(виконавець.map(_завантажити_файл_групи, шляхи))
+    else:
+        with ProcessPoolExecutor(max_workers=кількість_виконавців) as виконавець:
+            розмір_порції = max(1, len(шляхи) // ((кількість_виконавців or os.cpu_count() or 1) * 4))
+            результати = list(виконавець.map(_завантажити_файл_групи, шляхи, chunksize=розмір_порції))
+    
+    дані_груп = {}
+    помилки_груп = {}
+    for група, (студенти, помилки) in zip(групи, результати):
+        дані_груп[група] = студенти
+        if помилки:
+            помилки_груп[група] = помилки
+    return дані_груп, помилки_груп
+
 def шукати_студента_у_групі(назва_групи: str, ім_я_студента: str, 
                            каталог_даних: str = КАТАЛОГ_ДАНИХ) -> List[Tuple[str, float]]:
     """
@@ -173,17 +241,40 @@ def шукати_студента_у_групі(назва_групи: str, ім
     return знайдені_студенти
 
 def шукати_студента_у_всіх_групах(ім_я_студента: str, 
-                                 каталог_даних: str = КАТАЛОГ_ДАНИХ) -> Dict[str, List[Tuple[str, float]]]:
+                                 каталог_даних: str = КАТАЛОГ_ДАНИХ,
+                                 індекс: Optional[NameIndex] = None) -> Dict[str, List[Tuple[str, float]]]:
     """
     Шукає студента у всіх групах.
     
     Args:
         ім_я_студента: Ім'я студента для пошуку (може бути частиною імені)
         каталог_даних: Шлях до каталогу з файлами груп
+        індекс: Необов'язковий індекс імен; якщо заданий, файли груп не перечитуються
         
     Returns:
         Словник {назва_групи: [(ім'я_студента, середній_бал), ...]}
+        (шлях виконання запиту повідомляє шукати_студента_з_індексом)
     """
+    результати, _ = шукати_студента_з_індексом(ім_я_студента, каталог_даних, індекс)
+    return результати
+
+def шукати_студента_з_індексом(ім_я_студента: str,
+                               каталог_даних: str = КАТАЛОГ_ДАНИХ,
+                               індекс: Optional[NameIndex] = None) -> Tuple[Dict[str, List[Tuple[str, float]]], str]:
+    """
+    Шукає студента у всіх групах і повідомляє, яким шляхом виконано запит.
+    
+    Args:
+        ім_я_студента: Ім'я студента для пошуку (може бути частиною імені або регулярним виразом)
+        каталог_даних: Шлях до каталогу з файлами груп
+        індекс: Необов'язковий індекс імен; якщо заданий, файли груп не перечитуються
+        
+    Returns:
+        Кортеж (словник {назва_групи: [(ім'я_студента, середній_бал), ...]}, шлях: 'index' або 'scan')
+    """
+    if індекс is not None:
+        return індекс.search(ім_я_студента)
+    
     результати = {}
     
     # Отримання списку груп
@@ -195,17 +286,19 @@ def шукати_студента_у_всіх_групах(ім_я_студен
         if знайдені_студенти:
             результати[група] = знайдені_студенти
     
-    return результати
+    return результати, PATH_SCAN
 
 def сортувати_групу_за_середнім_балом(назва_групи: str, за_зростанням: bool = True, 
-                                     каталог_даних: str = КАТАЛОГ_ДАНИХ) -> List[Tuple[str, float]]:
+                                     каталог_даних: str = КАТАЛОГ_ДАНИХ,
+                                     індекс: Optional[NameIndex] = None) -> List[Tuple[str, float]]:
     """
-    Сортує дані у файлі групи за середнім балом використовуючи модуль csv.
+    Сортує дані у файлі групи за середнім балом (діалект файлу зберігається).
     
     Args:
         назва_групи: Назва групи
         за_зростанням: Якщо True, сортування за зростанням, інакше - за спаданням
         каталог_даних: Шлях до каталогу з файлами груп
+        індекс: Необов'язковий індекс імен, який треба оновити після перезапису
         
     Returns:
         Відсортований список кортежів (ім'я студента, середній бал)
@@ -216,21 +309,15 @@ def сортувати_групу_за_середнім_балом(назва_г
     # Сортування за середнім балом
     відсортовані_студенти = sorted(студенти, key=lambda x: x[1], reverse=not за_зростанням)
     
-    # Запис відсортованих даних у файл
+    # Запис відсортованих даних у файл; атомарний, тож збій посеред запису не залишить
+    # обрізаний файл групи
     шлях_до_файлу = os.path.join(каталог_даних, f"{назва_групи}.txt")
+    діалект = file_dialect(шлях_до_файлу, COLON_DIALECT)
+    write_file_rows(шлях_до_файлу, відсортовані_студенти, діалект, atomic=True)
     
-    # Відкриття файлу для запису
-    файл = open(шлях_до_файлу, 'w', encoding='utf-8', newline='')
-    
-    # Використання csv.writer з розділювачем ':'
-    записувач = csv.writer(файл, delimiter=":")
-    
-    # Запис відсортованих даних у файл
-    for ім_я, середній_бал in відсортовані_студенти:
-        записувач.writerow([ім_я, середній_бал])
-        
-    # Закриття файлу
-    файл.close()
+    # Позиції рядків змінилися, тож група в індексі замінюється повністю
+    if індекс is not None:
+        індекс.update_group(назва_групи, нормалізувати_рядки(відсортовані_студенти, діалект))
     
     return відсортовані_студенти
 
@@ -243,9 +330,11 @@ def головна():
     
     # 1. Читання файлів
     print("\n1. Читання даних з файлів груп:")
-    for назва_групи in знайти_файли_груп(каталог_даних):
-        студенти = читати_файл_групи(назва_групи, каталог_даних)
+    усі_групи, помилки_завантаження = завантажити_всі_групи(каталог_даних, кількість_виконавців=4)
+    for назва_групи, студенти in усі_групи.items():
         print(f"\nГрупа {назва_групи}:")
+        for повідомлення in помилки_завантаження.get(назва_групи, []):
+            print(f"  ! {повідомлення}")
         for ім_я, середній_бал in студенти:
             print(f"  {ім_я}: {середній_бал}")
     
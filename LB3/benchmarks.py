@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Бенчмарки для роботи з файлами груп студентів.
+Кожен бенчмарк створює синтетичні дані у тимчасовому каталозі та виводить таблицю результатів.
+
+Запуск:
+    python benchmarks.py load_all [--sizes 10 1000 100000] [--workers 8]
+    python benchmarks.py binary [--rows 1000000]
+"""
+
+import os
+import sys
+import time
+import random
+import json
+import math
+import argparse
+import tempfile
+import subprocess
+from typing import Iterable, Optional
+
+from LB3Task1 import StudentManager
+from binary_groups import BinaryGroupFile
+from group_format import convert_file
+
+# Імена для синтетичних груп
+ПРІЗВИЩА = ["Шевченко", "Коваленко", "Бойко", "Мельник", "Бондаренко", "Ткаченко", "Кравченко", "Олійник"]
+ІМЕНА = ["Олександр", "Наталія", "Василь", "Оксана", "Олег", "Ірина", "Тарас", "Леся"]
+
+
+def make_synthetic_directory(directory_path: str, files: int, rows_per_file: int = 30, seed: int = 1) -> None:
+    """
+    Створює каталог із синтетичними файлами груп у форматі StudentManager.
+
+    Args:
+        directory_path: Шлях до каталогу
+        files: Кількість файлів груп
+        rows_per_file: Кількість студентів у кожній групі
+        seed: Зерно генератора випадкових чисел
+    """
+    rng = random.Random(seed)
+    os.makedirs(directory_path, exist_ok=True)
+    for i in range(files):
+        with open(os.path.join(directory_path, f"Група_{i:06d}.txt"), 'w', encoding='utf-8', newline='') as fd:
+            for _ in range(rows_per_file):
+                fd.write(f"{rng.choice(ПРІЗВИЩА)} {rng.choice(ІМЕНА)}:{rng.randint(20, 50) / 10}\r\n")
+
+
+def benchmark_load_all(sizes: Iterable[int] = (10, 1000, 100000), rows_per_file: int = 30,
+                       workers: Optional[int] = None, repeats: int = 3) -> None:
+    """
+    Порівнює послідовне завантаження, пул потоків та пул процесів у StudentManager.load_all.
+
+    Args:
+        sizes: Кількості файлів у синтетичних каталогах
+        rows_per_file: Кількість студентів у кожній групі
+        workers: Кількість потоків/процесів (None - значення пулу за замовчуванням)
+        repeats: Кількість повторів (береться найкращий час)
+    """
+    print(f"{'файлів':>8} {'режим':>8} {'час, с':>10} {'файлів/с':>12} {'рядків/с':>12}")
+    for files in sizes:
+        with tempfile.TemporaryDirectory() as directory_path:
+            make_synthetic_directory(directory_path, files, rows_per_file)
+            # Без кешу: кожен прогін читає файли заново
+            manager = StudentManager(directory_path)
+            for mode in ("serial", "thread", "process"):
+                best = float('inf')
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    groups, errors = manager.load_all(workers=workers, mode=mode)
+                    best = min(best, time.perf_counter() - start)
+                assert len(groups) == files and not errors
+                print(f"{files:>8} {mode:>8} {best:>10.4f} {files / best:>12.0f} "
+                      f"{files * rows_per_file / best:>12.0f}")
+
+
+def current_rss() -> int:
+    """
+    Повертає поточний резидентний обсяг пам'яті процесу в байтах
+    (на системах без /proc - пікове значення з resource).
+    """
+    try:
+        with open('/proc/self/statm') as fd:
+            return int(fd.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS повертає байти, Linux - кілобайти
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _binary_probe(storage: str, file_path: str) -> dict:
+    """
+    Вимірює в окремому процесі час відкриття/розбору, середнє, точковий доступ та приріст RSS.
+
+    Args:
+        storage: 'csv' або 'binary'
+        file_path: Шлях до файлу групи
+
+    Returns:
+        Словник з результатами вимірювань
+    """
+    rss_before = current_rss()
+    start = time.perf_counter()
+    if storage == 'csv':
+        directory_path, file_name = os.path.split(file_path)
+        data = StudentManager(directory_path).read_group_file(file_name[:-4])
+        opened = time.perf_counter()
+        mean = math.fsum(avg_grade for _, avg_grade in data) / len(data)
+        aggregated = time.perf_counter()
+        name = data[len(data) // 2][0]
+    else:
+        data = BinaryGroupFile(file_path)
+        opened = time.perf_counter()
+        mean = math.fsum(data.grades) / len(data)
+        aggregated = time.perf_counter()
+        name = data.name(len(data) // 2)
+    looked_up = time.perf_counter()
+    result = {
+        'open': opened - start,
+        'mean': aggregated - opened,
+        'lookup': looked_up - aggregated,
+        'rss': current_rss() - rss_before,
+        'value': mean,
+        'name': name,
+    }
+    if storage == 'binary':
+        data.close()
+    return result
+
+
+def benchmark_binary(rows: int = 1000000) -> None:
+    """
+    Порівнює текстовий формат (csv, розділювач ':') і двійковий .sgb за часом
+    відкриття, агрегату, точкового доступу та приростом RSS. Кожне вимірювання
+    виконується в окремому процесі, щоб кеші та пам'ять не впливали одне на одне.
+
+    Args:
+        rows: Кількість студентів у синтетичній групі
+    """
+    with tempfile.TemporaryDirectory() as directory_path:
+        make_synthetic_directory(directory_path, 1, rows)
+        text_path = os.path.join(directory_path, "Група_000000.txt")
+        binary_path = os.path.join(directory_path, "Група_000000.sgb")
+        convert_file(text_path, binary_path)
+        print(f"Розмір: txt {os.path.getsize(text_path)} байт, sgb {os.path.getsize(binary_path)} байт")
+
+        print(f"{'формат':>8} {'відкр., с':>10} {'серед., с':>10} {'доступ, мкс':>12} {'RSS, МБ':>9}")
+        for storage, file_path in (('csv', text_path), ('binary', binary_path)):
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '_binary_probe', storage, file_path],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            result = json.loads(output.splitlines()[-1])
+            print(f"{storage:>8} {result['open']:>10.4f} {result['mean']:>10.4f} "
+                  f"{result['lookup'] * 1e6:>12.1f} {result['rss'] / 2 ** 20:>9.1f}")
+
+
+def main(argv=None):
+    if argv and argv[0] == '_binary_probe':
+        # Службовий режим для benchmark_binary
+        print(json.dumps(_binary_probe(argv[1], argv[2])))
+        return
+
+    parser = argparse.ArgumentParser(description="Бенчмарки файлів груп студентів")
+    parser.add_argument("benchmark", choices=["load_all", "binary"], help="Назва бенчмарку")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 100000],
+                        help="Кількості файлів у синтетичних каталогах")
+    parser.add_argument("--rows", type=int, default=None,
+                        help="Кількість студентів у групі (load_all: 30, binary: 1000000)")
+    parser.add_argument("--workers", type=int, default=None, help="Кількість потоків/процесів")
+    parser.add_argument("--repeats", type=int, default=3, help="Кількість повторів")
+    args = parser.parse_args(argv)
+
+    if args.benchmark == "load_all":
+        benchmark_load_all(args.sizes, args.rows or 30, args.workers, args.repeats)
+    elif args.benchmark == "binary":
+        benchmark_binary(args.rows or 1000000)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Двійковий формат файлів груп (.sgb) з читанням через mmap.
+
+Структура файлу (little-endian):
+    заголовок     - магічні байти b'SGB1', версія (u16), прапорці (u16),
+                    кількість студентів N (u64), розмір блоку імен (u64)
+    зміщення      - (N + 1) чисел u32 (у версії 1 та для блоку імен від 4 ГіБ - u64):
+                    початок кожного імені у блоці імен
+    блок імен     - імена у UTF-8 одне за одним
+    вирівнювання  - нульові байти до межі 8 байт
+    бали          - N чисел float64
+
+Читання не розбирає текст: бали доступні як memoryview над mmap,
+а ім'я декодується лише тоді, коли до нього звертаються.
+
+Формат не менший за текстовий: рядок займає ім'я + 12 байт (зміщення й бал),
+тоді як у тексті "ім'я:4.35" з кінцем рядка - ім'я + 6-7 байт. Бал зберігається
+як float64 без округлення, а виграш формату - у швидкості відкриття та читання.
+"""
+
+import sys
+import mmap
+import bisect
+import struct
+from array import array
+from typing import Iterator, List, Tuple
+
+from external_sort import atomic_write
+from group_columns import GroupColumns, grade_statistics
+
+MAGIC = b'SGB1'
+VERSION = 2
+# Версія зі зміщеннями u64 (читається; пишеться, якщо блок імен не вміщується в u32)
+VERSION_WIDE = 1
+_OFFSET_TYPES = {VERSION: 'I', VERSION_WIDE: 'Q'}
+HEADER = struct.Struct('<4sHHQQ')
+BINARY_EXTENSION = '.sgb'
+
+# memoryview.cast використовує нативний порядок байтів
+_NATIVE_LITTLE = sys.byteorder == 'little'
+
+
+def _aligned(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def write_binary_group(file_path: str, rows) -> int:
+    """
+    Атомарно записує групу у двійковому форматі.
+
+    Args:
+        file_path: Шлях до файлу .sgb
+        rows: Ітерований потік кортежів (ім'я студента, середній бал)
+
+    Returns:
+        Кількість записаних студентів
+    """
+    lengths = array('Q', [0])
+    grades = array('d')
+    blob = bytearray()
+    for name, avg_grade in rows:
+        blob += name.encode('utf-8')
+        lengths.append(len(blob))
+        grades.append(avg_grade)
+    count = len(grades)
+    version = VERSION if len(blob) < 1 << 32 else VERSION_WIDE
+    offsets = array(_OFFSET_TYPES[version], lengths)
+    del lengths
+
+    if not _NATIVE_LITTLE:
+        offsets.byteswap()
+        grades.byteswap()
+
+    names_start = HEADER.size + offsets.itemsize * (count + 1)
+    padding = _aligned(names_start + len(blob)) - (names_start + len(blob))
+
+    def write(fd):
+        fd.write(HEADER.pack(MAGIC, version, 0, count, len(blob)))
+        fd.write(offsets.tobytes())
+        fd.write(blob)
+        fd.write(b'\0' * padding)
+        fd.write(grades.tobytes())
+
+    atomic_write(file_path, write, binary=True)
+    return count
+
+
+class _NameView:
+    """Послідовність імен, що декодує ім'я з mmap лише при зверненні."""
+
+    __slots__ = ('_group',)
+
+    def __init__(self, group: 'BinaryGroupFile'):
+        self._group = group
+
+    def __len__(self) -> int:
+        return len(self._group)
+
+    def __getitem__(self, position: int) -> str:
+        return self._group.name(position)
+
+
+class BinaryGroupFile:
+    """
+    Група, відкрита з файлу .sgb через mmap.
+    Має той самий інтерфейс, що й GroupColumns (names, grades, group_names, len),
+    тож її можна передавати у grade_statistics без перетворення.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Відкриває файл групи.
+
+        Args:
+            file_path: Шлях до файлу .sgb
+        """
+        self.file_path = file_path
+        self.group_names = []
+        self._fd = open(file_path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._fd.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._fd.close()
+            raise ValueError(f"Файл {file_path} порожній або пошкоджений.")
+
+        if len(self._mm) < HEADER.size:
+            self.close()
+            raise ValueError(f"Файл {file_path} не є двійковим файлом групи або пошкоджений.")
+        magic, version, _, count, blob_size = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version not in _OFFSET_TYPES:
+            self.close()
+            raise ValueError(f"Файл {file_path} не є двійковим файлом групи.")
+
+        self._count = count
+        offset_type = _OFFSET_TYPES[version]
+        offsets_start = HEADER.size
+        self._names_start = offsets_start + array(offset_type).itemsize * (count + 1)
+        grades_start = _aligned(self._names_start + blob_size)
+        if grades_start + 8 * count > len(self._mm):
+            self.close()
+            raise ValueError(f"Файл {file_path} обрізаний.")
+
+        view = memoryview(self._mm)
+        if _NATIVE_LITTLE:
+            self._view = view
+            self.offsets = view[offsets_start:self._names_start].cast(offset_type)
+            self.grades = view[grades_start:grades_start + 8 * count].cast('d')
+        else:
+            # На big-endian платформах доводиться робити копію з перестановкою байтів
+            self._view = view
+            self.offsets = array(offset_type, view[offsets_start:self._names_start].tobytes())
+            self.offsets.byteswap()
+            self.grades = array('d', view[grades_start:grades_start + 8 * count].tobytes())
+            self.grades.byteswap()
+        self.names = _NameView(self)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> 'BinaryGroupFile':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Звільняє представлення пам'яті та закриває mmap і файл."""
+        for attr in ('offsets', 'grades', '_view'):
+            value = getattr(self, attr, None)
+            if isinstance(value, memoryview):
+                value.release()
+        mm = getattr(self, '_mm', None)
+        if mm is not None and not mm.closed:
+            mm.close()
+        self._fd.close()
+
+    def name(self, position: int) -> str:
+        """
+        Повертає ім'я студента за номером рядка.
+
+        Args:
+            position: Номер рядка
+
+        Returns:
+            Ім'я студента
+        """
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError("Номер рядка поза межами групи.")
+        start = self._names_start + self.offsets[position]
+        end = self._names_start + self.offsets[position + 1]
+        return self._mm[start:end].decode('utf-8')
+
+    def grade(self, position: int) -> float:
+        """
+        Повертає середній бал студента за номером рядка.
+
+        Args:
+            position: Номер рядка
+
+        Returns:
+            Середній бал
+        """
+        return self.grades[position]
+
+    def __iter__(self) -> Iterator[Tuple[str, float]]:
+        for position in range(self._count):
+            yield self.name(position), self.grades[position]
+
+    def find(self, substring: str) -> List[Tuple[str, float]]:
+        """
+        Шукає студентів, чиє ім'я містить підрядок (з урахуванням регістру),
+        шукаючи байти безпосередньо у блоці імен без декодування всіх імен.
+
+        Args:
+            substring: Частина імені
+
+        Returns:
+            Список кортежів (ім'я студента, середній бал) у порядку файлу
+        """
+        needle = substring.encode('utf-8')
+        if not needle:
+            return list(self)
+        found = []
+
+        start = self._names_start
+        end = self._names_start + self.offsets[self._count]
+        position = self._mm.find(needle, start, end)
+        while position != -1:
+            row = bisect.bisect_right(self.offsets, position - self._names_start) - 1
+            row_end = self._names_start + self.offsets[row + 1]
+            # Збіг не повинен виходити за межі імені
+            if position + len(needle) <= row_end:
+                found.append((self.name(row), self.grades[row]))
+                position = self._mm.find(needle, row_end, end)
+            else:
+                position = self._mm.find(needle, position + 1, end)
+        return found
+
+    def to_columns(self) -> GroupColumns:
+        """
+        Копіює групу у стовпцеве представлення в пам'яті.
+
+        Returns:
+            Об'єкт GroupColumns
+        """
+        return GroupColumns([self.name(i) for i in range(self._count)], array('d', self.grades))
+
+    def statistics(self, **kwargs) -> dict:
+        """
+        Рахує статистику балів безпосередньо над mmap (див. grade_statistics).
+
+        Returns:
+            Словник зі статистикою
+        """
+        return grade_statistics(self, **kwargs)
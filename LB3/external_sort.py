@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Зовнішнє сортування файлів груп та атомарний запис.
+Рядки читаються потоком, сортуються порціями обмеженого розміру, відсортовані порції
+скидаються у тимчасові файли і зливаються через heapq.merge. Одночасно відкрито не
+більше MAX_MERGE_FAN_IN файлів порцій: якщо порцій більше, вони попередньо зливаються
+проходами по MAX_MERGE_FAN_IN сусідніх порцій у довші.
+"""
+
+import os
+import csv
+import sys
+import heapq
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+# Бюджет пам'яті за замовчуванням для однієї порції (байти)
+DEFAULT_MEMORY_BUDGET = 32 * 1024 * 1024
+
+# Найбільша кількість файлів порцій, що зливаються (і відкриті) одночасно
+MAX_MERGE_FAN_IN = 64
+
+# Накладні витрати на один рядок (кортеж, float, посилання у списку)
+_ROW_OVERHEAD = sys.getsizeof(("", 0.0)) + sys.getsizeof(0.0) + 8
+
+
+def atomic_write(file_path: str, write_rows: Callable, encoding: str = 'utf-8', binary: bool = False) -> None:
+    """
+    Записує файл атомарно: дані пишуться у тимчасовий файл у тому ж каталозі,
+    синхронізуються на диск і лише потім замінюють цільовий файл через os.replace.
+    Якщо запис перервано, цільовий файл лишається незмінним.
+
+    Args:
+        file_path: Шлях до цільового файлу
+        write_rows: Функція, яка отримує відкритий файл і записує у нього дані
+        encoding: Кодування файлу (для текстового режиму)
+        binary: True - файл відкривається у двійковому режимі
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd_num, tmp_path = tempfile.mkstemp(prefix='.', suffix='.tmp', dir=directory)
+    try:
+        if binary:
+            fd = os.fdopen(fd_num, 'wb')
+        else:
+            fd = os.fdopen(fd_num, 'w', encoding=encoding, newline='')
+        with fd:
+            write_rows(fd)
+            fd.flush()
+            os.fsync(fd.fileno())
+        # mkstemp створює файл з правами 0600 - повертаємо права оригіналу
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_run(rows: Iterable[Tuple[str, float]], tmp_dir: Optional[str]) -> str:
+    """Скидає відсортовану порцію у тимчасовий файл і повертає його шлях."""
+    fd_num, run_path = tempfile.mkstemp(prefix='sort_run_', suffix='.tsv', dir=tmp_dir)
+    try:
+        with os.fdopen(fd_num, 'w', encoding='utf-8', newline='') as fd:
+            writer = csv.writer(fd, delimiter='\t', lineterminator='\n')
+            # repr зберігає float без втрати точності
+            writer.writerows((name, repr(avg_grade)) for name, avg_grade in rows)
+    except BaseException:
+        os.remove(run_path)
+        raise
+    return run_path
+
+
+def _read_run(run_path: str) -> Iterator[Tuple[str, float]]:
+    """Потоково читає порцію, збережену _write_run."""
+    with open(run_path, 'r', encoding='utf-8', newline='') as fd:
+        for name, avg_grade in csv.reader(fd, delimiter='\t'):
+            yield name, float(avg_grade)
+
+
+def _merge_runs(run_paths: List[str], key: Callable, reverse: bool, max_fan_in: int,
+                tmp_dir: Optional[str]) -> None:
+    """
+    Зливає порції проходами, доки їх не залишиться не більше max_fan_in. Сусідні порції
+    зливаються по порядку, тож стабільність сортування зберігається. Список run_paths
+    змінюється на місці й завжди містить усі наявні файли порцій (для прибирання при помилці).
+    """
+    while len(run_paths) > max_fan_in:
+        # Порції поточного проходу - на початку списку, злиті додаються в кінець
+        remaining = len(run_paths)
+        while remaining:
+            size = min(max_fan_in, remaining)
+            remaining -= size
+            if size == 1:
+                run_paths.append(run_paths.pop(0))
+                continue
+            group = run_paths[:size]
+            readers = [_read_run(path) for path in group]
+            try:
+                run_paths.append(_write_run(heapq.merge(*readers, key=key, reverse=reverse), tmp_dir))
+            finally:
+                for reader in readers:
+                    reader.close()
+            del run_paths[:size]
+            for path in group:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+@contextmanager
+def external_sorted(rows: Iterable[Tuple[str, float]], reverse: bool = False,
+                    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                    tmp_dir: Optional[str] = None,
+                    max_fan_in: int = MAX_MERGE_FAN_IN) -> Iterator[Iterator[Tuple[str, float]]]:
+    """
+    Сортує потік рядків (ім'я, бал) за балом, не тримаючи в пам'яті більше memory_budget байт рядків.
+    Сортування стабільне, як і sorted(..., key=бал, reverse=reverse).
+    Використовується як контекстний менеджер: тимчасові файли видаляються при виході.
+
+    Args:
+        rows: Ітерований потік кортежів (ім'я студента, середній бал)
+        reverse: True для сортування за спаданням
+        memory_budget: Приблизний обсяг пам'яті на одну порцію (байти)
+        tmp_dir: Каталог для тимчасових файлів (за замовчуванням - системний)
+        max_fan_in: Найбільша кількість порцій, що зливаються одночасно (не менше 2)
+
+    Returns:
+        Ітератор відсортованих рядків
+    """
+    if max_fan_in < 2:
+        raise ValueError("Кількість порцій для злиття має бути не менше 2.")
+    key = lambda row: row[1]
+    run_paths = []
+    readers = []
+    chunk = []
+    chunk_bytes = 0
+    try:
+        for row in rows:
+            chunk.append(row)
+            chunk_bytes += _ROW_OVERHEAD + sys.getsizeof(row[0])
+            if chunk_bytes >= memory_budget:
+                chunk.sort(key=key, reverse=reverse)
+                run_paths.append(_write_run(chunk, tmp_dir))
+                chunk = []
+                chunk_bytes = 0
+
+        chunk.sort(key=key, reverse=reverse)
+        if not run_paths:
+            # Усе вмістилося в бюджет - тимчасові файли не потрібні
+            yield iter(chunk)
+            return
+
+        if chunk:
+            run_paths.append(_write_run(chunk, tmp_dir))
+            chunk = []
+        _merge_runs(run_paths, key, reverse, max_fan_in, tmp_dir)
+        # Порції передаються у порядку появи, тож heapq.merge зберігає стабільність
+        readers = [_read_run(path) for path in run_paths]
+        yield heapq.merge(*readers, key=key, reverse=reverse)
+    finally:
+        # Спершу закриваємо файли порцій, інакше на Windows їх неможливо видалити
+        for reader in readers:
+            reader.close()
+        for path in run_paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Кеш розібраних файлів груп у пам'яті.
+Записи кешу прив'язані до шляху файлу та його os.stat (mtime і розмір),
+тож зміна файлу поза менеджером автоматично робить запис застарілим.
+"""
+
+import os
+import sys
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+
+def stat_signature(file_path: str) -> Optional[Tuple[int, int]]:
+    """
+    Повертає підпис файлу (mtime у наносекундах, розмір) або None, якщо файлу немає.
+
+    Args:
+        file_path: Шлях до файлу
+
+    Returns:
+        Кортеж (mtime_ns, розмір) або None
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def estimate_rows_size(rows: List[Tuple[str, float]]) -> int:
+    """
+    Приблизно оцінює обсяг пам'яті, який займає список рядків групи.
+
+    Args:
+        rows: Список кортежів (ім'я студента, середній бал)
+
+    Returns:
+        Оцінка розміру в байтах
+    """
+    # Кортеж з двох елементів і float мають сталий розмір, тож рахуємо їх один раз
+    per_row = sys.getsizeof(("", 0.0)) + sys.getsizeof(0.0) + 8
+    size = sys.getsizeof(rows)
+    for name, _ in rows:
+        size += per_row + sys.getsizeof(name)
+    return size
+
+
+class GroupCache:
+    """
+    LRU-кеш розібраних груп з обмеженням за кількістю записів та обсягом пам'яті.
+    Ключ запису - шлях до файлу, валідність перевіряється за підписом os.stat.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Ініціалізація кешу.
+
+        Args:
+            max_entries: Максимальна кількість груп у кеші
+            max_bytes: Максимальний сумарний обсяг даних у кеші (байти)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        # {шлях: (підпис, рядки, розмір)}
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, file_path: str) -> bool:
+        return file_path in self._entries
+
+    def get(self, file_path: str) -> Optional[List[Tuple[str, float]]]:
+        """
+        Повертає копію закешованих рядків, якщо файл не змінився з моменту кешування.
+
+        Args:
+            file_path: Шлях до файлу групи
+
+        Returns:
+            Список кортежів (ім'я студента, середній бал) або None, якщо запису немає чи він застарів
+        """
+        entry = self._entries.get(file_path)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        signature, rows, _ = entry
+        if stat_signature(file_path) != signature:
+            self.invalidate(file_path)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(file_path)
+        self.hits += 1
+        # Повертаємо копію, щоб зміни у списку викликача не зіпсували кеш
+        return list(rows)
+
+    def put(self, file_path: str, rows: List[Tuple[str, float]],
+            signature: Optional[Tuple[int, int]] = None) -> bool:
+        """
+        Зберігає рядки групи у кеші.
+
+        Args:
+            file_path: Шлях до файлу групи
+            rows: Список кортежів (ім'я студента, середній бал)
+            signature: Підпис файлу, отриманий до читання (якщо None - береться поточний)
+
+        Returns:
+            True, якщо запис збережено, False - якщо він не вміщується у кеш або файлу немає
+        """
+        self.invalidate(file_path)
+        if signature is None:
+            signature = stat_signature(file_path)
+        if signature is None:
+            return False
+
+        size = estimate_rows_size(rows)
+        if size > self.max_bytes or self.max_entries <= 0:
+            return False
+
+        self._entries[file_path] = (signature, list(rows), size)
+        self.current_bytes += size
+        self._evict()
+        return True
+
+    def extend(self, file_path: str, old_signature: Optional[Tuple[int, int]],
+               new_rows: List[Tuple[str, float]]) -> bool:
+        """
+        Доповнює закешовану групу рядками, дописаними у кінець файлу.
+        Запис оновлюється лише тоді, коли до дозапису він відповідав файлу (old_signature),
+        інакше він видаляється, щоб наступне читання розібрало файл заново.
+
+        Args:
+            file_path: Шлях до файлу групи
+            old_signature: Підпис файлу до дозапису
+            new_rows: Дописані рядки
+
+        Returns:
+            True, якщо запис оновлено на місці, False - якщо його видалено
+        """
+        entry = self._entries.get(file_path)
+        if entry is None or old_signature is None or entry[0] != old_signature:
+            self.invalidate(file_path)
+            return False
+
+        _, rows, _ = entry
+        self.invalidate(file_path)
+        return self.put(file_path, rows + list(new_rows))
+
+    def invalidate(self, file_path: str) -> None:
+        """
+        Видаляє запис з кешу.
+
+        Args:
+            file_path: Шлях до файлу групи
+        """
+        entry = self._entries.pop(file_path, None)
+        if entry is not None:
+            self.current_bytes -= entry[2]
+
+    def clear(self) -> None:
+        """Очищає кеш повністю."""
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def _evict(self) -> None:
+        """Витісняє найдавніше використані записи, доки кеш не вкладеться в ліміти."""
+        while self._entries and (len(self._entries) > self.max_entries
+                                 or self.current_bytes > self.max_bytes):
+            _, (_, _, size) = self._entries.popitem(last=False)
+            self.current_bytes -= size
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Стовпцеве представлення груп студентів та векторизована статистика балів.
+Імена зберігаються в одному списку інтернованих рядків, бали - в array('d').
+Якщо встановлено NumPy, статистика рахується через нього (без копіювання балів),
+інакше - через сортування масиву та бінарний пошук.
+"""
+
+import sys
+import math
+import heapq
+import bisect
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необов'язковий
+    np = None
+
+
+class GroupColumns:
+    """
+    Стовпцеве сховище однієї чи кількох груп: names[i] та grades[i] описують i-го студента.
+    Для об'єднаних груп group_names та group_offsets вказують, де починається кожна група.
+    """
+
+    __slots__ = ('names', 'grades', 'group_names', 'group_offsets')
+
+    def __init__(self, names: Optional[List[str]] = None, grades: Optional[array] = None):
+        """
+        Ініціалізація стовпців.
+
+        Args:
+            names: Список імен студентів
+            grades: Масив середніх балів (array('d')) тієї ж довжини
+        """
+        self.names = names if names is not None else []
+        self.grades = grades if grades is not None else array('d')
+        if len(self.names) != len(self.grades):
+            raise ValueError("Кількість імен і балів має збігатися.")
+        self.group_names = []
+        self.group_offsets = array('q')
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[str, float]]) -> 'GroupColumns':
+        """
+        Перетворює список кортежів (ім'я, бал) у стовпці.
+
+        Args:
+            rows: Ітерований потік кортежів (ім'я студента, середній бал)
+
+        Returns:
+            Об'єкт GroupColumns
+        """
+        intern = sys.intern
+        names = []
+        grades = array('d')
+        for name, avg_grade in rows:
+            names.append(intern(name))
+            grades.append(avg_grade)
+        return cls(names, grades)
+
+    @classmethod
+    def concat(cls, groups: Dict[str, 'GroupColumns']) -> 'GroupColumns':
+        """
+        Об'єднує кілька груп у одне сховище, запам'ятовуючи межі груп.
+
+        Args:
+            groups: Словник {назва_групи: GroupColumns}
+
+        Returns:
+            Об'єднаний GroupColumns
+        """
+        result = cls()
+        for group_name, columns in groups.items():
+            result.group_names.append(group_name)
+            result.group_offsets.append(len(result.names))
+            result.names.extend(columns.names)
+            result.grades.extend(columns.grades)
+        return result
+
+    def to_rows(self) -> List[Tuple[str, float]]:
+        """
+        Перетворює стовпці назад у список кортежів (ім'я, бал).
+
+        Returns:
+            Список кортежів (ім'я студента, середній бал)
+        """
+        return list(zip(self.names, self.grades))
+
+    def group_of(self, position: int) -> Optional[str]:
+        """
+        Повертає назву групи, до якої належить рядок (для об'єднаних груп).
+
+        Args:
+            position: Номер рядка
+
+        Returns:
+            Назва групи або None, якщо сховище не об'єднане
+        """
+        if not self.group_names:
+            return None
+        return self.group_names[bisect.bisect_right(self.group_offsets, position) - 1]
+
+    def __len__(self) -> int:
+        return len(self.grades)
+
+
+def _percentile_sorted(values: Sequence[float], percent: float) -> float:
+    """Лінійна інтерполяція перцентиля по відсортованих значеннях (як numpy.percentile)."""
+    rank = percent / 100 * (len(values) - 1)
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def grade_statistics(columns: GroupColumns, percentiles: Sequence[float] = (25, 50, 75),
+                     top_n: int = 5, bins: int = 10) -> Dict:
+    """
+    Рахує агрегати середніх балів: кількість, середнє, мінімум, максимум, медіану,
+    перцентилі, top-N студентів та гістограму.
+
+    Args:
+        columns: Стовпці однієї чи кількох груп
+        percentiles: Перцентилі для обчислення (0..100)
+        top_n: Скільки найкращих студентів повернути
+        bins: Кількість інтервалів гістограми (додатне ціле число)
+
+    Returns:
+        Словник зі статистикою; для порожнього сховища значення агрегатів - None
+    """
+    if isinstance(bins, bool) or not isinstance(bins, int) or bins <= 0:
+        raise ValueError("Кількість інтервалів гістограми має бути додатним цілим числом.")
+    count = len(columns)
+    stats = {
+        'count': count,
+        'mean': None,
+        'min': None,
+        'max': None,
+        'median': None,
+        'percentiles': {p: None for p in percentiles},
+        'top': [],
+        'histogram': {'edges': [], 'counts': []},
+    }
+    if count == 0:
+        return stats
+
+    if np is not None:
+        # Представлення масиву без копіювання
+        grades = np.frombuffer(columns.grades, dtype=np.float64)
+        stats['mean'] = float(grades.mean())
+        stats['min'] = float(grades.min())
+        stats['max'] = float(grades.max())
+        stats['median'] = float(np.median(grades))
+        values = np.percentile(grades, list(percentiles)) if percentiles else []
+        stats['percentiles'] = {p: float(v) for p, v in zip(percentiles, values)}
+        # Стабільне сортування: за спаданням балу, при рівності - за позицією (як heapq.nlargest)
+        top = np.argsort(-grades, kind='stable')[:max(top_n, 0)].tolist()
+        counts, edges = np.histogram(grades, bins=bins)
+        stats['histogram'] = {'edges': edges.tolist(), 'counts': counts.tolist()}
+    else:
+        ordered = sorted(columns.grades)
+        stats['mean'] = math.fsum(columns.grades) / count
+        stats['min'] = ordered[0]
+        stats['max'] = ordered[-1]
+        stats['median'] = _percentile_sorted(ordered, 50)
+        stats['percentiles'] = {p: _percentile_sorted(ordered, p) for p in percentiles}
+        top = heapq.nlargest(top_n, range(count), key=columns.grades.__getitem__)
+
+        # Рівні інтервали на [min, max]; останній інтервал включає праву межу
+        low, high = ordered[0], ordered[-1]
+        if low == high:
+            low, high = low - 0.5, high + 0.5
+        step = (high - low) / bins
+        edges = [low + i * step for i in range(bins)] + [high]
+        positions = [bisect.bisect_left(ordered, edge) for edge in edges[:-1]] + [count]
+        stats['histogram'] = {
+            'edges': edges,
+            'counts': [positions[i + 1] - positions[i] for i in range(bins)],
+        }
+
+    if columns.group_names:
+        stats['top'] = [(columns.group_of(i), columns.names[i], columns.grades[i]) for i in top]
+    else:
+        stats['top'] = [(columns.names[i], columns.grades[i]) for i in top]
+    return stats
@@ -0,0 +1,538 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Спільне ядро читання та запису файлів груп.
+Усі три реалізації (StudentManager, функції з LB3Task1_функції.py та варіант
+з табуляцією й заголовком з LB3Task1.1.py) читають і пишуть файли через цей модуль.
+
+Текстові файли описуються діалектом (розділювач, заголовок, точність балу, кінець рядка),
+який визначається автоматично за початком файлу. Токенізатор толерантний: якщо у рядку
+немає очікуваного розділювача, ім'я відділяється від балу останнім пробільним проміжком
+(у ГрупаКН.txt частину рядків розділено пробілом замість табуляції).
+Двійкові файли .sgb розпізнаються за магічними байтами.
+"""
+
+import os
+import csv
+import io
+from collections import deque
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from external_sort import atomic_write
+from binary_groups import MAGIC, BinaryGroupFile, write_binary_group, BINARY_EXTENSION
+
+# Скільки байтів з початку файлу аналізується для визначення діалекту
+SNIFF_BYTES = 64 * 1024
+# Розділювачі, які розпізнаються автоматично (у порядку пріоритету)
+CANDIDATE_DELIMITERS = ('\t', ':', ';', ',')
+# Скільки рядків файлу може займати одне ім'я в лапках з перенесеннями
+MAX_QUOTED_LINES = 64
+
+FORMAT_TEXT = 'text'
+FORMAT_BINARY = 'binary'
+
+# Зареєстровані двійкові формати: {назва: (магічні байти, відкриття для читання, запис)}
+_BINARY_FORMATS = {}
+
+
+def register_binary_format(name: str, magic: bytes, open_reader: Callable, writer: Callable) -> None:
+    """
+    Реєструє двійковий формат файлів груп.
+
+    Args:
+        name: Назва формату
+        magic: Магічні байти на початку файлу
+        open_reader: Функція (шлях) -> контекстний менеджер, що ітерує кортежі (ім'я, бал)
+        writer: Функція (шлях, рядки) -> кількість записаних рядків (запис має бути атомарним)
+    """
+    _BINARY_FORMATS[name] = (magic, open_reader, writer)
+
+
+register_binary_format(FORMAT_BINARY, MAGIC, BinaryGroupFile, write_binary_group)
+
+
+class Dialect:
+    """
+    Опис текстового формату файлу групи.
+    delimiter - розділювач імені та балу (' ' означає будь-який пробільний проміжок),
+    header - назви стовпців заголовка або None,
+    precision - кількість знаків після коми при записі (None - як str(float)); бал,
+        який має більше знаків, записується повністю (format_grade не втрачає даних),
+    lineterminator - кінець рядка при записі.
+    """
+
+    __slots__ = ('delimiter', 'header', 'precision', 'lineterminator')
+
+    def __init__(self, delimiter: str, header: Optional[Tuple[str, ...]] = None,
+                 precision: Optional[int] = None, lineterminator: str = '\n'):
+        self.delimiter = delimiter
+        self.header = tuple(header) if header else None
+        self.precision = precision
+        self.lineterminator = lineterminator
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Dialect) and all(
+            getattr(self, attr) == getattr(other, attr) for attr in self.__slots__)
+
+    def __repr__(self) -> str:
+        return (f"Dialect(delimiter={self.delimiter!r}, header={self.header!r}, "
+                f"precision={self.precision!r}, lineterminator={self.lineterminator!r})")
+
+
+# Формат StudentManager та функцій: 'ім'я:бал' без заголовка, як пише csv.writer
+COLON_DIALECT = Dialect(':', None, None, '\r\n')
+# Формат каталогу групи_студентів: заголовок, табуляція, один знак після коми
+TAB_DIALECT = Dialect('\t', ('Ім_я', 'Середній_бал'), 1, '\n')
+
+
+def _is_number(text: str) -> bool:
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def split_line(line: str, delimiter: str) -> Optional[Tuple[str, str]]:
+    """
+    Розбиває рядок файлу на (ім'я, текст балу).
+    Значення в лапках розбираються за правилами csv; за відсутності розділювача
+    бал відділяється останнім пробільним проміжком.
+
+    Args:
+        line: Рядок без символу кінця рядка
+        delimiter: Розділювач діалекту
+
+    Returns:
+        Кортеж (ім'я, бал як текст) або None, якщо рядок не містить двох полів
+    """
+    if '"' in line and delimiter != ' ':
+        fields = next(csv.reader([line], delimiter=delimiter), [])
+        if len(fields) == 2:
+            return fields[0], fields[1]
+        if len(fields) < 2:
+            return None
+        return delimiter.join(fields[:-1]), fields[-1]
+
+    if delimiter != ' ' and delimiter in line:
+        name, _, grade = line.rpartition(delimiter)
+        return name, grade
+
+    parts = line.rsplit(None, 1)
+    if len(parts) != 2:
+        return None
+    return parts[0].strip(), parts[1]
+
+
+def sniff_dialect(text: str) -> Dialect:
+    """
+    Визначає діалект за початком файлу.
+
+    Args:
+        text: Початок файлу (як прочитано у двійковому режимі і декодовано, з оригінальними кінцями рядків)
+
+    Returns:
+        Об'єкт Dialect
+    """
+    lineterminator = '\r\n' if '\r\n' in text else '\n'
+    lines = [line for line in text.splitlines() if line.strip()]
+    # Останній рядок міг обрізатися на межі SNIFF_BYTES
+    if len(text) >= SNIFF_BYTES and len(lines) > 1:
+        lines.pop()
+    if not lines:
+        return COLON_DIALECT
+
+    # Для кожного розділювача рахуємо рядки, де після нього стоїть число
+    scores = {d: sum(1 for line in lines if d in line and _is_number(line.rpartition(d)[2]))
+              for d in CANDIDATE_DELIMITERS}
+    delimiter = max(CANDIDATE_DELIMITERS, key=lambda d: scores[d])
+
+    first = lines[0]
+    header = None
+    first_fields = split_line(first, delimiter if scores[delimiter] else ' ')
+    if first_fields is None or not _is_number(first_fields[1]):
+        # Перший рядок не закінчується числом - це заголовок
+        header_delimiter = next((d for d in CANDIDATE_DELIMITERS if d in first), None)
+        if scores[delimiter] == 0 and header_delimiter is not None:
+            delimiter = header_delimiter
+        header = tuple(first.split(header_delimiter)) if header_delimiter else (first,)
+        lines = lines[1:]
+
+    if scores[delimiter] == 0 and header is None:
+        delimiter = ' '
+
+    # Фіксована точність лише там, де бали очевидно форматуються: є заголовок або всі
+    # бали записано з однаковою ненульовою кількістю знаків після коми. Цілі бали без
+    # заголовка ("Іван:5") точності не задають - інакше 4.65 записалося б як "5"
+    precision = None
+    grades = [fields[1].strip() for fields in (split_line(line, delimiter) for line in lines)
+              if fields is not None and _is_number(fields[1])]
+    decimals = {len(g.partition('.')[2]) for g in grades}
+    formatted = header is not None or 0 not in decimals
+    if grades and len(decimals) == 1 and formatted:
+        precision = decimals.pop()
+
+    return Dialect(delimiter, header, precision, lineterminator)
+
+
+def detect_format(file_path: str) -> Tuple[str, Optional[Dialect]]:
+    """
+    Визначає формат файлу групи.
+
+    Args:
+        file_path: Шлях до файлу
+
+    Returns:
+        Кортеж (назва формату, діалект для текстових файлів або None для двійкових)
+    """
+    with open(file_path, 'rb') as fd:
+        head = fd.read(SNIFF_BYTES)
+    for name, (magic, _, _) in _BINARY_FORMATS.items():
+        if head.startswith(magic):
+            return name, None
+    return FORMAT_TEXT, sniff_dialect(head.decode('utf-8', errors='ignore'))
+
+
+def _report(message: str, errors: Optional[List[str]]) -> None:
+    if errors is None:
+        print(message)
+    else:
+        errors.append(message)
+
+
+def _opens_quoted_field(text: str, delimiter: str) -> bool:
+    """
+    Чи закінчується текст всередині поля в лапках (за правилами csv: лапка відкриває
+    поле лише на його початку, "" всередині поля - це сама лапка).
+    """
+    if delimiter == ' ':
+        # Пробільний діалект не використовує csv, лапки можуть бути лише частиною імені
+        return False
+    state = 'start'
+    for char in text:
+        if state == 'quoted':
+            if char == '"':
+                state = 'quote'
+        elif state == 'quote':
+            # Лапка в полі: подвоєна - це символ лапки, інакше поле в лапках закрито
+            state = 'quoted' if char == '"' else 'start' if char == delimiter else 'plain'
+        elif char == delimiter:
+            state = 'start'
+        elif state == 'start':
+            state = 'quoted' if char == '"' else 'plain'
+    return state == 'quoted'
+
+
+def _logical_lines(fd, delimiter: str, errors: Optional[List[str]]) -> Iterator[str]:
+    """
+    Рядки файлу без символів кінця рядка; рядки поля в лапках з перенесеннями
+    склеюються в один. Поле, яке не закрилося за MAX_QUOTED_LINES рядків або до кінця
+    файлу, вважається помилкою: його перший рядок пропускається, решта розбирається заново.
+    """
+    lines = (line.rstrip('\r\n') for line in fd)
+    backlog = deque()
+    pending = []
+    while True:
+        if backlog:
+            line = backlog.popleft()
+        else:
+            line = next(lines, None)
+            if line is None:
+                if not pending:
+                    return
+                _report(f"Незакрита лапка в рядку {pending[0]!r}. Пропускаємо запис.", errors)
+                backlog.extend(pending[1:])
+                pending = []
+                continue
+        if not pending and ('"' not in line or not _opens_quoted_field(line, delimiter)):
+            yield line
+            continue
+        pending.append(line)
+        text = '\n'.join(pending)
+        if not _opens_quoted_field(text, delimiter):
+            pending = []
+            yield text
+        elif len(pending) > MAX_QUOTED_LINES:
+            _report(f"Незакрита лапка в рядку {pending[0]!r}. Пропускаємо запис.", errors)
+            backlog.extendleft(reversed(pending[1:]))
+            pending = []
+
+
+def iter_rows(fd, dialect: Dialect, errors: Optional[List[str]] = None) -> Iterator[Tuple[str, float]]:
+    """
+    Потоково розбирає рядки відкритого текстового файлу групи.
+
+    Args:
+        fd: Файл, відкритий у текстовому режимі
+        dialect: Діалект файлу
+        errors: Список для повідомлень про помилки; якщо None - повідомлення виводяться
+
+    Returns:
+        Ітератор кортежів (ім'я студента, середній бал)
+    """
+    delimiter = dialect.delimiter
+    first = dialect.header is not None
+    # Ім'я в лапках може містити перенесення рядка
+    for line in _logical_lines(fd, delimiter, errors):
+        if not line.strip():
+            continue
+        fields = split_line(line, delimiter)
+        if fields is None:
+            continue
+        name, grade = fields
+        try:
+            avg_grade = float(grade)
+        except ValueError:
+            if first:
+                # Рядок заголовка
+                first = False
+                continue
+            _report(f"Помилка при конвертації оцінки для студента {name}. Пропускаємо запис.", errors)
+            continue
+        first = False
+        yield name, avg_grade
+
+
+def iter_file_rows(file_path: str, dialect: Optional[Dialect] = None,
+                   errors: Optional[List[str]] = None) -> Iterator[Tuple[str, float]]:
+    """
+    Потоково читає файл групи будь-якого підтримуваного формату.
+
+    Args:
+        file_path: Шлях до файлу
+        dialect: Діалект текстового файлу (None - визначити автоматично)
+        errors: Список для повідомлень про помилки; якщо None - повідомлення виводяться
+
+    Returns:
+        Ітератор кортежів (ім'я студента, середній бал)
+    """
+    if dialect is None:
+        file_format, dialect = detect_format(file_path)
+        if file_format != FORMAT_TEXT:
+            with _BINARY_FORMATS[file_format][1](file_path) as group:
+                yield from group
+            return
+    with open(file_path, 'r', encoding='utf-8') as fd:
+        yield from iter_rows(fd, dialect, errors)
+
+
+def read_file_rows(file_path: str, dialect: Optional[Dialect] = None,
+                   errors: Optional[List[str]] = None) -> List[Tuple[str, float]]:
+    """
+    Читає файл групи будь-якого підтримуваного формату у список.
+
+    Args:
+        file_path: Шлях до файлу
+        dialect: Діалект текстового файлу (None - визначити автоматично)
+        errors: Список для повідомлень про помилки; якщо None - повідомлення виводяться
+
+    Returns:
+        Список кортежів (ім'я студента, середній бал)
+    """
+    return list(iter_file_rows(file_path, dialect, errors))
+
+
+def format_grade(avg_grade, dialect: Dialect) -> str:
+    """
+    Форматує бал так, як його записує діалект. Точність діалекту - найменша кількість
+    знаків після коми: бал, що має більше знаків, не округлюється, а записується
+    найкоротшим точним поданням (str(float)).
+    """
+    if dialect.precision is None:
+        # Так само, як csv.writer перетворює значення на рядок
+        return '' if avg_grade is None else str(avg_grade)
+    value = float(avg_grade)
+    text = f"{value:.{dialect.precision}f}"
+    if float(text) != value and value == value:
+        return repr(value)
+    return text
+
+
+def write_rows(fd, rows: Iterable[Tuple[str, float]], dialect: Dialect, header: bool = True) -> int:
+    """
+    Записує рядки у відкритий текстовий файл у форматі діалекту.
+    Прості імена форматуються напряму, імена зі спецсимволами - через csv.writer.
+
+    Args:
+        fd: Файл, відкритий у текстовому режимі з newline=''
+        rows: Ітерований потік кортежів (ім'я студента, середній бал)
+        dialect: Діалект файлу
+        header: Чи записувати заголовок діалекту
+
+    Returns:
+        Кількість записаних рядків (без заголовка)
+    """
+    delimiter = '\t' if dialect.delimiter == ' ' else dialect.delimiter
+    terminator = dialect.lineterminator
+    special = (delimiter, '"', '\r', '\n')
+    writer = csv.writer(fd, delimiter=delimiter, lineterminator=terminator)
+    if header and dialect.header:
+        writer.writerow(dialect.header)
+
+    count = 0
+    buffer = []
+    for name, avg_grade in rows:
+        name = '' if name is None else str(name)
+        grade = format_grade(avg_grade, dialect)
+        if any(c in name or c in grade for c in special):
+            fd.write(''.join(buffer))
+            buffer.clear()
+            writer.writerow([name, grade])
+        else:
+            buffer.append(f"{name}{delimiter}{grade}{terminator}")
+            if len(buffer) >= 4096:
+                fd.write(''.join(buffer))
+                buffer.clear()
+        count += 1
+    fd.write(''.join(buffer))
+    return count
+
+
+def write_file_rows(file_path: str, rows: Iterable[Tuple[str, float]], target: Union[Dialect, str],
+                    atomic: bool = False) -> int:
+    """
+    Перезаписує файл групи.
+
+    Args:
+        file_path: Шлях до файлу
+        rows: Ітерований потік кортежів (ім'я студента, середній бал)
+        target: Діалект текстового файлу або назва зареєстрованого двійкового формату
+        atomic: True - запис через тимчасовий файл і os.replace (двійкові формати - завжди)
+
+    Returns:
+        Кількість записаних рядків
+    """
+    if not isinstance(target, Dialect):
+        if target not in _BINARY_FORMATS:
+            raise ValueError(f"Невідомий формат: {target}")
+        return _BINARY_FORMATS[target][2](file_path, rows)
+
+    if atomic:
+        written = [0]
+
+        def write(fd):
+            written[0] = write_rows(fd, rows, target)
+
+        atomic_write(file_path, write)
+        return written[0]
+
+    with open(file_path, 'w', encoding='utf-8', newline='') as fd:
+        return write_rows(fd, rows, target)
+
+
+def append_file_rows(file_path: str, rows: Iterable[Tuple[str, float]], default_dialect: Dialect) -> Dialect:
+    """
+    Дописує рядки у кінець текстового файлу групи у діалекті самого файлу
+    (для нового чи порожнього файлу - у діалекті за замовчуванням, із заголовком).
+
+    Args:
+        file_path: Шлях до файлу
+        rows: Ітерований потік кортежів (ім'я студента, середній бал)
+        default_dialect: Діалект для нового файлу
+
+    Returns:
+        Діалект, у якому дописано рядки
+    """
+    dialect = default_dialect
+    is_new = not os.path.exists(file_path) or os.path.getsize(file_path) == 0
+    if not is_new:
+        file_format, dialect = detect_format(file_path)
+        if file_format != FORMAT_TEXT:
+            raise ValueError(f"Дозапис у двійковий файл {file_path} не підтримується.")
+        # Якщо файл не закінчується переведенням рядка, починаємо з нового рядка
+        with open(file_path, 'rb') as fd:
+            fd.seek(-1, io.SEEK_END)
+            needs_newline = fd.read(1) not in (b'\n', b'\r')
+    with open(file_path, 'a', encoding='utf-8', newline='') as fd:
+        if not is_new and needs_newline:
+            fd.write(dialect.lineterminator)
+        write_rows(fd, rows, dialect, header=is_new)
+    return dialect
+
+
+def normalize_rows(rows: Iterable[Tuple[str, float]], dialect: Dialect) -> List[Tuple[str, float]]:
+    """
+    Приводить дані до вигляду, у якому їх поверне читання після запису у діалекті.
+
+    Args:
+        rows: Список кортежів (ім'я студента, середній бал)
+        dialect: Діалект запису
+
+    Returns:
+        Список кортежів (ім'я студента, середній бал) з рядковими іменами та float-балами
+    """
+    result = []
+    for name, avg_grade in rows:
+        try:
+            result.append(('' if name is None else str(name), float(format_grade(avg_grade, dialect))))
+        except (TypeError, ValueError):
+            # Такий рядок буде пропущено і при читанні файлу
+            continue
+    return result
+
+
+def file_dialect(file_path: str, default_dialect: Dialect) -> Dialect:
+    """
+    Повертає діалект наявного текстового файлу або діалект за замовчуванням.
+
+    Args:
+        file_path: Шлях до файлу
+        default_dialect: Діалект для відсутнього, порожнього чи двійкового файлу
+
+    Returns:
+        Об'єкт Dialect
+    """
+    try:
+        if os.path.getsize(file_path) == 0:
+            return default_dialect
+        file_format, dialect = detect_format(file_path)
+    except OSError:
+        return default_dialect
+    return dialect if file_format == FORMAT_TEXT else default_dialect
+
+
+def convert_file(source_path: str, target_path: str, target: Union[Dialect, str] = FORMAT_BINARY) -> int:
+    """
+    Перетворює файл групи з будь-якого підтримуваного формату в інший.
+
+    Args:
+        source_path: Шлях до вихідного файлу (формат визначається автоматично)
+        target_path: Шлях до нового файлу
+        target: Діалект нового текстового файлу або назва двійкового формату
+
+    Returns:
+        Кількість перетворених рядків
+    """
+    return write_file_rows(target_path, iter_file_rows(source_path, errors=[]), target, atomic=True)
+
+
+def convert_directory(source_dir: str, target_dir: Optional[str] = None,
+                      target: Union[Dialect, str] = FORMAT_BINARY) -> dict:
+    """
+    Перетворює всі файли груп .txt каталогу (у будь-якому діалекті) в інший формат.
+
+    Args:
+        source_dir: Каталог з текстовими файлами груп
+        target_dir: Каталог для нових файлів (за замовчуванням - той самий)
+        target: Діалект нових текстових файлів або назва двійкового формату (.sgb)
+
+    Returns:
+        Словник {назва_групи: кількість рядків}
+    """
+    target_dir = target_dir or source_dir
+    os.makedirs(target_dir, exist_ok=True)
+    extension = '.txt' if isinstance(target, Dialect) else BINARY_EXTENSION
+    converted = {}
+    for file_name in sorted(os.listdir(source_dir)):
+        if not file_name.endswith('.txt'):
+            continue
+        group_name = file_name[:-4]
+        source_path = os.path.join(source_dir, file_name)
+        target_path = os.path.join(target_dir, group_name + extension)
+        # Якщо файл перетворюється на місці, спершу читаємо його повністю
+        rows = iter_file_rows(source_path, errors=[])
+        if os.path.abspath(target_path) == os.path.abspath(source_path):
+            rows = list(rows)
+        converted[group_name] = write_file_rows(target_path, rows, target, atomic=True)
+    return converted
@@ -0,0 +1,476 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Журнал змін (write-ahead log) для файлів груп.
+
+Кожна зміна (додавання, оновлення, видалення студента чи заміна всієї групи) дописується
+одним рядком JSON у файл журналу каталогу і лише потім застосовується до знімка в пам'яті.
+Файли груп не переписуються на кожну зміну: фоновий потік періодично ущільнює журнал,
+атомарно записуючи змінені групи і зберігаючи у файлі контрольної точки номер останнього
+застосованого запису для кожної групи. Тому повторне відтворення журналу після збою
+не застосовує жодну зміну двічі.
+
+Рядки групи - незмінний кортеж: запис замінює кортеж лише зміненої групи, тож
+читання однієї групи не потребує блокувань, а вартість запису залежить лише від
+розміру цієї групи. Узгоджений знімок усіх груп (snapshot) копіюється один раз
+після змін і повторно використовується, доки групи не зміняться.
+
+Журнал розрахований на один процес: ущільнення атомарно замінює файл журналу, і
+процес, що тримає відкритим старий файл, дописував би в уже видалений файл. Тому
+GroupLog на час роботи бере виключне блокування файлу .group_wal.lock у каталозі,
+і другий журнал того самого каталогу (в іншому чи тому самому процесі) не
+відкривається. Поки журнал увімкнено, файли груп не слід змінювати в обхід нього.
+"""
+
+import os
+import json
+import threading
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from group_cache import stat_signature
+from external_sort import atomic_write
+
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+    import msvcrt
+
+# Назви службових файлів у каталозі груп (без розширення .txt, тож не вважаються групами)
+LOG_FILE_NAME = '.group_wal.log'
+CHECKPOINT_FILE_NAME = '.group_wal.checkpoint'
+LOCK_FILE_NAME = '.group_wal.lock'
+
+# Операції журналу
+OP_ADD = 'add'
+OP_UPDATE = 'update'
+OP_DELETE = 'delete'
+OP_REPLACE = 'replace'
+
+Rows = Tuple[Tuple[str, float], ...]
+
+
+def _acquire_lock(path: str) -> int:
+    """
+    Бере виключне блокування файлу без очікування.
+
+    Args:
+        path: Шлях до файлу блокування (створюється за потреби)
+
+    Returns:
+        Дескриптор файлу, який тримає блокування
+
+    Raises:
+        ValueError: Якщо файл уже заблоковано іншим журналом
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        os.close(fd)
+        raise ValueError(f"Журнал змін каталогу вже відкрито: {os.path.dirname(path)}")
+    return fd
+
+
+def _release_lock(fd: int) -> None:
+    if fcntl is None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    os.close(fd)
+
+
+def apply_operation(rows: Rows, record: dict) -> Rows:
+    """
+    Застосовує один запис журналу до рядків групи.
+
+    Args:
+        rows: Поточні рядки групи
+        record: Запис журналу
+
+    Returns:
+        Нові рядки групи
+    """
+    op = record['op']
+    if op == OP_ADD:
+        return rows + tuple((name, float(avg_grade)) for name, avg_grade in record['rows'])
+    if op == OP_REPLACE:
+        return tuple((name, float(avg_grade)) for name, avg_grade in record['rows'])
+    if op == OP_UPDATE:
+        name = record['name']
+        avg_grade = float(record['grade'])
+        return tuple((row_name, avg_grade if row_name == name else row_grade) for row_name, row_grade in rows)
+    if op == OP_DELETE:
+        return tuple(row for row in rows if row[0] != record['name'])
+    raise ValueError(f"Невідома операція журналу: {op}")
+
+
+class GroupLog:
+    """
+    Журнал змін каталогу груп зі знімком у пам'яті та фоновим ущільненням.
+    """
+
+    def __init__(self, directory_path: str, read_group: Callable[[str], List[Tuple[str, float]]],
+                 write_group: Callable[[str, Iterable[Tuple[str, float]]], None],
+                 sync_interval: float = 0.01, compact_interval: float = 5.0,
+                 compact_threshold: int = 10000, durable: bool = True):
+        """
+        Відкриває журнал каталогу і відтворює записи, ще не перенесені у файли груп.
+
+        Args:
+            directory_path: Шлях до каталогу з файлами груп
+            read_group: Функція, яка читає групу з файлу (назва_групи -> рядки)
+            write_group: Функція, яка атомарно перезаписує файл групи
+            sync_interval: Найдовший інтервал (у секундах) між синхронізаціями журналу на диск
+            compact_interval: Як часто (у секундах) фоновий потік ущільнює журнал
+            compact_threshold: Кількість записів, після якої ущільнення запускається позачергово
+            durable: True - зміна повертається лише після fsync журналу (fsync спільний
+                     для всіх змін, що надійшли за цей час)
+
+        Raises:
+            ValueError: Якщо журнал цього каталогу вже відкрито
+        """
+        self.directory_path = directory_path
+        self.read_group = read_group
+        self.write_group = write_group
+        self.sync_interval = sync_interval
+        self.compact_interval = compact_interval
+        self.compact_threshold = compact_threshold
+        self.durable = durable
+        self.log_path = os.path.join(directory_path, LOG_FILE_NAME)
+        self.checkpoint_path = os.path.join(directory_path, CHECKPOINT_FILE_NAME)
+
+        # Завантажені групи; кортеж групи замінюється під блокуванням запису, читається без нього
+        self._groups: Dict[str, Rows] = {}
+        # Копія _groups для snapshot(); None - групи змінилися після останньої копії
+        self._snapshot: Optional[Mapping[str, Rows]] = None
+        # Записи журналу, ще не застосовані до незавантажених груп: {група: [запис, ...]}
+        self._pending: Dict[str, List[dict]] = {}
+        # Рядки журналу, ще не перенесені у файли груп: [(seq, група, рядок JSON), ...]
+        self._tail: List[Tuple[int, str, str]] = []
+        self._checkpoints: Dict[str, dict] = {}
+        self._last_seq = 0
+        self._synced_seq = 0
+        self._written_seq = 0
+
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._synced = threading.Condition(threading.Lock())
+        self._wakeup = threading.Event()
+        self._compact_now = threading.Event()
+        self._stop = threading.Event()
+        self._closed = False
+
+        self._lock_fd = _acquire_lock(os.path.join(directory_path, LOCK_FILE_NAME))
+        try:
+            self._load_checkpoints()
+            self._replay()
+            self._fd = open(self.log_path, 'a', encoding='utf-8', newline='\n')
+        except BaseException:
+            _release_lock(self._lock_fd)
+            raise
+
+        self._sync_thread = threading.Thread(target=self._sync_loop, name='group-wal-sync', daemon=True)
+        self._compact_thread = threading.Thread(target=self._compact_loop, name='group-wal-compact', daemon=True)
+        self._sync_thread.start()
+        self._compact_thread.start()
+
+    def __enter__(self) -> 'GroupLog':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # Відновлення
+
+    def _load_checkpoints(self) -> None:
+        """Читає контрольні точки і з'ясовує, чи завершилося перервано ущільнення."""
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as fd:
+                data = json.load(fd)
+        except (OSError, ValueError):
+            data = {}
+        self._last_seq = data.get('last_seq', 0)
+
+        for group_name, entry in data.get('groups', {}).items():
+            pending = entry.pop('pending', None)
+            if pending is not None:
+                # Файл групи вже замінено, якщо його підпис відрізняється від збереженого до заміни
+                signature = stat_signature(self._group_path(group_name))
+                recorded = tuple(entry['signature']) if entry.get('signature') else None
+                if signature != recorded:
+                    entry['seq'] = pending
+                    entry['signature'] = signature
+            self._checkpoints[group_name] = entry
+
+    def _replay(self) -> None:
+        """Читає журнал і відкладає записи, яких ще немає у файлах груп."""
+        try:
+            fd = open(self.log_path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            return
+        with fd:
+            for line in fd:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Обірваний останній рядок після збою посеред запису
+                    break
+                seq = record['seq']
+                group_name = record['group']
+                self._last_seq = max(self._last_seq, seq)
+                if seq <= self._checkpoints.get(group_name, {}).get('seq', 0):
+                    continue
+                self._pending.setdefault(group_name, []).append(record)
+                self._tail.append((seq, group_name, line if line.endswith('\n') else line + '\n'))
+        self._written_seq = self._synced_seq = self._last_seq
+        # Переписуємо журнал без обірваного хвоста та вже перенесених рядків,
+        # щоб нові записи не опинилися після пошкодженого рядка
+        self._rewrite_log()
+
+    def _group_path(self, group_name: str) -> str:
+        return os.path.join(self.directory_path, f"{group_name}.txt")
+
+    # Читання
+
+    def snapshot(self) -> Mapping[str, Rows]:
+        """
+        Повертає узгоджений знімок усіх завантажених груп. Знімок не змінюється:
+        після запису наступний виклик копіює групи заново (O(кількості груп)),
+        а без записів повертає ту саму копію.
+
+        Returns:
+            Незмінний словник {назва_групи: кортеж рядків}
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = MappingProxyType(dict(self._groups))
+                snapshot = self._snapshot
+        return snapshot
+
+    def group_names(self) -> List[str]:
+        """
+        Повертає назви груп, про які знає журнал (включно з ще не записаними на диск).
+
+        Returns:
+            Список назв груп
+        """
+        with self._lock:
+            return list(self._groups.keys() | self._pending.keys())
+
+    def has_group(self, group_name: str) -> bool:
+        """
+        Перевіряє, чи існує група у знімку, у журналі або на диску.
+
+        Args:
+            group_name: Назва групи
+
+        Returns:
+            True, якщо група існує
+        """
+        return (group_name in self._groups or group_name in self._pending
+                or os.path.exists(self._group_path(group_name)))
+
+    def rows(self, group_name: str) -> Rows:
+        """
+        Повертає рядки групи зі знімка; група, якої ще немає у знімку, завантажується
+        з файлу з відтворенням журналу (один раз).
+
+        Args:
+            group_name: Назва групи
+
+        Returns:
+            Кортеж рядків (ім'я студента, середній бал)
+        """
+        rows = self._groups.get(group_name)
+        if rows is None:
+            with self._lock:
+                rows = self._materialize(group_name)
+        return rows
+
+    def _materialize(self, group_name: str) -> Rows:
+        """Завантажує групу у знімок (викликається під блокуванням запису)."""
+        rows = self._groups.get(group_name)
+        if rows is not None:
+            return rows
+        rows = tuple(self.read_group(group_name)) if os.path.exists(self._group_path(group_name)) else ()
+        for record in self._pending.pop(group_name, ()):
+            rows = apply_operation(rows, record)
+        self._publish(group_name, rows)
+        return rows
+
+    def _publish(self, group_name: str, rows: Rows) -> None:
+        self._groups[group_name] = rows
+        self._snapshot = None
+
+    # Запис
+
+    def log(self, group_name: str, op: str, **fields) -> Rows:
+        """
+        Дописує зміну у журнал і застосовує її до знімка.
+
+        Args:
+            group_name: Назва групи
+            op: Операція (add, update, delete або replace)
+            fields: Поля операції: rows для add/replace, name і grade для update, name для delete
+
+        Returns:
+            Нові рядки групи
+        """
+        if 'rows' in fields:
+            fields['rows'] = [(str(name), float(avg_grade)) for name, avg_grade in fields['rows']]
+        with self._lock:
+            if self._closed:
+                raise ValueError("Журнал змін закрито.")
+            rows = self._materialize(group_name)
+            record = dict(fields, op=op, group=group_name, seq=self._last_seq + 1)
+            rows = apply_operation(rows, record)
+
+            line = json.dumps(record, ensure_ascii=False) + '\n'
+            self._fd.write(line)
+            self._fd.flush()
+            self._last_seq = record['seq']
+            self._written_seq = record['seq']
+            self._tail.append((record['seq'], group_name, line))
+            self._publish(group_name, rows)
+            seq = record['seq']
+            tail_size = len(self._tail)
+
+        self._wakeup.set()
+        if tail_size >= self.compact_threshold:
+            self._compact_now.set()
+        if self.durable:
+            self.wait_synced(seq)
+        return rows
+
+    def wait_synced(self, seq: Optional[int] = None) -> None:
+        """
+        Чекає, поки журнал буде синхронізовано на диск щонайменше до запису seq.
+
+        Args:
+            seq: Номер запису (None - останній дописаний)
+        """
+        if seq is None:
+            seq = self._written_seq
+        with self._synced:
+            while self._synced_seq < seq and not self._closed:
+                self._synced.wait(self.sync_interval)
+
+    def _sync_once(self) -> None:
+        with self._lock:
+            seq = self._written_seq
+            if seq <= self._synced_seq or self._fd.closed:
+                return
+            fd = self._fd.fileno()
+        # fsync виконується без блокування запису: нові записи тим часом накопичуються
+        # для наступної синхронізації
+        os.fsync(fd)
+        with self._synced:
+            self._synced_seq = max(self._synced_seq, seq)
+            self._synced.notify_all()
+
+    def _sync_loop(self) -> None:
+        while not self._stop.is_set():
+            self._wakeup.wait(self.sync_interval)
+            self._wakeup.clear()
+            try:
+                self._sync_once()
+            except (OSError, ValueError):
+                # Файл журналу закрито або замінено під час ущільнення
+                continue
+
+    # Ущільнення
+
+    def _save_checkpoints(self) -> None:
+        data = {'last_seq': self._last_seq, 'groups': self._checkpoints}
+        atomic_write(self.checkpoint_path, lambda fd: json.dump(data, fd, ensure_ascii=False))
+
+    def _rewrite_log(self) -> None:
+        """Переписує журнал лише з рядків, ще не перенесених у файли груп."""
+        lines = [line for _, _, line in self._tail]
+        atomic_write(self.log_path, lambda fd: fd.writelines(lines))
+
+    def compact(self) -> int:
+        """
+        Переносить зміни з журналу у файли груп і скорочує журнал.
+        Файли груп записуються без блокування запису; нові зміни тим часом
+        продовжують дописуватися у журнал.
+
+        Returns:
+            Кількість перезаписаних файлів груп
+        """
+        with self._compact_lock:
+            with self._lock:
+                if not self._tail:
+                    return 0
+                targets = {}
+                for seq, group_name, _ in self._tail:
+                    targets[group_name] = seq
+                # Незавантажені групи спершу відтворюємо, щоб записати їхній актуальний стан
+                snapshot = {group_name: self._materialize(group_name) for group_name in targets}
+
+            # Крок 1: фіксуємо намір, щоб відновлення знало, який номер запису
+            # відповідає новому файлу групи
+            for group_name, seq in targets.items():
+                entry = self._checkpoints.setdefault(group_name, {'seq': 0, 'signature': None})
+                entry['signature'] = stat_signature(self._group_path(group_name))
+                entry['pending'] = seq
+            with self._lock:
+                self._save_checkpoints()
+
+            # Крок 2: атомарно перезаписуємо групи зі знімка
+            for group_name in targets:
+                self.write_group(group_name, snapshot[group_name])
+                entry = self._checkpoints[group_name]
+                entry['seq'] = entry.pop('pending')
+                entry['signature'] = stat_signature(self._group_path(group_name))
+
+            # Крок 3: зберігаємо контрольні точки і викидаємо перенесені рядки журналу
+            with self._lock:
+                self._save_checkpoints()
+                self._tail = [item for item in self._tail
+                              if item[0] > self._checkpoints.get(item[1], {}).get('seq', 0)]
+                self._fd.close()
+                self._rewrite_log()
+                self._fd = open(self.log_path, 'a', encoding='utf-8', newline='\n')
+                # Щойно переписаний журнал уже синхронізовано атомарним записом
+                self._synced_seq = max(self._synced_seq, self._written_seq)
+            with self._synced:
+                self._synced.notify_all()
+            return len(targets)
+
+    def _compact_loop(self) -> None:
+        while not self._stop.is_set():
+            self._compact_now.wait(self.compact_interval)
+            self._compact_now.clear()
+            if self._stop.is_set():
+                return
+            try:
+                self.compact()
+            except Exception as e:
+                print(f"Помилка при ущільненні журналу змін: {e}")
+
+    def close(self) -> None:
+        """Ущільнює журнал, зупиняє фонові потоки і закриває файл журналу."""
+        if self._closed:
+            return
+        self.compact()
+        with self._lock:
+            self._closed = True
+            self._fd.flush()
+            os.fsync(self._fd.fileno())
+            self._fd.close()
+            _release_lock(self._lock_fd)
+        self._stop.set()
+        self._wakeup.set()
+        self._compact_now.set()
+        with self._synced:
+            self._synced.notify_all()
+        self._sync_thread.join()
+        self._compact_thread.join()
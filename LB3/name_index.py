@@ -0,0 +1,386 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Інвертований триграмний індекс імен студентів для всього каталогу груп.
+Індекс зберігається у файлі поруч із групами, перевіряється за os.stat кожного файлу
+та оновлюється інкрементально при записі чи дозаписі групи.
+"""
+
+import os
+import re
+import json
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from group_cache import stat_signature
+
+# Назва файлу індексу у каталозі груп (не має розширення .txt, тож не вважається групою)
+INDEX_FILE_NAME = '.name_index.json'
+INDEX_VERSION = 1
+
+# Шляхи виконання запиту
+PATH_INDEX = 'index'
+PATH_SCAN = 'scan'
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Повертає множину триграм рядка (у нижньому регістрі).
+
+    Args:
+        text: Вхідний рядок
+
+    Returns:
+        Множина триграм
+    """
+    text = text.lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def required_literals(pattern: str) -> Optional[List[str]]:
+    """
+    Виділяє з регулярного виразу літерали, які обов'язково присутні в кожному збігу.
+    Аналіз консервативний: усе, що стоїть у групах, класах символів чи під квантифікаторами,
+    які дозволяють нуль повторень, ігнорується.
+
+    Args:
+        pattern: Регулярний вираз
+
+    Returns:
+        Список обов'язкових літералів або None, якщо вираз неможливо проаналізувати
+    """
+    try:
+        if re.compile(pattern).flags & re.VERBOSE:
+            return None
+    except re.error:
+        return None
+
+    literals = []
+    run = []
+    depth = 0
+    i = 0
+    n = len(pattern)
+
+    def flush():
+        if run:
+            literals.append(''.join(run))
+            run.clear()
+
+    while i < n:
+        c = pattern[i]
+        if c == '\\':
+            nxt = pattern[i + 1] if i + 1 < n else ''
+            if nxt in ('x', 'u', 'U', 'N') or nxt.isdigit():
+                # \x41, \u0410, \N{...}, вісімкові коди та зворотні посилання займають більше
+                # двох символів; без їх розбору залишок був би хибним літералом
+                return None
+            if depth == 0 and nxt and not nxt.isalnum():
+                run.append(nxt)
+            else:
+                # Класи (\d, \w...) та якорі (\b) розривають літерал
+                flush()
+            i += 2
+            continue
+        if c == '[':
+            flush()
+            i += 1
+            if i < n and pattern[i] == '^':
+                i += 1
+            if i < n and pattern[i] == ']':
+                i += 1
+            while i < n and pattern[i] != ']':
+                i += 2 if pattern[i] == '\\' else 1
+            i += 1
+            continue
+        if c == '(':
+            depth += 1
+            flush()
+        elif c == ')':
+            depth -= 1
+            flush()
+        elif c == '|':
+            if depth == 0:
+                # Альтернатива на верхньому рівні: жоден літерал не є обов'язковим
+                return []
+            flush()
+        elif c in '*?{':
+            # Попередній символ може бути відсутнім
+            if depth == 0 and run:
+                run.pop()
+            flush()
+            if c == '{':
+                close = pattern.find('}', i)
+                if close != -1:
+                    i = close
+        elif c == '+':
+            flush()
+        elif c in '.^$':
+            flush()
+        elif depth == 0:
+            run.append(c)
+        i += 1
+
+    flush()
+    return literals
+
+
+class NameIndex:
+    """
+    Триграмний індекс імен студентів по всіх групах каталогу.
+    Для кожної групи зберігаються рядки (ім'я, бал), підпис файлу та локальні списки
+    позицій для кожної триграми; глобально - множина груп для кожної триграми.
+    """
+
+    def __init__(self, directory_path: str, read_group: Callable[[str], List[Tuple[str, float]]],
+                 index_path: Optional[str] = None, max_age: float = 0.0):
+        """
+        Ініціалізація індексу.
+
+        Args:
+            directory_path: Шлях до директорії з файлами груп
+            read_group: Функція, що читає групу за назвою і повертає список (ім'я, бал)
+            index_path: Шлях до файлу індексу (за замовчуванням - у каталозі груп)
+            max_age: Скільки секунд після звірки пошук довіряє індексу без повторного
+                os.stat файлів; 0 - звіряти з каталогом перед кожним пошуком
+        """
+        self.directory_path = directory_path
+        self.read_group = read_group
+        self.index_path = index_path or os.path.join(directory_path, INDEX_FILE_NAME)
+        self.max_age = max_age
+        # {група: {'signature': (mtime_ns, розмір), 'names': [...], 'grades': [...]}}
+        self.groups = {}
+        # {група: {триграма: [позиції рядків]}}
+        self._group_postings = {}
+        # {триграма: {групи}}
+        self._postings = {}
+        self._dirty = False
+        self._last_refresh = None
+
+    def load(self) -> bool:
+        """
+        Завантажує збережений індекс з файлу.
+
+        Returns:
+            True, якщо індекс завантажено, False - якщо файлу немає або він пошкоджений
+        """
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as fd:
+                data = json.load(fd)
+        except (OSError, ValueError):
+            return False
+        if data.get('version') != INDEX_VERSION:
+            return False
+
+        self.groups.clear()
+        self._group_postings.clear()
+        self._postings.clear()
+        for group_name, entry in data.get('groups', {}).items():
+            rows = list(zip(entry['names'], entry['grades']))
+            signature = entry['signature']
+            self._set_group(group_name, rows, tuple(signature) if signature else None)
+        self._dirty = False
+        return True
+
+    def save(self) -> bool:
+        """
+        Атомарно зберігає індекс у файл.
+
+        Returns:
+            True, якщо збереження успішне, False - інакше
+        """
+        data = {
+            'version': INDEX_VERSION,
+            'groups': {
+                group_name: {
+                    'signature': list(entry['signature']) if entry['signature'] else None,
+                    'names': entry['names'],
+                    'grades': entry['grades'],
+                }
+                for group_name, entry in self.groups.items()
+            },
+        }
+        tmp_path = self.index_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as fd:
+                json.dump(data, fd, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"Помилка при збереженні індексу імен: {e}")
+            return False
+        self._dirty = False
+        return True
+
+    def build(self) -> None:
+        """Завантажує збережений індекс (якщо є) і звіряє його з каталогом."""
+        self.load()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Звіряє індекс з каталогом: перечитує лише нові та змінені файли, видаляє зниклі групи.
+        Якщо індекс змінився, він зберігається на диск.
+        """
+        try:
+            file_names = os.listdir(self.directory_path)
+        except OSError as e:
+            print(f"Помилка при пошуку файлів груп: {e}")
+            file_names = []
+
+        present = set()
+        for file_name in file_names:
+            if not file_name.endswith('.txt'):
+                continue
+            group_name = file_name[:-4]
+            present.add(group_name)
+            signature = stat_signature(os.path.join(self.directory_path, file_name))
+            entry = self.groups.get(group_name)
+            if signature is not None and (entry is None or entry['signature'] != signature):
+                self.update_group(group_name, self.read_group(group_name), signature)
+
+        for group_name in list(self.groups):
+            if group_name not in present:
+                self.drop_group(group_name)
+
+        self._last_refresh = time.monotonic()
+        if self._dirty:
+            self.save()
+
+    def update_group(self, group_name: str, rows: List[Tuple[str, float]],
+                     signature: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Замінює рядки групи в індексі (після перезапису файлу).
+
+        Args:
+            group_name: Назва групи
+            rows: Список кортежів (ім'я студента, середній бал)
+            signature: Підпис файлу після запису (якщо None - береться поточний)
+        """
+        if signature is None:
+            signature = stat_signature(self._group_path(group_name))
+        self.drop_group(group_name)
+        self._set_group(group_name, rows, signature)
+        self._dirty = True
+
+    def append_rows(self, group_name: str, rows: List[Tuple[str, float]],
+                    old_signature: Optional[Tuple[int, int]]) -> None:
+        """
+        Додає дописані у файл рядки до індексу без переіндексації всієї групи.
+        Якщо до дозапису індекс не відповідав файлу, група переіндексовується з диску.
+
+        Args:
+            group_name: Назва групи
+            rows: Дописані рядки
+            old_signature: Підпис файлу до дозапису
+        """
+        entry = self.groups.get(group_name)
+        new_signature = stat_signature(self._group_path(group_name))
+        if entry is None or old_signature is None or entry['signature'] != old_signature:
+            self.update_group(group_name, self.read_group(group_name), new_signature)
+            return
+
+        postings = self._group_postings[group_name]
+        start = len(entry['names'])
+        for offset, (name, avg_grade) in enumerate(rows):
+            entry['names'].append(name)
+            entry['grades'].append(avg_grade)
+            self._index_name(group_name, postings, name, start + offset)
+        entry['signature'] = new_signature
+        self._dirty = True
+
+    def drop_group(self, group_name: str) -> None:
+        """
+        Видаляє групу з індексу.
+
+        Args:
+            group_name: Назва групи
+        """
+        if self.groups.pop(group_name, None) is None:
+            return
+        for gram in self._group_postings.pop(group_name, {}):
+            groups = self._postings.get(gram)
+            if groups is not None:
+                groups.discard(group_name)
+                if not groups:
+                    del self._postings[gram]
+        self._dirty = True
+
+    def search(self, pattern: str) -> Tuple[Dict[str, List[Tuple[str, float]]], str]:
+        """
+        Шукає студентів за регулярним виразом (без урахування регістру) у всіх групах.
+        Якщо вираз містить обов'язковий літерал довжиною від трьох символів, перевіряються
+        лише рядки-кандидати з індексу; інакше перебираються всі проіндексовані рядки.
+        Перед пошуком індекс звіряється з каталогом (refresh), якщо з останньої звірки
+        минуло більше max_age секунд.
+
+        Args:
+            pattern: Ім'я студента або регулярний вираз
+
+        Returns:
+            Кортеж (словник {назва_групи: [(ім'я_студента, середній_бал), ...]}, шлях виконання)
+        """
+        if (self._last_refresh is None or self.max_age <= 0
+                or time.monotonic() - self._last_refresh > self.max_age):
+            self.refresh()
+
+        compiled = re.compile(pattern, re.IGNORECASE)
+        literals = required_literals(pattern) or []
+        grams = set()
+        for literal in literals:
+            grams |= trigrams(literal)
+
+        results = {}
+        if not grams:
+            for group_name, entry in self.groups.items():
+                found = [(name, grade) for name, grade in zip(entry['names'], entry['grades'])
+                         if compiled.search(name)]
+                if found:
+                    results[group_name] = found
+            return results, PATH_SCAN
+
+        # Спершу звужуємо множину груп, потім - рядків усередині кожної групи
+        ordered = sorted(grams, key=lambda g: len(self._postings.get(g, ())))
+        candidate_groups = set(self._postings.get(ordered[0], ()))
+        for gram in ordered[1:]:
+            if not candidate_groups:
+                break
+            candidate_groups &= self._postings.get(gram, set())
+
+        for group_name in self.groups:
+            if group_name not in candidate_groups:
+                continue
+            postings = self._group_postings[group_name]
+            rows = set(postings[ordered[0]])
+            for gram in ordered[1:]:
+                rows.intersection_update(postings[gram])
+            entry = self.groups[group_name]
+            found = [(entry['names'][i], entry['grades'][i]) for i in sorted(rows)
+                     if compiled.search(entry['names'][i])]
+            if found:
+                results[group_name] = found
+        return results, PATH_INDEX
+
+    def _group_path(self, group_name: str) -> str:
+        return os.path.join(self.directory_path, f"{group_name}.txt")
+
+    def _set_group(self, group_name: str, rows: List[Tuple[str, float]],
+                   signature: Optional[Tuple[int, int]]) -> None:
+        """Додає групу до індексу (групи в індексі ще немає)."""
+        entry = {'signature': signature, 'names': [], 'grades': []}
+        postings = {}
+        for position, (name, avg_grade) in enumerate(rows):
+            entry['names'].append(name)
+            entry['grades'].append(avg_grade)
+            self._index_name(group_name, postings, name, position)
+        self.groups[group_name] = entry
+        self._group_postings[group_name] = postings
+
+    def _index_name(self, group_name: str, postings: Dict[str, List[int]], name: str, position: int) -> None:
+        """Додає триграми імені до локальних та глобальних списків."""
+        for gram in trigrams(name):
+            positions = postings.get(gram)
+            if positions is None:
+                postings[gram] = [position]
+                self._postings.setdefault(gram, set()).add(group_name)
+            else:
+                positions.append(position)
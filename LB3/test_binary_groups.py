@@ -0,0 +1,69 @@
+"""Тести двійкового формату файлів груп (binary_groups.py)."""
+
+import struct
+
+import pytest
+
+from binary_groups import HEADER, MAGIC, VERSION_WIDE, BinaryGroupFile, write_binary_group
+from group_columns import grade_statistics
+
+ROWS = [('Іван Петренко', 4.5), ('Олена', 3.25), ('', 0.0), ('Ян', 5.0), ('Петро Іваненко', 1 / 3)]
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / 'ІП-11.sgb')
+    assert write_binary_group(path, iter(ROWS)) == len(ROWS)
+    with BinaryGroupFile(path) as group:
+        assert len(group) == len(ROWS)
+        # Бал зберігається як float64 без округлення
+        assert list(group) == ROWS
+        assert group.name(-1) == 'Петро Іваненко'
+        with pytest.raises(IndexError):
+            group.name(len(ROWS))
+        assert group.to_columns().names == [name for name, _ in ROWS]
+        assert group.statistics() == grade_statistics(group.to_columns())
+
+
+def test_empty_group(tmp_path):
+    path = str(tmp_path / 'empty.sgb')
+    assert write_binary_group(path, []) == 0
+    with BinaryGroupFile(path) as group:
+        assert list(group) == []
+        assert group.find('Іван') == []
+
+
+def test_find_does_not_match_across_names(tmp_path):
+    path = str(tmp_path / 'group.sgb')
+    write_binary_group(path, [('Анна', 4.0), ('Іван', 3.0), ('Іванна', 5.0)])
+    with BinaryGroupFile(path) as group:
+        assert group.find('Іван') == [('Іван', 3.0), ('Іванна', 5.0)]
+        # "наІ" є лише на стику імен "Анна" та "Іван"
+        assert group.find('наІ') == []
+
+
+def test_reads_wide_offsets(tmp_path):
+    names = [name.encode('utf-8') for name, _ in ROWS[:2]]
+    offsets = [0, len(names[0]), len(names[0]) + len(names[1])]
+    blob = b''.join(names)
+    data = HEADER.pack(MAGIC, VERSION_WIDE, 0, 2, len(blob)) + struct.pack('<3Q', *offsets) + blob
+    data += b'\0' * (-len(data) % 8) + struct.pack('<2d', 4.5, 3.25)
+    path = tmp_path / 'wide.sgb'
+    path.write_bytes(data)
+    with BinaryGroupFile(str(path)) as group:
+        assert list(group) == ROWS[:2]
+
+
+@pytest.mark.parametrize('data', [b'', b'SGB1', b'TEXT' + b'\0' * 20])
+def test_rejects_damaged_files(tmp_path, data):
+    path = tmp_path / 'bad.sgb'
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        BinaryGroupFile(str(path))
+
+
+def test_rejects_truncated_file(tmp_path):
+    path = tmp_path / 'group.sgb'
+    write_binary_group(str(path), ROWS)
+    path.write_bytes(path.read_bytes()[:-8])
+    with pytest.raises(ValueError):
+        BinaryGroupFile(str(path))
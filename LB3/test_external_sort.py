@@ -0,0 +1,60 @@
+"""Тести зовнішнього сортування та атомарного запису (external_sort.py)."""
+
+import os
+import random
+
+import pytest
+
+import external_sort
+from external_sort import atomic_write, external_sorted
+
+
+def make_rows(count, seed=1):
+    generator = random.Random(seed)
+    # Багато однакових балів, щоб перевірити стабільність
+    return [(f"Студент {i}", generator.randint(0, 20) / 4) for i in range(count)]
+
+
+@pytest.mark.parametrize('reverse', [False, True])
+@pytest.mark.parametrize('max_fan_in', [2, 3, 64])
+def test_matches_sorted(tmp_path, reverse, max_fan_in):
+    rows = make_rows(2000)
+    with external_sorted(iter(rows), reverse, memory_budget=2000, tmp_dir=str(tmp_path),
+                         max_fan_in=max_fan_in) as merged:
+        assert list(merged) == sorted(rows, key=lambda row: row[1], reverse=reverse)
+    assert os.listdir(tmp_path) == []
+
+
+def test_open_runs_are_bounded(tmp_path, monkeypatch):
+    open_runs = [0, 0]
+    read_run = external_sort._read_run
+
+    def counting_read_run(path):
+        open_runs[0] += 1
+        open_runs[1] = max(open_runs)
+        try:
+            yield from read_run(path)
+        finally:
+            open_runs[0] -= 1
+
+    monkeypatch.setattr(external_sort, '_read_run', counting_read_run)
+    rows = make_rows(3000)
+    with external_sorted(iter(rows), memory_budget=1000, tmp_dir=str(tmp_path), max_fan_in=4) as merged:
+        assert list(merged) == sorted(rows, key=lambda row: row[1])
+    assert 0 < open_runs[1] <= 4
+
+
+def test_atomic_write_keeps_file_on_error(tmp_path):
+    path = str(tmp_path / 'group.txt')
+    with open(path, 'w', encoding='utf-8') as fd:
+        fd.write('Іван:4.5\n')
+
+    def failing_write(fd):
+        fd.write('Петро:')
+        raise RuntimeError("збій запису")
+
+    with pytest.raises(RuntimeError):
+        atomic_write(path, failing_write)
+    with open(path, encoding='utf-8') as fd:
+        assert fd.read() == 'Іван:4.5\n'
+    assert os.listdir(tmp_path) == ['group.txt']
@@ -0,0 +1,73 @@
+"""Тести кешу розібраних груп (group_cache.py) та його використання у StudentManager."""
+
+import os
+
+from group_cache import GroupCache, estimate_rows_size, stat_signature
+from LB3Task1 import StudentManager
+
+ROWS = [('Бойко Василь', 4.3), ('Мельник Оксана', 4.7)]
+
+
+def write(path, text, mtime_ns=None):
+    path.write_text(text, encoding='utf-8')
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return str(path)
+
+
+def test_entry_is_invalidated_when_file_changes(tmp_path):
+    path = write(tmp_path / 'А.txt', 'Бойко Василь:4.3\n', 10 ** 18)
+    cache = GroupCache()
+    assert cache.put(path, ROWS[:1])
+    assert cache.get(path) == ROWS[:1]
+    # Копія: зміни викликача не псують кеш
+    cache.get(path).append(ROWS[1])
+    assert cache.get(path) == ROWS[:1]
+
+    write(tmp_path / 'А.txt', 'Бойко Василь:4.5\n', 2 * 10 ** 18)
+    assert cache.get(path) is None
+    assert path not in cache and cache.current_bytes == 0
+    assert (cache.hits, cache.misses) == (3, 1)
+    assert not cache.put(str(tmp_path / 'немає.txt'), ROWS)
+
+
+def test_lru_eviction_by_entries_and_bytes(tmp_path):
+    paths = [write(tmp_path / f'{number}.txt', 'x:1\n') for number in range(3)]
+    cache = GroupCache(max_entries=2)
+    for path in paths:
+        cache.put(path, ROWS)
+    assert paths[0] not in cache and len(cache) == 2
+
+    cache = GroupCache(max_bytes=estimate_rows_size(ROWS) * 2)
+    cache.put(paths[0], ROWS)
+    cache.put(paths[1], ROWS)
+    cache.get(paths[0]) # Тепер найдавніше використаний - paths[1]
+    cache.put(paths[2], ROWS)
+    assert paths[0] in cache and paths[1] not in cache and paths[2] in cache
+    assert not cache.put(paths[0], ROWS * 10)
+    assert paths[0] not in cache
+
+
+def test_extend_requires_matching_signature(tmp_path):
+    path = write(tmp_path / 'А.txt', 'Бойко Василь:4.3\n', 10 ** 18)
+    cache = GroupCache()
+    cache.put(path, ROWS[:1])
+    before = stat_signature(path)
+    write(tmp_path / 'А.txt', 'Бойко Василь:4.3\nМельник Оксана:4.7\n', 2 * 10 ** 18)
+    assert cache.extend(path, before, ROWS[1:])
+    assert cache.get(path) == ROWS
+    assert not cache.extend(path, before, ROWS[1:])
+    assert path not in cache
+
+
+def test_manager_reads_through_cache(tmp_path):
+    manager = StudentManager(str(tmp_path), cache=GroupCache())
+    assert manager.write_to_group_file('А', ROWS)
+    assert manager.read_group_file('А') == ROWS
+    assert manager.append_to_group_file('А', [('Франко Іван', 4.0)])
+    assert manager.read_group_file('А') == ROWS + [('Франко Іван', 4.0)]
+    assert manager.cache.hits >= 1
+
+    # Зміна файлу в обхід менеджера
+    write(tmp_path / 'А.txt', 'Інший Студент:3.0\n', 3 * 10 ** 18)
+    assert manager.read_group_file('А') == [('Інший Студент', 3.0)]
@@ -0,0 +1,65 @@
+"""Тести стовпцевого представлення груп і статистики балів (group_columns.py)."""
+
+import random
+
+import pytest
+
+import group_columns
+from group_columns import GroupColumns, grade_statistics
+
+
+@pytest.fixture(params=['numpy', 'fallback'])
+def backend(request, monkeypatch):
+    if request.param == 'numpy':
+        if group_columns.np is None:
+            pytest.skip("NumPy не встановлено")
+    else:
+        monkeypatch.setattr(group_columns, 'np', None)
+    return request.param
+
+
+def test_statistics(backend):
+    columns = GroupColumns.from_rows([('Іван', 4.0), ('Оля', 5.0), ('Петро', 3.0), ('Марко', 4.0)])
+    stats = grade_statistics(columns, percentiles=(25, 50), top_n=3, bins=2)
+    assert stats['count'] == 4
+    assert stats['mean'] == 4.0 and stats['median'] == 4.0
+    assert (stats['min'], stats['max']) == (3.0, 5.0)
+    assert stats['percentiles'] == {25: 3.75, 50: 4.0}
+    # При рівних балах першим іде студент, що стоїть раніше у групі
+    assert stats['top'] == [('Оля', 5.0), ('Іван', 4.0), ('Марко', 4.0)]
+    assert stats['histogram'] == {'edges': [3.0, 4.0, 5.0], 'counts': [1, 3]}
+
+
+def test_ties_at_top_boundary(backend):
+    columns = GroupColumns.from_rows([(f"Студент {i}", 4.0) for i in range(50)])
+    assert [name for name, _ in grade_statistics(columns, top_n=3)['top']] == \
+        ['Студент 0', 'Студент 1', 'Студент 2']
+
+
+def test_concatenated_groups(backend):
+    columns = GroupColumns.concat({
+        'Група_А': GroupColumns.from_rows([('Іван', 4.5)]),
+        'Група_Б': GroupColumns.from_rows([('Оля', 5.0), ('Петро', 3.0)]),
+    })
+    assert grade_statistics(columns, top_n=2)['top'] == [('Група_Б', 'Оля', 5.0), ('Група_А', 'Іван', 4.5)]
+
+
+@pytest.mark.parametrize('bins', [0, -1, 2.5])
+def test_invalid_bins(backend, bins):
+    columns = GroupColumns.from_rows([('Іван', 4.5)])
+    with pytest.raises(ValueError):
+        grade_statistics(columns, bins=bins)
+
+
+def test_backends_agree(monkeypatch):
+    if group_columns.np is None:
+        pytest.skip("NumPy не встановлено")
+    generator = random.Random(5)
+    columns = GroupColumns.from_rows([(f"Студент {i}", generator.randint(0, 10) / 2) for i in range(500)])
+    expected = grade_statistics(columns, (10, 50, 90), top_n=20, bins=7)
+    monkeypatch.setattr(group_columns, 'np', None)
+    actual = grade_statistics(columns, (10, 50, 90), top_n=20, bins=7)
+    assert actual['top'] == expected['top']
+    assert actual['histogram']['counts'] == expected['histogram']['counts']
+    assert actual['percentiles'] == pytest.approx(expected['percentiles'])
+    assert actual['mean'] == pytest.approx(expected['mean'])
@@ -0,0 +1,66 @@
+"""Тести визначення діалекту, лапок і запису файлів груп (group_format.py)."""
+
+import io
+
+import pytest
+
+from group_format import (COLON_DIALECT, MAX_QUOTED_LINES, TAB_DIALECT, Dialect, append_file_rows,
+                          iter_rows, read_file_rows, sniff_dialect, write_file_rows, write_rows)
+
+
+def parse(text, dialect=COLON_DIALECT):
+    errors = []
+    return list(iter_rows(io.StringIO(text), dialect, errors)), errors
+
+
+@pytest.mark.parametrize('text, dialect', [
+    ('Іван:4.5\r\nПетро:3.0\r\n', Dialect(':', None, 1, '\r\n')),
+    ('Іван:5\nПетро:3.25\n', Dialect(':', None, None, '\n')),
+    ('Ім_я\tСередній_бал\nІван\t4.5\nПетро\t3.0\n', TAB_DIALECT),
+    ('Іван Петренко;4.50\nОля;3.00\n', Dialect(';', None, 2, '\n')),
+    ('Іван Петренко 4.5\nОля 3.5\n', Dialect(' ', None, 1, '\n')),
+])
+def test_sniff_dialect(text, dialect):
+    assert sniff_dialect(text) == dialect
+
+
+def test_quoted_names_round_trip():
+    rows = [('Іван\nМалий', 4.5), ('a"b', 3.0), ('x:y', 2.25), ('Оля', 5.0)]
+    buffer = io.StringIO()
+    write_rows(buffer, rows, COLON_DIALECT)
+    assert parse(buffer.getvalue()) == (rows, [])
+
+
+def test_quote_inside_field_is_literal():
+    # Лапка не на початку поля не відкриває поле в лапках і не поглинає решту файлу
+    assert parse('Іван "Малий:4.5\nПетро:3.0\nОля:5.0') == (
+        [('Іван "Малий', 4.5), ('Петро', 3.0), ('Оля', 5.0)], [])
+
+
+def test_unclosed_quote_is_reported():
+    rows, errors = parse('"Іван Малий:4.5\nПетро:3.0\nОля:5.0')
+    assert rows == [('Петро', 3.0), ('Оля', 5.0)]
+    assert len(errors) == 1
+
+    text = '"Іван\n' + 'рядок\n' * (MAX_QUOTED_LINES * 2) + 'Оля:5.0\n'
+    rows, errors = parse(text)
+    assert rows == [('Оля', 5.0)]
+    assert len(errors) == 1
+
+
+def test_sniffed_precision_keeps_grades(tmp_path):
+    path = str(tmp_path / 'group.txt')
+    with open(path, 'w', encoding='utf-8') as fd:
+        fd.write('Іван:4.5\nПетро:3.0\n')
+    dialect = append_file_rows(path, [('Оля', 4.65), ('Марко', 4.0)], COLON_DIALECT)
+    assert dialect.precision == 1
+    assert read_file_rows(path) == [('Іван', 4.5), ('Петро', 3.0), ('Оля', 4.65), ('Марко', 4.0)]
+
+
+def test_atomic_rewrite_keeps_dialect(tmp_path):
+    path = str(tmp_path / 'group.txt')
+    rows = [('Іван', 4.5), ('Петро', 3.0)]
+    assert write_file_rows(path, rows, TAB_DIALECT, atomic=True) == 2
+    with open(path, encoding='utf-8') as fd:
+        assert fd.read() == 'Ім_я\tСередній_бал\nІван\t4.5\nПетро\t3.0\n'
+    assert read_file_rows(path) == rows
@@ -0,0 +1,104 @@
+"""Тести журналу змін груп (group_wal.py): відновлення після збою та блокування каталогу."""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from group_wal import GroupLog, LOG_FILE_NAME, OP_ADD, OP_DELETE, OP_UPDATE
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Спільні для тесту й процесу, що "падає", функції читання та запису файлу групи
+FILE_FUNCTIONS = '''
+import os
+
+def read_group(directory, group_name):
+    with open(os.path.join(directory, group_name + '.txt'), encoding='utf-8') as fd:
+        return [(name, float(grade)) for name, grade in (line.rstrip('\\n').split(',') for line in fd)]
+
+def write_group(directory, group_name, rows):
+    path = os.path.join(directory, group_name + '.txt')
+    with open(path + '.tmp', 'w', encoding='utf-8') as fd:
+        fd.writelines(f"{name},{grade}\\n" for name, grade in rows)
+    os.replace(path + '.tmp', path)
+'''
+exec(FILE_FUNCTIONS)
+
+
+def open_log(directory, **options):
+    return GroupLog(str(directory), lambda name: read_group(str(directory), name),
+                    lambda name, rows: write_group(str(directory), name, rows),
+                    compact_interval=3600, **options)
+
+
+def crash(directory, script):
+    """Виконує script з відкритим журналом log в окремому процесі, що завершується без close()."""
+    code = FILE_FUNCTIONS + textwrap.dedent(f'''
+        from group_wal import GroupLog
+        directory = {str(directory)!r}
+        log = GroupLog(directory, lambda name: read_group(directory, name),
+                       lambda name, rows: write_group(directory, name, rows), compact_interval=3600)
+    ''') + textwrap.dedent(script) + '\nos._exit(0)\n'
+    subprocess.run([sys.executable, '-c', code], cwd=HERE, check=True)
+
+
+def test_replays_synced_changes_after_crash(tmp_path):
+    crash(tmp_path, '''
+        log.log('ІП-11', 'add', rows=[('Іван', 90), ('Олена', 85)])
+        log.log('ІП-11', 'update', name='Іван', grade=70)
+        log.log('ІП-12', 'add', rows=[('Петро', 60)])
+        log.log('ІП-12', 'delete', name='Петро')
+    ''')
+    assert not (tmp_path / 'ІП-11.txt').exists()
+    # Обірваний останній рядок журналу (збій посеред запису) відкидається
+    with open(tmp_path / LOG_FILE_NAME, 'a', encoding='utf-8') as fd:
+        fd.write('{"op": "add", "gro')
+
+    with open_log(tmp_path) as log:
+        assert log.rows('ІП-11') == (('Іван', 70.0), ('Олена', 85.0))
+        assert log.rows('ІП-12') == ()
+        log.log('ІП-12', OP_ADD, rows=[('Марія', 95)])
+    assert read_group(str(tmp_path), 'ІП-12') == [('Марія', 95.0)]
+
+
+def test_interrupted_compaction_is_not_applied_twice(tmp_path):
+    # Процес падає одразу після атомарної заміни першого файлу групи під час ущільнення
+    crash(tmp_path, '''
+        log.log('ІП-11', 'add', rows=[('Іван', 90)])
+        log.log('ІП-12', 'add', rows=[('Петро', 60)])
+        def write_and_crash(name, rows):
+            write_group(directory, name, rows)
+            os._exit(0)
+        log.write_group = write_and_crash
+        log.compact()
+    ''')
+    with open_log(tmp_path) as log:
+        assert log.rows('ІП-11') == (('Іван', 90.0),)
+        assert log.rows('ІП-12') == (('Петро', 60.0),)
+    assert read_group(str(tmp_path), 'ІП-11') == [('Іван', 90.0)]
+    assert read_group(str(tmp_path), 'ІП-12') == [('Петро', 60.0)]
+
+
+def test_snapshot_is_immutable_and_reused(tmp_path):
+    with open_log(tmp_path, durable=False) as log:
+        log.log('ІП-11', OP_ADD, rows=[('Іван', 90), ('Олена', 85)])
+        first = log.snapshot()
+        assert log.snapshot() is first
+        with pytest.raises(TypeError):
+            first['ІП-12'] = ()
+
+        log.log('ІП-11', OP_DELETE, name='Іван')
+        log.log('ІП-11', OP_UPDATE, name='Олена', grade=88)
+        assert first['ІП-11'] == (('Іван', 90.0), ('Олена', 85.0))
+        assert log.snapshot()['ІП-11'] == (('Олена', 88.0),)
+
+
+def test_directory_is_locked_while_open(tmp_path):
+    log = open_log(tmp_path)
+    with pytest.raises(ValueError):
+        open_log(tmp_path)
+    log.close()
+    open_log(tmp_path).close()
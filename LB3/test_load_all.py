@@ -0,0 +1,57 @@
+"""Тести паралельного завантаження всіх груп (StudentManager.load_all, завантажити_всі_групи)."""
+
+import importlib
+
+import pytest
+
+from group_cache import GroupCache
+from LB3Task1 import StudentManager
+
+функції = importlib.import_module('LB3Task1_функції')
+
+GROUPS = {
+    'Група_А': 'Бойко Василь:4.3\nМельник Оксана:4.7\n',
+    'Група_Б': 'Франко Іван\t4.0\nКоваль Петро\t3.5\n',
+    'Група_В': 'Шевченко Тарас:5\nбез балу\nЛеся:не число\n',
+    'Група_Г': '',
+}
+EXPECTED = {
+    'Група_А': [('Бойко Василь', 4.3), ('Мельник Оксана', 4.7)],
+    'Група_Б': [('Франко Іван', 4.0), ('Коваль Петро', 3.5)],
+    'Група_В': [('Шевченко Тарас', 5.0)],
+    'Група_Г': [],
+}
+
+
+@pytest.fixture
+def directory(tmp_path):
+    for name, text in GROUPS.items():
+        (tmp_path / f'{name}.txt').write_text(text, encoding='utf-8')
+    return str(tmp_path)
+
+
+@pytest.mark.parametrize('mode', ['serial', 'thread', 'process'])
+def test_modes_give_same_groups_and_errors(directory, mode):
+    manager = StudentManager(directory)
+    groups, errors = manager.load_all(workers=2, mode=mode)
+    assert groups == EXPECTED
+    assert list(groups) == manager.find_group_files()
+    # Помилки повертаються для кожного файлу окремо, а не друкуються
+    assert list(errors) == ['Група_В'] and len(errors['Група_В']) == 2
+
+    function_groups, function_errors = функції.завантажити_всі_групи(directory, 2, mode)
+    assert (function_groups, function_errors) == (groups, errors)
+
+
+def test_unknown_mode(directory):
+    with pytest.raises(ValueError):
+        StudentManager(directory).load_all(mode='gpu')
+
+
+def test_cache_is_filled_only_with_clean_files(directory):
+    manager = StudentManager(directory, cache=GroupCache())
+    manager.load_all(mode='thread')
+    assert len(manager.cache) == 3
+    groups, errors = manager.load_all(mode='thread')
+    assert manager.cache.hits == 3
+    assert groups == EXPECTED and list(errors) == ['Група_В']
@@ -0,0 +1,65 @@
+"""Тести триграмного індексу імен (name_index.py) та його використання у функціях LB3."""
+
+import importlib
+import os
+
+import pytest
+
+from name_index import PATH_INDEX, PATH_SCAN, NameIndex, required_literals
+
+функції = importlib.import_module('LB3Task1_функції')
+
+
+@pytest.fixture
+def directory(tmp_path):
+    (tmp_path / 'Група_А.txt').write_text('Бойко Василь:4.3\nМельник Оксана:4.7\n', encoding='utf-8')
+    (tmp_path / 'Група_Б.txt').write_text('Франко Іван:4.3\n', encoding='utf-8')
+    return str(tmp_path)
+
+
+@pytest.mark.parametrize('pattern, literals', [
+    ('Василь', ['Василь']),
+    ('^Бойко\\s+Вас', ['Бойко', 'Вас']),
+    ('Іван|Петро', []),
+    ('Оле?г', ['Ол', 'г']),
+    ('\\x41ндрій', None),
+    ('(a)\\1bcd', None),
+])
+def test_required_literals(pattern, literals):
+    assert required_literals(pattern) == literals
+
+
+def test_search_uses_index_and_scan(directory):
+    index = функції.створити_індекс_імен(directory)
+    assert index.search('Василь') == ({'Група_А': [('Бойко Василь', 4.3)]}, PATH_INDEX)
+    assert index.search('Ів|Ок') == ({'Група_А': [('Мельник Оксана', 4.7)],
+                                      'Група_Б': [('Франко Іван', 4.3)]}, PATH_SCAN)
+
+
+def test_search_sees_external_changes_immediately(directory):
+    index = функції.створити_індекс_імен(directory)
+    assert index.search('Леся')[0] == {}
+    # Інший процес дописує файл і додає нову групу; пошук одразу бачить зміни
+    with open(os.path.join(directory, 'Група_Б.txt'), 'a', encoding='utf-8') as fd:
+        fd.write('Українка Леся:4.8\n')
+    with open(os.path.join(directory, 'Група_В.txt'), 'w', encoding='utf-8') as fd:
+        fd.write('Костенко Ліна:4.6\n')
+    os.remove(os.path.join(directory, 'Група_А.txt'))
+    assert index.search('Леся')[0] == {'Група_Б': [('Українка Леся', 4.8)]}
+    assert index.search('Ліна')[0] == {'Група_В': [('Костенко Ліна', 4.6)]}
+    assert index.search('Василь')[0] == {}
+
+
+def test_index_survives_reload(directory):
+    функції.створити_індекс_імен(directory)
+    index = NameIndex(directory, lambda name: pytest.fail("група перечитана з диску"))
+    index.build()
+    assert index.search('Іван')[0] == {'Група_Б': [('Франко Іван', 4.3)]}
+
+
+def test_sort_updates_index(directory):
+    index = функції.створити_індекс_імен(directory, max_age=3600)
+    функції.сортувати_групу_за_середнім_балом('Група_А', за_зростанням=False,
+                                             каталог_даних=directory, індекс=index)
+    assert index.groups['Група_А']['names'] == ['Мельник Оксана', 'Бойко Василь']
+    assert index.search('Оксана') == ({'Група_А': [('Мельник Оксана', 4.7)]}, PATH_INDEX)
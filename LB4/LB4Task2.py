@@ -1,66 +1,242 @@
-# Зчитування тексту з файлу
-file_path = "M:\Programing\Python\SkriptLanguage\LB4\ХорЕлементів.txt"  # Шлях до файлу
-try:
-    with open(file_path, 'r', encoding='utf-8') as file:
-        text = file.read()
-except FileNotFoundError:
-    print(f"Помилка: Файл '{file_path}' не знайдено. Переконайтеся, що файл існує в правильній директорії.")
-    exit(1)
-except UnicodeDecodeError:
-    print("Помилка: Проблема з кодуванням файлу. Переконайтеся, що файл збережено в UTF-8.")
-    exit(1)
+import heapq
+import math
+import os
+import sys
+from collections import Counter
+
+from sketches import CountMinSketch, DistinctSample, HeavyHitters, HyperLogLog, word_hash
+
+# Шлях до файлу (поруч зі скриптом)
+file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ХорЕлементів.txt")
+
+# Файл читається порціями по CHUNK_SIZE символів, тож пам'ять залежить від
+# кількості різних слів, а не від розміру файлу
+CHUNK_SIZE = 1 << 20
+
+# Пам'ять (байтів) наближеного режиму за замовчуванням
+APPROX_MEMORY = 4 << 20
+
+# Основні знаки пунктуації з лекційного матеріалу та тексту; видаляються одним translate
+PUNCTUATION = '.,!?;:"\'—-()'
+_DELETE_PUNCTUATION = str.maketrans('', '', PUNCTUATION)
+
 
 # Функція для підрахунку символів
 def count_characters(text):
     # Загальна кількість символів (з пробілами, включаючи всі символи)
     total_chars = len(text)
-    
-    # Кількість символів без пробілів (видаляємо пробіли, табуляцію, переноси рядків)
-    # Використовуємо replace для видалення пробільних символів
-    no_spaces_text = text.replace(' ', '').replace('\n', '').replace('\t', '')
-    chars_no_spaces = len(no_spaces_text)
-    
+
+    # Кількість символів без пробілів (без пробілів, табуляції та переносів рядків)
+    chars_no_spaces = total_chars - text.count(' ') - text.count('\n') - text.count('\t')
+
     return total_chars, chars_no_spaces
 
+
+# Частоти слів: нижній регістр, без пунктуації, розбиття за пробільними символами.
+# Пунктуація не є пробільним символом, тож спочатку рахуються слова як є, а нижній
+# регістр і translate застосовуються лише до різних слів, а не до кожного символу тексту
+def word_frequencies(text, word_freq=None):
+    word_freq = Counter() if word_freq is None else word_freq
+    for word, count in Counter(text.split()).items():
+        word = word.lower().translate(_DELETE_PUNCTUATION)
+        if word:  # Слово лише з пунктуації (наприклад, тире) зникає
+            word_freq[word] += count
+    return word_freq
+
+
+# Загальна кількість слів, кількість різних слів і слів, що зустрічаються один раз
+def word_stats(word_freq):
+    total_words = sum(word_freq.values())
+    unique_words = len(word_freq)
+    one_time_words = sum(1 for count in word_freq.values() if count == 1)
+    return total_words, unique_words, one_time_words
+
+
 # Функція для підрахунку слів
 def count_words(text):
-    # Видаляємо основні знаки пунктуації за допомогою replace
-    # Список основних знаків пунктуації з лекційного матеріалу та тексту
-    punctuation = '.,!?;:"\'—-()'
-    clean_text = text.lower()  # Приводимо до нижнього регістру
-    for char in punctuation:
-        clean_text = clean_text.replace(char, '')
-    
-    # Розділяємо текст на слова
-    words = clean_text.split()
-    
-    # Загальна кількість слів
-    total_words = len(words)
-    
-    # Кількість різних слів (без повторів)
-    # Створюємо словник для підрахунку частоти слів
-    word_freq = {}
-    for word in words:
-        if word in word_freq:
-            word_freq[word] = word_freq[word] + 1
+    return word_stats(word_frequencies(text))
+
+
+class TextStats:
+    """
+    Статистика тексту, що надходить порціями (feed). Слово, розірване межею порцій,
+    не обробляється, доки не надійде пробільний символ після нього (або finish()),
+    тож результати такі самі, як для всього тексту одразу.
+    """
+
+    def __init__(self):
+        self.total_chars = 0
+        self.chars_no_spaces = 0
+        self.word_freq = Counter()
+        self._tail = ''  # Початок слова з кінця попередньої порції (ще не оброблений)
+
+    def feed(self, chunk):
+        total_chars, chars_no_spaces = count_characters(chunk)
+        self.total_chars += total_chars
+        self.chars_no_spaces += chars_no_spaces
+
+        # Відрізаємо незавершене слово в кінці порції (після останнього пробільного символу)
+        cut = len(chunk)
+        while cut and not chunk[cut - 1].isspace():
+            cut -= 1
+        if not cut:
+            self._tail += chunk
+            return
+        self._add_words(self._tail + chunk[:cut])
+        self._tail = chunk[cut:]
+
+    def finish(self):
+        if self._tail:
+            self._add_words(self._tail)
+            self._tail = ''
+        return self
+
+    def _add_words(self, text):
+        word_frequencies(text, self.word_freq)
+
+    def merge(self, other):
+        """
+        Додає статистику іншого завершеного (finish) тексту, наприклад порахованого в
+        іншому процесі. Результат не залежить від порядку злиття.
+        """
+        self.total_chars += other.total_chars
+        self.chars_no_spaces += other.chars_no_spaces
+        self.word_freq.update(other.word_freq)
+        return self
+
+    def result(self):
+        """(total_chars, chars_no_spaces, total_words, unique_words, one_time_words)"""
+        return (self.total_chars, self.chars_no_spaces) + word_stats(self.word_freq)
+
+    def most_common(self, n=10):
+        """
+        n найчастіших слів: [(слово, кількість), ...]. Слова з однаковою кількістю -
+        за абеткою, тож порядок не залежить від порядку порцій і злиття.
+        """
+        return heapq.nsmallest(n, self.word_freq.items(), key=lambda item: (-item[1], item[0]))
+
+
+class ApproxTextStats(TextStats):
+    """
+    Наближена статистика тексту в пам'яті фіксованого розміру (не залежить від
+    кількості різних слів). Кількості символів і слів точні; кількість різних слів
+    оцінює HyperLogLog, слів, що зустрічаються один раз, - частка таких слів у
+    вибірці DistinctSample, помножена на кількість різних слів; найчастіші слова -
+    HeavyHitters над CountMinSketch. Поки різних слів не більше, ніж уміщує вибірка,
+    кількості різних і одноразових слів точні.
+
+    Args:
+        memory: Пам'ять на структури (байтів, не менше MIN_MEMORY + список найчастіших
+            слів). Після списку найчастіших слів: 1/32 - HyperLogLog, 1/2 - CountMinSketch,
+            1/4 - вибірка слів
+        top_k: Скільки найчастіших слів відстежувати
+    """
+
+    MIN_MEMORY = 16 << 10
+
+    def __init__(self, memory=APPROX_MEMORY, top_k=100):
+        if not isinstance(top_k, int) or top_k <= 0:
+            raise ValueError("Кількість найчастіших слів має бути додатним цілим числом.")
+        rest = memory - top_k * DistinctSample.WORD_BYTES if isinstance(memory, int) else 0
+        if rest < self.MIN_MEMORY:
+            raise ValueError(f"Пам'ять наближеного режиму має бути не менше "
+                             f"{self.MIN_MEMORY + top_k * DistinctSample.WORD_BYTES} байтів.")
+        super().__init__()
+        self.word_freq = None
+        self.total_words = 0
+        self.hll = HyperLogLog(min(18, int(math.log2(rest // 32))))
+        depth = 4
+        self.top = HeavyHitters(CountMinSketch(rest // 2 // (8 * depth), depth), top_k)
+        self.sample = DistinctSample(rest // 4 // DistinctSample.WORD_BYTES)
+
+    def _add_words(self, text):
+        # Словник частот лише для однієї порції тексту
+        hll, top, sample = self.hll, self.top, self.sample
+        for word, count in word_frequencies(text).items():
+            value, sample_value = word_hash(word)
+            hll.add_hash(value)
+            top.add(word, value, count)
+            sample.add(word, sample_value, count)
+            self.total_words += count
+
+    def merge(self, other):
+        self.total_chars += other.total_chars
+        self.chars_no_spaces += other.chars_no_spaces
+        self.total_words += other.total_words
+        self.hll.merge(other.hll)
+        self.top.merge(other.top)
+        self.sample.merge(other.sample)
+        return self
+
+    def _estimates(self):
+        """(різні слова, одноразові слова, їх стандартні похибки)."""
+        sample = self.sample
+        fraction, fraction_error = sample.hapax_fraction()
+        if sample.exact:
+            unique_words, unique_error = len(sample.counts), 0.0
         else:
-            word_freq[word] = 1
-    
-    # Кількість різних слів — це кількість ключів у словнику
-    unique_words = len(word_freq.keys())
-    
-    # Кількість унікальних слів, що зустрічаються лише один раз
-    one_time_words = len([word for word, count in word_freq.items() if count == 1])
-    
-    return total_words, unique_words, one_time_words
+            unique_words = self.hll.estimate()
+            unique_error = unique_words * self.hll.relative_error()
+        one_time_words = unique_words * fraction
+        # Похибка добутку незалежних оцінок
+        one_time_error = math.hypot(unique_error * fraction, unique_words * fraction_error)
+        return unique_words, one_time_words, unique_error, one_time_error
+
+    def result(self):
+        """(total_chars, chars_no_spaces, total_words, unique_words, one_time_words); дві останні - оцінки."""
+        unique_words, one_time_words, _, _ = self._estimates()
+        return self.total_chars, self.chars_no_spaces, self.total_words, round(unique_words), round(one_time_words)
+
+    def error_bounds(self):
+        """
+        Стандартні похибки оцінок (0.0 - оцінка точна) і межа завищення частот
+        найчастіших слів.
+
+        Returns:
+            {'unique_words': похибка, 'one_time_words': похибка,
+             'word_count': (завищення, імовірність його перевищення)}
+        """
+        _, _, unique_error, one_time_error = self._estimates()
+        return {'unique_words': unique_error, 'one_time_words': one_time_error,
+                'word_count': self.top.sketch.error_bound()}
+
+    def most_common(self, n=10):
+        """n найчастіших слів з оцінками частоти (не меншими за справжні)."""
+        return self.top.most_common(n)
+
+    def memory_bytes(self):
+        """Пам'ять структур (байтів), без словника частот поточної порції."""
+        return self.hll.memory_bytes() + self.top.memory_bytes() + self.sample.memory_bytes()
+
+
+# Потоковий аналіз файлу порціями по chunk_size символів (у stats, якщо задано)
+def analyze_file(path, chunk_size=CHUNK_SIZE, stats=None):
+    stats = TextStats() if stats is None else stats
+    with open(path, 'r', encoding='utf-8') as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            stats.feed(chunk)
+    return stats.finish()
+
+
+if __name__ == "__main__":
+    # Зчитування та аналіз тексту з файлу
+    try:
+        stats = analyze_file(file_path)
+    except FileNotFoundError:
+        print(f"Помилка: Файл '{file_path}' не знайдено. Переконайтеся, що файл існує в правильній директорії.")
+        sys.exit(1)
+    except UnicodeDecodeError:
+        print("Помилка: Проблема з кодуванням файлу. Переконайтеся, що файл збережено в UTF-8.")
+        sys.exit(1)
 
-# Виконання аналізу
-total_chars, chars_no_spaces = count_characters(text)
-total_words, unique_words, one_time_words = count_words(text)
+    total_chars, chars_no_spaces, total_words, unique_words, one_time_words = stats.result()
 
-# Виведення результатів
-print(f"Загальна кількість символів (з пробілами): {total_chars}")
-print(f"Загальна кількість символів (без пробілів): {chars_no_spaces}")
-print(f"Загальна кількість слів: {total_words}")
-print(f"Кількість різних слів (без повторів): {unique_words}")
-print(f"Кількість унікальних слів (зустрічаються один раз): {one_time_words}")
\ No newline at end of file
+    # Виведення результатів
+    print(f"Загальна кількість символів (з пробілами): {total_chars}")
+    print(f"Загальна кількість символів (без пробілів): {chars_no_spaces}")
+    print(f"Загальна кількість слів: {total_words}")
+    print(f"Кількість різних слів (без повторів): {unique_words}")
+    print(f"Кількість унікальних слів (зустрічаються один раз): {one_time_words}")
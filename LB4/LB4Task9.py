@@ -1,6 +1,336 @@
-file_path = "ХорЕлементів.txt"
-try:
-        text = file.read()
-except FileNotFoundError:
-    exit (1)
+"""
+Статистика тексту (LB4Task2) для багатьох файлів: каталогу або шаблону шляхів.
 
+Файли розподіляються між процесами пулу пакетами. Кожен процес рахує статистику
+файлів свого пакета (для кожного файлу окремо) і зливає їх в одну часткову
+статистику TextStats; головний процес зливає часткові статистики в міру надходження.
+Злиття - це додавання лічильників, тож результат не залежить від кількості
+процесів і порядку файлів і збігається з аналізом усіх файлів по черзі.
+
+    python LB4Task9.py тексти/ --per-file
+    python LB4Task9.py "тексти/**/*.txt" --workers 4 --top 10
+    python LB4Task9.py тексти/ --benchmark
+    python LB4Task9.py тексти/ --approx --memory 8
+
+У наближеному режимі (--approx) пам'ять на словник фіксована (ApproxTextStats):
+кількості різних і одноразових слів та частоти найчастіших слів - оцінки з
+похибками; для окремих файлів відомі лише кількості символів і слів. --compare
+рахує обидва режими й показує похибки оцінок.
+"""
+
+import argparse
+import collections
+import functools
+import glob
+import multiprocessing
+import os
+import sys
+import time
+
+from LB4Task2 import APPROX_MEMORY, ApproxTextStats, TextStats, analyze_file
+
+# Файл за замовчуванням (поруч зі скриптом)
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ХорЕлементів.txt")
+# Шаблон імен файлів при пошуку в каталозі
+DEFAULT_PATTERN = "*.txt"
+# Пакетів на процес: більше - рівномірніше навантаження, менше - менше передач між процесами
+BATCHES_PER_WORKER = 4
+# Найбільша кількість файлів у пакеті
+MAX_BATCH_FILES = 256
+
+# Статистика одного файлу; error - текст помилки (тоді решта полів нульові).
+# У наближеному режимі unique_words і one_time_words - None
+FileReport = collections.namedtuple(
+    'FileReport',
+    'path total_chars chars_no_spaces total_words unique_words one_time_words error')
+
+
+class CorpusReport:
+    """
+    Результат аналізу набору файлів.
+
+    Args:
+        files: Список FileReport (у порядку шляхів)
+        stats: Зведена TextStats (ApproxTextStats у наближеному режимі) усіх прочитаних файлів
+    """
+
+    def __init__(self, files, stats):
+        self.files = files
+        self.stats = stats
+
+    @property
+    def errors(self):
+        """Файли, які не вдалося прочитати."""
+        return [report for report in self.files if report.error]
+
+    def result(self):
+        """(total_chars, chars_no_spaces, total_words, unique_words, one_time_words) для всіх файлів."""
+        return self.stats.result()
+
+    @property
+    def approximate(self):
+        return isinstance(self.stats, ApproxTextStats)
+
+    def most_common(self, n=10):
+        """n найчастіших слів усіх файлів: [(слово, кількість), ...]."""
+        return self.stats.most_common(n)
+
+
+def collect_files(sources, pattern=DEFAULT_PATTERN):
+    """
+    Шляхи файлів (без повторів, відсортовані). Джерело - файл, каталог (файли за
+    pattern у ньому та всіх підкаталогах) або шаблон glob ("**" - будь-які підкаталоги).
+    """
+    if isinstance(sources, str):
+        sources = [sources]
+    paths = set()
+    for source in sources:
+        if os.path.isdir(source):
+            found = glob.glob(os.path.join(source, '**', pattern), recursive=True)
+        elif glob.has_magic(source):
+            found = glob.glob(source, recursive=True)
+        else:
+            found = [source] # Звичайний шлях; якщо файлу немає, це буде в звіті
+        paths.update(os.path.normpath(path) for path in found if not os.path.isdir(path))
+    return sorted(paths)
+
+
+def _read(path, chunk_size, stats):
+    """Аналізує файл у stats; повертає текст помилки або None."""
+    try:
+        analyze_file(path, chunk_size, stats)
+    except FileNotFoundError:
+        return "файл не знайдено"
+    except UnicodeDecodeError:
+        return "файл не в кодуванні UTF-8"
+    except OSError as exc:
+        return exc.strerror or str(exc)
+    return None
+
+
+def _analyze_batch(paths, chunk_size, memory=None):
+    """Статистика кожного файлу пакета та їх злиття (виконується в процесі пулу)."""
+    if memory is not None:
+        return _analyze_batch_approx(paths, chunk_size, memory)
+    reports = []
+    total = TextStats()
+    for path in paths:
+        stats = TextStats()
+        error = _read(path, chunk_size, stats)
+        if error:
+            reports.append(FileReport(path, 0, 0, 0, 0, 0, error))
+        else:
+            reports.append(FileReport(path, *stats.result(), None))
+            total.merge(stats)
+    return reports, total
+
+
+def _analyze_batch_approx(paths, chunk_size, memory):
+    """
+    Наближений режим: усі файли пакета рахуються в одну ApproxTextStats (окрема
+    статистика кожного файлу зайняла б memory байтів). Для файлу - лише кількості
+    символів і слів; прочитана до помилки частина файлу залишається у статистиці.
+    """
+    reports = []
+    total = ApproxTextStats(memory)
+    for path in paths:
+        before = total.total_chars, total.chars_no_spaces, total.total_words
+        error = _read(path, chunk_size, total)
+        if error:
+            total.finish() # Незавершене слово не повинно злитися з першим словом наступного файлу
+            if total.total_chars != before[0]:
+                error += " (прочитану частину враховано)"
+        reports.append(FileReport(path, total.total_chars - before[0], total.chars_no_spaces - before[1],
+                                  total.total_words - before[2], None, None, error))
+    return reports, total
+
+
+def _batches(paths, workers):
+    """
+    Розбиває файли на пакети близького сумарного розміру. Найбільші файли йдуть у
+    перші пакети, щоб довгі задачі почалися раніше.
+    """
+    sizes = {}
+    for path in paths:
+        try:
+            sizes[path] = os.path.getsize(path)
+        except OSError:
+            sizes[path] = 0
+    ordered = sorted(paths, key=sizes.__getitem__, reverse=True)
+    target = sum(sizes.values()) / (workers * BATCHES_PER_WORKER) or 1
+    batches, batch, batch_size = [], [], 0
+    for path in ordered:
+        batch.append(path)
+        batch_size += sizes[path]
+        if batch_size >= target or len(batch) >= MAX_BATCH_FILES:
+            batches.append(batch)
+            batch, batch_size = [], 0
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def analyze_corpus(sources, workers=None, pattern=DEFAULT_PATTERN, chunk_size=1 << 20, memory=None):
+    """
+    Статистика всіх файлів джерел (див. collect_files).
+
+    Args:
+        sources: Шлях, каталог або шаблон glob (чи список таких)
+        workers: Кількість процесів (None - кількість ядер; 1 - без пулу, в цьому процесі)
+        pattern: Шаблон імен файлів для каталогів
+        chunk_size: Розмір порції читання файлу (символів)
+        memory: None - точний режим; інакше - наближений (ApproxTextStats) з пам'яттю
+            memory байтів на процес
+
+    Returns:
+        CorpusReport
+    """
+    paths = collect_files(sources, pattern)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int) or workers <= 0:
+        raise ValueError("Кількість процесів має бути додатним цілим числом.")
+    workers = min(workers, len(paths)) or 1
+    reports = []
+    if workers == 1:
+        batch_reports, total = _analyze_batch(paths, chunk_size, memory)
+        reports.extend(batch_reports)
+    else:
+        total = TextStats() if memory is None else ApproxTextStats(memory)
+        analyze = functools.partial(_analyze_batch, chunk_size=chunk_size, memory=memory)
+        with multiprocessing.Pool(workers) as pool:
+            for batch_reports, stats in pool.imap_unordered(analyze, _batches(paths, workers)):
+                reports.extend(batch_reports)
+                total.merge(stats)
+    reports.sort(key=lambda report: report.path)
+    return CorpusReport(reports, total)
+
+
+def benchmark(sources, pattern=DEFAULT_PATTERN, max_workers=None, repeat=3, memory=None):
+    """
+    Час аналізу джерел для 1, 2, 4, ... процесів (до max_workers, за замовчуванням -
+    кількість ядер) і прискорення відносно одного процесу. Результат кожного
+    запуску порівнюється з результатом одного процесу (у наближеному режимі злиття
+    скетчів дає ті самі оцінки за будь-якої кількості процесів).
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 < max_workers:
+        counts.append(counts[-1] * 2)
+    if max_workers > 1:
+        counts.append(max_workers)
+    paths = collect_files(sources, pattern)
+    megabytes = sum(os.path.getsize(path) for path in paths if os.path.isfile(path)) / 2 ** 20
+    print(f"Файлів: {len(paths)}, {megabytes:.1f} МБ, ядер: {os.cpu_count()}")
+    expected = None
+    base = None
+    for workers in counts:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            report = analyze_corpus(paths, workers, pattern, memory=memory)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        result = report.result()
+        if expected is None:
+            expected, base = result, best
+        elif result != expected:
+            print(f"Помилка: результат для {workers} процесів відрізняється: {result} != {expected}")
+        print(f"Процесів: {workers:3d}  час: {best:8.3f} с  {megabytes / best:8.1f} МБ/с  "
+              f"прискорення: {base / best:5.2f}x")
+
+
+def compare(sources, pattern=DEFAULT_PATTERN, workers=None, memory=APPROX_MEMORY, top=10):
+    """
+    Порівнює наближений режим з точним: оцінка, точне значення, похибка та
+    стандартна похибка, яку повідомляє ApproxTextStats.
+    """
+    start = time.perf_counter()
+    exact = analyze_corpus(sources, workers, pattern)
+    exact_time = time.perf_counter() - start
+    start = time.perf_counter()
+    approx = analyze_corpus(sources, workers, pattern, memory=memory)
+    approx_time = time.perf_counter() - start
+    bounds = approx.stats.error_bounds()
+    exact_result, approx_result = exact.result(), approx.result()
+    print(f"Точний режим: {exact_time:.3f} с, словник: {len(exact.stats.word_freq)} слів")
+    print(f"Наближений режим: {approx_time:.3f} с, пам'ять структур: {approx.stats.memory_bytes() / 2 ** 20:.2f} МБ")
+    print(f"{'':34} {'точно':>10} {'оцінка':>10} {'похибка':>9} {'ст. похибка':>11}")
+    for name, index in (("Кількість різних слів", 3), ("Кількість одноразових слів", 4)):
+        key = 'unique_words' if index == 3 else 'one_time_words'
+        print(f"{name:34} {exact_result[index]:10d} {approx_result[index]:10d} "
+              f"{approx_result[index] - exact_result[index]:+9d} {bounds[key]:11.1f}")
+    excess, probability = bounds['word_count']
+    print(f"Найчастіші слова (оцінка частоти завищена не більше ніж на {excess:.1f} "
+          f"з імовірністю {1 - probability:.3f}):")
+    exact_counts = exact.stats.word_freq
+    for word, count in approx.most_common(top):
+        print(f"  {word}: {count} (точно {exact_counts[word]})")
+
+
+def _print_stats(result):
+    total_chars, chars_no_spaces, total_words, unique_words, one_time_words = result
+    print(f"Загальна кількість символів (з пробілами): {total_chars}")
+    print(f"Загальна кількість символів (без пробілів): {chars_no_spaces}")
+    print(f"Загальна кількість слів: {total_words}")
+    print(f"Кількість різних слів (без повторів): {unique_words}")
+    print(f"Кількість унікальних слів (зустрічаються один раз): {one_time_words}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Статистика символів і слів для набору текстових файлів.")
+    parser.add_argument('sources', nargs='*', default=[DEFAULT_PATH],
+                        help="файли, каталоги або шаблони glob (за замовчуванням - ХорЕлементів.txt)")
+    parser.add_argument('--pattern', default=DEFAULT_PATTERN, help="шаблон імен файлів у каталогах")
+    parser.add_argument('--workers', type=int, default=None, help="кількість процесів (за замовчуванням - ядер)")
+    parser.add_argument('--per-file', action='store_true', help="показати статистику кожного файлу")
+    parser.add_argument('--top', type=int, default=0, help="показати N найчастіших слів")
+    parser.add_argument('--benchmark', action='store_true', help="виміряти прискорення залежно від кількості процесів")
+    parser.add_argument('--approx', action='store_true', help="наближений режим з фіксованою пам'яттю")
+    parser.add_argument('--memory', type=float, default=APPROX_MEMORY / 2 ** 20,
+                        help="пам'ять наближеного режиму на процес, МБ")
+    parser.add_argument('--compare', action='store_true', help="порівняти наближений режим з точним")
+    args = parser.parse_args(argv)
+    memory = int(args.memory * 2 ** 20)
+
+    if args.compare:
+        compare(args.sources, args.pattern, args.workers, memory, args.top or 10)
+        return 0
+    if args.benchmark:
+        benchmark(args.sources, args.pattern, args.workers, memory=memory if args.approx else None)
+        return 0
+
+    report = analyze_corpus(args.sources, args.workers, args.pattern, memory=memory if args.approx else None)
+    if not report.files:
+        print("Помилка: Не знайдено жодного файлу.")
+        return 1
+
+    if args.per_file:
+        print(f"{'Файл':40} {'Символи':>10} {'Без проб.':>10} {'Слова':>9} {'Різні':>8} {'Один раз':>8}")
+        for item in report.files:
+            if item.error:
+                print(f"{item.path:40} помилка: {item.error}")
+            else:
+                unique_words = '-' if item.unique_words is None else item.unique_words
+                one_time_words = '-' if item.one_time_words is None else item.one_time_words
+                print(f"{item.path:40} {item.total_chars:10d} {item.chars_no_spaces:10d} "
+                      f"{item.total_words:9d} {unique_words:>8} {one_time_words:>8}")
+        print()
+
+    for item in report.errors:
+        print(f"Помилка: '{item.path}': {item.error}")
+    print(f"Файлів: {len(report.files) - len(report.errors)}")
+    _print_stats(report.result())
+    if report.approximate:
+        bounds = report.stats.error_bounds()
+        print(f"Наближений режим ({report.stats.memory_bytes() / 2 ** 20:.2f} МБ): стандартна похибка "
+              f"різних слів ±{bounds['unique_words']:.0f}, одноразових ±{bounds['one_time_words']:.0f}")
+    if args.top:
+        print("Найчастіші слова:")
+        for word, count in report.most_common(args.top):
+            print(f"  {word}: {count}")
+    return 1 if len(report.errors) == len(report.files) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+Імовірнісні структури фіксованого розміру для наближеної статистики слів.
+
+    HyperLogLog     - кількість різних слів (відносна похибка ~1.04/sqrt(2^precision))
+    CountMinSketch  - частота слова з завищенням не більше e/width * N з імовірністю
+                      1 - e^(-depth) (N - кількість усіх слів)
+    HeavyHitters    - capacity слів з найбільшими оцінками частоти CountMinSketch
+    DistinctSample  - слова, хеш яких потрапляє в 1/2^level частину (з точними
+                      частотами); level зростає, коли вибірка переповнюється. Частка
+                      слів, що зустрілися один раз, у вибірці оцінює таку частку серед
+                      усіх різних слів
+
+Усі структури можна зливати (merge): структура, злита з кількох частин тексту,
+така сама, як побудована за всім текстом (для HeavyHitters - наближено). Хеш
+стабільний (blake2b), тож частини можна рахувати в різних процесах.
+"""
+
+import hashlib
+import math
+from array import array
+
+
+def word_hash(word):
+    """Два незалежні 64-бітові хеші слова."""
+    digest = hashlib.blake2b(word.encode('utf-8'), digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little')
+
+
+class HyperLogLog:
+    """
+    Оцінка кількості різних елементів.
+
+    Args:
+        precision: Кількість бітів номера регістра (регістрів - 2^precision, по байту)
+    """
+
+    def __init__(self, precision=14):
+        if not isinstance(precision, int) or not 4 <= precision <= 18:
+            raise ValueError("Точність HyperLogLog має бути цілим числом від 4 до 18.")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add_hash(self, value):
+        """Додає елемент за його 64-бітовим хешем."""
+        bits = 64 - self.precision
+        index = value >> bits
+        rank = bits - (value & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other):
+        if other.precision != self.precision:
+            raise ValueError("Злиття HyperLogLog різної точності неможливе.")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def estimate(self):
+        registers = self.registers
+        m = len(registers)
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        total = sum(registers.count(rank) * 2.0 ** -rank for rank in range(max(registers) + 1))
+        estimate = alpha * m * m / total
+        zeros = registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros) # Мало елементів: лінійний підрахунок
+        return estimate
+
+    def relative_error(self):
+        """Стандартна відносна похибка оцінки."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def memory_bytes(self):
+        return len(self.registers)
+
+
+class CountMinSketch:
+    """
+    Оцінка частоти елемента (не менша за справжню).
+
+    Args:
+        width: Кількість лічильників у рядку
+        depth: Кількість рядків (незалежних хешів)
+    """
+
+    def __init__(self, width=1 << 16, depth=4):
+        if not isinstance(width, int) or width <= 0 or not isinstance(depth, int) or depth <= 0:
+            raise ValueError("Розміри Count-Min Sketch мають бути додатними цілими числами.")
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self.rows = [array('q', bytes(8 * width)) for _ in range(depth)]
+
+    def _columns(self, value):
+        # Подвійне хешування: i-й рядок - (a + i * b) mod width
+        a, b = value & 0xFFFFFFFF, (value >> 32) | 1
+        width = self.width
+        return [(a + row * b) % width for row in range(self.depth)]
+
+    def add_hash(self, value, count=1):
+        """Додає count входжень елемента; повертає нову оцінку його частоти."""
+        self.total += count
+        estimate = None
+        for row, column in zip(self.rows, self._columns(value)):
+            row[column] += count
+            if estimate is None or row[column] < estimate:
+                estimate = row[column]
+        return estimate
+
+    def estimate_hash(self, value):
+        return min(row[column] for row, column in zip(self.rows, self._columns(value)))
+
+    def merge(self, other):
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Злиття Count-Min Sketch різного розміру неможливе.")
+        self.total += other.total
+        self.rows = [array('q', map(int.__add__, mine, theirs)) for mine, theirs in zip(self.rows, other.rows)]
+        return self
+
+    def error_bound(self):
+        """(завищення, імовірність, що його перевищено) для будь-якої оцінки."""
+        return math.e / self.width * self.total, math.exp(-self.depth)
+
+    def memory_bytes(self):
+        return 8 * self.width * self.depth
+
+
+class HeavyHitters:
+    """
+    Найчастіші слова за оцінками CountMinSketch.
+
+    Args:
+        sketch: CountMinSketch, через який рахуються всі слова
+        capacity: Скільки слів-кандидатів тримати
+    """
+
+    def __init__(self, sketch, capacity=100):
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("Кількість найчастіших слів має бути додатним цілим числом.")
+        self.sketch = sketch
+        self.capacity = capacity
+        self.candidates = {} # {слово: (оцінка частоти, хеш)}
+        self._min = 0 # Нижня межа найменшої оцінки серед кандидатів (уточнюється при потребі)
+
+    def add(self, word, value, count=1):
+        """
+        Додає count входжень слова з хешем value до скетча та списку кандидатів.
+        Оцінки лише зростають, тож нове слово досить порівняти з найменшим кандидатом.
+        """
+        estimate = self.sketch.add_hash(value, count)
+        candidates = self.candidates
+        if word in candidates or len(candidates) < self.capacity:
+            candidates[word] = (estimate, value)
+            return
+        if estimate <= self._min:
+            return
+        smallest = min(candidates, key=candidates.__getitem__)
+        if estimate > candidates[smallest][0]:
+            del candidates[smallest]
+            candidates[word] = (estimate, value)
+            smallest = min(candidates, key=candidates.__getitem__)
+        self._min = candidates[smallest][0]
+
+    def merge(self, other):
+        """Зливає скетчі й переоцінює кандидатів обох списків за злитим скетчем."""
+        self.sketch.merge(other.sketch)
+        values = {word: value for word, (_, value) in self.candidates.items()}
+        values.update((word, value) for word, (_, value) in other.candidates.items())
+        estimate = self.sketch.estimate_hash
+        ranked = sorted(((estimate(value), word, value) for word, value in values.items()), reverse=True)
+        self.candidates = {word: (count, value) for count, word, value in ranked[:self.capacity]}
+        self._min = 0
+        return self
+
+    def most_common(self, n=10):
+        """n слів з найбільшими оцінками: [(слово, оцінка), ...]."""
+        ranked = sorted(self.candidates.items(), key=lambda item: (-item[1][0], item[0]))
+        return [(word, count) for word, (count, _) in ranked[:n]]
+
+    def memory_bytes(self):
+        return self.sketch.memory_bytes() + self.capacity * DistinctSample.WORD_BYTES
+
+
+class DistinctSample:
+    """
+    Вибірка різних слів за хешем з точними частотами.
+
+    Args:
+        capacity: Найбільша кількість слів у вибірці
+    """
+
+    # Оцінка пам'яті на одне слово (рядок, число, запис словника)
+    WORD_BYTES = 160
+
+    def __init__(self, capacity=4096):
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("Розмір вибірки має бути додатним цілим числом.")
+        self.capacity = capacity
+        self.level = 0 # У вибірці слова, хеш яких ділиться на 2^level
+        self.counts = {} # {слово: (частота, хеш)}
+
+    def add(self, word, value, count=1):
+        if value & ((1 << self.level) - 1):
+            return
+        counts = self.counts
+        item = counts.get(word)
+        counts[word] = (count, value) if item is None else (item[0] + count, value)
+        if len(counts) > self.capacity:
+            self._shrink()
+
+    def _shrink(self):
+        counts = self.counts
+        while len(counts) > self.capacity:
+            self.level += 1
+            mask = (1 << self.level) - 1
+            self.counts = counts = {word: item for word, item in counts.items() if not item[1] & mask}
+
+    def merge(self, other):
+        if other.level > self.level:
+            self.level = other.level
+        mask = (1 << self.level) - 1
+        counts = {word: item for word, item in self.counts.items() if not item[1] & mask}
+        for word, (count, value) in other.counts.items():
+            if not value & mask:
+                item = counts.get(word)
+                counts[word] = (count, value) if item is None else (item[0] + count, value)
+        self.counts = counts
+        self._shrink()
+        return self
+
+    @property
+    def exact(self):
+        """Чи містить вибірка всі слова (вибірку ще не проріджували)."""
+        return self.level == 0
+
+    def hapax_fraction(self):
+        """(частка слів з частотою 1 у вибірці, її стандартна похибка)."""
+        size = len(self.counts)
+        if not size:
+            return 0.0, 0.0
+        fraction = sum(1 for count, _ in self.counts.values() if count == 1) / size
+        return fraction, 0.0 if self.exact else math.sqrt(fraction * (1 - fraction) / size)
+
+    def memory_bytes(self):
+        return self.capacity * self.WORD_BYTES
@@ -0,0 +1,50 @@
+"""Тести потокової статистики тексту (LB4Task2.py): порції дають той самий результат, що й весь текст."""
+
+import pytest
+
+from LB4Task2 import TextStats, analyze_file, count_characters, count_words, file_path
+
+TEXT = ("Хор елементів — це не просто хор!\n"
+        "Кожен  елемент\tспіває свою партію; (а деякі - двічі).\n"
+        "\n"
+        "Слово-слово, \"цитата\" і «лапки»: ХОР, хор, Хор...\n"
+        "кінець")
+
+
+def whole_text(text):
+    return count_characters(text) + count_words(text)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, 1 << 20])
+def test_chunks_match_whole_text(tmp_path, chunk_size):
+    path = tmp_path / 'text.txt'
+    path.write_text(TEXT, encoding='utf-8')
+    stats = analyze_file(str(path), chunk_size)
+    assert stats.result() == whole_text(TEXT)
+    assert stats.most_common(1) == [('хор', 5)]
+
+
+def test_course_file_matches_whole_text():
+    with open(file_path, encoding='utf-8') as fd:
+        text = fd.read()
+    assert analyze_file(file_path, 4096).result() == whole_text(text)
+
+
+def test_merge_matches_single_pass():
+    middle = TEXT.index('\n\n')
+    first = TextStats()
+    first.feed(TEXT[:middle])
+    second = TextStats()
+    second.feed(TEXT[middle:])
+    merged = first.finish().merge(second.finish())
+    assert merged.result() == whole_text(TEXT)
+    single = TextStats()
+    single.feed(TEXT)
+    assert merged.word_freq == single.finish().word_freq
+
+
+def test_word_split_by_chunk_boundary():
+    stats = TextStats()
+    for chunk in ('хо', 'р е', 'лем', 'ентів'):
+        stats.feed(chunk)
+    assert dict(stats.finish().word_freq) == {'хор': 1, 'елементів': 1}
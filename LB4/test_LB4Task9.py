@@ -0,0 +1,61 @@
+"""Тести аналізу набору файлів (LB4Task9.py): процеси пулу дають той самий результат, що й один процес."""
+
+import os
+
+from LB4Task2 import TextStats, analyze_file
+from LB4Task9 import _batches, analyze_corpus, collect_files
+
+TEXTS = {
+    'a.txt': "Хор елементів співає. Хор!",
+    'b.txt': "елементів багато,\nа хор один",
+    os.path.join('вкладений', 'c.txt'): "Один - це один.\n",
+    os.path.join('вкладений', 'd.md'): "не текст",
+}
+
+
+def make_corpus(tmp_path):
+    for name, text in TEXTS.items():
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+    (tmp_path / 'bad.txt').write_bytes(b'\xff\xfe\xfa')
+    return str(tmp_path)
+
+
+def test_collect_files(tmp_path):
+    directory = make_corpus(tmp_path)
+    files = collect_files(directory)
+    assert [os.path.relpath(path, directory) for path in files] == sorted(
+        ['a.txt', 'b.txt', 'bad.txt', os.path.join('вкладений', 'c.txt')])
+    assert collect_files([os.path.join(directory, '*.txt'), files[0]]) == files[:3]
+
+
+def test_parallel_matches_serial(tmp_path):
+    directory = make_corpus(tmp_path)
+    serial = analyze_corpus(directory, workers=1)
+    parallel = analyze_corpus(directory, workers=3)
+    assert parallel.files == serial.files
+    assert parallel.result() == serial.result()
+    assert parallel.most_common(3) == serial.most_common(3)
+
+    expected = TextStats()
+    for path in collect_files(directory):
+        if not path.endswith('bad.txt'):
+            expected.merge(analyze_file(path))
+    assert serial.result() == expected.result()
+    assert [os.path.basename(report.path) for report in serial.errors] == ['bad.txt']
+
+
+def test_batches_cover_all_files(tmp_path):
+    directory = make_corpus(tmp_path)
+    files = collect_files(directory)
+    batches = _batches(files, 2)
+    assert sorted(path for batch in batches for path in batch) == files
+
+
+def test_approx_parallel_matches_serial(tmp_path):
+    directory = make_corpus(tmp_path)
+    serial = analyze_corpus(directory, workers=1, memory=1 << 20)
+    parallel = analyze_corpus(directory, workers=3, memory=1 << 20)
+    assert serial.approximate
+    assert parallel.result() == serial.result() == analyze_corpus(directory, workers=1).result()
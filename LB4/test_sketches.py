@@ -0,0 +1,75 @@
+"""Тести імовірнісних структур (sketches.py) і наближеної статистики тексту (ApproxTextStats)."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from LB4Task2 import ApproxTextStats, TextStats
+from sketches import CountMinSketch, DistinctSample, HeavyHitters, HyperLogLog, word_hash
+
+
+def words(count, seed=1):
+    rng = random.Random(seed)
+    # Частоти за законом Ципфа: кілька частих слів і багато рідкісних
+    return [f"слово{int(rng.paretovariate(1.0))}" for _ in range(count)]
+
+
+def build(structure, items):
+    for word in items:
+        value, sample_value = word_hash(word)
+        if isinstance(structure, DistinctSample):
+            structure.add(word, sample_value)
+        else:
+            structure.add_hash(value)
+    return structure
+
+
+def test_hyperloglog_within_error():
+    items = [f"w{number}" for number in range(20000)]
+    hll = build(HyperLogLog(12), items)
+    assert abs(hll.estimate() - 20000) <= 4 * hll.relative_error() * 20000
+    with pytest.raises(ValueError):
+        HyperLogLog(3)
+
+
+def test_count_min_never_underestimates():
+    items = words(20000)
+    sketch = build(CountMinSketch(256, 4), items)
+    excess, _ = sketch.error_bound()
+    counts = Counter(items)
+    for word, count in counts.items():
+        estimate = sketch.estimate_hash(word_hash(word)[0])
+        assert count <= estimate <= count + 4 * excess
+
+
+@pytest.mark.parametrize('make', [lambda: HyperLogLog(10), lambda: CountMinSketch(64, 3),
+                                  lambda: DistinctSample(50)])
+def test_merge_equals_single_pass(make):
+    items = words(5000)
+    merged = build(make(), items[:2000]).merge(build(make(), items[2000:]))
+    single = build(make(), items)
+    state = {HyperLogLog: 'registers', CountMinSketch: 'rows', DistinctSample: 'counts'}[type(single)]
+    assert getattr(merged, state) == getattr(single, state)
+
+
+def test_heavy_hitters_find_frequent_words():
+    items = words(20000)
+    top = HeavyHitters(CountMinSketch(1024, 4), capacity=10)
+    for word in items:
+        top.add(word, word_hash(word)[0])
+    counts = Counter(items)
+    expected = [word for word, _ in counts.most_common(3)]
+    assert [word for word, _ in top.most_common(3)] == expected
+
+
+def test_approx_stats_are_exact_while_sample_fits():
+    text = " ".join(words(3000))
+    exact = TextStats()
+    exact.feed(text)
+    approx = ApproxTextStats(memory=1 << 20, top_k=10)
+    approx.feed(text)
+    assert approx.finish().result() == exact.finish().result()
+    assert approx.error_bounds()['unique_words'] == 0.0
+    with pytest.raises(ValueError):
+        ApproxTextStats(memory=1024)
@@ -1,32 +1,103 @@
 import datetime
+import decimal
+import itertools
+import threading
+import contextlib
+import time
+
+from events import PrintSink, RingBufferSink
+from journal import StringTable, TransactionJournal
+
+# Порожній контекст замість блокування для рахунків банку без конкурентного режиму
+_NO_LOCK = contextlib.nullcontext()
+
+# Гроші зберігаються цілими копійками; суми у гривнях (int, float, Decimal) переводяться
+# в копійки з округленням до парного в цьому фіксованому контексті
+MONEY_CONTEXT = decimal.Context(prec=34, rounding=decimal.ROUND_HALF_EVEN)
+
+def to_kopiyky(amount):
+    """Переводить суму у гривнях у ціле число копійок. Нечислові та нескінченні значення - ValueError."""
+    if type(amount) is int:
+        return amount * 100
+    if isinstance(amount, float):
+        # repr дає найкоротший десятковий запис float (0.1, а не 0.1000000000000000055...)
+        amount = decimal.Decimal(repr(amount))
+    elif isinstance(amount, bool) or not isinstance(amount, (int, decimal.Decimal)):
+        raise ValueError(f"Сума має бути числом, отримано {amount!r}.")
+    if not amount.is_finite():
+        raise ValueError(f"Сума має бути скінченним числом, отримано {amount!r}.")
+    return int(MONEY_CONTEXT.scaleb(amount, 2).to_integral_value(context=MONEY_CONTEXT))
+
+def from_kopiyky(kopiyky):
+    """Ціле число копійок -> Decimal у гривнях із двома знаками після коми."""
+    return decimal.Decimal(kopiyky).scaleb(-2)
 
 class Transaction:
-    """Клас для зберігання інформації про транзакцію."""
-    def __init__(self, transaction_id, type, amount, date, description=""):
+    """Клас для зберігання інформації про транзакцію. Сума зберігається в копійках."""
+    def __init__(self, transaction_id, type, amount_kopiyky, date, description=""):
         self.transaction_id = transaction_id
         self.type = type # 'deposit', 'withdrawal'
-        self.amount = amount
+        self.amount_kopiyky = amount_kopiyky
         self.date = date # datetime.datetime object
         self.description = description
 
+    @property
+    def amount(self):
+        """Сума в гривнях (Decimal)."""
+        return from_kopiyky(self.amount_kopiyky)
+
     def __str__(self):
         return (f"ID: {self.transaction_id}, Тип: {self.type}, "
                 f"Сума: {self.amount:.2f} грн, Дата: {self.date.strftime('%Y-%m-%d %H:%M')}, "
                 f"Опис: {self.description}")
 
+def _now_timestamp():
+    """Поточний час у цілих мікросекундах epoch (формат часу журналу)."""
+    return time.time_ns() // 1000
+
+def _to_timestamp(moment):
+    """datetime -> мікросекунди epoch для запитів до журналу (None лишається None)."""
+    return round(moment.timestamp() * 1000000) if isinstance(moment, datetime.datetime) else moment
+
+def _from_timestamp(timestamp):
+    return datetime.datetime.fromtimestamp(timestamp / 1000000)
+
+def _positive_kopiyky(amount, message):
+    """Додатна сума в копійках або ValueError з message."""
+    try:
+        kopiyky = to_kopiyky(amount)
+    except ValueError:
+        raise ValueError(message) from None
+    if kopiyky <= 0:
+        raise ValueError(message)
+    return kopiyky
+
 class BankAccount:
     """Клас, який представляє банківський рахунок."""
-    _next_transaction_id = 1
+    # Спільний лічильник ID транзакцій: next() для itertools.count атомарний, тож ID не повторюються між потоками
+    _transaction_ids = itertools.count(1)
 
-    def __init__(self, account_number, initial_balance=0.0):
+    def __init__(self, account_number, initial_balance=0.0, events=None, lock=None, journal_options=None):
         if not isinstance(account_number, str) or not account_number.isdigit():
             raise ValueError("Номер рахунку має бути рядком, що містить тільки цифри.")
-        if initial_balance < 0:
+        balance_kopiyky = to_kopiyky(initial_balance)
+        if balance_kopiyky < 0:
             raise ValueError("Початковий баланс не може бути від'ємним.")
 
         self.account_number = account_number
-        self.balance = initial_balance
-        self.transaction_history = [] # Список об'єктів Transaction
+        # Стовпцевий журнал транзакцій (journal.py); він же зберігає поточний баланс
+        self.journal = TransactionJournal(balance_kopiyky, **(journal_options or {}))
+        self.events = PrintSink() if events is None else events # Приймач подій (events.py)
+        self._lock = _NO_LOCK if lock is None else lock # threading.RLock у конкурентному режимі банку
+
+    @property
+    def balance_kopiyky(self):
+        return self.journal.balance
+
+    @property
+    def balance(self):
+        """Баланс у гривнях (Decimal); точне значення - balance_kopiyky."""
+        return from_kopiyky(self.journal.balance)
 
     def get_balance(self):
         """Повертає поточний баланс рахунку."""
@@ -34,67 +105,118 @@ class BankAccount:
 
     def deposit(self, amount, description=""):
         """Нараховує кошти на рахунок."""
-        if not isinstance(amount, (int, float)) or amount <= 0:
-            raise ValueError("Сума поповнення має бути додатним числом.")
-        self.balance += amount
-        transaction = Transaction(
-            BankAccount._next_transaction_id,
-            'deposit',
-            amount,
-            datetime.datetime.now(),
-            description
-        )
-        self.transaction_history.append(transaction)
-        BankAccount._next_transaction_id += 1
-        print(f"Рахунок {self.account_number}: Нараховано {amount:.2f} грн. Новий баланс: {self.balance:.2f} грн.")
+        kopiyky = _positive_kopiyky(amount, "Сума поповнення має бути додатним числом.")
+        return self._deposit_kopiyky(kopiyky, description)
+
+    def _deposit_kopiyky(self, kopiyky, description):
+        with self._lock:
+            transaction_id = next(BankAccount._transaction_ids)
+            self.journal.append(transaction_id, 'deposit', kopiyky, _now_timestamp(), description)
+            if self.events.enabled:
+                self.events.emit('deposit', "Рахунок {account_number}: Нараховано {amount:.2f} грн. Новий баланс: {balance:.2f} грн.",
+                                 account_number=self.account_number, amount=from_kopiyky(kopiyky), balance=self.balance,
+                                 transaction_id=transaction_id)
         return True
 
     def withdraw(self, amount, description=""):
         """Списує кошти з рахунку."""
-        if not isinstance(amount, (int, float)) or amount <= 0:
-            raise ValueError("Сума списання має бути додатним числом.")
-        if self.balance < amount:
-            print(f"Недостатньо коштів на рахунку {self.account_number} для списання {amount:.2f} грн. Поточний баланс: {self.balance:.2f} грн.")
-            return False
-        self.balance -= amount
-        transaction = Transaction(
-            BankAccount._next_transaction_id,
-            'withdrawal',
-            amount,
-            datetime.datetime.now(),
-            description
-        )
-        self.transaction_history.append(transaction)
-        BankAccount._next_transaction_id += 1
-        print(f"Рахунок {self.account_number}: Списано {amount:.2f} грн. Новий баланс: {self.balance:.2f} грн.")
+        kopiyky = _positive_kopiyky(amount, "Сума списання має бути додатним числом.")
+        return self._withdraw_kopiyky(kopiyky, description)
+
+    def _withdraw_kopiyky(self, kopiyky, description):
+        # Перевірка балансу і списання виконуються під одним блокуванням
+        with self._lock:
+            if self.balance_kopiyky < kopiyky:
+                self.events.emit('insufficient_funds', "Недостатньо коштів на рахунку {account_number} для списання {amount:.2f} грн. Поточний баланс: {balance:.2f} грн.",
+                                 account_number=self.account_number, amount=from_kopiyky(kopiyky), balance=self.balance)
+                return False
+            transaction_id = next(BankAccount._transaction_ids)
+            self.journal.append(transaction_id, 'withdrawal', kopiyky, _now_timestamp(), description)
+            if self.events.enabled:
+                self.events.emit('withdrawal', "Рахунок {account_number}: Списано {amount:.2f} грн. Новий баланс: {balance:.2f} грн.",
+                                 account_number=self.account_number, amount=from_kopiyky(kopiyky), balance=self.balance,
+                                 transaction_id=transaction_id)
         return True
 
-    def get_transaction_history(self):
-        """Повертає історію транзакцій."""
-        return self.transaction_history
+    def get_transaction_history(self, start=None, end=None, offset=0, limit=None):
+        """
+        Повертає історію транзакцій (список Transaction): усю або за проміжок часу
+        [start, end) (datetime), сторінками по limit записів, починаючи з offset-го.
+        """
+        with self._lock:
+            entries = list(self.journal.entries(_to_timestamp(start), _to_timestamp(end), offset, limit))
+        return [Transaction(transaction_id, kind, amount, _from_timestamp(timestamp), description)
+                for transaction_id, kind, amount, timestamp, description in entries]
+
+    @property
+    def transaction_history(self):
+        """
+        Уся історія транзакцій списком Transaction. Список щоразу заново будується з журналу
+        (зокрема з вивантажених сегментів), тож кожне звернення коштує O(кількість транзакцій);
+        для великих рахунків використовуйте get_transaction_history з проміжком часу чи сторінками.
+        """
+        return self.get_transaction_history()
+
+    def count_transactions(self, start=None, end=None):
+        """Кількість транзакцій за проміжок часу [start, end) - для поділу виписки на сторінки."""
+        with self._lock:
+            return self.journal.count_between(_to_timestamp(start), _to_timestamp(end))
+
+    def get_balance_at(self, moment):
+        """Баланс (Decimal) на момент moment (datetime) - після всіх транзакцій до нього включно."""
+        with self._lock:
+            return from_kopiyky(self.journal.balance_at(_to_timestamp(moment)))
 
     def __str__(self):
         return f"Рахунок №{self.account_number}, Баланс: {self.balance:.2f} грн"
 
 class Bank:
-    """Клас для керування банківськими рахунками."""
-    def __init__(self, name):
+    """
+    Клас для керування банківськими рахунками.
+    З concurrent=True методи банку можна викликати з кількох потоків: кожен рахунок
+    має власне блокування, переказ бере блокування обох рахунків у порядку їхніх номерів
+    (тож потоки не блокують одне одного навхрест) і виконується повністю або не виконується.
+    """
+    def __init__(self, name, events=None, concurrent=False, journal_options=None):
         self.name = name
         self.accounts = {} # dict: {account_number: BankAccount object}
+        self._events = PrintSink() if events is None else events
+        self.concurrent = concurrent
+        # Параметри журналів рахунків (TransactionJournal); таблиця описів спільна для банку
+        self.journal_options = dict(journal_options or {})
+        self.journal_options.setdefault('strings', StringTable())
+        self._accounts_lock = threading.Lock() if concurrent else _NO_LOCK # Захищає додавання/видалення рахунків
+
+    @property
+    def events(self):
+        """Приймач подій банку (events.py); спільний для всіх його рахунків."""
+        return self._events
+
+    @events.setter
+    def events(self, sink):
+        self._events = sink
+        for account in self.accounts.values():
+            account.events = sink
 
     def add_account(self, account_number, initial_balance=0.0):
         """Додає новий банківський рахунок."""
-        if account_number in self.accounts:
-            print(f"Рахунок з номером {account_number} вже існує.")
-            return None
-        try:
-            account = BankAccount(account_number, initial_balance)
-            self.accounts[account_number] = account
-            print(f"Рахунок {account_number} успішно додано з початковим балансом {initial_balance:.2f} грн.")
-            return account
-        except ValueError as e:
-            print(f"Помилка при додаванні рахунку: {e}")
-            return None
+        with self._accounts_lock:
+            if account_number in self.accounts:
+                self._events.emit('account_exists', "Рахунок з номером {account_number} вже існує.",
+                                  account_number=account_number)
+                return None
+            try:
+                account = BankAccount(account_number, initial_balance, self._events,
+                                      threading.RLock() if self.concurrent else None, self.journal_options)
+                self.accounts[account_number] = account
+                if self._events.enabled:
+                    self._events.emit('account_added', "Рахунок {account_number} успішно додано з початковим балансом {balance:.2f} грн.",
+                                      account_number=account_number, balance=account.balance)
+                return account
+            except ValueError as e:
+                self._events.emit('account_error', "Помилка при додаванні рахунку: {error}",
+                                  account_number=account_number, error=str(e))
+                return None
 
     def find_account(self, account_number):
         """Шукає рахунок за номером."""
@@ -102,11 +224,19 @@ class Bank:
 
     def delete_account(self, account_number):
         """Видаляє рахунок за номером."""
-        if account_number not in self.accounts:
-            print(f"Рахунок з номером {account_number} не знайдений.")
-            return False
-        del self.accounts[account_number]
-        print(f"Рахунок {account_number} успішно видалено.")
+        with self._accounts_lock:
+            account = self.accounts.get(account_number)
+            if account is None:
+                self._events.emit('account_not_found', "Рахунок з номером {account_number} не знайдений.",
+                                  account_number=account_number)
+                return False
+            # Чекаємо завершення операцій, що вже тримають рахунок
+            with account._lock:
+                del self.accounts[account_number]
+                # Видаляємо файли вивантажених на диск сегментів журналу
+                account.journal.close()
+        self._events.emit('account_deleted', "Рахунок {account_number} успішно видалено.",
+                          account_number=account_number)
         return True
 
     def perform_transfer(self, from_account_number, to_account_number, amount):
@@ -115,26 +245,164 @@ class Bank:
         to_account = self.find_account(to_account_number)
 
         if not from_account:
-            print(f"Відправник: Рахунок {from_account_number} не знайдений.")
+            self._events.emit('account_not_found', "Відправник: Рахунок {account_number} не знайдений.",
+                              account_number=from_account_number)
             return False
         if not to_account:
-            print(f"Отримувач: Рахунок {to_account_number} не знайдений.")
+            self._events.emit('account_not_found', "Отримувач: Рахунок {account_number} не знайдений.",
+                              account_number=to_account_number)
             return False
         if from_account_number == to_account_number:
-            print("Неможливо переказати кошти на той самий рахунок.")
+            self._events.emit('same_account', "Неможливо переказати кошти на той самий рахунок.",
+                              account_number=from_account_number)
             return False
-        if not isinstance(amount, (int, float)) or amount <= 0:
-            print("Сума переказу має бути додатним числом.")
+        try:
+            kopiyky = _positive_kopiyky(amount, "Сума переказу має бути додатним числом.")
+        except ValueError as e:
+            self._events.emit('invalid_amount', "{error}", error=str(e), amount=repr(amount))
             return False
 
-        if from_account.withdraw(amount, f"Переказ на рахунок {to_account_number}"):
-            to_account.deposit(amount, f"Переказ з рахунку {from_account_number}")
-            print(f"Успішний переказ {amount:.2f} грн з {from_account_number} на {to_account_number}.")
-            return True
+        # Блокування обох рахунків у порядку номерів: списання і нарахування виконуються разом
+        first, second = ((from_account, to_account) if from_account_number < to_account_number
+                         else (to_account, from_account))
+        with first._lock, second._lock:
+            # Рахунок могли видалити в іншому потоці, поки ми чекали на блокування
+            still_open = (self.accounts.get(from_account_number) is from_account
+                          and self.accounts.get(to_account_number) is to_account)
+            if still_open and from_account._withdraw_kopiyky(kopiyky, f"Переказ на рахунок {to_account_number}"):
+                to_account._deposit_kopiyky(kopiyky, f"Переказ з рахунку {from_account_number}")
+                if self._events.enabled:
+                    self._events.emit('transfer', "Успішний переказ {amount:.2f} грн з {from_account} на {to_account}.",
+                                      from_account=from_account_number, to_account=to_account_number,
+                                      amount=from_kopiyky(kopiyky))
+                return True
+        self._events.emit('transfer_failed', "Не вдалося здійснити переказ з {from_account} на {to_account}.",
+                          from_account=from_account_number, to_account=to_account_number, amount=from_kopiyky(kopiyky))
+        return False
+
+    def apply_batch(self, transfers, atomic=True, net=False):
+        """
+        Пакетні перекази. transfers - ітерований набір кортежів (from_account_number,
+        to_account_number, amount). Усі перекази перевіряються заздалегідь, блокування
+        рахунків беруться один раз на пакет, а кожна частина переказу (списання або
+        нарахування) дає один запис в історії рахунку без окремого повідомлення.
+
+        Args:
+            transfers: Перекази
+            atomic: True - пакет виконується повністю або не виконується зовсім
+                (будь-яка помилка чи нестача коштів відхиляє весь пакет);
+                False - відхиляються лише невдалі перекази, решта виконується по черзі
+            net: Взаємозалік: перекази між парою рахунків замінюються одним переказом
+                на різницю зустрічних сум
+
+        Returns:
+            dict: applied і rejected - кількості переказів, legs - кількість виконаних
+            переказів після взаємозаліку, errors - список (індекс переказу, причина)
+        """
+        transfers = list(transfers)
+        errors = []
+        valid = [] # (індекс, відправник, отримувач, сума в копійках)
+        accounts = self.accounts
+        for index, (from_number, to_number, amount) in enumerate(transfers):
+            if from_number not in accounts:
+                errors.append((index, f"рахунок відправника {from_number} не знайдений"))
+            elif to_number not in accounts:
+                errors.append((index, f"рахунок отримувача {to_number} не знайдений"))
+            elif from_number == to_number:
+                errors.append((index, "переказ на той самий рахунок"))
+            else:
+                try:
+                    kopiyky = to_kopiyky(amount)
+                except ValueError:
+                    kopiyky = 0
+                if kopiyky <= 0:
+                    errors.append((index, f"невірна сума {amount!r}"))
+                else:
+                    valid.append((index, from_number, to_number, kopiyky))
+
+        legs = 0
+        if not (atomic and errors):
+            # Блокування всіх задіяних рахунків у порядку номерів, як у perform_transfer
+            numbers = sorted({number for _, from_number, to_number, _ in valid for number in (from_number, to_number)})
+            with contextlib.ExitStack() as stack:
+                involved = {}
+                for number in numbers:
+                    account = accounts.get(number)
+                    if account is not None:
+                        stack.enter_context(account._lock)
+                        involved[number] = account
+                # Рахунок могли видалити, поки пакет чекав на блокування
+                closed = set(numbers) - involved.keys()
+                if closed:
+                    still_valid = []
+                    for transfer in valid:
+                        number = next((number for number in transfer[1:3] if number in closed), None)
+                        if number is None:
+                            still_valid.append(transfer)
+                        else:
+                            errors.append((transfer[0], f"рахунок {number} закрито"))
+                    valid = still_valid
+                if not (atomic and errors):
+                    legs = self._apply_locked_batch(valid, involved, atomic, net, errors)
+
+        rejected = len(transfers) if atomic and errors else len(errors)
+        result = {'applied': len(transfers) - rejected, 'rejected': rejected, 'legs': legs,
+                  'errors': sorted(errors, key=lambda error: error[0])}
+        self._events.emit('batch', "Пакет переказів: виконано {applied}, відхилено {rejected}, проводок {legs}.",
+                          applied=result['applied'], rejected=rejected, legs=legs)
+        return result
+
+    def _apply_locked_batch(self, valid, involved, atomic, net, errors):
+        """
+        Перевіряє кошти та виконує перевірені перекази (блокування рахунків уже взяті).
+        Відхилені перекази додаються до errors; повертає кількість виконаних переказів.
+        """
+        if net:
+            # Для кожної пари - сума від меншого номера до більшого (від'ємна - у зворотний бік)
+            flows = {}
+            members = {}
+            for index, from_number, to_number, amount in valid:
+                pair = (from_number, to_number) if from_number < to_number else (to_number, from_number)
+                flows[pair] = flows.get(pair, 0) + (amount if pair[0] == from_number else -amount)
+                members.setdefault(pair, []).append(index)
+            planned = []
+            for (low, high), value in flows.items():
+                if value >= 0:
+                    planned.append((low, high, value, members[(low, high)]))
+                else:
+                    planned.append((high, low, -value, members[(low, high)]))
         else:
-            print(f"Не вдалося здійснити переказ з {from_account_number} на {to_account_number}.")
-            return False
+            planned = [(from_number, to_number, amount, (index,))
+                       for index, from_number, to_number, amount in valid]
 
+        # Перевірка коштів на копії балансів; нічого не змінюється, доки пакет не прийнято
+        balances = {number: account.balance_kopiyky for number, account in involved.items()}
+        accepted = []
+        for leg in planned:
+            from_number, to_number, amount, indexes = leg
+            if balances[from_number] < amount:
+                errors.extend((index, f"недостатньо коштів на рахунку {from_number}") for index in indexes)
+                if atomic:
+                    return 0
+                continue
+            balances[from_number] -= amount
+            balances[to_number] += amount
+            accepted.append(leg)
+
+        # Один запис журналу на кожну частину переказу й одна мітка часу на весь пакет
+        now = _now_timestamp()
+        transaction_ids = BankAccount._transaction_ids
+        journals = {number: account.journal for number, account in involved.items()}
+        outgoing = {number: f"Переказ на рахунок {number}" for number in involved}
+        incoming = {number: f"Переказ з рахунку {number}" for number in involved}
+        legs = 0
+        for from_number, to_number, amount, _ in accepted:
+            if not amount:
+                continue # Зустрічні перекази повністю взаємно погашені
+            journals[from_number].append(next(transaction_ids), 'withdrawal', amount, now, outgoing[to_number])
+            journals[to_number].append(next(transaction_ids), 'deposit', amount, now, incoming[from_number])
+            legs += 1
+        return legs
 
 # --- Приклад використання класу "Банківський рахунок" ---
 if __name__ == "__main__":
@@ -178,4 +446,27 @@ if __name__ == "__main__":
         my_bank.delete_account("1234567890")
         my_bank.delete_account("9999999999") # Спроба видалити неіснуючий рахунок
 
-        print(f"\nРахунок 1234567890 після видалення: {my_bank.find_account('1234567890')}")
\ No newline at end of file
+        print(f"\nРахунок 1234567890 після видалення: {my_bank.find_account('1234567890')}")
+
+        print("\n--- Тихий режим: події в буфері замість друку ---")
+        account2.events = RingBufferSink(capacity=100)
+        account2.withdraw(50.0, "Комісія")
+        account2.withdraw(10000.0, "Завелика сума")
+        for event in account2.events:
+            print(f"- {event.kind}: {event.message}")
+
+    print("\n--- Пакет переказів ---")
+    my_bank.add_account("1111111111", 1000.0)
+    batch = [("0987654321", "1111111111", 100.0), ("1111111111", "0987654321", 250.0),
+             ("0987654321", "1111111111", 50.0)]
+    result = my_bank.apply_batch(batch, net=True)
+    print(f"Переказів: {result['applied']}, проводок після взаємозаліку: {result['legs']}")
+    print(my_bank.find_account("0987654321"))
+    print(my_bank.find_account("1111111111"))
+
+    print("\n--- Виписка сторінками ---")
+    history_page = account2.get_transaction_history(offset=0, limit=2)
+    print(f"Транзакцій на рахунку 0987654321: {account2.count_transactions()}, перша сторінка:")
+    for t in history_page:
+        print(t)
+    print(f"Баланс після першої транзакції: {account2.get_balance_at(history_page[0].date):.2f} грн")
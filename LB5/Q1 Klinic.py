@@ -1,21 +1,136 @@
+import bisect
 import datetime
+import os
+import sys
+import csv
+import json
+import time
+import functools
+import tempfile
+from operator import attrgetter, itemgetter
+
+from events import PrintSink, RingBufferSink
+from clinic_store import ClinicStore
+from record_index import RecordIndex, SearchResults
+from clinic_analytics import ClinicAnalytics
+
+# Тривалість прийому за замовчуванням (хвилини) та робочий день для пошуку вільних слотів
+DEFAULT_DURATION = 30
+WORKING_DAY_START = datetime.time(8, 0)
+WORKING_DAY_END = datetime.time(20, 0)
+
+def _intern(value):
+    """Інтернує рядок, щоб однакові значення (спеціалізації, діагнози) зберігалися один раз."""
+    return sys.intern(value) if type(value) is str else value
+
+class ContactInfo:
+    """Контактні дані особи. Компактний запис із доступом як до словника: info['phone']."""
+    __slots__ = ('phone', 'email', '_extra')
+
+    def __init__(self, phone=None, email=None, **extra):
+        self.phone = phone
+        self.email = email
+        self._extra = extra or None # Інші поля зберігаються лише за наявності
+
+    @classmethod
+    def from_value(cls, value):
+        """Створює ContactInfo зі словника (або повертає вже готовий запис)."""
+        if isinstance(value, ContactInfo):
+            return value
+        if value is None:
+            return cls()
+        return cls(**dict(value))
+
+    def to_dict(self):
+        result = {key: value for key, value in (('phone', self.phone), ('email', self.email))
+                  if value is not None}
+        if self._extra:
+            result.update(self._extra)
+        return result
+
+    def __getitem__(self, key):
+        if key in ('phone', 'email'):
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        elif self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in ('phone', 'email'):
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def keys(self):
+        return self.to_dict().keys()
+
+    def items(self):
+        return self.to_dict().items()
+
+    def __iter__(self):
+        return iter(self.to_dict())
+
+    def __len__(self):
+        return len(self.to_dict())
+
+    def __eq__(self, other):
+        if isinstance(other, (ContactInfo, dict)):
+            return self.to_dict() == (other.to_dict() if isinstance(other, ContactInfo) else other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"ContactInfo({self.to_dict()!r})"
 
 class Person:
     """Базовий клас для особи (пацієнта або лікаря)."""
+    __slots__ = ('id', 'name', '_contact_info')
+
     def __init__(self, id, name, contact_info):
-        self.id = id
+        self.id = _intern(id)
         self.name = name
         self.contact_info = contact_info # Наприклад, dict: {'phone': '...', 'email': '...'}
 
+    @property
+    def contact_info(self):
+        return self._contact_info
+
+    @contact_info.setter
+    def contact_info(self, value):
+        self._contact_info = ContactInfo.from_value(value)
+
     def __str__(self):
         return f"{self.name} (ID: {self.id})"
 
 class Patient(Person):
     """Клас для пацієнтів1."""
+    __slots__ = ('birth_date', '_medical_history')
+
     def __init__(self, id, name, contact_info, birth_date):
         super().__init__(id, name, contact_info)
         self.birth_date = birth_date
-        self.medical_history = [] # Список об'єктів MedicalRecord
+        # Список об'єктів MedicalRecord: None - ще немає записів (список створюється з першим),
+        # _HistoryLoader - історія лежить у сховищі й завантажується при першому зверненні
+        self._medical_history = None
+
+    @property
+    def medical_history(self):
+        history = self._medical_history
+        if type(history) is not list:
+            history = self._medical_history = [] if history is None else history.load(self)
+        return history
 
     def add_medical_record(self, record):
         if isinstance(record, MedicalRecord):
@@ -28,9 +143,11 @@ class Patient(Person):
 
 class Doctor(Person):
     """Клас для лікарів."""
+    __slots__ = ('specialization', 'appointments')
+
     def __init__(self, id, name, contact_info, specialization):
         super().__init__(id, name, contact_info)
-        self.specialization = specialization
+        self.specialization = _intern(specialization)
         self.appointments = [] # Список об'єктів Appointment
 
     def add_appointment(self, appointment):
@@ -42,14 +159,51 @@ class Doctor(Person):
     def get_appointments(self):
         return self.appointments
 
+class _Directory:
+    """Довідник пацієнтів і лікарів, через який записи знаходять особу за ID."""
+    __slots__ = ('patients', 'doctors')
+
+    def __init__(self, patients, doctors):
+        self.patients = patients # dict: {patient_id: patient_object}
+        self.doctors = doctors   # dict: {doctor_id: doctor_object}
+
+    @classmethod
+    def resolve(cls, patient, doctor, directory):
+        """
+        Повертає (patient_id, doctor_id, довідник) для пацієнта і лікаря, переданих
+        об'єктами чи ID. Для об'єктів без довідника клініки створюється власний.
+        """
+        if directory is None:
+            if not isinstance(patient, Patient) or not isinstance(doctor, Doctor):
+                raise ValueError("Без довідника пацієнт і лікар мають бути об'єктами Patient та Doctor.")
+            directory = cls({patient.id: patient}, {doctor.id: doctor})
+        patient_id = patient.id if isinstance(patient, Patient) else patient
+        doctor_id = doctor.id if isinstance(doctor, Doctor) else doctor
+        return patient_id, doctor_id, directory
+
 class Appointment:
-    """Клас для записів на прийом."""
-    def __init__(self, appointment_id, patient, doctor, date_time, reason):
+    """Клас для записів на прийом. Пацієнт і лікар зберігаються як ID."""
+    __slots__ = ('appointment_id', 'patient_id', 'doctor_id', 'date_time', 'reason', 'duration', '_directory')
+
+    def __init__(self, appointment_id, patient, doctor, date_time, reason, duration=DEFAULT_DURATION,
+                 directory=None):
         self.appointment_id = appointment_id
-        self.patient = patient        # Об'єкт Patient
-        self.doctor = doctor          # Об'єкт Doctor
+        self.patient_id, self.doctor_id, self._directory = _Directory.resolve(patient, doctor, directory)
         self.date_time = date_time    # Об'єкт datetime.datetime
-        self.reason = reason
+        self.reason = _intern(reason)
+        self.duration = duration      # Тривалість у хвилинах
+
+    @property
+    def patient(self):
+        return self._directory.patients[self.patient_id]
+
+    @property
+    def doctor(self):
+        return self._directory.doctors[self.doctor_id]
+
+    @property
+    def end_time(self):
+        return self.date_time + datetime.timedelta(minutes=self.duration)
 
     def __str__(self):
         return (f"Прийом ID: {self.appointment_id}, "
@@ -59,14 +213,23 @@ class Appointment:
                 f"Причина: {self.reason}")
 
 class MedicalRecord:
-    """Клас для медичних історій."""
-    def __init__(self, record_id, patient, doctor, date, diagnosis, treatment):
+    """Клас для медичних історій. Пацієнт і лікар зберігаються як ID."""
+    __slots__ = ('record_id', 'patient_id', 'doctor_id', 'date', 'diagnosis', 'treatment', '_directory')
+
+    def __init__(self, record_id, patient, doctor, date, diagnosis, treatment, directory=None):
         self.record_id = record_id
-        self.patient = patient       # Об'єкт Patient
-        self.doctor = doctor         # Об'єкт Doctor
+        self.patient_id, self.doctor_id, self._directory = _Directory.resolve(patient, doctor, directory)
         self.date = date             # Об'єкт datetime.date
-        self.diagnosis = diagnosis
-        self.treatment = treatment
+        self.diagnosis = _intern(diagnosis)
+        self.treatment = _intern(treatment)
+
+    @property
+    def patient(self):
+        return self._directory.patients[self.patient_id]
+
+    @property
+    def doctor(self):
+        return self._directory.doctors[self.doctor_id]
 
     def __str__(self):
         return (f"Медичний запис ID: {self.record_id}, "
@@ -76,25 +239,287 @@ class MedicalRecord:
                 f"Діагноз: {self.diagnosis}, "
                 f"Лікування: {self.treatment}")
 
+class _HistoryLoader:
+    """Спільний для пацієнтів клініки завантажувач медичної історії зі сховища."""
+    __slots__ = ('clinic',)
+
+    def __init__(self, clinic):
+        self.clinic = clinic
+
+    def load(self, patient):
+        clinic = self.clinic
+        history = [clinic._record_from_row(row) for row in clinic.store.records_for_patient(patient.id)]
+        for record in history:
+            clinic._index_record(record)
+        return history
+
+# Ключ сортування записів на прийом: (date_time, appointment_id)
+_time_key = attrgetter('date_time', 'appointment_id')
+
+class _TimeIndex:
+    """Список записів на прийом, відсортований за часом (для бінарного пошуку)."""
+    __slots__ = ('_items',)
+
+    def __init__(self):
+        # Об'єкти Appointment, відсортовані за (date_time, appointment_id); ключі не зберігаються
+        # окремо, а обчислюються під час бінарного пошуку
+        self._items = []
+
+    def add(self, appointment):
+        bisect.insort_right(self._items, appointment, key=_time_key)
+
+    def merge(self, appointments):
+        """
+        Додає відсортовані за часом записи за O(n + m): нові записи, пізніші за всі наявні,
+        просто дописуються, інакше timsort зливає дві відсортовані серії.
+        """
+        items = self._items
+        in_order = not items or _time_key(items[-1]) <= _time_key(appointments[0])
+        items.extend(appointments)
+        if not in_order:
+            items.sort(key=_time_key)
+
+    def find_overlap(self, start, end):
+        """
+        Повертає запис, що перетинається з проміжком [start, end), або None.
+        Записи лікаря не перетинаються між собою, тож їхні кінці теж відсортовані
+        і досить перевірити лише запис, що починається останнім перед end.
+        """
+        position = bisect.bisect_left(self._items, (end,), key=_time_key)
+        if position and self._items[position - 1].end_time > start:
+            return self._items[position - 1]
+        return None
+
+    def next_free(self, start, duration, adjust, before=None):
+        """
+        Найраніший час >= start, з якого вільно duration (timedelta).
+        adjust переносить кандидата у робочий час. Складність O(log n + k),
+        де k - кількість записів, проміжки між якими закороткі.
+        Якщо задано before, пошук припиняється (None), щойно кандидат сягає before.
+        """
+        candidate = adjust(start)
+        position = bisect.bisect_left(self._items, (candidate,), key=_time_key)
+        if position and self._items[position - 1].end_time > candidate:
+            candidate = adjust(self._items[position - 1].end_time)
+        while position < len(self._items):
+            if before is not None and candidate >= before:
+                return None
+            item = self._items[position]
+            if candidate + duration <= item.date_time:
+                break
+            if item.end_time > candidate:
+                candidate = adjust(item.end_time)
+            position += 1
+        return candidate
+
+    def between(self, start, end):
+        """Записи з часом у проміжку [start, end) за O(log n + k)."""
+        low = bisect.bisect_left(self._items, (start,), key=_time_key)
+        high = bisect.bisect_left(self._items, (end,), key=_time_key)
+        return self._items[low:high]
+
+    def since(self, start, limit=None):
+        """Записи з часом не раніше start (не більше limit штук)."""
+        low = bisect.bisect_left(self._items, (start,), key=_time_key)
+        high = len(self._items) if limit is None else min(len(self._items), low + limit)
+        return self._items[low:high]
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+@functools.lru_cache(maxsize=65536)
+def _parse_date_time(text):
+    """strptime 'РРРР-ММ-ДД ГГ:ХХ' з кешем: однакові мітки часу розбираються один раз."""
+    return datetime.datetime.strptime(text, '%Y-%m-%d %H:%M')
+
+@functools.lru_cache(maxsize=65536)
+def _parse_date(text):
+    """strptime 'РРРР-ММ-ДД' з кешем."""
+    return datetime.datetime.strptime(text, '%Y-%m-%d').date()
+
+def _to_datetime(value):
+    """Перетворює рядок 'РРРР-ММ-ДД ГГ:ХХ' (або datetime) на datetime.datetime."""
+    if isinstance(value, datetime.datetime):
+        return value
+    return _parse_date_time(value)
+
+def _to_date(value):
+    """Перетворює рядок 'РРРР-ММ-ДД' (або date) на datetime.date."""
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return _parse_date(value)
+
+def _parse_id(value):
+    """ID з файлу: рядок із цифр перетворюється на int, порожнє значення - на None."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return value
+
+# Поля файлів масового завантаження/вивантаження (CSV - усі стовпці, JSONL - лише заповнені)
+BULK_FIELDS = ['type', 'id', 'name', 'phone', 'email', 'birth_date', 'specialization',
+               'patient_id', 'doctor_id', 'date_time', 'duration', 'reason', 'date', 'diagnosis', 'treatment']
+BULK_TYPES = ('patient', 'doctor', 'appointment', 'record')
+
+def _bulk_format(path, fmt):
+    fmt = fmt or os.path.splitext(path)[1].lstrip('.').lower()
+    if fmt not in ('csv', 'jsonl'):
+        raise ValueError("Формат файлу має бути 'csv' або 'jsonl'.")
+    return fmt
+
+def _jsonl_rows(fd):
+    """
+    Пари (номер рядка, словник) непорожніх рядків JSONL. Замість рядка, що не є
+    JSON-об'єктом, повертається текст помилки - один такий рядок не зупиняє завантаження.
+    """
+    for line, text in enumerate(fd, 1):
+        if not text.strip():
+            continue
+        try:
+            row = json.loads(text)
+        except ValueError as error:
+            yield line, f"невірний JSON ({error.msg})"
+            continue
+        yield line, row if isinstance(row, dict) else "рядок має бути JSON-об'єктом"
+
+# Перетворення об'єктів на рядки таблиць сховища (clinic_store.TABLES)
+def _contact_columns(person):
+    contact = person.contact_info
+    extra = json.dumps(contact._extra, ensure_ascii=False) if contact._extra else None
+    return contact.phone, contact.email, extra
+
+def _patient_row(patient):
+    birth_date = patient.birth_date.isoformat() if patient.birth_date else None
+    return (patient.id, patient.name, *_contact_columns(patient), birth_date)
+
+def _doctor_row(doctor):
+    return (doctor.id, doctor.name, *_contact_columns(doctor), doctor.specialization)
+
+def _appointment_row(appointment):
+    return (appointment.appointment_id, appointment.patient_id, appointment.doctor_id,
+            appointment.date_time.isoformat(' '), appointment.duration, appointment.reason)
+
+def _record_row(record):
+    return (record.record_id, record.patient_id, record.doctor_id, record.date.isoformat(),
+            record.diagnosis, record.treatment)
+
+def _contact_from_columns(phone, email, extra):
+    return ContactInfo(phone, email, **(json.loads(extra) if extra else {}))
+
 class Clinic:
     """Основний клас "Клініка"."""
-    def __init__(self, name):
+    def __init__(self, name, events=None):
         self.name = name
+        # Приймач подій (events.py): за замовчуванням повідомлення друкуються
+        self.events = PrintSink() if events is None else events
         self.patients = {}  # dict: {patient_id: patient_object}
         self.doctors = {}   # dict: {doctor_id: doctor_object}
+        # Записи на прийом і медичні записи посилаються на пацієнтів і лікарів через цей довідник
+        self._directory = _Directory(self.patients, self.doctors)
         self.appointments = {} # dict: {appointment_id: appointment_object}
         self.medical_records = {} # dict: {record_id: medical_record_object}
+        # Повнотекстовий індекс медичних записів (record_index.py)
+        self.record_index = RecordIndex(self.medical_records)
+        # Лічильники для звітів (clinic_analytics.py), оновлюються з кожним прийомом і записом
+        self.analytics = ClinicAnalytics()
+        # Часові індекси записів на прийом: {doctor_id: _TimeIndex}, {patient_id: _TimeIndex}, {date: _TimeIndex}
+        self._doctor_schedule = {}
+        self._patient_schedule = {}
+        self._date_schedule = {}
+        self._doctors_by_specialization = {} # dict: {specialization: [doctor_id, ...]}
         self._next_appointment_id = 1
         self._next_medical_record_id = 1
+        self.store = None # ClinicStore, якщо клініку відкрито через Clinic.open
+        self._lazy_histories = False # Чи є пацієнти з ще не завантаженою медичною історією
+
+    @classmethod
+    def open(cls, path, name=None, events=None, **store_options):
+        """
+        Відкриває клініку, збережену у файлі SQLite (або створює нову), і надалі
+        зберігає в ньому всі зміни пакетами (store_options передаються ClinicStore).
+        Пацієнти, лікарі, прийоми та лічильники ID завантажуються одразу,
+        медична історія пацієнта - при першому зверненні.
+        """
+        store = ClinicStore(path, **store_options)
+        clinic = cls(name or store.meta('name') or os.path.splitext(os.path.basename(path))[0], events)
+        clinic._attach_store(store)
+        return clinic
+
+    def _attach_store(self, store):
+        loader = _HistoryLoader(self)
+        parse_date = functools.lru_cache(maxsize=65536)(datetime.date.fromisoformat)
+        parse_date_time = functools.lru_cache(maxsize=65536)(datetime.datetime.fromisoformat)
+        for patient_id, name, phone, email, extra, birth_date in store.rows('patients'):
+            patient = Patient(patient_id, name, _contact_from_columns(phone, email, extra),
+                              parse_date(birth_date) if birth_date else None)
+            patient._medical_history = loader
+            self._insert_patient(patient)
+        for doctor_id, name, phone, email, extra, specialization in store.rows('doctors'):
+            self._insert_doctor(Doctor(doctor_id, name, _contact_from_columns(phone, email, extra), specialization))
+        appointments = [Appointment(appointment_id, patient_id, doctor_id, parse_date_time(date_time),
+                                    reason, duration, self._directory)
+                        for appointment_id, patient_id, doctor_id, date_time, duration, reason
+                        in store.rows('appointments')]
+        self._register_appointments(appointments)
+        # Лічильники звітів для записів, що лишаються у сховищі до першого звернення
+        for date, specialization, diagnosis, count in store.record_counts():
+            self.analytics.add_records(parse_date(date), specialization, diagnosis, count)
+        # Лічильники з meta; MAX(id) страхує від лічильника, записаного раніше за останній рядок
+        self._next_appointment_id = max(store.meta('next_appointment_id', 1), store.max_id('appointments') + 1)
+        self._next_medical_record_id = max(store.meta('next_medical_record_id', 1),
+                                           store.max_id('medical_records') + 1)
+        store.state_callback = self._store_state
+        self.store = store
+        self._lazy_histories = bool(self.patients)
+
+    def _store_state(self):
+        return {'name': self.name, 'next_appointment_id': self._next_appointment_id,
+                'next_medical_record_id': self._next_medical_record_id}
+
+    def _record_from_row(self, row):
+        record_id, patient_id, doctor_id, date, diagnosis, treatment = row
+        return MedicalRecord(record_id, patient_id, doctor_id, datetime.date.fromisoformat(date),
+                             diagnosis, treatment, self._directory)
+
+    def load_medical_records(self):
+        """Завантажує зі сховища всі ще не завантажені медичні історії (одним запитом)."""
+        if not self._lazy_histories:
+            return
+        pending = {patient.id for patient in self.patients.values()
+                   if type(patient._medical_history) is _HistoryLoader}
+        if pending:
+            histories = {}
+            for row in self.store.rows('medical_records'):
+                if row[1] in pending:
+                    record = self._record_from_row(row)
+                    histories.setdefault(record.patient_id, []).append(record)
+                    self._index_record(record)
+            for patient_id in pending:
+                self.patients[patient_id]._medical_history = histories.get(patient_id, [])
+        self._lazy_histories = False
+
+    def close(self):
+        """Записує зміни у сховище та закриває його."""
+        if self.store is not None:
+            self.store.close()
+            self.store = None
 
     def add_patient(self, patient):
         if not isinstance(patient, Patient):
             raise ValueError("Об'єкт повинен бути екземпляром класу Patient.")
         if patient.id in self.patients:
-            print(f"Пацієнт з ID {patient.id} вже існує.")
+            self.events.emit('patient_exists', "Пацієнт з ID {patient_id} вже існує.", patient_id=patient.id)
             return False
-        self.patients[patient.id] = patient
-        print(f"Пацієнт {patient.name} доданий.")
+        self._insert_patient(patient)
+        # Поля події збираються лише для увімкненого приймача
+        if self.events.enabled:
+            self.events.emit('patient_added', "Пацієнт {name} доданий.", patient_id=patient.id, name=patient.name)
         return True
 
     def get_patient(self, patient_id):
@@ -104,78 +529,528 @@ class Clinic:
         if not isinstance(doctor, Doctor):
             raise ValueError("Об'єкт повинен бути екземпляром класу Doctor.")
         if doctor.id in self.doctors:
-            print(f"Лікар з ID {doctor.id} вже існує.")
+            self.events.emit('doctor_exists', "Лікар з ID {doctor_id} вже існує.", doctor_id=doctor.id)
             return False
-        self.doctors[doctor.id] = doctor
-        print(f"Лікар {doctor.name} доданий.")
+        self._insert_doctor(doctor)
+        if self.events.enabled:
+            self.events.emit('doctor_added', "Лікар {name} доданий.", doctor_id=doctor.id, name=doctor.name)
         return True
 
+    def _insert_patient(self, patient):
+        self.patients[patient.id] = patient
+        if self.store is not None:
+            self.store.add('patients', _patient_row(patient))
+
+    def _insert_doctor(self, doctor):
+        self.doctors[doctor.id] = doctor
+        self._doctors_by_specialization.setdefault(doctor.specialization, []).append(doctor.id)
+        if self.store is not None:
+            self.store.add('doctors', _doctor_row(doctor))
+
     def get_doctor(self, doctor_id):
         return self.doctors.get(doctor_id)
 
-    def schedule_appointment(self, patient_id, doctor_id, date_time_str, reason):
+    def schedule_appointment(self, patient_id, doctor_id, date_time_str, reason, duration=DEFAULT_DURATION):
         patient = self.get_patient(patient_id)
         doctor = self.get_doctor(doctor_id)
 
         if not patient:
-            print(f"Пацієнт з ID {patient_id} не знайдений.")
+            self.events.emit('patient_not_found', "Пацієнт з ID {patient_id} не знайдений.", patient_id=patient_id)
             return None
         if not doctor:
-            print(f"Лікар з ID {doctor_id} не знайдений.")
+            self.events.emit('doctor_not_found', "Лікар з ID {doctor_id} не знайдений.", doctor_id=doctor_id)
             return None
 
         try:
-            date_time_obj = datetime.datetime.strptime(date_time_str, '%Y-%m-%d %H:%M')
+            date_time_obj = _to_datetime(date_time_str)
         except ValueError:
-            print("Невірний формат дати/часу. Використовуйте 'РРРР-ММ-ДД ГГ:ХХ'.")
+            self.events.emit('invalid_date_time', "Невірний формат дати/часу. Використовуйте 'РРРР-ММ-ДД ГГ:ХХ'.")
+            return None
+        if not isinstance(duration, int) or duration <= 0:
+            self.events.emit('invalid_duration', "Тривалість прийому має бути додатним цілим числом хвилин.",
+                             duration=duration)
+            return None
+
+        conflict = self.find_conflict(doctor_id, date_time_obj, duration)
+        if conflict:
+            self.events.emit('doctor_busy', "Лікар {name} зайнятий у цей час (прийом ID {appointment_id}).",
+                             doctor_id=doctor.id, name=doctor.name, appointment_id=conflict.appointment_id)
             return None
 
         appointment_id = self._next_appointment_id
-        appointment = Appointment(appointment_id, patient, doctor, date_time_obj, reason)
-        self.appointments[appointment_id] = appointment
-        # patient.add_appointment(appointment) # ВИДАЛИТИ ЦЕЙ РЯДОК
-        doctor.add_appointment(appointment) # ЦЕЙ РЯДОК ПОВИНЕН БУТИ
+        appointment = Appointment(appointment_id, patient, doctor, date_time_obj, reason, duration,
+                                  self._directory)
+        self._register_appointment(appointment)
         self._next_appointment_id += 1
-        print(f"Запис на прийом ID {appointment_id} створено.")
+        if self.events.enabled:
+            self.events.emit('appointment_scheduled', "Запис на прийом ID {appointment_id} створено.",
+                             appointment_id=appointment_id, patient_id=patient.id, doctor_id=doctor.id,
+                             date_time=date_time_obj, duration=duration)
         return appointment
 
+    def _register_appointment(self, appointment):
+        """Додає запис на прийом до словника, списку лікаря та часових індексів."""
+        self.appointments[appointment.appointment_id] = appointment
+        appointment.doctor.add_appointment(appointment)
+        for index, key in ((self._doctor_schedule, appointment.doctor.id),
+                           (self._patient_schedule, appointment.patient.id),
+                           (self._date_schedule, appointment.date_time.date())):
+            schedule = index.get(key)
+            if schedule is None:
+                schedule = index[key] = _TimeIndex()
+            schedule.add(appointment)
+        self.analytics.add_appointment(appointment)
+        if self.store is not None:
+            self.store.add('appointments', _appointment_row(appointment))
+
+    def _register_appointments(self, appointments):
+        """Додає відсортовані за часом записи до індексів злиттям (один прохід на кожен індекс)."""
+        by_doctor, by_patient, by_date = {}, {}, {}
+        add_to_analytics = self.analytics.add_appointment
+        for appointment in appointments:
+            self.appointments[appointment.appointment_id] = appointment
+            appointment.doctor.add_appointment(appointment)
+            add_to_analytics(appointment)
+            by_doctor.setdefault(appointment.doctor_id, []).append(appointment)
+            by_patient.setdefault(appointment.patient_id, []).append(appointment)
+            by_date.setdefault(appointment.date_time.date(), []).append(appointment)
+        for index, groups in ((self._doctor_schedule, by_doctor), (self._patient_schedule, by_patient),
+                              (self._date_schedule, by_date)):
+            for key, items in groups.items():
+                schedule = index.get(key)
+                if schedule is None:
+                    schedule = index[key] = _TimeIndex()
+                schedule.merge(items)
+        if self.store is not None:
+            self.store.add_many('appointments', map(_appointment_row, appointments))
+
+    def find_conflict(self, doctor_id, start, duration=DEFAULT_DURATION):
+        """Прийом лікаря, що перетинається з [start, start + duration хв), або None (O(log n))."""
+        schedule = self._doctor_schedule.get(doctor_id)
+        if not schedule:
+            return None
+        start = _to_datetime(start)
+        return schedule.find_overlap(start, start + datetime.timedelta(minutes=duration))
+
+    def find_next_free_slot(self, specialization, duration=DEFAULT_DURATION, after=None):
+        """
+        Найраніший вільний проміжок тривалістю duration хвилин у робочий час серед лікарів
+        спеціалізації. Повертає кортеж (лікар, datetime) або None, якщо таких лікарів немає.
+        """
+        length = datetime.timedelta(minutes=duration)
+        day_start = datetime.datetime.combine(datetime.date.min, WORKING_DAY_START)
+        if duration <= 0 or day_start + length > datetime.datetime.combine(datetime.date.min, WORKING_DAY_END):
+            self.events.emit('invalid_duration', "Тривалість прийому має вкладатися у робочий день.",
+                             duration=duration)
+            return None
+        try:
+            after = datetime.datetime.now() if after is None else _to_datetime(after)
+        except ValueError:
+            self.events.emit('invalid_date_time', "Невірний формат дати/часу. Використовуйте 'РРРР-ММ-ДД ГГ:ХХ'.")
+            return None
+
+        def adjust(moment):
+            # Переносимо початок у робочий час (за потреби - на наступний день)
+            if moment.time() < WORKING_DAY_START:
+                moment = datetime.datetime.combine(moment.date(), WORKING_DAY_START)
+            if moment + length > datetime.datetime.combine(moment.date(), WORKING_DAY_END):
+                moment = datetime.datetime.combine(moment.date() + datetime.timedelta(days=1), WORKING_DAY_START)
+            return moment
+
+        best = None
+        for doctor_id in self._doctors_by_specialization.get(specialization, []):
+            schedule = self._doctor_schedule.get(doctor_id) or _TimeIndex()
+            # Розклад лікаря переглядаємо лише до найкращого вже знайденого часу
+            slot = schedule.next_free(after, length, adjust, best[1] if best else None)
+            if slot is not None and (best is None or slot < best[1]):
+                best = (self.doctors[doctor_id], slot)
+        return best
+
+    def schedule_appointments(self, requests):
+        """
+        Пакетний запис на прийом. requests - ітерований набір кортежів
+        (patient_id, doctor_id, date_time_str, reason[, duration]).
+        Запити кожного лікаря сортуються і звіряються з його розкладом одним проходом;
+        при перетині запитів між собою перевагу має раніший за часом.
+        Повертає список Appointment або None (відхилені) у порядку запитів.
+        """
+        results = []
+        by_doctor = {}
+        for position, request in enumerate(requests):
+            patient_id, doctor_id, date_time_str, reason = request[:4]
+            duration = request[4] if len(request) > 4 else DEFAULT_DURATION
+            results.append(None)
+            patient = self.get_patient(patient_id)
+            doctor = self.get_doctor(doctor_id)
+            if not patient or not doctor or not isinstance(duration, int) or duration <= 0:
+                continue
+            try:
+                start = _to_datetime(date_time_str)
+            except ValueError:
+                continue
+            by_doctor.setdefault(doctor.id, []).append((start, position, patient, doctor, reason, duration, None))
+
+        placed = self._place_appointments(by_doctor)
+        for position, appointment in placed:
+            results[position] = appointment
+        self.events.emit('appointments_batch', "Пакетний запис: створено {created}, відхилено {rejected}.",
+                         created=len(placed), rejected=len(results) - len(placed))
+        return results
+
+    def _place_appointments(self, by_doctor):
+        """
+        Розміщує пакет запитів {doctor_id: [(start, position, patient, doctor, reason, duration, id), ...]}
+        одним проходом по розкладу кожного лікаря. id = None - призначити наступний вільний.
+        Повертає список (position, Appointment) прийнятих запитів.
+        """
+        accepted = []
+        for doctor_id, batch in by_doctor.items():
+            batch.sort(key=itemgetter(0, 1))
+            schedule = self._doctor_schedule.get(doctor_id)
+            existing = schedule._items if schedule else []
+            # Починаємо з останнього запису, що стартує до першого запиту
+            cursor = max(0, bisect.bisect_left(existing, (batch[0][0],), key=_time_key) - 1) if batch else 0
+            last_end = None
+            for request in batch:
+                start, duration = request[0], request[5]
+                end = start + datetime.timedelta(minutes=duration)
+                # Початки запитів не спадають, тож вказівник у розкладі рухається лише вперед
+                while cursor < len(existing) and existing[cursor].end_time <= start:
+                    cursor += 1
+                if cursor < len(existing) and existing[cursor].date_time < end:
+                    continue
+                if last_end is not None and start < last_end:
+                    continue
+                last_end = end
+                accepted.append(request)
+
+        accepted.sort(key=itemgetter(0, 1))
+        # Явні ID пакета резервуються до автонумерації, щоб раніший за часом запит без ID
+        # не отримав номер, який у файлі стоїть у пізнішого запиту
+        explicit_ids = [request[6] for request in accepted if request[6] is not None]
+        if explicit_ids:
+            self._next_appointment_id = max(self._next_appointment_id, max(explicit_ids) + 1)
+        placed = []
+        appointments = []
+        for start, position, patient, doctor, reason, duration, appointment_id in accepted:
+            if appointment_id is None:
+                appointment_id = self._next_appointment_id
+                self._next_appointment_id += 1
+            appointment = Appointment(appointment_id, patient, doctor, start, reason, duration, self._directory)
+            placed.append((position, appointment))
+            appointments.append(appointment)
+        self._register_appointments(appointments)
+        return placed
+
     def add_medical_record_to_patient(self, patient_id, doctor_id, date_str, diagnosis, treatment):
         patient = self.get_patient(patient_id)
         doctor = self.get_doctor(doctor_id)
 
         if not patient:
-            print(f"Пацієнт з ID {patient_id} не знайдений.")
+            self.events.emit('patient_not_found', "Пацієнт з ID {patient_id} не знайдений.", patient_id=patient_id)
             return None
         if not doctor:
-            print(f"Лікар з ID {doctor_id} не знайдений.")
+            self.events.emit('doctor_not_found', "Лікар з ID {doctor_id} не знайдений.", doctor_id=doctor_id)
             return None
 
         try:
-            date_obj = datetime.datetime.strptime(date_str, '%Y-%m-%d').date()
+            date_obj = _to_date(date_str)
         except ValueError:
-            print("Невірний формат дати. Використовуйте 'РРРР-ММ-ДД'.")
+            self.events.emit('invalid_date', "Невірний формат дати. Використовуйте 'РРРР-ММ-ДД'.")
             return None
 
         record_id = self._next_medical_record_id
-        record = MedicalRecord(record_id, patient, doctor, date_obj, diagnosis, treatment)
-        self.medical_records[record_id] = record
-        patient.add_medical_record(record)
+        record = MedicalRecord(record_id, patient, doctor, date_obj, diagnosis, treatment, self._directory)
+        self._insert_record(record)
         self._next_medical_record_id += 1
-        print(f"Медичний запис ID {record_id} додано для пацієнта {patient.name}.")
+        if self.events.enabled:
+            self.events.emit('record_added', "Медичний запис ID {record_id} додано для пацієнта {name}.",
+                             record_id=record_id, patient_id=patient.id, doctor_id=doctor.id, name=patient.name)
         return record
 
+    def _insert_record(self, record):
+        self._index_record(record)
+        self.analytics.add_record(record)
+        record.patient.add_medical_record(record)
+        if self.store is not None:
+            self.store.add('medical_records', _record_row(record))
+
+    def _index_record(self, record):
+        """
+        Додає медичний запис до словника та пошукового індексу. Лічильники звітів оновлює
+        _insert_record: записи, завантажені зі сховища, враховано ще в _attach_store.
+        """
+        self.medical_records[record.record_id] = record
+        self.record_index.add(record)
+
     def get_patient_medical_history(self, patient_id):
         patient = self.get_patient(patient_id)
         if patient:
             return patient.get_medical_history()
         return []
 
+    def search_medical_records(self, query, start=None, end=None, doctor_id=None, field=None,
+                               days=None, today=None):
+        """
+        Повнотекстовий пошук у діагнозах і лікуванні (синтаксис запиту - у record_index.py).
+        Фільтри: дати запису в [start, end] включно або останні days днів до today
+        (за замовчуванням - сьогодні) включно, лікар doctor_id, лише одне поле field
+        ('diagnosis' або 'treatment'). Повертає SearchResults - записи за спаданням
+        релевантності, сортуються в міру читання (page(offset, limit), patient_ids()).
+        """
+        try:
+            start = None if start is None else _to_date(start)
+            end = None if end is None else _to_date(end)
+            if days is not None:
+                end = datetime.date.today() if today is None else _to_date(today)
+                start = end - datetime.timedelta(days=days - 1)
+        except ValueError:
+            self.events.emit('invalid_date', "Невірний формат дати. Використовуйте 'РРРР-ММ-ДД'.")
+            return SearchResults(self.medical_records, [])
+        # Індекс охоплює лише завантажені записи, тож спершу дочитуємо історії зі сховища
+        self.load_medical_records()
+        return self.record_index.search(query, start, end, doctor_id, field)
+
     def get_doctor_appointments(self, doctor_id):
         doctor = self.get_doctor(doctor_id)
         if doctor:
             return doctor.get_appointments()
         return []
 
+    def get_doctor_appointments_between(self, doctor_id, start, end):
+        """Прийоми лікаря з часом у проміжку [start, end), відсортовані за часом."""
+        try:
+            start, end = _to_datetime(start), _to_datetime(end)
+        except ValueError:
+            self.events.emit('invalid_date_time', "Невірний формат дати/часу. Використовуйте 'РРРР-ММ-ДД ГГ:ХХ'.")
+            return []
+        schedule = self._doctor_schedule.get(doctor_id)
+        return schedule.between(start, end) if schedule else []
+
+    def get_patient_upcoming_appointments(self, patient_id, now=None, limit=None):
+        """Майбутні прийоми пацієнта (починаючи з now, за замовчуванням - з поточного моменту)."""
+        try:
+            now = datetime.datetime.now() if now is None else _to_datetime(now)
+        except ValueError:
+            self.events.emit('invalid_date_time', "Невірний формат дати/часу. Використовуйте 'РРРР-ММ-ДД ГГ:ХХ'.")
+            return []
+        schedule = self._patient_schedule.get(patient_id)
+        return schedule.since(now, limit) if schedule else []
+
+    def get_appointments_on_date(self, date):
+        """Усі прийоми клініки за вказану дату, відсортовані за часом."""
+        try:
+            date = _to_date(date)
+        except ValueError:
+            self.events.emit('invalid_date', "Невірний формат дати. Використовуйте 'РРРР-ММ-ДД'.")
+            return []
+        schedule = self._date_schedule.get(date)
+        return list(schedule) if schedule else []
+
+    # --- Масове завантаження та вивантаження ---
+
+    def bulk_load(self, path, fmt=None, batch_size=10000, max_errors=100):
+        """
+        Потоково завантажує пацієнтів, лікарів, прийоми та медичні записи з CSV або JSONL
+        (поле type: patient, doctor, appointment, record). Рядки перевіряються пакетами
+        по batch_size, нічого не виводиться на кожен рядок. Пацієнти й лікарі пакета
+        додаються раніше за прийоми та записи, що на них посилаються.
+        Повертає словник зі статистикою: кількості за типами, rejected, errors
+        (перші max_errors повідомлень), seconds, rows_per_second.
+        """
+        fmt = _bulk_format(path, fmt)
+        stats = {kind: 0 for kind in BULK_TYPES}
+        stats.update(rows=0, rejected=0, errors=[])
+        batches = {kind: [] for kind in BULK_TYPES}
+        started = time.perf_counter()
+
+        def reject(line, message):
+            stats['rejected'] += 1
+            if len(stats['errors']) < max_errors:
+                stats['errors'].append(f"рядок {line}: {message}")
+
+        def flush():
+            self._load_patients(batches['patient'], stats, reject)
+            self._load_doctors(batches['doctor'], stats, reject)
+            self._load_appointments(batches['appointment'], stats, reject)
+            self._load_records(batches['record'], stats, reject)
+            for batch in batches.values():
+                batch.clear()
+
+        with open(path, 'r', encoding='utf-8', newline='') as fd:
+            rows = enumerate(csv.DictReader(fd), 2) if fmt == 'csv' else _jsonl_rows(fd)
+            pending = 0
+            for line, row in rows:
+                stats['rows'] += 1
+                if isinstance(row, str):
+                    reject(line, row)
+                    continue
+                batch = batches.get(row.get('type'))
+                if batch is None:
+                    reject(line, f"невідомий тип запису {row.get('type')!r}")
+                    continue
+                batch.append((line, row))
+                pending += 1
+                if pending >= batch_size:
+                    flush()
+                    pending = 0
+            flush()
+
+        stats['seconds'] = time.perf_counter() - started
+        stats['rows_per_second'] = stats['rows'] / stats['seconds'] if stats['seconds'] else 0.0
+        return stats
+
+    def _load_patients(self, batch, stats, reject):
+        for line, row in batch:
+            patient_id = _parse_id(row.get('id'))
+            if patient_id is None or not row.get('name'):
+                reject(line, "пацієнт без ID або імені")
+                continue
+            if patient_id in self.patients:
+                reject(line, f"пацієнт з ID {patient_id} вже існує")
+                continue
+            try:
+                birth_date = _to_date(row['birth_date']) if row.get('birth_date') else None
+            except ValueError:
+                reject(line, "невірний формат дати народження")
+                continue
+            contact_info = ContactInfo(row.get('phone') or None, row.get('email') or None)
+            self._insert_patient(Patient(patient_id, row['name'], contact_info, birth_date))
+            stats['patient'] += 1
+
+    def _load_doctors(self, batch, stats, reject):
+        for line, row in batch:
+            doctor_id = _parse_id(row.get('id'))
+            if doctor_id is None or not row.get('name'):
+                reject(line, "лікар без ID або імені")
+                continue
+            if doctor_id in self.doctors:
+                reject(line, f"лікар з ID {doctor_id} вже існує")
+                continue
+            contact_info = ContactInfo(row.get('phone') or None, row.get('email') or None)
+            self._insert_doctor(Doctor(doctor_id, row['name'], contact_info, row.get('specialization') or ''))
+            stats['doctor'] += 1
+
+    def _resolve_people(self, row):
+        """Повертає (пацієнт, лікар) рядка або текст помилки."""
+        patient = self.patients.get(_parse_id(row.get('patient_id')))
+        if patient is None:
+            return f"пацієнт з ID {row.get('patient_id')} не знайдений"
+        doctor = self.doctors.get(_parse_id(row.get('doctor_id')))
+        if doctor is None:
+            return f"лікар з ID {row.get('doctor_id')} не знайдений"
+        return patient, doctor
+
+    def _load_appointments(self, batch, stats, reject):
+        by_doctor = {}
+        waiting = set() # Рядки, що пройшли перевірку і чекають на розміщення у розкладі
+        seen_ids = set()
+        for line, row in batch:
+            people = self._resolve_people(row)
+            if isinstance(people, str):
+                reject(line, people)
+                continue
+            appointment_id = _parse_id(row.get('id'))
+            if appointment_id is not None and (not isinstance(appointment_id, int) or appointment_id in self.appointments
+                                               or appointment_id in seen_ids):
+                reject(line, f"невірний або повторний ID прийому {appointment_id}")
+                continue
+            try:
+                start = _to_datetime(row.get('date_time') or '')
+                duration = int(row.get('duration') or DEFAULT_DURATION)
+            except ValueError:
+                reject(line, "невірний формат дати/часу або тривалості")
+                continue
+            if duration <= 0:
+                reject(line, "тривалість прийому має бути додатною")
+                continue
+            if appointment_id is not None:
+                seen_ids.add(appointment_id)
+            patient, doctor = people
+            waiting.add(line)
+            by_doctor.setdefault(doctor.id, []).append(
+                (start, line, patient, doctor, row.get('reason') or '', duration, appointment_id))
+
+        placed = self._place_appointments(by_doctor)
+        waiting.difference_update(line for line, _ in placed)
+        for line in sorted(waiting):
+            reject(line, "лікар зайнятий у цей час")
+        stats['appointment'] += len(placed)
+
+    def _load_records(self, batch, stats, reject):
+        # Перевірка повторних ID потребує всіх записів, зокрема ще не завантажених зі сховища
+        self.load_medical_records()
+        for line, row in batch:
+            people = self._resolve_people(row)
+            if isinstance(people, str):
+                reject(line, people)
+                continue
+            record_id = _parse_id(row.get('id'))
+            if record_id is None:
+                record_id = self._next_medical_record_id
+            elif not isinstance(record_id, int) or record_id in self.medical_records:
+                reject(line, f"невірний або повторний ID медичного запису {record_id}")
+                continue
+            try:
+                date = _to_date(row.get('date') or '')
+            except ValueError:
+                reject(line, "невірний формат дати")
+                continue
+            patient, doctor = people
+            self._insert_record(MedicalRecord(record_id, patient, doctor, date, row.get('diagnosis') or '',
+                                              row.get('treatment') or '', self._directory))
+            self._next_medical_record_id = max(self._next_medical_record_id, record_id + 1)
+            stats['record'] += 1
+
+    def _export_rows(self):
+        """Рядки для вивантаження у порядку залежностей: пацієнти, лікарі, прийоми, записи."""
+        self.load_medical_records()
+        format_date_time = functools.lru_cache(maxsize=65536)(lambda value: value.strftime('%Y-%m-%d %H:%M'))
+        format_date = functools.lru_cache(maxsize=65536)(lambda value: value.strftime('%Y-%m-%d'))
+        for patient in self.patients.values():
+            yield {'type': 'patient', 'id': patient.id, 'name': patient.name,
+                   'phone': patient.contact_info.phone, 'email': patient.contact_info.email,
+                   'birth_date': format_date(patient.birth_date) if patient.birth_date else None}
+        for doctor in self.doctors.values():
+            yield {'type': 'doctor', 'id': doctor.id, 'name': doctor.name,
+                   'phone': doctor.contact_info.phone, 'email': doctor.contact_info.email,
+                   'specialization': doctor.specialization}
+        for appointment in self.appointments.values():
+            yield {'type': 'appointment', 'id': appointment.appointment_id,
+                   'patient_id': appointment.patient_id, 'doctor_id': appointment.doctor_id,
+                   'date_time': format_date_time(appointment.date_time), 'duration': appointment.duration,
+                   'reason': appointment.reason}
+        for record in self.medical_records.values():
+            yield {'type': 'record', 'id': record.record_id,
+                   'patient_id': record.patient_id, 'doctor_id': record.doctor_id,
+                   'date': format_date(record.date), 'diagnosis': record.diagnosis, 'treatment': record.treatment}
+
+    def export(self, path, fmt=None):
+        """
+        Потоково вивантажує всі дані клініки у CSV або JSONL (формат, який читає bulk_load).
+        З контактних даних вивантажуються лише phone та email: інші поля ContactInfo
+        (info['telegram'] тощо) у файл не потрапляють і після bulk_load втрачаються.
+        Повертає словник зі статистикою: rows, seconds, rows_per_second.
+        """
+        fmt = _bulk_format(path, fmt)
+        started = time.perf_counter()
+        count = 0
+        with open(path, 'w', encoding='utf-8', newline='') as fd:
+            if fmt == 'csv':
+                writer = csv.writer(fd)
+                writer.writerow(BULK_FIELDS)
+                for row in self._export_rows():
+                    writer.writerow(['' if row.get(field) is None else row[field] for field in BULK_FIELDS])
+                    count += 1
+            else:
+                dumps = json.JSONEncoder(ensure_ascii=False).encode
+                for row in self._export_rows():
+                    fd.write(dumps({key: value for key, value in row.items() if value is not None}))
+                    fd.write('\n')
+                    count += 1
+        seconds = time.perf_counter() - started
+        return {'rows': count, 'seconds': seconds, 'rows_per_second': count / seconds if seconds else 0.0}
+
 # --- Приклад використання класу "Клініка" ---
 if __name__ == "__main__":
     my_clinic = Clinic("Моя Добробут Клініка")
@@ -223,4 +1098,69 @@ if __name__ == "__main__":
     # Перегляд прийомів лікаря
     print(f"\nПрийоми для {doctor1.name}:")
     for appointment in my_clinic.get_doctor_appointments(101):
-        print(f"- {appointment.date_time.strftime('%Y-%m-%d %H:%M')}: Пацієнт {appointment.patient.name}, Причина: {appointment.reason}")
\ No newline at end of file
+        print(f"- {appointment.date_time.strftime('%Y-%m-%d %H:%M')}: Пацієнт {appointment.patient.name}, Причина: {appointment.reason}")
+
+    # Запити за часовими індексами
+    print(f"\nПрийоми {doctor1.name} 2025-06-10 з 10:30 до 12:00:")
+    for appointment in my_clinic.get_doctor_appointments_between(101, "2025-06-10 10:30", "2025-06-10 12:00"):
+        print(f"- {appointment}")
+
+    print(f"\nМайбутні прийоми {patient1.name} (станом на 2025-06-10 12:00):")
+    for appointment in my_clinic.get_patient_upcoming_appointments(1, now="2025-06-10 12:00"):
+        print(f"- {appointment}")
+
+    print("\nУсі прийоми на 2025-06-10:")
+    for appointment in my_clinic.get_appointments_on_date("2025-06-10"):
+        print(f"- {appointment}")
+
+    print("\n--- Розклад без накладок ---")
+    # Спроба записати на вже зайнятий час
+    my_clinic.schedule_appointment(2, 101, "2025-06-10 10:15", "Повторний огляд")
+    slot = my_clinic.find_next_free_slot("Терапевт", duration=60, after="2025-06-10 09:30")
+    if slot:
+        print(f"Найближчий вільний час терапевта на 60 хв: {slot[0].name}, {slot[1].strftime('%Y-%m-%d %H:%M')}")
+    booked = my_clinic.schedule_appointments([
+        (1, 102, "2025-06-12 09:00", "Перев'язка", 20),
+        (2, 102, "2025-06-12 09:10", "Консультація"),
+        (2, 102, "2025-06-12 09:20", "Консультація"),
+    ])
+    for appointment in booked:
+        print(f"- {appointment if appointment else 'відхилено (час зайнятий)'}")
+    print("\n--- Пошук у медичних записах ---")
+    my_clinic.add_medical_record_to_patient(2, 102, "2025-06-12", "Гострий бронхіт", "Антибіотик, інгаляції")
+    for query in ("ГРВІ", "антибіот*", "бронхіт АБО грві -інгаляції"):
+        results = my_clinic.search_medical_records(query, days=30, today="2025-06-20")
+        print(f"'{query}': знайдено {len(results)}, пацієнти {list(results.patient_ids())}")
+        for record in results.page(0, 2):
+            print(f"- {record.date}: {record.diagnosis} - {record.treatment}")
+    print("\n--- Зведення для панелі ---")
+    summary = my_clinic.analytics.summary(today="2025-06-12", k=3)
+    print(f"Прийомів: {summary['appointments']} (за 7 днів: {summary['appointments_7d']}), "
+          f"медичних записів: {summary['records']}")
+    print(f"За спеціалізаціями: {summary['by_specialization']}")
+    print(f"Навантаження {doctor1.name} 2025-06-10: {my_clinic.analytics.doctor_load(101, datetime.date(2025, 6, 10))}")
+    print(f"Найчастіші діагнози за 30 днів: {summary['top_diagnoses_30d']}")
+    print("\n--- Тихий режим: події в буфері замість друку ---")
+    my_clinic.events = RingBufferSink(capacity=100)
+    my_clinic.schedule_appointment(2, 102, "2025-06-13 10:00", "Огляд")
+    my_clinic.schedule_appointment(2, 102, "2025-06-13 10:10", "Огляд")
+    my_clinic.schedule_appointment(3, 102, "2025-06-13 12:00", "Огляд")
+    for event in my_clinic.events:
+        print(f"- {event.kind}: {event.message}")
+
+    print("\n--- Постійне сховище ---")
+    with tempfile.TemporaryDirectory() as directory_path:
+        path = os.path.join(directory_path, "clinic.db")
+        export_path = os.path.join(directory_path, "export.jsonl")
+        my_clinic.export(export_path)
+        # Переносимо дані клініки у сховище, закриваємо та відкриваємо знову
+        stored = Clinic.open(path, name="Моя Добробут Клініка")
+        stored.bulk_load(export_path)
+        stored.close()
+        reopened = Clinic.open(path)
+        print(f"Після перезапуску: пацієнтів {len(reopened.patients)}, прийомів {len(reopened.appointments)}, "
+              f"наступний ID прийому {reopened._next_appointment_id}")
+        print(f"Медична історія {reopened.get_patient(1).name} (завантажена при зверненні):")
+        for record in reopened.get_patient_medical_history(1):
+            print(f"- {record.date}: {record.diagnosis} - {record.treatment}")
+        reopened.close()
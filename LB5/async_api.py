@@ -0,0 +1,319 @@
+"""
+Асинхронний інтерфейс (asyncio) до Bank і Clinic.
+
+Це черга з одним писарем, а не паралельне виконання: кожна операція запису стає
+командою в одній черзі, а одна задача-писар виконує команди по черзі в потоці
+циклу подій. Команда виконується без await, тож жодна з них (зокрема переказ між
+рахунками) не переривається іншою, а операції над одним рахунком чи розкладом
+одного лікаря впорядковані без блокувань. Пропускна здатність обмежена одним
+потоком: Bank і Clinic - чистий Python, і під GIL писарі в кількох потоках лише
+додали б перемикання (для кількох ядер див. sharded_bank.py).
+
+Читання в чергу не стають: вони виконуються одразу, між командами, і бачать стан
+після цілої кількості команд, тобто узгоджений знімок. Методи читання повертають
+копії (списки, словники), які подальші записи не змінюють.
+
+Приймачі подій можуть блокуватися (JsonlSink пише у файл, PrintSink - у потік
+виведення), тому на час роботи інтерфейсу увімкнений приймач Bank чи Clinic
+підміняється буфером: події кожного пакета команд передаються справжньому
+приймачу в окремому потоці, у тому ж порядку. Час події - момент передачі
+приймачу; події читань передаються разом із наступним пакетом команд. Після
+close() приймач повертається на місце.
+
+    async with AsyncBank(bank) as api:
+        await api.deposit("1234567890", 100)
+        await api.perform_transfer("1234567890", "0987654321", 50)
+        balances = await api.balances()
+"""
+
+import asyncio
+import concurrent.futures
+
+from events import NullSink
+
+# Позначка зупинки писаря в черзі
+_STOP = object()
+
+
+class _DeferredSink(NullSink):
+    """Накопичує події, поки писар не передасть їх справжньому приймачу sink."""
+    enabled = True
+
+    def __init__(self, sink):
+        self.sink = sink
+        self.pending = []
+
+    def emit(self, kind, template, **fields):
+        self.pending.append((kind, template, fields))
+
+    def take(self):
+        pending, self.pending = self.pending, []
+        return pending
+
+
+def _replay(sink, pending):
+    for kind, template, fields in pending:
+        sink.emit(kind, template, **fields)
+
+
+class _Writer:
+    """
+    Черга команд і задача-писар.
+
+    Args:
+        queue_size: Місткість черги (0 - без обмеження); коли черга повна,
+            клієнти чекають, доки писар її розвантажить
+        max_batch: Скільки команд писар виконує підряд, перш ніж віддати керування циклу подій
+        after_batch: Що викликати після кожного пакета команд (або None)
+    """
+
+    def __init__(self, queue_size=0, max_batch=256, after_batch=None):
+        if not isinstance(max_batch, int) or max_batch <= 0:
+            raise ValueError("Розмір пакета команд має бути додатним цілим числом.")
+        self.queue_size = queue_size
+        self.max_batch = max_batch
+        self.after_batch = after_batch
+        self.executed = 0 # Кількість виконаних команд
+        self._queue = None
+        self._task = None
+        self._closing = False
+
+    async def start(self):
+        """Створює чергу та запускає писаря в поточному циклі подій."""
+        if self._task is not None:
+            return
+        self._closing = False
+        self._queue = asyncio.Queue(self.queue_size)
+        self._task = asyncio.create_task(self._write())
+
+    async def close(self):
+        """Виконує вже прийняті команди й зупиняє писаря."""
+        if self._task is None:
+            return
+        self._closing = True
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+
+    async def submit(self, function, *args):
+        """
+        Ставить виклик function(*args) у чергу і чекає на результат; виняток
+        функції передається тому, хто чекає.
+        """
+        if self._task is None or self._closing:
+            raise RuntimeError("Писар не запущений: використовуйте 'async with' або start().")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((future, function, args))
+        return await future
+
+    async def _write(self):
+        queue = self._queue
+        max_batch = self.max_batch
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                for command in batch:
+                    if command is _STOP:
+                        return
+                    future, function, args = command
+                    if future.cancelled():
+                        continue # Клієнт уже не чекає на результат
+                    try:
+                        result = function(*args)
+                    except Exception as error:
+                        future.set_exception(error)
+                    else:
+                        future.set_result(result)
+                    self.executed += 1
+            finally:
+                if self.after_batch is not None:
+                    self.after_batch()
+
+
+class _AsyncFrontEnd:
+    """Спільний для AsyncBank і AsyncClinic запуск і зупинка писаря та передача подій."""
+
+    def __init__(self, target, queue_size, max_batch):
+        self._target = target
+        self._writer = _Writer(queue_size, max_batch, self._pass_events)
+        self._deferred = None
+        self._events_thread = None
+        self._last_events = None
+
+    @property
+    def executed(self):
+        """Кількість виконаних команд."""
+        return self._writer.executed
+
+    async def start(self):
+        if self._target.events.enabled and self._deferred is None:
+            self._deferred = _DeferredSink(self._target.events)
+            self._events_thread = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            self._target.events = self._deferred
+        await self._writer.start()
+
+    async def close(self):
+        await self._writer.close()
+        if self._deferred is None:
+            return
+        self._pass_events()
+        last, self._last_events = self._last_events, None
+        try:
+            if last is not None:
+                await asyncio.wrap_future(last)
+        finally:
+            self._events_thread.shutdown()
+            self._target.events = self._deferred.sink
+            self._deferred = self._events_thread = None
+
+    def _pass_events(self):
+        if self._deferred is None:
+            return
+        pending = self._deferred.take()
+        if pending:
+            # Один потік виконує передачі по черзі, тож порядок подій зберігається
+            self._last_events = self._events_thread.submit(_replay, self._deferred.sink, pending)
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+class AsyncBank(_AsyncFrontEnd):
+    """
+    Асинхронний інтерфейс до Bank (BANK.py). Методи мають ті самі назви й результати,
+    що й у Bank та BankAccount, але рахунок задається номером.
+
+    Args:
+        bank: Об'єкт Bank
+        queue_size: Місткість черги команд (0 - без обмеження)
+        max_batch: Скільки команд писар виконує підряд
+    """
+
+    def __init__(self, bank, queue_size=0, max_batch=256):
+        super().__init__(bank, queue_size, max_batch)
+        self.bank = bank
+
+    # --- Запис ---
+
+    async def add_account(self, account_number, initial_balance=0.0):
+        return await self._writer.submit(self.bank.add_account, account_number, initial_balance)
+
+    async def delete_account(self, account_number):
+        return await self._writer.submit(self.bank.delete_account, account_number)
+
+    async def deposit(self, account_number, amount, description=""):
+        """Нараховує кошти на рахунок; False, якщо рахунок не знайдено."""
+        return await self._writer.submit(self._account_call, account_number,
+                                         'deposit', amount, description)
+
+    async def withdraw(self, account_number, amount, description=""):
+        """Списує кошти з рахунку; False, якщо рахунок не знайдено або бракує коштів."""
+        return await self._writer.submit(self._account_call, account_number,
+                                         'withdraw', amount, description)
+
+    async def perform_transfer(self, from_account_number, to_account_number, amount):
+        return await self._writer.submit(self.bank.perform_transfer,
+                                         from_account_number, to_account_number, amount)
+
+    async def apply_batch(self, transfers, atomic=True, net=False):
+        """Пакет переказів (див. Bank.apply_batch) однією командою."""
+        return await self._writer.submit(self.bank.apply_batch, list(transfers), atomic, net)
+
+    def _account_call(self, account_number, method, amount, description):
+        account = self.bank.find_account(account_number)
+        if account is None:
+            self.bank.events.emit('account_not_found', "Рахунок з номером {account_number} не знайдений.",
+                                  account_number=account_number)
+            return False
+        return getattr(account, method)(amount, description)
+
+    # --- Читання (без черги) ---
+
+    async def get_balance(self, account_number):
+        """Баланс рахунку (Decimal) або None, якщо рахунок не знайдено."""
+        account = self.bank.find_account(account_number)
+        return None if account is None else account.balance
+
+    async def balances(self, account_numbers=None):
+        """Баланси рахунків (усіх або вказаних) на один момент: {номер: Decimal}."""
+        accounts = self.bank.accounts
+        if account_numbers is None:
+            return {number: account.balance for number, account in accounts.items()}
+        return {number: accounts[number].balance for number in account_numbers if number in accounts}
+
+    async def get_transaction_history(self, account_number, start=None, end=None, offset=0, limit=None):
+        account = self.bank.find_account(account_number)
+        return [] if account is None else account.get_transaction_history(start, end, offset, limit)
+
+    async def get_balance_at(self, account_number, moment):
+        account = self.bank.find_account(account_number)
+        return None if account is None else account.get_balance_at(moment)
+
+
+class AsyncClinic(_AsyncFrontEnd):
+    """
+    Асинхронний інтерфейс до Clinic ("Q1 Klinic.py"). Записи на прийом і медичні
+    записи виконуються писарем по черзі, тож перевірка конфліктів розкладу лікаря
+    не перетинається з іншими записами.
+
+    Args:
+        clinic: Об'єкт Clinic
+        queue_size: Місткість черги команд (0 - без обмеження)
+        max_batch: Скільки команд писар виконує підряд
+    """
+
+    def __init__(self, clinic, queue_size=0, max_batch=256):
+        super().__init__(clinic, queue_size, max_batch)
+        self.clinic = clinic
+
+    # --- Запис ---
+
+    async def add_patient(self, patient):
+        return await self._writer.submit(self.clinic.add_patient, patient)
+
+    async def add_doctor(self, doctor):
+        return await self._writer.submit(self.clinic.add_doctor, doctor)
+
+    async def schedule_appointment(self, patient_id, doctor_id, date_time_str, reason, duration=None):
+        args = (patient_id, doctor_id, date_time_str, reason) + (() if duration is None else (duration,))
+        return await self._writer.submit(self.clinic.schedule_appointment, *args)
+
+    async def schedule_appointments(self, requests):
+        """Пакетний запис на прийом (див. Clinic.schedule_appointments) однією командою."""
+        return await self._writer.submit(self.clinic.schedule_appointments, list(requests))
+
+    async def add_medical_record_to_patient(self, patient_id, doctor_id, date_str, diagnosis, treatment):
+        return await self._writer.submit(self.clinic.add_medical_record_to_patient,
+                                         patient_id, doctor_id, date_str, diagnosis, treatment)
+
+    # --- Читання (без черги) ---
+
+    async def get_patient_medical_history(self, patient_id):
+        return list(self.clinic.get_patient_medical_history(patient_id))
+
+    async def get_doctor_appointments(self, doctor_id):
+        return list(self.clinic.get_doctor_appointments(doctor_id))
+
+    async def get_doctor_appointments_between(self, doctor_id, start, end):
+        return self.clinic.get_doctor_appointments_between(doctor_id, start, end)
+
+    async def get_patient_upcoming_appointments(self, patient_id, now=None, limit=None):
+        return self.clinic.get_patient_upcoming_appointments(patient_id, now, limit)
+
+    async def get_appointments_on_date(self, date):
+        return self.clinic.get_appointments_on_date(date)
+
+    async def search_medical_records(self, query, start=None, end=None, doctor_id=None, field=None,
+                                     days=None, today=None):
+        return self.clinic.search_medical_records(query, start, end, doctor_id, field, days, today)
+
+    async def find_next_free_slot(self, specialization, duration=None, after=None):
+        if duration is None:
+            return self.clinic.find_next_free_slot(specialization, after=after)
+        return self.clinic.find_next_free_slot(specialization, duration, after)
@@ -0,0 +1,903 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Бенчмарки для класів клініки та банку.
+Кожен бенчмарк створює синтетичні дані та виводить таблицю результатів.
+
+Запуск:
+    python benchmarks.py memory [--sizes 10000 100000 1000000]
+    python benchmarks.py bulk_load [--rows 1000000]
+    python benchmarks.py events [--rows 100000]
+    python benchmarks.py store [--rows 1000000]
+    python benchmarks.py concurrency [--threads 1 2 4 8 16 32 64] [--rows 200000]
+    python benchmarks.py batch [--rows 100000]
+    python benchmarks.py money [--rows 1000000]
+    python benchmarks.py journal [--rows 1000000]
+    python benchmarks.py async [--clients 10000] [--shards 1 4 16] [--rows 200000]
+    python benchmarks.py shards [--shards 1 2 4 8] [--rows 100000]
+    python benchmarks.py search [--rows 1000000]
+    python benchmarks.py analytics [--sizes 10000 100000 1000000]
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import random
+import decimal
+import argparse
+import threading
+import tempfile
+import datetime
+import tracemalloc
+import importlib.util
+
+from events import NullSink, PrintSink, RingBufferSink, JsonlSink
+
+LB5_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_clinic_module():
+    """
+    Імпортує модуль клініки (назва файлу містить пробіл, тож звичайний import не підходить).
+
+    Returns:
+        Модуль "Q1 Klinic.py"
+    """
+    spec = importlib.util.spec_from_file_location('klinic', os.path.join(LB5_DIR, 'Q1 Klinic.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def benchmark_memory(sizes=(10000, 100000, 1000000)):
+    """
+    Вимірює через tracemalloc, скільки байтів займає в Clinic один пацієнт
+    (з контактами), один запис на прийом (з усіма індексами) та один медичний запис.
+
+    Args:
+        sizes: Кількості пацієнтів (записів на прийом і медичних записів - стільки ж)
+    """
+    klinic = load_clinic_module()
+    diagnoses = ["ГРВІ", "Головний біль", "Гастрит", "Бронхіт", "Алергія"]
+    start_time = datetime.datetime(2025, 1, 6, 8, 0)
+
+    print(f"{'сутностей':>10} {'Б/пацієнт':>10} {'Б/прийом':>10} {'Б/запис':>10} {'час, с':>8}")
+    for size in sizes:
+        clinic = klinic.Clinic("Бенчмарк", events=NullSink())
+        doctors = max(1, size // 1000)
+        started = time.perf_counter()
+        for doctor_id in range(doctors):
+            clinic.add_doctor(klinic.Doctor(1000000000 + doctor_id, f"Лікар {doctor_id}",
+                                            {'phone': '0500000000'}, "Терапевт"))
+
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        for patient_id in range(size):
+            clinic.add_patient(klinic.Patient(
+                100000000 + patient_id, f"Пацієнт {patient_id}",
+                {'phone': f"098{patient_id:07d}", 'email': f"p{patient_id}@example.com"},
+                datetime.date(1950 + patient_id % 60, 1 + patient_id % 12, 1 + patient_id % 28)))
+        after_patients = tracemalloc.get_traced_memory()[0]
+
+        # Прийоми по 30 хв без накладок: кожен лікар приймає пацієнтів підряд
+        requests = []
+        for number in range(size):
+            moment = start_time + datetime.timedelta(minutes=30 * (number // doctors))
+            requests.append((100000000 + number, 1000000000 + number % doctors,
+                             moment.strftime('%Y-%m-%d %H:%M'), "Огляд"))
+        before_appointments = tracemalloc.get_traced_memory()[0]
+        clinic.schedule_appointments(requests)
+        del requests
+        after_appointments = tracemalloc.get_traced_memory()[0]
+
+        for number in range(size):
+            clinic.add_medical_record_to_patient(100000000 + number, 1000000000 + number % doctors,
+                                                 "2025-06-10", diagnoses[number % len(diagnoses)],
+                                                 "Спостереження")
+        after_records = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        print(f"{size:>10} {(after_patients - before) / size:>10.0f} "
+              f"{(after_appointments - before_appointments) / size:>10.0f} "
+              f"{(after_records - after_appointments) / size:>10.0f} "
+              f"{time.perf_counter() - started:>8.1f}")
+
+
+def make_bulk_file(path, appointments, fmt, seed=1, records=0):
+    """
+    Створює файл масового завантаження: пацієнти, лікарі, appointments прийомів
+    без накладок (кожен лікар приймає підряд по 30 хв з 8:00 до 20:00) та records медичних записів.
+
+    Args:
+        path: Шлях до файлу
+        appointments: Кількість прийомів
+        fmt: 'csv' або 'jsonl'
+        seed: Зерно генератора випадкових чисел
+        records: Кількість медичних записів
+    """
+    klinic = load_clinic_module()
+    rng = random.Random(seed)
+    patients = max(1, appointments // 10)
+    doctors = max(1, appointments // 2000)
+    slots_per_day = 24
+    start_date = datetime.datetime(2025, 1, 6, 8, 0)
+
+    def rows():
+        for patient_id in range(1, patients + 1):
+            yield {'type': 'patient', 'id': patient_id, 'name': f"Пацієнт {patient_id}",
+                   'phone': f"098{patient_id:07d}", 'birth_date': f"{1950 + patient_id % 60}-01-01"}
+        for doctor_id in range(1, doctors + 1):
+            yield {'type': 'doctor', 'id': 1000000 + doctor_id, 'name': f"Лікар {doctor_id}",
+                   'specialization': "Терапевт" if doctor_id % 2 else "Хірург"}
+        for number in range(appointments):
+            slot = number // doctors
+            moment = start_date + datetime.timedelta(days=slot // slots_per_day,
+                                                     minutes=30 * (slot % slots_per_day))
+            yield {'type': 'appointment', 'patient_id': rng.randint(1, patients),
+                   'doctor_id': 1000001 + number % doctors,
+                   'date_time': moment.strftime('%Y-%m-%d %H:%M'), 'duration': 30, 'reason': "Огляд"}
+        for number in range(records):
+            yield {'type': 'record', 'patient_id': rng.randint(1, patients),
+                   'doctor_id': 1000001 + number % doctors,
+                   'date': (start_date + datetime.timedelta(days=number % 365)).strftime('%Y-%m-%d'),
+                   'diagnosis': "ГРВІ" if number % 3 else "Бронхіт", 'treatment': "Спостереження"}
+
+    with open(path, 'w', encoding='utf-8', newline='') as fd:
+        if fmt == 'csv':
+            writer = csv.DictWriter(fd, fieldnames=klinic.BULK_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows())
+        else:
+            for row in rows():
+                fd.write(json.dumps(row, ensure_ascii=False) + '\n')
+
+
+def benchmark_bulk_load(appointments=1000000, per_row_sample=20000):
+    """
+    Порівнює Clinic.bulk_load/export (CSV та JSONL) із записом через
+    schedule_appointment по одному рядку.
+
+    Args:
+        appointments: Кількість прийомів у файлі
+        per_row_sample: Скільки прийомів записати через schedule_appointment для порівняння
+    """
+    klinic = load_clinic_module()
+    print(f"{'операція':>24} {'рядків':>9} {'час, с':>8} {'рядків/с':>10}")
+    with tempfile.TemporaryDirectory() as directory_path:
+        for fmt in ('csv', 'jsonl'):
+            path = os.path.join(directory_path, f"clinic.{fmt}")
+            make_bulk_file(path, appointments, fmt)
+            clinic = klinic.Clinic("Бенчмарк")
+            stats = clinic.bulk_load(path)
+            assert stats['rejected'] == 0, stats['errors']
+            print(f"{'bulk_load ' + fmt:>24} {stats['rows']:>9} {stats['seconds']:>8.2f} "
+                  f"{stats['rows_per_second']:>10.0f}")
+            stats = clinic.export(os.path.join(directory_path, f"export.{fmt}"))
+            print(f"{'export ' + fmt:>24} {stats['rows']:>9} {stats['seconds']:>8.2f} "
+                  f"{stats['rows_per_second']:>10.0f}")
+
+        # Той самий розклад через публічний API по одному рядку
+        clinic = klinic.Clinic("Бенчмарк", events=NullSink())
+        path = os.path.join(directory_path, "sample.jsonl")
+        make_bulk_file(path, per_row_sample, 'jsonl')
+        with open(path, encoding='utf-8') as fd:
+            rows = [json.loads(line) for line in fd]
+        started = time.perf_counter()
+        for row in rows:
+            if row['type'] == 'patient':
+                clinic.add_patient(klinic.Patient(row['id'], row['name'], {'phone': row['phone']},
+                                                  klinic._to_date(row['birth_date'])))
+            elif row['type'] == 'doctor':
+                clinic.add_doctor(klinic.Doctor(row['id'], row['name'], {}, row['specialization']))
+            else:
+                clinic.schedule_appointment(row['patient_id'], row['doctor_id'], row['date_time'],
+                                            row['reason'], row['duration'])
+        seconds = time.perf_counter() - started
+        print(f"{'API по одному рядку':>24} {len(rows):>9} {seconds:>8.2f} {len(rows) / seconds:>10.0f}")
+
+
+def benchmark_store(appointments=1000000):
+    """
+    Вимірює запис клініки у сховище SQLite (Clinic.open + bulk_load) і повторне
+    відкриття: з лінивою медичною історією та з повним завантаженням історій.
+
+    Args:
+        appointments: Кількість прийомів (медичних записів - стільки ж)
+    """
+    klinic = load_clinic_module()
+    print(f"{'операція':>32} {'час, с':>8}")
+    with tempfile.TemporaryDirectory() as directory_path:
+        source = os.path.join(directory_path, "clinic.jsonl")
+        make_bulk_file(source, appointments, 'jsonl', records=appointments)
+        path = os.path.join(directory_path, "clinic.db")
+
+        started = time.perf_counter()
+        clinic = klinic.Clinic.open(path, events=NullSink(), batch_size=10000)
+        stats = clinic.bulk_load(source)
+        assert stats['rejected'] == 0, stats['errors']
+        clinic.close()
+        print(f"{'bulk_load у сховище':>32} {time.perf_counter() - started:>8.2f}")
+
+        started = time.perf_counter()
+        clinic = klinic.Clinic.open(path, events=NullSink())
+        print(f"{'відкриття (історія - ліниво)':>32} {time.perf_counter() - started:>8.2f}")
+        started = time.perf_counter()
+        for patient_id in range(1, 1001):
+            clinic.get_patient_medical_history(patient_id)
+        print(f"{'історія 1000 пацієнтів':>32} {time.perf_counter() - started:>8.2f}")
+        started = time.perf_counter()
+        clinic.load_medical_records()
+        print(f"{'завантаження решти історій':>32} {time.perf_counter() - started:>8.2f}")
+        assert len(clinic.medical_records) == appointments
+        clinic.close()
+
+
+def replay_day(clinic_module, bank_module, events, operations):
+    """
+    Відтворює день роботи: operations операцій клініки (пацієнти, прийоми, медичні записи)
+    і стільки ж операцій банку (поповнення, списання, перекази) з указаним приймачем подій.
+
+    Returns:
+        Час у секундах
+    """
+    rng = random.Random(1)
+    clinic = clinic_module.Clinic("Бенчмарк", events=events)
+    bank = bank_module.Bank("Бенчмарк", events=events)
+    start_time = datetime.datetime(2025, 1, 6, 8, 0)
+    doctors = max(1, operations // 1000)
+    accounts = [f"{number:010d}" for number in range(max(2, operations // 100))]
+
+    started = time.perf_counter()
+    for doctor_id in range(doctors):
+        clinic.add_doctor(clinic_module.Doctor(1000000 + doctor_id, f"Лікар {doctor_id}", {}, "Терапевт"))
+    for account_number in accounts:
+        bank.add_account(account_number, 1000.0)
+    for number in range(operations // 3):
+        clinic.add_patient(clinic_module.Patient(number, f"Пацієнт {number}", {'phone': f"098{number:07d}"},
+                                                 datetime.date(1980, 1, 1)))
+        moment = start_time + datetime.timedelta(minutes=30 * (number // doctors))
+        clinic.schedule_appointment(number, 1000000 + number % doctors, moment, "Огляд")
+        clinic.add_medical_record_to_patient(number, 1000000 + number % doctors, moment.date(),
+                                             "ГРВІ", "Спостереження")
+    for number in range(operations // 3):
+        account = bank.accounts[rng.choice(accounts)]
+        account.deposit(rng.randint(1, 100), "Поповнення")
+        account.withdraw(rng.randint(1, 100), "Покупка")
+        bank.perform_transfer(*rng.sample(accounts, 2), rng.randint(1, 100))
+    seconds = time.perf_counter() - started
+    events.close()
+    return seconds
+
+
+def benchmark_events(operations=100000):
+    """
+    Порівнює час відтворення дня роботи клініки та банку з різними приймачами подій.
+
+    Args:
+        operations: Кількість операцій клініки (і стільки ж - банку)
+    """
+    clinic_module = load_clinic_module()
+    import BANK as bank_module
+
+    print(f"{'приймач':>24} {'операцій':>9} {'час, с':>8} {'операцій/с':>11}")
+    with tempfile.TemporaryDirectory() as directory_path, \
+            open(os.devnull, 'w', encoding='utf-8') as devnull:
+        sinks = [
+            ("PrintSink (devnull)", lambda: PrintSink(devnull)),
+            ("NullSink", NullSink),
+            ("RingBufferSink", lambda: RingBufferSink(10000)),
+            ("JsonlSink", lambda: JsonlSink(os.path.join(directory_path, "events.jsonl"))),
+        ]
+        for title, make_sink in sinks:
+            seconds = replay_day(clinic_module, bank_module, make_sink(), operations)
+            total = (operations // 3) * 6
+            print(f"{title:>24} {total:>9} {seconds:>8.2f} {total / seconds:>11.0f}")
+
+
+def benchmark_concurrency(thread_counts=(1, 2, 4, 8, 16, 32, 64), transfers=200000, accounts=100):
+    """
+    Стрес-тест Bank(concurrent=True): потоки виконують випадкові перекази між рахунками.
+    Для кожної кількості потоків виводить перекази за секунду та перевіряє, що сума
+    балансів не змінилася, а ID транзакцій не повторюються.
+
+    Args:
+        thread_counts: Кількості потоків
+        transfers: Загальна кількість переказів (ділиться між потоками)
+        accounts: Кількість рахунків
+    """
+    import BANK
+
+    print(f"{'потоків':>8} {'переказів':>10} {'успішних':>10} {'час, с':>8} {'переказів/с':>12} {'баланс':>8} {'ID':>5}")
+    for thread_count in thread_counts:
+        bank = BANK.Bank("Бенчмарк", events=NullSink(), concurrent=True)
+        numbers = [f"{number:010d}" for number in range(accounts)]
+        for account_number in numbers:
+            bank.add_account(account_number, 1000)
+        total_before = sum(account.balance for account in bank.accounts.values())
+        per_thread = transfers // thread_count
+        succeeded = []
+        barrier = threading.Barrier(thread_count + 1)
+
+        def worker(seed):
+            rng = random.Random(seed)
+            done = 0
+            barrier.wait()
+            for _ in range(per_thread):
+                # Цілі суми, щоб перевірка збереження коштів була точною
+                from_number, to_number = rng.sample(numbers, 2)
+                done += bank.perform_transfer(from_number, to_number, rng.randint(1, 200))
+            succeeded.append(done)
+
+        threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        started = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        seconds = time.perf_counter() - started
+
+        total_after = sum(account.balance for account in bank.accounts.values())
+        ids = [entry[0] for account in bank.accounts.values() for entry in account.journal]
+        balance_ok = "OK" if total_after == total_before else "ВТРАТА"
+        ids_ok = "OK" if len(ids) == len(set(ids)) == 2 * sum(succeeded) else "ДУБЛІ"
+        print(f"{thread_count:>8} {per_thread * thread_count:>10} {sum(succeeded):>10} {seconds:>8.2f} "
+              f"{per_thread * thread_count / seconds:>12.0f} {balance_ok:>8} {ids_ok:>5}")
+
+
+def benchmark_batch(transfers=100000, accounts=5):
+    """
+    Порівнює Bank.apply_batch (з взаємозаліком і без) з викликом perform_transfer у циклі
+    на пакеті переказів між кількома рахунками.
+
+    Args:
+        transfers: Кількість переказів у пакеті
+        accounts: Кількість рахунків
+    """
+    import BANK
+
+    rng = random.Random(1)
+    numbers = [f"{number:010d}" for number in range(accounts)]
+    batch = [(*rng.sample(numbers, 2), rng.randint(1, 100)) for _ in range(transfers)]
+
+    def make_bank():
+        bank = BANK.Bank("Бенчмарк", events=NullSink())
+        for account_number in numbers:
+            bank.add_account(account_number, 10 ** 9)
+        return bank
+
+    print(f"{'спосіб':>28} {'переказів':>10} {'проводок':>9} {'час, с':>8} {'переказів/с':>12}")
+    bank = make_bank()
+    started = time.perf_counter()
+    for from_number, to_number, amount in batch:
+        bank.perform_transfer(from_number, to_number, amount)
+    seconds = time.perf_counter() - started
+    expected = {number: account.balance for number, account in bank.accounts.items()}
+    print(f"{'perform_transfer у циклі':>28} {transfers:>10} {transfers:>9} {seconds:>8.2f} {transfers / seconds:>12.0f}")
+
+    for title, options in (("apply_batch", {}), ("apply_batch(net=True)", {'net': True}),
+                           ("apply_batch(atomic=False)", {'atomic': False})):
+        bank = make_bank()
+        started = time.perf_counter()
+        result = bank.apply_batch(batch, **options)
+        seconds = time.perf_counter() - started
+        assert result['applied'] == transfers, result['errors'][:5]
+        assert {number: account.balance for number, account in bank.accounts.items()} == expected
+        print(f"{title:>28} {transfers:>10} {result['legs']:>9} {seconds:>8.2f} {transfers / seconds:>12.0f}")
+
+
+def benchmark_money(operations=1000000, accounts=1000):
+    """
+    Порівнює облік у float (з проходом звірки, що виправляє розбіжність) з обліком
+    у цілих копійках, як у BankAccount: однакові операції поповнення/списання
+    з копійками по accounts рахунках.
+
+    Args:
+        operations: Кількість операцій
+        accounts: Кількість рахунків
+    """
+    import BANK
+
+    rng = random.Random(1)
+    targets = [rng.randrange(accounts) for _ in range(operations)]
+    kopiyky = [rng.randint(1, 100000) * (1 if rng.random() < 0.55 else -1) for _ in range(operations)]
+    hryvni = [value / 100 for value in kopiyky]
+    print(f"{'облік':>32} {'час, с':>8} {'операцій/с':>11} {'розбіжність, коп':>17}")
+
+    # float: баланс та історія у float, потім звірка з точною сумою історії
+    started = time.perf_counter()
+    balances = [0.0] * accounts
+    histories = [[] for _ in range(accounts)]
+    for account, amount in zip(targets, hryvni):
+        balances[account] += amount
+        histories[account].append(amount)
+    drift = 0
+    for account in range(accounts):
+        exact = sum(decimal.Decimal(repr(amount)) for amount in histories[account])
+        drift = max(drift, abs(decimal.Decimal(balances[account]) - exact))
+        balances[account] = float(exact)
+    seconds = time.perf_counter() - started
+    print(f"{'float + звірка':>32} {seconds:>8.2f} {operations / seconds:>11.0f} {drift * 100:>17.2e}")
+
+    # Цілі копійки: точний облік, звірка не потрібна
+    started = time.perf_counter()
+    balances = [0] * accounts
+    histories = [[] for _ in range(accounts)]
+    for account, amount in zip(targets, kopiyky):
+        balances[account] += amount
+        histories[account].append(amount)
+    seconds = time.perf_counter() - started
+    assert all(balances[account] == sum(histories[account]) for account in range(accounts))
+    print(f"{'цілі копійки':>32} {seconds:>8.2f} {operations / seconds:>11.0f} {0:>17.2e}")
+
+    # Повний шлях BankAccount: суми у гривнях (float) переводяться в копійки
+    bank = BANK.Bank("Бенчмарк", events=NullSink())
+    numbers = [f"{number:010d}" for number in range(accounts)]
+    for account_number in numbers:
+        bank.add_account(account_number, 10 ** 7)
+    started = time.perf_counter()
+    for account, amount in zip(targets, hryvni):
+        if amount > 0:
+            bank.accounts[numbers[account]].deposit(amount)
+        else:
+            bank.accounts[numbers[account]].withdraw(-amount)
+    seconds = time.perf_counter() - started
+    exact = sum(BANK.from_kopiyky(value) for value in kopiyky) + accounts * 10 ** 7
+    assert sum(account.balance for account in bank.accounts.values()) == exact
+    print(f"{'BankAccount.deposit/withdraw':>32} {seconds:>8.2f} {operations / seconds:>11.0f} {0:>17.2e}")
+
+
+def benchmark_journal(transactions=1000000, queries=10000):
+    """
+    Журнал транзакцій одного рахунку за кілька років: пам'ять на транзакцію
+    (журнал у пам'яті, з вивантаженням на диск і список об'єктів Transaction),
+    виписка за день сторінками по 50 записів та "баланс на момент T".
+
+    Args:
+        transactions: Кількість транзакцій
+        queries: Кількість запитів кожного виду
+    """
+    import BANK
+
+    rng = random.Random(1)
+    # Час у журналі - цілі мікросекунди epoch; транзакції рівномірно за 5 років
+    start = round(datetime.datetime(2020, 1, 1).timestamp() * 1000000)
+    step = 5 * 365 * 24 * 3600 * 1000000 // transactions
+    day = 24 * 3600 * 1000000
+    descriptions = ["Зарплата", "Покупки", "Комуналка", "Переказ на рахунок 0000000001"]
+    operations = [('deposit' if rng.random() < 0.5 else 'withdrawal', rng.randint(1, 100000),
+                   start + number * step, descriptions[number % len(descriptions)])
+                  for number in range(transactions)]
+    moments = [rng.randrange(start, start + transactions * step) for _ in range(queries)]
+
+    print(f"{'журнал':>30} {'Б/транзакцію':>13} {'запис/с':>10} {'виписка, мкс':>13} {'баланс на T, мкс':>17}")
+    with tempfile.TemporaryDirectory() as directory_path:
+        for title, options in (("стовпцевий (у пам'яті)", {}),
+                               ("стовпцевий (вивантаження)", {'spill_dir': directory_path})):
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            started = time.perf_counter()
+            journal = BANK.TransactionJournal(10 ** 12, **options)
+            for number, (kind, amount, timestamp, description) in enumerate(operations):
+                journal.append(number, kind, amount, timestamp, description)
+            append_rate = transactions / (time.perf_counter() - started)
+            memory = (tracemalloc.get_traced_memory()[0] - before) / transactions
+            tracemalloc.stop()
+
+            started = time.perf_counter()
+            for moment in moments:
+                list(journal.entries(moment, moment + day, 0, 50))
+            statement = (time.perf_counter() - started) / queries * 1e6
+            started = time.perf_counter()
+            for moment in moments:
+                journal.balance_at(moment)
+            balance_at = (time.perf_counter() - started) / queries * 1e6
+            print(f"{title:>30} {memory:>13.1f} {append_rate:>10.0f} {statement:>13.1f} {balance_at:>17.1f}")
+            journal.close()
+
+    # Для порівняння: список об'єктів Transaction і лінійний прохід по ньому
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    history = [BANK.Transaction(number, kind, amount, datetime.datetime.fromtimestamp(timestamp / 1000000),
+                                description)
+               for number, (kind, amount, timestamp, description) in enumerate(operations)]
+    append_rate = transactions / (time.perf_counter() - started)
+    memory = (tracemalloc.get_traced_memory()[0] - before) / transactions
+    tracemalloc.stop()
+    sample = moments[:max(1, queries // 100)]
+    started = time.perf_counter()
+    for moment in sample:
+        low = datetime.datetime.fromtimestamp(moment / 1000000)
+        high = datetime.datetime.fromtimestamp((moment + day) / 1000000)
+        [transaction for transaction in history if low <= transaction.date < high][:50]
+    statement = (time.perf_counter() - started) / len(sample) * 1e6
+    started = time.perf_counter()
+    for moment in sample:
+        limit = datetime.datetime.fromtimestamp(moment / 1000000)
+        sum(transaction.amount_kopiyky if transaction.type == 'deposit' else -transaction.amount_kopiyky
+            for transaction in history if transaction.date <= limit)
+    balance_at = (time.perf_counter() - started) / len(sample) * 1e6
+    print(f"{'список Transaction':>30} {memory:>13.1f} {append_rate:>10.0f} {statement:>13.1f} {balance_at:>17.1f}")
+
+
+class _ExecutorBank:
+    """Для порівняння з async_api: виклики Bank(concurrent=True) у пулі потоків через run_in_executor."""
+
+    def __init__(self, bank, executor):
+        self.bank = bank
+        self.executor = executor
+
+    async def _call(self, function, *args):
+        import asyncio
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+    async def deposit(self, account_number, amount):
+        return await self._call(self.bank.find_account(account_number).deposit, amount)
+
+    async def withdraw(self, account_number, amount):
+        return await self._call(self.bank.find_account(account_number).withdraw, amount)
+
+    async def perform_transfer(self, from_account_number, to_account_number, amount):
+        return await self._call(self.bank.perform_transfer, from_account_number, to_account_number, amount)
+
+    async def get_balance(self, account_number):
+        return await self._call(self.bank.find_account(account_number).get_balance)
+
+
+def benchmark_async(clients=10000, operations=200000, accounts=1000, workers=32):
+    """
+    Генератор навантаження для async_api.AsyncBank: clients одночасних клієнтів виконують
+    суміш операцій (40% поповнень, 20% списань, 30% переказів, 10% читань балансу).
+    Для черги з одним писарем і для пулу потоків над Bank(concurrent=True) виводить
+    операції за секунду, затримки p50/p99 та перевіряє, що сума балансів дорівнює
+    початковій плюс успішні поповнення мінус успішні списання.
+
+    Args:
+        clients: Кількість одночасних клієнтів
+        operations: Загальна кількість операцій (ділиться між клієнтами)
+        accounts: Кількість рахунків
+        workers: Кількість потоків у пулі для порівняння
+    """
+    import asyncio
+    import concurrent.futures
+    import BANK
+    import async_api
+
+    numbers = [f"{number:010d}" for number in range(accounts)]
+    per_client = max(1, operations // clients)
+
+    def make_bank(concurrent):
+        bank = BANK.Bank("Бенчмарк", events=NullSink(), concurrent=concurrent)
+        for account_number in numbers:
+            bank.add_account(account_number, 1000)
+        return bank
+
+    async def client(api, seed, latencies, delta):
+        rng = random.Random(seed)
+        for _ in range(per_client):
+            choice = rng.random()
+            amount = rng.randint(1, 200)
+            started = time.perf_counter()
+            if choice < 0.4:
+                if await api.deposit(rng.choice(numbers), amount):
+                    delta[0] += amount
+            elif choice < 0.6:
+                if await api.withdraw(rng.choice(numbers), amount):
+                    delta[0] -= amount
+            elif choice < 0.9:
+                from_number, to_number = rng.sample(numbers, 2)
+                await api.perform_transfer(from_number, to_number, amount)
+            else:
+                await api.get_balance(rng.choice(numbers))
+            latencies.append(time.perf_counter() - started)
+
+    async def load(api):
+        latencies, delta = [], [0]
+        started = time.perf_counter()
+        await asyncio.gather(*(client(api, seed, latencies, delta) for seed in range(clients)))
+        return time.perf_counter() - started, latencies, delta[0]
+
+    async def run_queue(bank):
+        async with async_api.AsyncBank(bank) as api:
+            return await load(api)
+
+    async def run_executor(bank):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return await load(_ExecutorBank(bank, executor))
+
+    print(f"{'режим':>16} {'клієнтів':>9} {'операцій':>9} {'час, с':>7} {'оп/с':>8} {'p50, мс':>8} {'p99, мс':>8} {'баланс':>7}")
+    modes = [(f"потоки ({workers})", True, run_executor), ("черга", False, run_queue)]
+    for title, concurrent_bank, run in modes:
+        bank = make_bank(concurrent_bank)
+        total_before = sum(account.balance_kopiyky for account in bank.accounts.values())
+        seconds, latencies, delta = asyncio.run(run(bank))
+        total_after = sum(account.balance_kopiyky for account in bank.accounts.values())
+        balance_ok = "OK" if total_after == total_before + delta * 100 else "ВТРАТА"
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2] * 1000
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+        print(f"{title:>16} {clients:>9} {len(latencies):>9} {seconds:>7.2f} {len(latencies) / seconds:>8.0f} "
+              f"{p50:>8.1f} {p99:>8.1f} {balance_ok:>7}")
+
+
+def benchmark_shards(shard_counts=(1, 2, 4, 8), operations=100000, accounts=1000, batch=1000):
+    """
+    Пропускна здатність ShardedBank залежно від кількості процесів-шардів: суміш
+    поповнень, списань і переказів (здебільшого між шардами) окремими викликами з
+    кількох потоків і пакетами run_many. Для порівняння - Bank в одному процесі.
+    Перевіряє, що сума балансів дорівнює початковій плюс поповнення мінус списання
+    і що ID транзакцій не повторюються між шардами.
+
+    Args:
+        shard_counts: Кількості шардів
+        operations: Кількість операцій у кожному режимі
+        accounts: Кількість рахунків
+        batch: Операцій в одному пакеті run_many
+    """
+    import BANK
+    import sharded_bank
+
+    rng = random.Random(1)
+    numbers = [f"{number:010d}" for number in range(accounts)]
+    plan = []
+    for _ in range(operations):
+        choice = rng.random()
+        if choice < 0.3:
+            plan.append(('deposit', rng.choice(numbers), rng.randint(1, 200)))
+        elif choice < 0.5:
+            plan.append(('withdraw', rng.choice(numbers), rng.randint(1, 200)))
+        else:
+            plan.append(('perform_transfer', *rng.sample(numbers, 2), rng.randint(1, 200)))
+
+    def check(bank_balances, results, history):
+        expected = accounts * 10 ** 6
+        for (method, _, *rest), result in zip(plan, results):
+            if result and method != 'perform_transfer':
+                expected += rest[-1] if method == 'deposit' else -rest[-1]
+        balance_ok = "OK" if sum(bank_balances) == expected else "ВТРАТА"
+        ids = [transaction.transaction_id for number in numbers for transaction in history(number)]
+        return balance_ok, "OK" if len(ids) == len(set(ids)) else "ДУБЛІ"
+
+    print(f"CPU: {os.cpu_count()}")
+    print(f"{'режим':>28} {'шардів':>7} {'операцій/с':>11} {'баланс':>7} {'ID':>5}")
+
+    bank = BANK.Bank("Бенчмарк", events=NullSink())
+    for account_number in numbers:
+        bank.add_account(account_number, 10 ** 6)
+    started = time.perf_counter()
+    results = []
+    for method, *args in plan:
+        if method == 'perform_transfer':
+            results.append(bank.perform_transfer(*args))
+        else:
+            results.append(getattr(bank.find_account(args[0]), method)(args[1]))
+    rate = operations / (time.perf_counter() - started)
+    balance_ok, ids_ok = check([account.balance for account in bank.accounts.values()], results,
+                               lambda number: bank.find_account(number).get_transaction_history())
+    print(f"{'Bank (один процес)':>28} {'-':>7} {rate:>11.0f} {balance_ok:>7} {ids_ok:>5}")
+
+    for shards in shard_counts:
+        for title in ("окремі виклики (потоки)", f"run_many по {batch}"):
+            with sharded_bank.ShardedBank("Бенчмарк", shards=shards, events=NullSink()) as bank:
+                bank.run_many([('add_account', number, 10 ** 6) for number in numbers])
+                results = [None] * operations
+                started = time.perf_counter()
+                if title.startswith("run_many"):
+                    for offset in range(0, operations, batch):
+                        results[offset:offset + batch] = bank.run_many(plan[offset:offset + batch])
+                else:
+                    # Два потоки-клієнти на шард: поки один чекає на відповідь, інший надсилає запит
+                    clients = 2 * shards
+
+                    def client(first):
+                        for position in range(first, operations, clients):
+                            method, *args = plan[position]
+                            results[position] = getattr(bank, method)(*args)
+
+                    threads = [threading.Thread(target=client, args=(first,)) for first in range(clients)]
+                    for thread in threads:
+                        thread.start()
+                    for thread in threads:
+                        thread.join()
+                rate = operations / (time.perf_counter() - started)
+                balance_ok, ids_ok = check(bank.balances().values(), results, bank.get_transaction_history)
+            print(f"{title:>28} {shards:>7} {rate:>11.0f} {balance_ok:>7} {ids_ok:>5}")
+
+
+def benchmark_search(records=1000000, queries=200):
+    """
+    Повнотекстовий пошук у медичних записах: запит "діагноз за останні 30 днів"
+    (і кілька інших) через індекс Clinic.search_medical_records проти перегляду всіх
+    записів усіх пацієнтів. Виводить час побудови індексу та середній час запиту.
+
+    Args:
+        records: Кількість медичних записів (за 3 роки)
+        queries: Кількість запитів кожного виду
+    """
+    klinic = load_clinic_module()
+    import record_index
+
+    rng = random.Random(1)
+    diagnoses = ["ГРВІ", "Гострий бронхіт", "Грип", "Хронічний гастрит", "Алергія на пилок", "Головний біль",
+                 "ГРВІ з ускладненнями", "Гіпертонічна хвороба", "Остеохондроз", "Цукровий діабет 2 типу"]
+    treatments = ["Антибіотики", "Антибіотик, інгаляції", "Постільний режим", "Парацетамол",
+                  "Перев'язка та спостереження", "Дієта", "Фізіотерапія", "Інсулін"]
+    patients, doctors = max(1, records // 10), max(1, records // 1000)
+    first_day = datetime.date(2023, 1, 1)
+    today = first_day + datetime.timedelta(days=3 * 365)
+
+    clinic = klinic.Clinic("Бенчмарк", events=NullSink())
+    for doctor_id in range(doctors):
+        clinic.add_doctor(klinic.Doctor(doctor_id, f"Лікар {doctor_id}", {}, "Терапевт"))
+    for patient_id in range(patients):
+        clinic.add_patient(klinic.Patient(patient_id, f"Пацієнт {patient_id}", {}, None))
+    started = time.perf_counter()
+    for number in range(records):
+        clinic.add_medical_record_to_patient(
+            rng.randrange(patients), rng.randrange(doctors),
+            first_day + datetime.timedelta(days=number * 3 * 365 // records),
+            rng.choice(diagnoses), rng.choice(treatments))
+    insert_rate = records / (time.perf_counter() - started)
+    print(f"Записів: {records}, додавання з індексацією: {insert_rate:.0f} записів/с")
+
+    def scan(query, start, end, doctor_id):
+        # Без індексу: усі записи всіх пацієнтів, ті самі правила збігу слів
+        clauses, excluded = record_index.parse_query(query)
+        found = []
+        for patient in clinic.patients.values():
+            for record in clinic.get_patient_medical_history(patient.id):
+                if (start is not None and record.date < start) or (doctor_id is not None and record.doctor_id != doctor_id):
+                    continue
+                if end is not None and record.date > end:
+                    continue
+                words = set(record_index.terms(record.diagnosis)) | set(record_index.terms(record.treatment))
+                matched = all(any(term in words if not prefix else any(word.startswith(term) for word in words)
+                                  for term, prefix in variants) for variants in clauses)
+                if matched and not any(term in words for term, _ in excluded):
+                    found.append(record)
+        return found
+
+    cases = [("ГРВІ за 30 днів", "ГРВІ", {'days': 30}),
+             ("антибіот* за рік", "антибіот*", {'days': 365}),
+             ("бронхіт АБО грип, лікар", "бронхіт АБО грип", {'doctor_id': 0}),
+             ("ГРВІ, уся історія", "ГРВІ", {})]
+    print(f"{'запит':>26} {'знайдено':>9} {'індекс, мс':>11} {'сторінка 20, мс':>16} {'перегляд, мс':>13}")
+    for title, query, options in cases:
+        started = time.perf_counter()
+        for _ in range(queries):
+            results = clinic.search_medical_records(query, today=today, **options)
+        search_time = (time.perf_counter() - started) / queries * 1000
+        started = time.perf_counter()
+        for _ in range(queries):
+            clinic.search_medical_records(query, today=today, **options).page(0, 20)
+        page_time = (time.perf_counter() - started) / queries * 1000
+        start = today - datetime.timedelta(days=options['days'] - 1) if 'days' in options else None
+        end = today if 'days' in options else None
+        repeats = max(1, queries // 50)
+        started = time.perf_counter()
+        for _ in range(repeats):
+            found = scan(query, start, end, options.get('doctor_id'))
+        scan_time = (time.perf_counter() - started) / repeats * 1000
+        assert len(found) == len(results)
+        print(f"{title:>26} {len(results):>9} {search_time:>11.2f} {page_time:>16.2f} {scan_time:>13.1f}")
+
+
+def benchmark_analytics(sizes=(10000, 100000, 1000000), queries=100):
+    """
+    Зведення для панелі (прийоми за спеціалізаціями, навантаження лікаря за день,
+    прийоми за 7 і 30 днів, 5 найчастіших діагнозів за весь час і за 30 днів):
+    з лічильників Clinic.analytics проти повного перегляду Clinic.appointments і
+    Clinic.medical_records. Також виводить час одного оновлення лічильників.
+
+    Args:
+        sizes: Кількості прийомів (медичних записів - стільки ж)
+        queries: Кількість зведень для лічильників
+    """
+    klinic = load_clinic_module()
+    import collections
+    import clinic_analytics
+
+    diagnoses = ["ГРВІ", "Гострий бронхіт", "Грип", "Хронічний гастрит", "Алергія", "Головний біль",
+                 "Гіпертонічна хвороба", "Остеохондроз", "Цукровий діабет", "Ангіна"]
+    specializations = ["Терапевт", "Хірург", "Кардіолог", "Невролог"]
+    start_time = datetime.datetime(2023, 1, 2, 8, 0)
+
+    def full_scan(clinic, today):
+        # Без лічильників: кожне зведення перебирає всю історію
+        week, month = today - datetime.timedelta(days=6), today - datetime.timedelta(days=29)
+        by_specialization = collections.Counter(appointment.doctor.specialization
+                                                for appointment in clinic.appointments.values())
+        load = sum(1 for appointment in clinic.appointments.values()
+                   if appointment.doctor_id == 0 and appointment.date_time.date() == today)
+        last_7 = sum(1 for appointment in clinic.appointments.values() if week <= appointment.date_time.date() <= today)
+        last_30 = sum(1 for appointment in clinic.appointments.values() if month <= appointment.date_time.date() <= today)
+        top = collections.Counter(record.diagnosis for record in clinic.medical_records.values()).most_common(5)
+        top_30 = collections.Counter(record.diagnosis for record in clinic.medical_records.values()
+                                     if month <= record.date <= today).most_common(5)
+        return by_specialization, load, last_7, last_30, top, top_30
+
+    print(f"{'прийомів':>10} {'оновлення, мкс':>15} {'зведення, мкс':>14} {'перегляд, мс':>13}")
+    for size in sizes:
+        rng = random.Random(1)
+        doctors = max(1, size // 1000)
+        clinic = klinic.Clinic("Бенчмарк", events=NullSink())
+        for doctor_id in range(doctors):
+            clinic.add_doctor(klinic.Doctor(doctor_id, f"Лікар {doctor_id}", {},
+                                            specializations[doctor_id % len(specializations)]))
+        for patient_id in range(size):
+            clinic.add_patient(klinic.Patient(patient_id, f"Пацієнт {patient_id}", {}, None))
+        for number in range(size):
+            moment = start_time + datetime.timedelta(minutes=30 * (number // doctors))
+            clinic.schedule_appointment(number, number % doctors, moment, "Огляд")
+            clinic.add_medical_record_to_patient(number, number % doctors, moment.date(),
+                                                 rng.choice(diagnoses), "Спостереження")
+        today = moment.date()
+
+        # Ціна оновлень: ті самі прийоми й записи через нові лічильники
+        replay = clinic_analytics.ClinicAnalytics()
+        started = time.perf_counter()
+        for appointment in clinic.appointments.values():
+            replay.add_appointment(appointment)
+        for record in clinic.medical_records.values():
+            replay.add_record(record)
+        update = (time.perf_counter() - started) / (2 * size) * 1e6
+
+        started = time.perf_counter()
+        for _ in range(queries):
+            analytics = clinic.analytics
+            analytics.summary(today, k=5)
+            analytics.doctor_load(0, today)
+        summary_time = (time.perf_counter() - started) / queries * 1e6
+        started = time.perf_counter()
+        full_scan(clinic, today)
+        scan_time = (time.perf_counter() - started) * 1000
+        print(f"{size:>10} {update:>15.2f} {summary_time:>14.1f} {scan_time:>13.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарки клініки та банку")
+    parser.add_argument("benchmark", choices=["memory", "bulk_load", "events", "store", "concurrency", "batch", "money", "journal", "async", "shards", "search", "analytics"], help="Назва бенчмарку")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000],
+                        help="Кількості сутностей (memory, analytics)")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32, 64],
+                        help="Кількості потоків (concurrency)")
+    parser.add_argument("--clients", type=int, default=10000,
+                        help="Кількість одночасних клієнтів (async)")
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 4, 16],
+                        help="Кількості шардів (shards)")
+    parser.add_argument("--rows", type=int, default=None,
+                        help="Кількість прийомів у файлі (bulk_load, store), операцій (events), переказів (concurrency, batch), операцій клієнтів (async, shards), медичних записів (search) чи грошових операцій (money, journal)")
+    args = parser.parse_args(argv)
+
+    if args.benchmark == "memory":
+        benchmark_memory(args.sizes)
+    elif args.benchmark == "bulk_load":
+        benchmark_bulk_load(args.rows or 1000000)
+    elif args.benchmark == "events":
+        benchmark_events(args.rows or 100000)
+    elif args.benchmark == "store":
+        benchmark_store(args.rows or 1000000)
+    elif args.benchmark == "concurrency":
+        benchmark_concurrency(args.threads, args.rows or 200000)
+    elif args.benchmark == "batch":
+        benchmark_batch(args.rows or 100000)
+    elif args.benchmark == "money":
+        benchmark_money(args.rows or 1000000)
+    elif args.benchmark == "journal":
+        benchmark_journal(args.rows or 1000000)
+    elif args.benchmark == "async":
+        benchmark_async(args.clients, args.rows or 200000)
+    elif args.benchmark == "shards":
+        benchmark_shards(args.shards, args.rows or 100000)
+    elif args.benchmark == "search":
+        benchmark_search(args.rows or 1000000)
+    elif args.benchmark == "analytics":
+        benchmark_analytics(args.sizes)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
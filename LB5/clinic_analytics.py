@@ -0,0 +1,184 @@
+"""
+Зведені показники клініки, що оновлюються з кожним записом на прийом і медичним записом.
+
+Замість перегляду всіх прийомів і медичних записів для кожного звіту ClinicAnalytics
+тримає лічильники:
+    - прийоми за днями, за лікарем і днем, за спеціалізацією лікаря;
+    - медичні записи за спеціалізацією лікаря;
+    - діагнози: загальні лічильники та лічильники за днями;
+    - K найчастіших діагнозів (обмежений набір, що підтримується при кожному оновленні).
+
+Оновлення - O(1) (для найчастіших діагнозів - O(K) лише тоді, коли діагноз може
+потрапити до K найчастіших). Запити не переглядають історію, але їхня ціна залежить
+від вікна: кількість прийомів за "останні N днів" (за замовчуванням 7 і 30) - сума
+N денних лічильників, O(N); K найчастіших діагнозів за вікно - O(M + D log K), де
+M - кількість пар (день, діагноз) у вікні, D - різних діагнозів у ньому. K
+найчастіших діагнозів за весь час - O(K log K).
+Діагнози з різним регістром і закінченнями ("ГРВІ", "грві") рахуються разом;
+у звітах показується перше написання.
+
+Клініка зі сховищем заповнює лічильники медичних записів агрегатним запитом до
+сховища (add_records), тож звіти не завантажують самі записи й ліниві медичні
+історії лишаються незавантаженими.
+"""
+
+import datetime
+import heapq
+
+from record_index import terms
+
+# Вікна (у днях) для зведення summary()
+WINDOWS = (7, 30)
+
+
+def _day(value):
+    """datetime, date або рядок 'РРРР-ММ-ДД' -> datetime.date."""
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, str):
+        return datetime.date.fromisoformat(value)
+    return value
+
+
+class ClinicAnalytics:
+    """
+    Лічильники для звітів клініки.
+
+    Args:
+        top_k: Скільки найчастіших діагнозів підтримувати
+    """
+
+    def __init__(self, top_k=10):
+        if not isinstance(top_k, int) or top_k <= 0:
+            raise ValueError("top_k має бути додатним цілим числом.")
+        self.top_k = top_k
+        self.appointments = 0
+        self.records = 0
+        self._by_day = {} # {date: кількість прийомів}
+        self._by_doctor_day = {} # {doctor_id: {date: кількість прийомів}}
+        self._by_specialization = {} # {specialization: кількість прийомів}
+        self._records_by_specialization = {} # {specialization: кількість медичних записів}
+        self._diagnoses = {} # {ключ діагнозу: кількість записів}
+        self._diagnosis_names = {} # {ключ діагнозу: перше написання}
+        self._diagnoses_by_day = {} # {date: {ключ діагнозу: кількість}}
+        self._top = set() # Ключі K найчастіших діагнозів
+        self._top_min = 0 # Нижня межа найменшого лічильника в _top (уточнюється при потребі)
+
+    # --- Оновлення ---
+
+    def add_appointment(self, appointment):
+        day = appointment.date_time.date()
+        self.appointments += 1
+        self._by_day[day] = self._by_day.get(day, 0) + 1
+        doctor_days = self._by_doctor_day.get(appointment.doctor_id)
+        if doctor_days is None:
+            doctor_days = self._by_doctor_day[appointment.doctor_id] = {}
+        doctor_days[day] = doctor_days.get(day, 0) + 1
+        specialization = appointment.doctor.specialization
+        self._by_specialization[specialization] = self._by_specialization.get(specialization, 0) + 1
+
+    def add_record(self, record):
+        self.add_records(record.date, record.doctor.specialization, record.diagnosis)
+
+    def add_records(self, date, specialization, diagnosis, count=1):
+        """
+        Враховує count медичних записів з однаковими датою, спеціалізацією лікаря та
+        діагнозом (наприклад, рядок агрегатного запиту до сховища).
+        """
+        self.records += count
+        self._records_by_specialization[specialization] = (
+            self._records_by_specialization.get(specialization, 0) + count)
+        key = ' '.join(terms(diagnosis))
+        total = self._diagnoses.get(key, 0) + count
+        self._diagnoses[key] = total
+        if total == count:
+            self._diagnosis_names[key] = diagnosis
+        day_counts = self._diagnoses_by_day.get(date)
+        if day_counts is None:
+            day_counts = self._diagnoses_by_day[date] = {}
+        day_counts[key] = day_counts.get(key, 0) + count
+        self._update_top(key, total)
+
+    def _update_top(self, key, count):
+        """
+        Підтримує _top: жоден діагноз поза _top не має більшого лічильника, ніж
+        найменший у _top. Лічильники лише зростають, тож досить порівняти оновлений
+        діагноз із найменшим у _top.
+        """
+        top = self._top
+        if key in top:
+            return
+        if len(top) < self.top_k:
+            top.add(key)
+            self._top_min = min(self._diagnoses[item] for item in top)
+            return
+        if count <= self._top_min:
+            return
+        diagnoses = self._diagnoses
+        smallest = min(top, key=diagnoses.__getitem__)
+        if count > diagnoses[smallest]:
+            top.discard(smallest)
+            top.add(key)
+            smallest = min(top, key=diagnoses.__getitem__)
+        self._top_min = diagnoses[smallest]
+
+    # --- Запити ---
+
+    def _window(self, days, today):
+        """Дати вікна з days днів, що закінчується today (за замовчуванням - сьогодні) включно."""
+        today = datetime.date.today() if today is None else _day(today)
+        return [today - datetime.timedelta(days=offset) for offset in range(days)]
+
+    def appointments_on(self, date):
+        return self._by_day.get(_day(date), 0)
+
+    def appointments_window(self, days=7, today=None):
+        """Кількість прийомів за останні days днів."""
+        by_day = self._by_day
+        return sum(by_day.get(day, 0) for day in self._window(days, today))
+
+    def doctor_load(self, doctor_id, date):
+        """Кількість прийомів лікаря за день."""
+        return self._by_doctor_day.get(doctor_id, {}).get(_day(date), 0)
+
+    def doctor_load_window(self, doctor_id, days=7, today=None):
+        """Кількість прийомів лікаря за останні days днів."""
+        doctor_days = self._by_doctor_day.get(doctor_id, {})
+        return sum(doctor_days.get(day, 0) for day in self._window(days, today))
+
+    def specialization_counts(self):
+        """Прийоми за спеціалізаціями лікарів: {specialization: кількість}."""
+        return dict(self._by_specialization)
+
+    def record_specialization_counts(self):
+        """Медичні записи за спеціалізаціями лікарів: {specialization: кількість}."""
+        return dict(self._records_by_specialization)
+
+    def top_diagnoses(self, k=None):
+        """k (не більше top_k) найчастіших діагнозів: [(діагноз, кількість), ...]."""
+        k = self.top_k if k is None else min(k, self.top_k)
+        ranked = sorted(self._top, key=lambda key: (-self._diagnoses[key], key))[:k]
+        return [(self._diagnosis_names[key], self._diagnoses[key]) for key in ranked]
+
+    def top_diagnoses_window(self, k=None, days=30, today=None):
+        """
+        k найчастіших діагнозів за останні days днів: [(діагноз, кількість), ...].
+        Денні лічильники вікна підсумовуються при кожному запиті: O(M + D log k), де
+        M - кількість пар (день, діагноз) у вікні, D - різних діагнозів у ньому.
+        """
+        k = self.top_k if k is None else k
+        counts = {}
+        for day in self._window(days, today):
+            for key, count in self._diagnoses_by_day.get(day, {}).items():
+                counts[key] = counts.get(key, 0) + count
+        ranked = heapq.nsmallest(k, counts, key=lambda key: (-counts[key], key))
+        return [(self._diagnosis_names[key], counts[key]) for key in ranked]
+
+    def summary(self, today=None, k=5):
+        """Зведення для панелі: загальні кількості, прийоми й діагнози за вікнами WINDOWS."""
+        result = {'appointments': self.appointments, 'records': self.records,
+                  'by_specialization': self.specialization_counts(), 'top_diagnoses': self.top_diagnoses(k)}
+        for days in WINDOWS:
+            result[f'appointments_{days}d'] = self.appointments_window(days, today)
+            result[f'top_diagnoses_{days}d'] = self.top_diagnoses_window(k, days, today)
+        return result
@@ -0,0 +1,213 @@
+"""
+Постійне сховище клініки на основі sqlite3 у режимі WAL.
+
+ClinicStore працює з рядками (кортежами) таблиць patients, doctors, appointments,
+medical_records та meta; перетворення об'єктів клініки на рядки і назад
+виконує Clinic (див. Clinic.open у "Q1 Klinic.py").
+
+Записи накопичуються в пам'яті й записуються однією транзакцією пакетами
+по batch_size рядків (або під час flush()/batch()/close()). Кожен flush() дописує
+лише зміни з попереднього - так утворюються інкрементні знімки; snapshot()
+переносить журнал WAL в основний файл або копіює базу в інший файл порціями сторінок.
+"""
+
+import contextlib
+import sqlite3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS patients (
+    id PRIMARY KEY, name TEXT, phone TEXT, email TEXT, extra TEXT, birth_date TEXT);
+CREATE TABLE IF NOT EXISTS doctors (
+    id PRIMARY KEY, name TEXT, phone TEXT, email TEXT, extra TEXT, specialization TEXT);
+CREATE TABLE IF NOT EXISTS appointments (
+    id INTEGER PRIMARY KEY, patient_id, doctor_id, date_time TEXT, duration INTEGER, reason TEXT);
+CREATE TABLE IF NOT EXISTS medical_records (
+    id INTEGER PRIMARY KEY, patient_id, doctor_id, date TEXT, diagnosis TEXT, treatment TEXT);
+CREATE INDEX IF NOT EXISTS medical_records_patient ON medical_records (patient_id, id);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value);
+"""
+
+# Стовпці таблиць у порядку полів рядка
+TABLES = {
+    'patients': ('id', 'name', 'phone', 'email', 'extra', 'birth_date'),
+    'doctors': ('id', 'name', 'phone', 'email', 'extra', 'specialization'),
+    'appointments': ('id', 'patient_id', 'doctor_id', 'date_time', 'duration', 'reason'),
+    'medical_records': ('id', 'patient_id', 'doctor_id', 'date', 'diagnosis', 'treatment'),
+}
+
+
+class ClinicStore:
+    """
+    Сховище рядків клініки у файлі SQLite.
+
+    Args:
+        path: Шлях до файлу бази даних
+        batch_size: Кількість рядків, після якої накопичені зміни записуються автоматично
+        synchronous: Режим PRAGMA synchronous ('NORMAL' - зміни не губляться при збої
+            процесу; 'FULL' - і при збої живлення)
+    """
+
+    def __init__(self, path, batch_size=1000, synchronous='NORMAL'):
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise ValueError("Розмір пакета має бути додатним цілим числом.")
+        if synchronous not in ('OFF', 'NORMAL', 'FULL'):
+            raise ValueError("synchronous має бути 'OFF', 'NORMAL' або 'FULL'.")
+        self.path = path
+        self.batch_size = batch_size
+        self.state_callback = None # Функція без аргументів -> dict значень для meta під час flush()
+        self._connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(f"PRAGMA synchronous={synchronous}")
+        self._connection.executescript(SCHEMA)
+        self._inserts = {table: f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+                                f"VALUES ({', '.join('?' * len(columns))})"
+                         for table, columns in TABLES.items()}
+        self._pending = {table: [] for table in TABLES}
+        self._pending_count = 0
+        self._pending_meta = {}
+        self._batch_depth = 0
+
+    # --- Запис ---
+
+    def add(self, table, row):
+        """Додає (або замінює за id) рядок таблиці; записується з наступним пакетом."""
+        self._pending[table].append(row)
+        self._pending_count += 1
+        if self._pending_count >= self.batch_size and not self._batch_depth:
+            self.flush()
+
+    def add_many(self, table, rows):
+        """Додає кілька рядків таблиці одним викликом."""
+        pending = self._pending[table]
+        before = len(pending)
+        pending.extend(rows)
+        self._pending_count += len(pending) - before
+        if self._pending_count >= self.batch_size and not self._batch_depth:
+            self.flush()
+
+    def set_meta(self, key, value):
+        self._pending_meta[key] = value
+
+    def flush(self):
+        """Записує всі накопичені зміни однією транзакцією."""
+        if not self._pending_count and not self._pending_meta:
+            return
+        if self.state_callback is not None:
+            self._pending_meta.update(self.state_callback())
+        connection = self._connection
+        connection.execute("BEGIN")
+        try:
+            for table, rows in self._pending.items():
+                if rows:
+                    connection.executemany(self._inserts[table], rows)
+            if self._pending_meta:
+                connection.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                                       self._pending_meta.items())
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        for rows in self._pending.values():
+            rows.clear()
+        self._pending_count = 0
+        self._pending_meta.clear()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Контекст, у якому автоматичні записи пакетами вимкнені: усі зміни
+        записуються однією транзакцією на виході (або відкидаються при винятку).
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if self._batch_depth == 1:
+                for rows in self._pending.values():
+                    rows.clear()
+                self._pending_count = 0
+                self._pending_meta.clear()
+            raise
+        finally:
+            self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
+
+    def snapshot(self, target_path=None, pages=1024):
+        """
+        Записує накопичені зміни та фіксує знімок бази. Без target_path журнал WAL
+        переноситься в основний файл; з target_path база копіюється в інший файл
+        порціями по pages сторінок (записи між порціями не блокуються).
+
+        Returns:
+            Шлях до файлу знімка
+        """
+        self.flush()
+        if target_path is None:
+            self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            return self.path
+        target = sqlite3.connect(target_path)
+        try:
+            self._connection.backup(target, pages=pages)
+        finally:
+            target.close()
+        return target_path
+
+    # --- Читання ---
+
+    def rows(self, table, order_by='id'):
+        """Ітератор рядків таблиці (накопичені зміни спершу записуються)."""
+        if table not in TABLES or order_by not in TABLES[table]:
+            raise ValueError(f"Невідома таблиця або стовпець: {table}.{order_by}")
+        self.flush()
+        return self._connection.execute(
+            f"SELECT {', '.join(TABLES[table])} FROM {table} ORDER BY {order_by}")
+
+    def records_for_patient(self, patient_id):
+        """Медичні записи пацієнта у порядку додавання."""
+        self.flush()
+        return self._connection.execute(
+            f"SELECT {', '.join(TABLES['medical_records'])} FROM medical_records "
+            "WHERE patient_id = ? ORDER BY id", (patient_id,)).fetchall()
+
+    def record_counts(self):
+        """
+        Кількості медичних записів за (дата, спеціалізація лікаря, діагноз) у порядку першого
+        запису кожної трійки - для лічильників звітів без завантаження самих записів.
+        """
+        self.flush()
+        return self._connection.execute(
+            "SELECT r.date, d.specialization, r.diagnosis, COUNT(*) FROM medical_records r "
+            "LEFT JOIN doctors d ON d.id = r.doctor_id "
+            "GROUP BY r.date, d.specialization, r.diagnosis ORDER BY MIN(r.id)")
+
+    def count(self, table):
+        if table not in TABLES:
+            raise ValueError(f"Невідома таблиця: {table}")
+        self.flush()
+        return self._connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def max_id(self, table):
+        """Найбільший id у таблиці (0 для порожньої)."""
+        if table not in TABLES:
+            raise ValueError(f"Невідома таблиця: {table}")
+        self.flush()
+        return self._connection.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()[0]
+
+    def meta(self, key, default=None):
+        row = self._connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return default if row is None else row[0]
+
+    def close(self):
+        """Записує зміни, переносить журнал у основний файл і закриває з'єднання."""
+        if self._connection is None:
+            return
+        self.snapshot()
+        self._connection.close()
+        self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
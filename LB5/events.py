@@ -0,0 +1,166 @@
+"""
+Приймачі подій (event sinks) для класів клініки та банку.
+
+Методи Clinic і Bank не друкують повідомлення самі, а передають приймачу подію:
+тип (kind), шаблон повідомлення та поля. Текст повідомлення форматується лише
+тоді, коли він справді потрібен (PrintSink або Event.message), а запис події
+створюється лише якщо приймач увімкнений (enabled), тож з NullSink операції
+не витрачають час ні на форматування, ні на виведення.
+
+Приймачі:
+    NullSink       - нічого не робить
+    PrintSink      - друкує повідомлення (поведінка за замовчуванням)
+    RingBufferSink - зберігає останні capacity подій у пам'яті
+    JsonlSink      - записує події у файл JSON Lines пакетами
+"""
+
+import collections
+import datetime
+import json
+import threading
+import time
+
+
+class Event:
+    """Структурований запис події."""
+    __slots__ = ('kind', 'time', 'template', 'fields')
+
+    def __init__(self, kind, template, fields, timestamp=None):
+        self.kind = kind
+        self.time = time.time() if timestamp is None else timestamp
+        self.template = template
+        self.fields = fields
+
+    @property
+    def message(self):
+        """Текст повідомлення (форматується при кожному зверненні)."""
+        return self.template.format(**self.fields)
+
+    def to_dict(self):
+        result = {'time': self.time, 'kind': self.kind}
+        result.update(self.fields)
+        return result
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return f"Event({self.kind!r}, {self.fields!r})"
+
+
+def _json_default(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat(sep=' ') if isinstance(value, datetime.datetime) else value.isoformat()
+    return str(value)
+
+
+class NullSink:
+    """Приймач, що відкидає всі події."""
+    enabled = False
+
+    def emit(self, kind, template, **fields):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class PrintSink(NullSink):
+    """Друкує текст кожної події (за замовчуванням - у поточний sys.stdout)."""
+    enabled = True
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def emit(self, kind, template, **fields):
+        print(template.format(**fields), file=self.stream)
+
+
+class RingBufferSink(NullSink):
+    """Зберігає в пам'яті останні capacity подій (старіші витісняються)."""
+    enabled = True
+
+    def __init__(self, capacity=10000):
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("Місткість буфера має бути додатним цілим числом.")
+        self._events = collections.deque(maxlen=capacity)
+
+    def emit(self, kind, template, **fields):
+        # Зберігаємо кортеж; об'єкт Event створюється лише під час читання
+        self._events.append((kind, template, fields, time.time()))
+
+    def events(self, kind=None):
+        """Список збережених подій (від найстарішої), за потреби - лише одного типу."""
+        return [Event(*item) for item in list(self._events) if kind is None or item[0] == kind]
+
+    def clear(self):
+        self._events.clear()
+
+    def __len__(self):
+        return len(self._events)
+
+    def __iter__(self):
+        return iter(self.events())
+
+
+class JsonlSink(NullSink):
+    """
+    Записує події у файл JSON Lines (один об'єкт {time, kind, ...поля} на рядок).
+    Події накопичуються в буфері й серіалізуються та дописуються у файл пакетом
+    по batch_size подій, а також під час flush()/close().
+    """
+    enabled = True
+
+    def __init__(self, path, batch_size=1000):
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise ValueError("Розмір пакета має бути додатним цілим числом.")
+        self.path = path
+        self.batch_size = batch_size
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._encode = json.JSONEncoder(ensure_ascii=False, default=_json_default).encode
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def emit(self, kind, template, **fields):
+        self._buffer.append((time.time(), kind, fields))
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            if self._file is None:
+                return
+            batch, self._buffer = self._buffer, []
+            if not batch:
+                return
+            encode = self._encode
+            lines = []
+            for timestamp, kind, fields in batch:
+                record = {'time': timestamp, 'kind': kind}
+                record.update(fields)
+                lines.append(encode(record))
+            lines.append('')
+            self._file.write('\n'.join(lines))
+            self._file.flush()
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def read_jsonl_events(path):
+    """Читає події, записані JsonlSink, як список словників."""
+    with open(path, encoding='utf-8') as fd:
+        return [json.loads(line) for line in fd if line.strip()]
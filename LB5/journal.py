@@ -0,0 +1,253 @@
+"""
+Стовпцевий журнал транзакцій банківського рахунку.
+
+Замість списку об'єктів Transaction журнал зберігає поля транзакцій у типізованих
+масивах (array): ID, час (цілі мікросекунди epoch), тип, суму в копійках зі знаком та номер
+опису в таблиці рядків (однакові описи зберігаються один раз). Записи лише дописуються.
+
+Записи поділено на сегменти по segment_size. Час записів не спадає, тож діапазон
+часу знаходиться бінарним пошуком. Через кожні checkpoint_interval записів журнал
+запам'ятовує баланс, тому "баланс на момент T" рахується з найближчої контрольної
+точки й не більше ніж checkpoint_interval сум. Старі заповнені сегменти можна
+вивантажувати на диск (spill_dir): у пам'яті лишаються їхні межі часу, а стовпці
+читаються з файлу при зверненні.
+"""
+
+import array
+import bisect
+import os
+import tempfile
+import threading
+
+# Типи транзакцій і знак суми для балансу
+KINDS = ('deposit', 'withdrawal')
+_SIGNS = {'deposit': 1, 'withdrawal': -1}
+_KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+
+# Стовпці сегмента: назва та код типу array
+_COLUMNS = (('ids', 'q'), ('times', 'q'), ('kinds', 'B'), ('amounts', 'q'), ('descriptions', 'I'))
+
+
+class StringTable:
+    """Таблиця рядків: кожен різний рядок зберігається один раз і має номер."""
+
+    def __init__(self):
+        self._strings = []
+        self._ids = {}
+        self._lock = threading.Lock()
+
+    def intern(self, text):
+        index = self._ids.get(text)
+        if index is None:
+            with self._lock:
+                index = self._ids.get(text)
+                if index is None:
+                    index = len(self._strings)
+                    self._strings.append(text)
+                    self._ids[text] = index
+        return index
+
+    def __getitem__(self, index):
+        return self._strings[index]
+
+    def __len__(self):
+        return len(self._strings)
+
+
+class _Segment:
+    """Сегмент журналу: стовпці записів [start, start + len) або файл, у який їх вивантажено."""
+    __slots__ = ('start', 'count', 'first_time', 'last_time', 'path', 'ids', 'times', 'kinds', 'amounts',
+                 'descriptions')
+
+    def __init__(self, start):
+        self.start = start
+        self.count = 0
+        self.first_time = None
+        self.last_time = None
+        self.path = None
+        for name, typecode in _COLUMNS:
+            setattr(self, name, array.array(typecode))
+
+    @property
+    def spilled(self):
+        return self.ids is None
+
+    def spill(self, directory):
+        """Записує стовпці у файл і звільняє пам'ять."""
+        descriptor, self.path = tempfile.mkstemp(prefix='journal-', suffix='.seg', dir=directory)
+        with os.fdopen(descriptor, 'wb') as fd:
+            for name, _ in _COLUMNS:
+                getattr(self, name).tofile(fd)
+        for name, _ in _COLUMNS:
+            setattr(self, name, None)
+
+    def load(self):
+        """Читає стовпці вивантаженого сегмента (повертає новий сегмент, сам сегмент лишається на диску)."""
+        loaded = _Segment(self.start)
+        loaded.count, loaded.first_time, loaded.last_time = self.count, self.first_time, self.last_time
+        with open(self.path, 'rb') as fd:
+            for name, _ in _COLUMNS:
+                getattr(loaded, name).fromfile(fd, self.count)
+        return loaded
+
+
+class TransactionJournal:
+    """
+    Журнал транзакцій одного рахунку.
+
+    Args:
+        opening_balance: Баланс до першого запису (копійки)
+        strings: Таблиця описів (StringTable); рахунки одного банку можуть мати спільну
+        segment_size: Кількість записів у сегменті
+        checkpoint_interval: Через скільки записів зберігається баланс (має ділити segment_size)
+        spill_dir: Каталог для вивантажених сегментів (None - усе в пам'яті)
+        max_memory_segments: Скільки заповнених сегментів тримати в пам'яті перед вивантаженням
+    """
+
+    def __init__(self, opening_balance=0, strings=None, segment_size=4096, checkpoint_interval=64,
+                 spill_dir=None, max_memory_segments=4):
+        if segment_size <= 0 or checkpoint_interval <= 0 or segment_size % checkpoint_interval:
+            raise ValueError("checkpoint_interval має бути додатним дільником segment_size.")
+        self.opening_balance = opening_balance
+        self.balance = opening_balance # Поточний баланс (копійки)
+        self.strings = StringTable() if strings is None else strings
+        self.segment_size = segment_size
+        self.checkpoint_interval = checkpoint_interval
+        self.spill_dir = spill_dir
+        self.max_memory_segments = max_memory_segments
+        self._segments = [_Segment(0)]
+        self._segment_starts = [None] # Час першого запису кожного сегмента (для бінарного пошуку)
+        self._checkpoints = array.array('q') # Баланс перед записом k * checkpoint_interval
+        self._count = 0
+        self._cached = None # Останній прочитаний з диска сегмент
+
+    # --- Запис ---
+
+    def append(self, transaction_id, kind, amount, timestamp, description=""):
+        """
+        Дописує транзакцію. amount - додатна сума в копійках, kind - 'deposit' або 'withdrawal',
+        timestamp - ціле число мікросекунд epoch.
+        Час, менший за час попереднього запису (наприклад, після переведення годинника),
+        замінюється часом попереднього, щоб журнал лишався впорядкованим.
+        """
+        segment = self._segments[-1]
+        if segment.count == self.segment_size:
+            segment = self._new_segment()
+        if self._count % self.checkpoint_interval == 0:
+            self._checkpoints.append(self.balance)
+        if segment.last_time is not None and timestamp < segment.last_time:
+            timestamp = segment.last_time
+        signed = amount * _SIGNS[kind]
+        segment.ids.append(transaction_id)
+        segment.times.append(timestamp)
+        segment.kinds.append(_KIND_CODES[kind])
+        segment.amounts.append(signed)
+        segment.descriptions.append(self.strings.intern(description))
+        if segment.count == 0:
+            segment.first_time = timestamp
+            self._segment_starts[-1] = timestamp
+        segment.last_time = timestamp
+        segment.count += 1
+        self._count += 1
+        self.balance += signed
+
+    def _new_segment(self):
+        last = self._segments[-1]
+        segment = _Segment(last.start + last.count)
+        segment.last_time = last.last_time
+        self._segments.append(segment)
+        self._segment_starts.append(None)
+        if self.spill_dir is not None:
+            in_memory = [item for item in self._segments[:-1] if not item.spilled]
+            for item in in_memory[:max(0, len(in_memory) - self.max_memory_segments)]:
+                item.spill(self.spill_dir)
+        return segment
+
+    def spill(self):
+        """Вивантажує на диск усі заповнені сегменти (потрібен spill_dir)."""
+        if self.spill_dir is None:
+            raise ValueError("Для вивантаження потрібен каталог spill_dir.")
+        for segment in self._segments[:-1]:
+            if not segment.spilled:
+                segment.spill(self.spill_dir)
+
+    def close(self):
+        """Видаляє файли вивантажених сегментів."""
+        for segment in self._segments:
+            if segment.path is not None and os.path.exists(segment.path):
+                os.remove(segment.path)
+        self._cached = None
+
+    # --- Читання ---
+
+    def __len__(self):
+        return self._count
+
+    def _columns(self, number):
+        """Сегмент із номером number зі стовпцями в пам'яті."""
+        segment = self._segments[number]
+        if not segment.spilled:
+            return segment
+        cached = self._cached
+        if cached is None or cached.start != segment.start:
+            cached = self._cached = segment.load()
+        return cached
+
+    def _segment_of(self, index):
+        return index // self.segment_size
+
+    def index_at(self, timestamp, inclusive=True):
+        """Кількість записів із часом <= timestamp (або < timestamp, якщо inclusive=False)."""
+        if not self._count:
+            return 0
+        search = bisect.bisect_right if inclusive else bisect.bisect_left
+        starts = self._segment_starts
+        number = max(0, search(starts, timestamp, hi=len(starts) - (starts[-1] is None)) - 1)
+        segment = self._columns(number)
+        return segment.start + search(segment.times, timestamp)
+
+    def balance_at(self, timestamp):
+        """Баланс (копійки) після всіх записів із часом <= timestamp."""
+        index = self.index_at(timestamp)
+        checkpoint = index // self.checkpoint_interval
+        if checkpoint >= len(self._checkpoints):
+            return self.balance
+        balance = self._checkpoints[checkpoint]
+        first = checkpoint * self.checkpoint_interval
+        if index > first:
+            segment = self._columns(self._segment_of(first))
+            offset = first - segment.start
+            balance += sum(segment.amounts[offset:offset + index - first])
+        return balance
+
+    def entries(self, start=None, end=None, offset=0, limit=None):
+        """
+        Записи з часом у [start, end) у хронологічному порядку, починаючи з offset-го
+        і не більше limit. Кожен запис - кортеж
+        (transaction_id, kind, amount, timestamp, description), amount у копійках (додатна).
+        """
+        low = 0 if start is None else self.index_at(start, inclusive=False)
+        high = self._count if end is None else self.index_at(end, inclusive=False)
+        low += offset
+        if limit is not None:
+            high = min(high, low + limit)
+        strings = self.strings
+        index = low
+        while index < high:
+            segment = self._columns(self._segment_of(index))
+            first = index - segment.start
+            last = min(high - segment.start, segment.count)
+            for position in range(first, last):
+                amount = segment.amounts[position]
+                yield (segment.ids[position], KINDS[segment.kinds[position]], abs(amount),
+                       segment.times[position], strings[segment.descriptions[position]])
+            index = segment.start + last
+
+    def count_between(self, start=None, end=None):
+        """Кількість записів із часом у [start, end) (для сторінок виписки)."""
+        low = 0 if start is None else self.index_at(start, inclusive=False)
+        high = self._count if end is None else self.index_at(end, inclusive=False)
+        return max(0, high - low)
+
+    def __iter__(self):
+        return self.entries()
@@ -0,0 +1,315 @@
+"""
+Інвертований індекс медичних записів клініки за словами діагнозу та лікування.
+
+Текст розбивається на слова, які нормалізуються: нижній регістр, один вид апострофа,
+відкидання типових закінчень українських іменників і прикметників ("антибіотики" і
+"антибіотик", "грипу" і "грип" дають один термін). Для кожного терміну й поля
+зберігається список ID записів; окремо - списки записів за датою та за лікарем, щоб
+фільтри не переглядали всі записи.
+
+Запит - слова через пробіл (усі мають бути в записі). Варіанти одного слова
+поєднуються OR або АБО, слово з "-" на початку (або після NOT) виключає записи,
+"*" у кінці слова - пошук за префіксом (без нормалізації закінчення). Частка "не" -
+звичайне стоп-слово, а не заперечення: "не зламано" шукає записи зі словом "зламано".
+
+    грві                  записи зі словом "ГРВІ"
+    грип АБО грві кашель  (грип або ГРВІ) і кашель
+    антибіот* -алергія    слова, що починаються з "антибіот", без слова "алергія"
+
+Результати ранжуються за сумою ваг знайдених термінів (рідкісніший термін важить
+більше, збіг у діагнозі - удвічі більше, ніж у лікуванні), а за рівної ваги -
+новіші записи раніше. Сортування виконується лише в міру читання результатів.
+"""
+
+import bisect
+import functools
+import heapq
+import math
+import re
+
+FIELDS = ('diagnosis', 'treatment')
+# Вага збігу в полі для ранжування
+FIELD_WEIGHTS = {'diagnosis': 2.0, 'treatment': 1.0}
+
+_WORD = re.compile(r"[^\W_]+(?:'[^\W_]+)*")
+_APOSTROPHES = str.maketrans({"’": "'", "ʼ": "'", "`": "'", "‘": "'"})
+# Закінчення від довших до коротших; відкидається перше, після якого лишається не менше MIN_STEM літер
+_ENDINGS = ('ами', 'ями', 'ові', 'еві', 'ого', 'ому', 'ими', 'іми',
+            'ах', 'ях', 'ам', 'ям', 'ом', 'ем', 'єм', 'ою', 'ею', 'єю', 'ів', 'їв', 'ей',
+            'ий', 'ій', 'ої', 'их', 'іх', 'им', 'ім', 'ая', 'яя',
+            'а', 'я', 'о', 'е', 'є', 'у', 'ю', 'і', 'ї', 'и', 'ь', 'й')
+MIN_STEM = 4
+STOP_WORDS = frozenset(('і', 'й', 'та', 'а', 'в', 'у', 'з', 'із', 'зі', 'на', 'до', 'по', 'від', 'для',
+                        'при', 'після', 'без', 'не', 'чи', 'або'))
+_OR_WORDS = frozenset(('or', 'або'))
+_NOT_WORDS = frozenset(('not',))
+
+
+def normalize_word(word):
+    """Нормалізована форма слова (термін індексу)."""
+    word = word.lower().translate(_APOSTROPHES)
+    for ending in _ENDINGS:
+        if word.endswith(ending) and len(word) - len(ending) >= MIN_STEM:
+            return word[:-len(ending)]
+    return word
+
+
+@functools.lru_cache(maxsize=65536)
+def terms(text):
+    """Різні терміни тексту (з кешем: діагнози й призначення часто повторюються)."""
+    result = []
+    for word in _WORD.findall((text or '').lower().translate(_APOSTROPHES)):
+        if word in STOP_WORDS:
+            continue
+        term = normalize_word(word)
+        if term not in result:
+            result.append(term)
+    return tuple(result)
+
+
+def parse_query(query):
+    """
+    Розбирає запит на (clauses, excluded): clauses - список груп варіантів (OR),
+    усі групи мають збігтися; excluded - варіанти, що виключають запис.
+    Варіант - кортеж (термін, prefix).
+    """
+    clauses, excluded = [], []
+    join_next = negate_next = False
+    for word in query.translate(_APOSTROPHES).split():
+        lowered = word.lower()
+        if lowered in _OR_WORDS:
+            join_next = bool(clauses)
+            continue
+        if lowered in _NOT_WORDS:
+            negate_next = True
+            continue
+        negate = negate_next or word.startswith('-')
+        prefix = word.endswith('*')
+        text = word.strip('-*')
+        words = [part for part in _WORD.findall(text.lower()) if part not in STOP_WORDS]
+        if not words:
+            negate_next = join_next = False
+            continue
+        # "ГРВІ," - одне слово; складене "серцево-судинний" - кілька обов'язкових слів
+        variants = [(words[-1], True) if prefix else (normalize_word(words[-1]), False)]
+        required = [(normalize_word(part), False) for part in words[:-1]]
+        if negate:
+            excluded.extend(required + variants)
+        elif join_next and not required:
+            clauses[-1].extend(variants)
+        else:
+            clauses.extend([variant] for variant in required + variants)
+        negate_next = join_next = False
+    return clauses, excluded
+
+
+class SearchResults:
+    """
+    Результати пошуку. Записи віддаються за спаданням релевантності; порядок
+    визначається купою лише для прочитаних результатів (перша сторінка з n
+    знайдених - O(n + k log n), а не повне сортування).
+    """
+
+    def __init__(self, records, ranked):
+        self._records = records
+        self._ranked = ranked # [(-вага, -дата, -ID запису), ...] у довільному порядку
+
+    def __len__(self):
+        return len(self._ranked)
+
+    def __bool__(self):
+        return bool(self._ranked)
+
+    def __iter__(self):
+        heap = list(self._ranked)
+        heapq.heapify(heap)
+        records = self._records
+        while heap:
+            yield records[-heapq.heappop(heap)[2]]
+
+    def page(self, offset=0, limit=20):
+        """Записи з offset-го по offset + limit у порядку релевантності."""
+        best = heapq.nsmallest(offset + limit, self._ranked)
+        return [self._records[-item[2]] for item in best[offset:]]
+
+    def patient_ids(self):
+        """ID пацієнтів у порядку релевантності їхнього найкращого запису (без повторів)."""
+        seen = set()
+        for record in self:
+            if record.patient_id not in seen:
+                seen.add(record.patient_id)
+                yield record.patient_id
+
+
+class RecordIndex:
+    """
+    Індекс медичних записів.
+
+    Args:
+        records: Словник {record_id: MedicalRecord}, з якого беруться знайдені записи
+    """
+
+    def __init__(self, records):
+        self._records = records
+        self._postings = {field: {} for field in FIELDS} # {field: {term: [record_id, ...]}}
+        self._by_date = {} # {date: [record_id, ...]}
+        self._dates = [] # Відсортовані дати з _by_date
+        self._by_doctor = {} # {doctor_id: [record_id, ...]}
+        self._vocabulary = None # Відсортовані терміни для пошуку за префіксом (будується при потребі)
+        self.count = 0
+
+    def add(self, record):
+        """Додає запис до індексу (запис уже має бути в словнику records)."""
+        record_id = record.record_id
+        for field in FIELDS:
+            postings = self._postings[field]
+            for term in terms(getattr(record, field)):
+                ids = postings.get(term)
+                if ids is None:
+                    postings[term] = [record_id]
+                    self._vocabulary = None
+                else:
+                    ids.append(record_id)
+        ids = self._by_date.get(record.date)
+        if ids is None:
+            self._by_date[record.date] = [record_id]
+            bisect.insort(self._dates, record.date)
+        else:
+            ids.append(record_id)
+        self._by_doctor.setdefault(record.doctor_id, []).append(record_id)
+        self.count += 1
+
+    def _expand(self, term, prefix):
+        """Терміни, що відповідають варіанту запиту."""
+        if not prefix:
+            return (term,)
+        if self._vocabulary is None:
+            self._vocabulary = sorted(set().union(*self._postings.values()))
+        vocabulary = self._vocabulary
+        low = bisect.bisect_left(vocabulary, term)
+        high = low
+        while high < len(vocabulary) and vocabulary[high].startswith(term):
+            high += 1
+        return vocabulary[low:high]
+
+    def _frequency(self, term, prefix, fields):
+        """Кількість записів із варіантом запиту (сума довжин списків; для рідкісності та плану запиту)."""
+        return sum(len(self._postings[field].get(expanded, ())) for field in fields
+                   for expanded in self._expand(term, prefix))
+
+    def _matches(self, term, prefix, fields):
+        """{record_id: вага поля} для варіанту запиту (без множника рідкісності)."""
+        weights = {}
+        for field in fields:
+            postings = self._postings[field]
+            weight = FIELD_WEIGHTS[field]
+            for expanded in self._expand(term, prefix):
+                for record_id in postings.get(expanded, ()):
+                    if weights.get(record_id, 0.0) < weight:
+                        weights[record_id] = weight
+        return weights
+
+    @staticmethod
+    def _record_weight(record, term, prefix, fields):
+        """Вага поля для варіанту запиту в одному записі (0.0 - немає збігу)."""
+        best = 0.0
+        for field in fields:
+            words = terms(getattr(record, field))
+            found = any(word.startswith(term) for word in words) if prefix else term in words
+            if found and FIELD_WEIGHTS[field] > best:
+                best = FIELD_WEIGHTS[field]
+        return best
+
+    def _date_range(self, start, end):
+        """Дати записів у [start, end]."""
+        dates = self._dates
+        low = 0 if start is None else bisect.bisect_left(dates, start)
+        high = len(dates) if end is None else bisect.bisect_right(dates, end)
+        return dates[low:high]
+
+    def search(self, query, start=None, end=None, doctor_id=None, field=None):
+        """
+        Записи, що відповідають запиту, з датою в [start, end] (datetime.date, межі
+        включно) і, за потреби, одного лікаря та лише в одному полі.
+
+        Returns:
+            SearchResults
+        """
+        if field is not None and field not in FIELDS:
+            raise ValueError(f"Невідоме поле: {field}")
+        fields = FIELDS if field is None else (field,)
+        clauses, excluded = parse_query(query)
+        records = self._records
+        if not clauses:
+            return SearchResults(records, [])
+
+        # Рідкісність (idf) кожного варіанту та оцінка розміру кожної групи OR
+        weighted = []
+        sizes = []
+        for variants in clauses:
+            group = []
+            for term, prefix in variants:
+                frequency = self._frequency(term, prefix, fields)
+                if frequency:
+                    group.append((term, prefix, math.log(1.0 + self.count / frequency), frequency))
+            if not group:
+                return SearchResults(records, [])
+            weighted.append(group)
+            sizes.append(sum(item[3] for item in group))
+
+        # Найменший фільтр (записи лікаря або записи за дати); якщо він менший за
+        # найменшу групу, перевіряємо його записи напряму замість списків термінів
+        filtered = None
+        if doctor_id is not None:
+            filtered = self._by_doctor.get(doctor_id, [])
+        if start is not None or end is not None:
+            dates = self._date_range(start, end)
+            if filtered is None or sum(len(self._by_date[date]) for date in dates) < len(filtered):
+                filtered = [record_id for date in dates for record_id in self._by_date[date]]
+
+        ranked = []
+        if filtered is not None and len(filtered) < min(sizes):
+            record_weight = self._record_weight
+            for record_id in filtered:
+                record = records[record_id]
+                if doctor_id is not None and record.doctor_id != doctor_id:
+                    continue
+                if (start is not None and record.date < start) or (end is not None and record.date > end):
+                    continue
+                score = 0.0
+                for group in weighted:
+                    group_score = sum(record_weight(record, term, prefix, fields) * idf
+                                      for term, prefix, idf, _ in group)
+                    if not group_score:
+                        break
+                    score += group_score
+                else:
+                    if not any(record_weight(record, term, prefix, fields) for term, prefix in excluded):
+                        ranked.append((-score, -record.date.toordinal(), -record_id))
+            return SearchResults(records, ranked)
+
+        # Інакше - списки термінів: перетин починаючи з найменшої групи, потім фільтри
+        groups = []
+        for group in weighted:
+            scores = {}
+            for term, prefix, idf, _ in group:
+                for record_id, weight in self._matches(term, prefix, fields).items():
+                    scores[record_id] = scores.get(record_id, 0.0) + weight * idf
+            groups.append(scores)
+        groups.sort(key=len)
+        candidates = set(groups[0])
+        for group in groups[1:]:
+            candidates.intersection_update(group)
+        if filtered is not None:
+            # Список фільтра враховує одну умову; інша перевіряється за полями запису
+            candidates.intersection_update(filtered)
+            candidates = {record_id for record_id in candidates
+                          if (doctor_id is None or records[record_id].doctor_id == doctor_id)
+                          and (start is None or records[record_id].date >= start)
+                          and (end is None or records[record_id].date <= end)}
+        for term, prefix in excluded:
+            candidates.difference_update(self._matches(term, prefix, fields))
+        for record_id in candidates:
+            score = sum(group[record_id] for group in groups)
+            ranked.append((-score, -records[record_id].date.toordinal(), -record_id))
+        return SearchResults(records, ranked)
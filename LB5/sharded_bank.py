@@ -0,0 +1,440 @@
+"""
+Банк, рахунки якого розподілені між кількома процесами (шардами).
+
+Рахунок належить шарду shard_of(account_number, shards). Кожен шард -
+окремий процес multiprocessing зі своїм Bank, тож шарди не ділять GIL. Процес-координатор
+(ShardedBank) спілкується з шардами через Pipe: операція над одним рахунком - один обмін
+повідомленнями з його шардом, пакет операцій (run_many) - одне повідомлення кожному
+задіяному шарду, і шарди виконують свої частини паралельно.
+
+Переказ між рахунками різних шардів виконується у дві фази:
+    1. prepare: шард відправника резервує суму (інші списання бачать баланс за
+       вирахуванням резерву), шард отримувача перевіряє рахунок і забороняє його видалення;
+    2. commit, якщо обидва шарди погодились (списання й нарахування записуються в журнали),
+       інакше abort (резерви знімаються, журнали не змінюються).
+Координатор - один процес; відновлення після його збою між фазами (або після обриву
+каналу до шарду під час першої фази) не передбачене.
+
+Обмеження пропускної здатності. Кожна операція серіалізується (pickle) і проходить
+через Pipe у процесі координатора, а ця робота виконується під його GIL. Потоки, що
+звертаються до різних шардів, не чекають на блокування одне одного, але серіалізацію
+все одно виконують по черзі. Тож у межах одного процесу-клієнта шарди не множать
+пропускну здатність: для дрібних операцій (поповнення, баланс) обмін повідомленнями
+коштує більше, ніж сама операція в Bank, і з ростом кількості шардів пропускна
+здатність навіть падає. Вимірювання (benchmarks.py shards, одне ядро): run_many -
+близько 84 тис. оп./с з одним шардом і 65 тис. з чотирма; окремі виклики - 17 тис.
+і 9 тис. оп./с. Шарди виграють, коли робота на шарді важча за обмін (великі
+журнали, вивантаження сегментів на диск) і є вільні ядра, або коли обсяг рахунків
+перевищує пам'ять одного процесу. Для найбільшої пропускної здатності на одній
+машині підходить Bank(concurrent=True) або пакети Bank.apply_batch.
+
+Події шардів пересилаються координатору разом з відповіддю й передаються його приймачу
+(events), тож повідомлення такі самі, як у Bank.
+"""
+
+import itertools
+import multiprocessing
+import threading
+import zlib
+
+import BANK
+from events import NullSink, PrintSink
+
+# Операції, які можна передати в run_many
+OPERATIONS = ('add_account', 'delete_account', 'deposit', 'withdraw', 'perform_transfer', 'get_balance')
+
+
+def shard_of(key, shards):
+    """Номер шарду для ключа (однаковий у всіх процесах, на відміну від hash())."""
+    return zlib.crc32(str(key).encode('utf-8')) % shards
+
+
+class _ForwardSink(NullSink):
+    """Приймач шарду: накопичує події, щоб відправити їх координатору з відповіддю."""
+    enabled = True
+
+    def __init__(self):
+        self.pending = []
+
+    def emit(self, kind, template, **fields):
+        self.pending.append((kind, template, fields))
+
+    def drain(self):
+        events, self.pending = self.pending, []
+        return events
+
+
+class _Shard:
+    """Стан одного шарду: Bank з його рахунками та резерви незавершених переказів."""
+
+    def __init__(self, shard, shards, forward_events, journal_options):
+        # ID транзакцій шардів не перетинаються: шард k видає k + 1, k + 1 + shards, ...
+        BANK.BankAccount._transaction_ids = itertools.count(shard + 1, shards)
+        self.events = _ForwardSink() if forward_events else NullSink()
+        self.bank = BANK.Bank(f"Шард {shard}", events=self.events, journal_options=journal_options)
+        self.holds = {} # {txid: (account_number, kind, kopiyky)} - підготовлені частини переказів
+        self.held = {} # {account_number: зарезервована сума в копійках}
+        self.pinned = {} # {account_number: кількість незавершених переказів за участю рахунку}
+
+    def drain_events(self):
+        return self.events.drain() if self.events.enabled else []
+
+    def _account(self, account_number, template="Рахунок з номером {account_number} не знайдений."):
+        account = self.bank.find_account(account_number)
+        if account is None:
+            self.events.emit('account_not_found', template, account_number=account_number)
+        return account
+
+    def _can_spend(self, account, kopiyky):
+        """Чи вистачає коштів з урахуванням резерву (без резерву перевіряє сам BankAccount)."""
+        held = self.held.get(account.account_number, 0)
+        if held and account.balance_kopiyky - held < kopiyky:
+            self.events.emit('insufficient_funds', "Недостатньо коштів на рахунку {account_number} для списання {amount:.2f} грн. Поточний баланс: {balance:.2f} грн (зарезервовано {held:.2f} грн).",
+                             account_number=account.account_number, amount=BANK.from_kopiyky(kopiyky),
+                             balance=account.balance, held=BANK.from_kopiyky(held))
+            return False
+        return True
+
+    # --- Операції над рахунками шарду ---
+
+    def add_account(self, account_number, initial_balance=0.0):
+        return self.bank.add_account(account_number, initial_balance) is not None
+
+    def delete_account(self, account_number):
+        if self.pinned.get(account_number):
+            self.events.emit('account_busy', "Рахунок {account_number} бере участь у незавершеному переказі.",
+                             account_number=account_number)
+            return False
+        return self.bank.delete_account(account_number)
+
+    def deposit(self, account_number, amount, description=""):
+        account = self._account(account_number)
+        return False if account is None else account.deposit(amount, description)
+
+    def withdraw(self, account_number, amount, description=""):
+        account = self._account(account_number)
+        if account is None:
+            return False
+        kopiyky = BANK._positive_kopiyky(amount, "Сума списання має бути додатним числом.")
+        return self._can_spend(account, kopiyky) and account._withdraw_kopiyky(kopiyky, description)
+
+    def transfer(self, from_account_number, to_account_number, kopiyky):
+        """Переказ між двома рахунками цього шарду."""
+        account = self.bank.find_account(from_account_number)
+        if account is not None and not self._can_spend(account, kopiyky):
+            return False
+        return self.bank.perform_transfer(from_account_number, to_account_number, BANK.from_kopiyky(kopiyky))
+
+    def get_balance(self, account_number):
+        account = self.bank.find_account(account_number)
+        return None if account is None else account.balance
+
+    def balances(self):
+        return {number: account.balance for number, account in self.bank.accounts.items()}
+
+    def get_transaction_history(self, account_number, start=None, end=None, offset=0, limit=None):
+        account = self.bank.find_account(account_number)
+        return [] if account is None else account.get_transaction_history(start, end, offset, limit)
+
+    # --- Двофазний переказ між шардами ---
+
+    def prepare_debit(self, txid, account_number, kopiyky):
+        account = self._account(account_number, "Відправник: Рахунок {account_number} не знайдений.")
+        if account is None:
+            return False
+        if account.balance_kopiyky - self.held.get(account_number, 0) < kopiyky:
+            self.events.emit('insufficient_funds', "Недостатньо коштів на рахунку {account_number} для списання {amount:.2f} грн. Поточний баланс: {balance:.2f} грн.",
+                             account_number=account_number, amount=BANK.from_kopiyky(kopiyky), balance=account.balance)
+            return False
+        self.held[account_number] = self.held.get(account_number, 0) + kopiyky
+        self._hold(txid, account_number, 'withdrawal', kopiyky)
+        return True
+
+    def prepare_credit(self, txid, account_number, kopiyky):
+        if self._account(account_number, "Отримувач: Рахунок {account_number} не знайдений.") is None:
+            return False
+        self._hold(txid, account_number, 'deposit', kopiyky)
+        return True
+
+    def _hold(self, txid, account_number, kind, kopiyky):
+        self.holds[txid] = (account_number, kind, kopiyky)
+        self.pinned[account_number] = self.pinned.get(account_number, 0) + 1
+
+    def _release(self, txid):
+        hold = self.holds.pop(txid, None)
+        if hold is not None:
+            account_number, kind, kopiyky = hold
+            if kind == 'withdrawal':
+                self.held[account_number] -= kopiyky
+                if not self.held[account_number]:
+                    del self.held[account_number]
+            self.pinned[account_number] -= 1
+            if not self.pinned[account_number]:
+                del self.pinned[account_number]
+        return hold
+
+    def commit(self, txid, description):
+        account_number, kind, kopiyky = self._release(txid)
+        account = self.bank.accounts[account_number]
+        if kind == 'withdrawal':
+            return account._withdraw_kopiyky(kopiyky, description)
+        return account._deposit_kopiyky(kopiyky, description)
+
+    def abort(self, txid):
+        self._release(txid)
+        return True
+
+    def close(self):
+        for account in self.bank.accounts.values():
+            account.journal.close()
+
+
+def _serve(connection, shard, shards, forward_events, journal_options):
+    """Цикл процесу шарду: повідомлення - список викликів [(метод, аргументи), ...]."""
+    worker = _Shard(shard, shards, forward_events, journal_options)
+    try:
+        while True:
+            try:
+                calls = connection.recv()
+            except EOFError:
+                break
+            if calls is None:
+                break
+            outcomes = []
+            for method, args in calls:
+                try:
+                    outcomes.append((True, getattr(worker, method)(*args)))
+                except Exception as error:
+                    outcomes.append((False, error))
+            connection.send((outcomes, worker.drain_events()))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        worker.close()
+        connection.close()
+
+
+class ShardedBank:
+    """
+    Банк із рахунками в shards процесах. Методи мають ті самі назви, що й у Bank,
+    але рахунок задається номером, а add_account повертає True/False замість об'єкта
+    рахунку (рахунок живе в іншому процесі). Методи можна викликати з кількох потоків.
+
+    Args:
+        name: Назва банку
+        shards: Кількість процесів-шардів
+        events: Приймач подій координатора (за замовчуванням PrintSink); події шардів
+            пересилаються лише якщо він увімкнений на момент створення банку
+        journal_options: Параметри журналів рахунків (див. TransactionJournal)
+        start_method: Спосіб запуску процесів multiprocessing ('fork', 'spawn', ...)
+    """
+
+    def __init__(self, name, shards=4, events=None, journal_options=None, start_method=None):
+        if not isinstance(shards, int) or shards <= 0:
+            raise ValueError("Кількість шардів має бути додатним цілим числом.")
+        self.name = name
+        self.shards = shards
+        self.events = PrintSink() if events is None else events
+        self._txids = itertools.count(1)
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._connections = []
+        self._processes = []
+        context = multiprocessing.get_context(start_method)
+        for shard in range(shards):
+            parent_end, child_end = context.Pipe()
+            process = context.Process(target=_serve, name=f"bank-shard-{shard}", daemon=True,
+                                      args=(child_end, shard, shards, self.events.enabled, journal_options))
+            process.start()
+            child_end.close()
+            self._connections.append(parent_end)
+            self._processes.append(process)
+
+    def shard_for(self, account_number):
+        return shard_of(account_number, self.shards)
+
+    # --- Обмін повідомленнями з шардами ---
+
+    def _round(self, calls):
+        """
+        Надсилає кожному шарду його список викликів {shard: [(метод, аргументи), ...]}
+        і чекає на всі відповіді (шарди працюють паралельно). Повертає
+        {shard: [(успіх, результат або виняток), ...]}.
+        """
+        shards = sorted(calls)
+        # Блокування шардів у порядку номерів, щоб потоки не блокували одне одного навхрест
+        for shard in shards:
+            self._locks[shard].acquire()
+        try:
+            for shard in shards:
+                self._connections[shard].send(calls[shard])
+            replies = {shard: self._connections[shard].recv() for shard in shards}
+        finally:
+            for shard in reversed(shards):
+                self._locks[shard].release()
+        results = {}
+        for shard in shards:
+            outcomes, events = replies[shard]
+            for kind, template, fields in events:
+                self.events.emit(kind, template, **fields)
+            results[shard] = outcomes
+        return results
+
+    def _call(self, shard, method, *args):
+        success, value = self._round({shard: [(method, args)]})[shard][0]
+        if not success:
+            raise value
+        return value
+
+    # --- Операції ---
+
+    def add_account(self, account_number, initial_balance=0.0):
+        """Додає новий рахунок у його шард; True, якщо рахунок додано."""
+        return self._call(self.shard_for(account_number), 'add_account', account_number, initial_balance)
+
+    def delete_account(self, account_number):
+        return self._call(self.shard_for(account_number), 'delete_account', account_number)
+
+    def deposit(self, account_number, amount, description=""):
+        return self._call(self.shard_for(account_number), 'deposit', account_number, amount, description)
+
+    def withdraw(self, account_number, amount, description=""):
+        return self._call(self.shard_for(account_number), 'withdraw', account_number, amount, description)
+
+    def get_balance(self, account_number):
+        """Баланс рахунку (Decimal) або None, якщо рахунок не знайдено."""
+        return self._call(self.shard_for(account_number), 'get_balance', account_number)
+
+    def get_transaction_history(self, account_number, start=None, end=None, offset=0, limit=None):
+        return self._call(self.shard_for(account_number), 'get_transaction_history',
+                          account_number, start, end, offset, limit)
+
+    def balances(self):
+        """
+        Баланси всіх рахунків {номер: Decimal}. Шарди відповідають незалежно, тож під час
+        переказів між шардами сума може бути неузгодженою.
+        """
+        result = {}
+        for outcomes in self._round({shard: [('balances', ())] for shard in range(self.shards)}).values():
+            result.update(outcomes[0][1])
+        return result
+
+    def perform_transfer(self, from_account_number, to_account_number, amount):
+        """Здійснює переказ коштів між рахунками (між шардами - у дві фази)."""
+        return self.run_many([('perform_transfer', from_account_number, to_account_number, amount)],
+                             raise_errors=True)[0]
+
+    def run_many(self, operations, raise_errors=False):
+        """
+        Виконує пакет операцій: кожен задіяний шард отримує одне повідомлення на фазу.
+        operations - кортежі (назва, *аргументи), назва з OPERATIONS, аргументи як у
+        відповідних методів. Операції одного шарду виконуються в порядку пакета;
+        перекази між шардами резервують кошти в тій самій черзі й завершуються другою фазою,
+        тож кошти, що надходять такими переказами, стають доступними лише після пакета.
+
+        Returns:
+            Список результатів у порядку операцій; виняток операції (наприклад, ValueError
+            для невірної суми поповнення) стоїть на її місці, якщо raise_errors=False
+        """
+        results = [None] * len(operations)
+        calls = {} # {shard: [(метод, аргументи), ...]}
+        slots = {} # {shard: [позиція результату або (позиція, роль) для переказу між шардами, ...]}
+        transfers = {} # {позиція: (txid, from, to, копійки, шард відправника, шард отримувача)}
+
+        def add_call(shard, slot, method, args):
+            calls.setdefault(shard, []).append((method, args))
+            slots.setdefault(shard, []).append(slot)
+
+        for position, (method, *args) in enumerate(operations):
+            if method not in OPERATIONS:
+                raise ValueError(f"Невідома операція: {method}")
+            if method != 'perform_transfer':
+                add_call(self.shard_for(args[0]), position, method, tuple(args))
+                continue
+            from_account_number, to_account_number, amount = args
+            kopiyky = self._transfer_kopiyky(from_account_number, to_account_number, amount)
+            if kopiyky is None:
+                results[position] = False
+                continue
+            source, target = self.shard_for(from_account_number), self.shard_for(to_account_number)
+            if source == target:
+                add_call(source, position, 'transfer', (from_account_number, to_account_number, kopiyky))
+                continue
+            txid = next(self._txids)
+            transfers[position] = (txid, from_account_number, to_account_number, kopiyky, source, target)
+            add_call(source, (position, 'debit'), 'prepare_debit', (txid, from_account_number, kopiyky))
+            add_call(target, (position, 'credit'), 'prepare_credit', (txid, to_account_number, kopiyky))
+
+        # Збій самого обміну (наприклад, BrokenPipeError, якщо процес шарду завершився)
+        # виходить одразу: стан каналів невідомий, тож другу фазу не надсилаємо. Резерви
+        # на інших шардах лишаються, як і після збою координатора між фазами
+        replies = self._round(calls) if calls else {}
+        votes = {}
+        error = None
+        for shard, outcomes in replies.items():
+            for slot, (success, value) in zip(slots[shard], outcomes):
+                if isinstance(slot, tuple):
+                    votes.setdefault(slot[0], []).append(success and value)
+                    continue
+                if not success and raise_errors and error is None:
+                    error = value # Виняток - лише після другої фази, щоб зняти резерви переказів
+                results[slot] = value
+        if transfers:
+            self._finish_transfers(transfers, votes, results)
+        if error is not None:
+            raise error
+        return results
+
+    def _finish_transfers(self, transfers, votes, results):
+        """Друга фаза переказів між шардами: commit, якщо обидва шарди погодились, інакше abort."""
+        second = {}
+        for position, (txid, from_account_number, to_account_number, _, source, target) in transfers.items():
+            position_votes = votes.get(position, [])
+            results[position] = len(position_votes) == 2 and all(position_votes)
+            if results[position]:
+                second.setdefault(source, []).append(('commit', (txid, f"Переказ на рахунок {to_account_number}")))
+                second.setdefault(target, []).append(('commit', (txid, f"Переказ з рахунку {from_account_number}")))
+            else:
+                second.setdefault(source, []).append(('abort', (txid,)))
+                second.setdefault(target, []).append(('abort', (txid,)))
+        self._round(second)
+        for position, (_, from_account_number, to_account_number, kopiyky, _, _) in transfers.items():
+            if not results[position]:
+                self.events.emit('transfer_failed', "Не вдалося здійснити переказ з {from_account} на {to_account}.",
+                                 from_account=from_account_number, to_account=to_account_number,
+                                 amount=BANK.from_kopiyky(kopiyky))
+            elif self.events.enabled:
+                self.events.emit('transfer', "Успішний переказ {amount:.2f} грн з {from_account} на {to_account}.",
+                                 from_account=from_account_number, to_account=to_account_number,
+                                 amount=BANK.from_kopiyky(kopiyky))
+
+    def _transfer_kopiyky(self, from_account_number, to_account_number, amount):
+        """Перевіряє переказ до звернення до шардів; сума в копійках або None."""
+        if from_account_number == to_account_number:
+            self.events.emit('same_account', "Неможливо переказати кошти на той самий рахунок.",
+                             account_number=from_account_number)
+            return None
+        try:
+            return BANK._positive_kopiyky(amount, "Сума переказу має бути додатним числом.")
+        except ValueError as e:
+            self.events.emit('invalid_amount', "{error}", error=str(e), amount=repr(amount))
+            return None
+
+    def close(self):
+        """Зупиняє процеси шардів."""
+        for shard, connection in enumerate(self._connections):
+            with self._locks[shard]:
+                try:
+                    connection.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+        for process, connection in zip(self._processes, self._connections):
+            process.join()
+            connection.close()
+        self._processes = []
+        self._connections = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
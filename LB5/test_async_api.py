@@ -0,0 +1,95 @@
+"""Тести асинхронного інтерфейсу до Bank і Clinic (async_api.py)."""
+
+import asyncio
+import threading
+
+import pytest
+
+from async_api import AsyncBank, AsyncClinic
+from BANK import Bank
+from benchmarks import load_clinic_module
+from events import NullSink, RingBufferSink
+
+klinic = load_clinic_module()
+
+
+class ThreadSink(RingBufferSink):
+    """Запам'ятовує ще й потік, у якому приймач отримав кожну подію."""
+
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+
+    def emit(self, kind, template, **fields):
+        self.threads.append(threading.get_ident())
+        super().emit(kind, template, **fields)
+
+
+def test_commands_run_in_order_and_keep_money():
+    bank = Bank("Тест", events=NullSink())
+
+    async def scenario():
+        async with AsyncBank(bank, max_batch=8) as api:
+            await asyncio.gather(*(api.add_account(str(number), 100) for number in range(10)))
+            results = await asyncio.gather(*(
+                api.perform_transfer(str(i % 10), str((i + 1) % 10), 60) for i in range(30)))
+            balances = await api.balances()
+            return results, balances, api.executed
+
+    results, balances, executed = asyncio.run(scenario())
+    assert executed == 40
+    assert sum(balances.values()) == 1000
+    # Перше коло переказів проходить: кожен відправник щойно отримав 60 грн (крім першого)
+    assert results[:10] == [True] * 10
+
+
+def test_command_errors_reach_the_caller():
+    bank = Bank("Тест", events=NullSink())
+
+    async def scenario():
+        async with AsyncBank(bank) as api:
+            await api.add_account('1')
+            with pytest.raises(ValueError):
+                await api.deposit('1', -5)
+            assert await api.deposit('2', 5) is False
+            assert await api.get_balance('1') == 0
+
+    asyncio.run(scenario())
+    with pytest.raises(RuntimeError):
+        asyncio.run(AsyncBank(bank).deposit('1', 5))
+
+
+def test_events_are_passed_outside_the_loop_thread():
+    sink = ThreadSink()
+    bank = Bank("Тест", events=sink)
+
+    async def scenario():
+        async with AsyncBank(bank) as api:
+            await api.add_account('1')
+            for _ in range(3):
+                await api.deposit('1', 10)
+            await api.withdraw('1', 100)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(scenario())
+    assert bank.events is sink
+    assert [event.kind for event in sink.events()][-1] == 'insufficient_funds'
+    assert len(sink) >= 5
+    assert loop_thread not in sink.threads
+
+
+def test_clinic_appointments_do_not_conflict():
+    clinic = klinic.Clinic("Тест", events=NullSink())
+
+    async def scenario():
+        async with AsyncClinic(clinic) as api:
+            await api.add_doctor(klinic.Doctor(101, "Ковальчук Олена", {}, "Терапевт"))
+            await asyncio.gather(*(api.add_patient(klinic.Patient(i, f"Пацієнт {i}", {}, None))
+                                   for i in range(1, 6)))
+            booked = await asyncio.gather(*(api.schedule_appointment(i, 101, "2030-01-10 10:00", "Огляд")
+                                            for i in range(1, 6)))
+            return booked, await api.get_doctor_appointments(101)
+
+    booked, appointments = asyncio.run(scenario())
+    assert sum(1 for result in booked if result) == 1
+    assert len(appointments) == 1
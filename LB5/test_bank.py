@@ -0,0 +1,91 @@
+"""Тести банку (BANK.py) та журналу транзакцій (journal.py)."""
+
+import datetime
+import decimal
+import os
+import threading
+
+import pytest
+
+from BANK import Bank, to_kopiyky
+from events import NullSink
+
+
+@pytest.fixture
+def bank():
+    return Bank("Тест", events=NullSink())
+
+
+@pytest.mark.parametrize('amount, kopiyky', [
+    (10, 1000), (0.1, 10), (0.125, 12), (0.135, 14), (decimal.Decimal('1.005'), 100),
+])
+def test_to_kopiyky(amount, kopiyky):
+    assert to_kopiyky(amount) == kopiyky
+
+
+@pytest.mark.parametrize('amount', ['10', float('nan'), float('inf'), True, None])
+def test_to_kopiyky_rejects_non_numbers(amount):
+    with pytest.raises(ValueError):
+        to_kopiyky(amount)
+
+
+def test_transfers_keep_exact_money(bank):
+    first = bank.add_account('1', 0.3)
+    second = bank.add_account('2')
+    for _ in range(3):
+        assert bank.perform_transfer('1', '2', 0.1)
+    assert not bank.perform_transfer('1', '2', 0.01)
+    assert (first.balance, second.balance) == (decimal.Decimal('0.00'), decimal.Decimal('0.30'))
+    assert [t.type for t in second.get_transaction_history()] == ['deposit'] * 3
+
+
+def test_atomic_batch_is_all_or_nothing(bank):
+    bank.add_account('1', 100)
+    bank.add_account('2', 0)
+    result = bank.apply_batch([('1', '2', 60), ('1', '2', 60)])
+    assert (result['applied'], result['rejected']) == (0, 2)
+    assert bank.find_account('1').balance == 100
+
+    result = bank.apply_batch([('1', '2', 60), ('2', '1', 20)], net=True)
+    assert (result['applied'], result['legs']) == (2, 1)
+    assert (bank.find_account('1').balance, bank.find_account('2').balance) == (60, 40)
+
+
+def test_concurrent_transfers_conserve_money():
+    bank = Bank("Тест", events=NullSink(), concurrent=True)
+    for number in range(4):
+        bank.add_account(str(number), 1000)
+
+    def worker(offset):
+        for i in range(200):
+            bank.perform_transfer(str((i + offset) % 4), str((i + offset + 1) % 4), 1)
+
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sum(account.balance for account in bank.accounts.values()) == 4000
+
+
+def test_history_pages_and_balance_at(bank):
+    account = bank.add_account('1')
+    for amount in range(1, 11):
+        account.deposit(amount)
+    assert account.count_transactions() == 10
+    page = account.get_transaction_history(offset=2, limit=3)
+    assert [t.amount for t in page] == [3, 4, 5]
+    assert account.get_balance_at(datetime.datetime.now()) == 55
+
+
+def test_delete_account_removes_spilled_segments(tmp_path):
+    bank = Bank("Тест", events=NullSink(), journal_options={
+        'segment_size': 8, 'checkpoint_interval': 4, 'spill_dir': str(tmp_path), 'max_memory_segments': 1})
+    account = bank.add_account('1')
+    for _ in range(100):
+        account.deposit(1)
+    assert os.listdir(tmp_path)
+    assert len(account.transaction_history) == 100
+    assert account.get_balance() == 100
+    assert bank.delete_account('1')
+    assert os.listdir(tmp_path) == []
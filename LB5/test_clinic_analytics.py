@@ -0,0 +1,68 @@
+"""Тести лічильників звітів клініки (clinic_analytics.py) для клініки в пам'яті та зі сховищем."""
+
+import datetime
+
+import pytest
+
+from benchmarks import load_clinic_module
+from clinic_analytics import ClinicAnalytics
+from events import NullSink
+
+klinic = load_clinic_module()
+
+TODAY = datetime.date(2025, 6, 30)
+DIAGNOSES = ['ГРВІ', 'грві', 'Грип', 'Алергія', 'Грип', 'ГРВІ']
+
+
+def fill(clinic):
+    clinic.add_doctor(klinic.Doctor(101, "Ковальчук Олена", {}, "Терапевт"))
+    clinic.add_doctor(klinic.Doctor(102, "Мельник Сергій", {}, "Хірург"))
+    for patient_id in range(1, 4):
+        clinic.add_patient(klinic.Patient(patient_id, f"Пацієнт {patient_id}", {}, None))
+    for number, diagnosis in enumerate(DIAGNOSES):
+        day = TODAY - datetime.timedelta(days=10 * number)
+        doctor_id = 101 if number % 2 == 0 else 102
+        clinic.schedule_appointment(number % 3 + 1, doctor_id, f"{day} 10:00", "Огляд")
+        clinic.add_medical_record_to_patient(number % 3 + 1, doctor_id, str(day), diagnosis, "Спостереження")
+
+
+def test_counters():
+    clinic = klinic.Clinic("Тест", events=NullSink())
+    fill(clinic)
+    analytics = clinic.analytics
+    assert analytics.top_diagnoses() == [('ГРВІ', 3), ('Грип', 2), ('Алергія', 1)]
+    assert analytics.top_diagnoses_window(k=2, days=21, today=TODAY) == [('ГРВІ', 2), ('Грип', 1)]
+    assert analytics.appointments_window(7, TODAY) == 1
+    assert analytics.doctor_load(102, TODAY - datetime.timedelta(days=10)) == 1
+    assert analytics.specialization_counts() == {'Терапевт': 3, 'Хірург': 3}
+    assert analytics.record_specialization_counts() == {'Терапевт': 3, 'Хірург': 3}
+
+
+def test_top_k_is_bounded():
+    analytics = ClinicAnalytics(top_k=2)
+    for diagnosis, count in (('a', 1), ('b', 2), ('c', 3), ('a', 5)):
+        analytics.add_records(TODAY, 'Терапевт', diagnosis, count)
+    assert analytics.top_diagnoses() == [('a', 6), ('c', 3)]
+    with pytest.raises(ValueError):
+        ClinicAnalytics(top_k=0)
+
+
+def test_store_counters_without_loading_histories(tmp_path):
+    path = str(tmp_path / 'clinic.db')
+    clinic = klinic.Clinic.open(path, "Тест", events=NullSink())
+    fill(clinic)
+    expected = clinic.analytics.summary(TODAY, k=3)
+    clinic.close()
+
+    clinic = klinic.Clinic.open(path, events=NullSink())
+    assert clinic.analytics.summary(TODAY, k=3) == expected
+    # Зведення не завантажує медичні історії
+    assert not clinic.medical_records
+    assert all(type(patient._medical_history) is not list for patient in clinic.patients.values())
+
+    # Нові записи та довантажені історії не рахуються двічі
+    clinic.add_medical_record_to_patient(1, 101, str(TODAY), 'Грип', 'Спостереження')
+    clinic.load_medical_records()
+    assert clinic.analytics.top_diagnoses(2) == [('ГРВІ', 3), ('Грип', 3)]
+    assert clinic.analytics.records == len(DIAGNOSES) + 1
+    clinic.close()
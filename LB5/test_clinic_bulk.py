@@ -0,0 +1,87 @@
+"""Тести масового завантаження та вивантаження клініки (bulk_load / export)."""
+
+import json
+
+import pytest
+
+from benchmarks import load_clinic_module
+from events import NullSink
+
+klinic = load_clinic_module()
+
+
+@pytest.fixture
+def clinic():
+    return klinic.Clinic("Тест", events=NullSink())
+
+
+def write_jsonl(path, rows):
+    with open(path, 'w', encoding='utf-8') as fd:
+        for row in rows:
+            fd.write(row if isinstance(row, str) else json.dumps(row, ensure_ascii=False))
+            fd.write('\n')
+    return str(path)
+
+
+PEOPLE = [
+    {'type': 'patient', 'id': 1, 'name': 'Іванов Іван', 'phone': '0981112233'},
+    {'type': 'doctor', 'id': 101, 'name': 'Ковальчук Олена', 'specialization': 'Терапевт'},
+]
+
+
+def appointment(date_time, appointment_id=None):
+    row = {'type': 'appointment', 'patient_id': 1, 'doctor_id': 101, 'date_time': date_time}
+    if appointment_id is not None:
+        row['id'] = appointment_id
+    return row
+
+
+def test_explicit_ids_are_reserved_before_auto_numbering(clinic, tmp_path):
+    # Раніший за часом прийом без ID не повинен отримати ID 1, який явно заданий пізнішому
+    path = write_jsonl(tmp_path / 'data.jsonl', PEOPLE + [
+        appointment('2025-06-10 09:00'),
+        appointment('2025-06-10 10:00', 1),
+        appointment('2025-06-10 11:00'),
+    ])
+    stats = clinic.bulk_load(path)
+    assert stats['appointment'] == 3 and stats['rejected'] == 0
+    assert sorted(clinic.appointments) == [1, 2, 3]
+    assert clinic.appointments[1].date_time.hour == 10
+    assert len({a.appointment_id for a in clinic.appointments.values()}) == 3
+
+
+def test_explicit_id_of_existing_appointment_is_rejected(clinic, tmp_path):
+    clinic.bulk_load(write_jsonl(tmp_path / 'first.jsonl', PEOPLE + [appointment('2025-06-10 09:00')]))
+    stats = clinic.bulk_load(write_jsonl(tmp_path / 'second.jsonl', [appointment('2025-06-11 09:00', 1)]))
+    assert stats['appointment'] == 0 and stats['rejected'] == 1
+    assert len(clinic.appointments) == 1
+
+
+def test_bad_jsonl_lines_are_rejected_with_line_numbers(clinic, tmp_path):
+    path = write_jsonl(tmp_path / 'data.jsonl', PEOPLE[:1] + [
+        '{"type": "patient", "id": 2',
+        '',
+        '[1, 2]',
+        {'type': 'patient', 'id': 3, 'name': 'Петрова Анна'},
+        {'type': 'nurse', 'id': 4},
+    ])
+    stats = clinic.bulk_load(path)
+    assert stats['patient'] == 2 and stats['rows'] == 5 and stats['rejected'] == 3
+    assert [error.split(':')[0] for error in stats['errors']] == ['рядок 2', 'рядок 4', 'рядок 6']
+    assert sorted(clinic.patients) == [1, 3]
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'jsonl'])
+def test_export_round_trip(clinic, tmp_path, fmt):
+    clinic.bulk_load(write_jsonl(tmp_path / 'data.jsonl', PEOPLE + [
+        appointment('2025-06-10 09:00'),
+        {'type': 'record', 'patient_id': 1, 'doctor_id': 101, 'date': '2025-06-10',
+         'diagnosis': 'ГРВІ', 'treatment': 'Відпочинок'},
+    ]))
+    path = str(tmp_path / f'export.{fmt}')
+    assert clinic.export(path)['rows'] == 4
+
+    copy = klinic.Clinic("Копія", events=NullSink())
+    stats = copy.bulk_load(path)
+    assert stats['rejected'] == 0
+    assert list(copy._export_rows()) == list(clinic._export_rows())
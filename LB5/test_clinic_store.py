@@ -0,0 +1,67 @@
+"""Тести сховища клініки (clinic_store.py) та Clinic.open."""
+
+import datetime
+
+import pytest
+
+from benchmarks import load_clinic_module
+from clinic_store import ClinicStore
+from events import NullSink
+
+klinic = load_clinic_module()
+
+PATIENT = ('1', 'Іваненко Іван', '+380501234567', None, None, '1990-05-01')
+
+
+def test_batch_is_all_or_nothing(tmp_path):
+    with ClinicStore(str(tmp_path / 'clinic.db'), batch_size=2) as store:
+        with pytest.raises(RuntimeError):
+            with store.batch():
+                store.add('patients', PATIENT)
+                store.add('patients', ('2', 'Петренко Олена', None, None, None, None))
+                store.add('patients', ('3', 'Коваль Петро', None, None, None, None))
+                raise RuntimeError("збій посеред пакета")
+        assert store.count('patients') == 0
+
+        store.add('patients', PATIENT)
+        store.add('patients', PATIENT) # INSERT OR REPLACE за id
+        assert list(store.rows('patients')) == [PATIENT]
+        with pytest.raises(ValueError):
+            store.rows('patients; DROP TABLE patients')
+
+
+def test_snapshot_copy(tmp_path):
+    with ClinicStore(str(tmp_path / 'clinic.db')) as store:
+        store.add('patients', PATIENT)
+        copy = store.snapshot(str(tmp_path / 'copy.db'))
+    with ClinicStore(copy) as store:
+        assert list(store.rows('patients')) == [PATIENT]
+
+
+def test_reopen_restores_clinic(tmp_path):
+    path = str(tmp_path / 'clinic.db')
+    clinic = klinic.Clinic.open(path, "Тест", events=NullSink())
+    clinic.add_patient(klinic.Patient(1, "Іваненко Іван", {'phone': '+380501234567', 'email': 'i@x.ua'},
+                                      datetime.date(1990, 5, 1)))
+    clinic.add_doctor(klinic.Doctor(101, "Ковальчук Олена", {}, "Терапевт"))
+    assert clinic.schedule_appointment(1, 101, "2030-01-10 10:00", "Огляд")
+    clinic.add_medical_record_to_patient(1, 101, "2025-06-01", "ГРВІ", "Постільний режим")
+    clinic.close()
+
+    clinic = klinic.Clinic.open(path, events=NullSink())
+    assert clinic.name == "Тест"
+    patient = clinic.get_patient(1)
+    assert (patient.name, patient.contact_info['email'], patient.birth_date) == (
+        "Іваненко Іван", 'i@x.ua', datetime.date(1990, 5, 1))
+    [appointment] = clinic.get_doctor_appointments(101)
+    assert (appointment.patient_id, appointment.date_time) == (1, datetime.datetime(2030, 1, 10, 10))
+
+    # Медична історія завантажується зі сховища лише при зверненні
+    assert not clinic.medical_records
+    assert [record.diagnosis for record in clinic.get_patient_medical_history(1)] == ["ГРВІ"]
+
+    # Лічильники ID продовжуються, а конфлікти розкладу перевіряються з відновленими прийомами
+    assert not clinic.schedule_appointment(1, 101, "2030-01-10 10:15", "Повторний огляд")
+    new = clinic.schedule_appointment(1, 101, "2030-01-10 11:00", "Повторний огляд")
+    assert new.appointment_id > appointment.appointment_id
+    clinic.close()
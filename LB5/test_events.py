@@ -0,0 +1,60 @@
+"""Тести приймачів подій (events.py) та їх використання у Bank і Clinic."""
+
+import io
+
+import pytest
+
+from BANK import Bank
+from benchmarks import load_clinic_module
+from events import JsonlSink, NullSink, PrintSink, RingBufferSink, read_jsonl_events
+
+klinic = load_clinic_module()
+
+
+def test_print_sink_keeps_messages():
+    stream = io.StringIO()
+    bank = Bank("Тест", events=PrintSink(stream))
+    bank.add_account('1', 10)
+    bank.find_account('1').withdraw(20)
+    lines = stream.getvalue().splitlines()
+    assert lines == ["Рахунок 1 успішно додано з початковим балансом 10.00 грн.",
+                     "Недостатньо коштів на рахунку 1 для списання 20.00 грн. Поточний баланс: 10.00 грн."]
+
+
+def test_ring_buffer_keeps_last_events():
+    sink = RingBufferSink(capacity=2)
+    clinic = klinic.Clinic("Тест", events=sink)
+    clinic.add_doctor(klinic.Doctor(101, "Ковальчук Олена", {}, "Терапевт"))
+    clinic.add_doctor(klinic.Doctor(101, "Ковальчук Олена", {}, "Терапевт"))
+    clinic.schedule_appointment(1, 101, "2030-01-10 10:00", "Огляд")
+    assert [event.kind for event in sink] == ['doctor_exists', 'patient_not_found']
+    [event] = sink.events('doctor_exists')
+    assert event.message == "Лікар з ID 101 вже існує."
+    assert event.to_dict()['doctor_id'] == 101
+    with pytest.raises(ValueError):
+        RingBufferSink(capacity=0)
+
+
+def test_jsonl_sink_writes_batches(tmp_path):
+    path = str(tmp_path / 'events.jsonl')
+    with JsonlSink(path, batch_size=2) as sink:
+        bank = Bank("Тест", events=sink)
+        account = bank.add_account('1')
+        account.deposit(5)
+        # Перший пакет із двох подій уже у файлі, третя подія - у буфері
+        account.deposit(7)
+        assert [event['kind'] for event in read_jsonl_events(path)] == ['account_added', 'deposit']
+    events = read_jsonl_events(path)
+    assert [event['kind'] for event in events] == ['account_added', 'deposit', 'deposit']
+    assert events[-1]['account_number'] == '1'
+
+
+def test_null_sink_is_disabled():
+    bank = Bank("Тест", events=NullSink())
+    bank.add_account('1')
+    assert not bank.events.enabled
+    # Заміна приймача банку поширюється на всі рахунки
+    sink = RingBufferSink()
+    bank.events = sink
+    bank.find_account('1').deposit(1)
+    assert [event.kind for event in sink] == ['deposit']
@@ -0,0 +1,62 @@
+"""Тести повнотекстового індексу медичних записів (record_index.py)."""
+
+import datetime
+from collections import namedtuple
+
+import pytest
+
+from record_index import RecordIndex, normalize_word, parse_query, terms
+
+Record = namedtuple('Record', 'record_id patient_id doctor_id date diagnosis treatment')
+
+
+@pytest.fixture
+def index():
+    records = {}
+    index = RecordIndex(records)
+    rows = [
+        (1, 1, 101, '2025-06-01', 'ГРВІ', 'Постільний режим, антибіотики'),
+        (2, 2, 101, '2025-06-02', 'Грип', 'Антибіотик не призначено'),
+        (3, 1, 102, '2025-06-03', 'Перелом, не зламано ребро', 'Спокій'),
+        (4, 3, 102, '2025-06-04', 'Алергія', 'Антигістамінні'),
+        (5, 3, 101, '2025-06-05', None, 'Огляд'),
+    ]
+    for record_id, patient_id, doctor_id, date, diagnosis, treatment in rows:
+        record = Record(record_id, patient_id, doctor_id, datetime.date.fromisoformat(date), diagnosis, treatment)
+        records[record_id] = record
+        index.add(record)
+    return index
+
+
+def ids(results):
+    return [record.record_id for record in results]
+
+
+def test_terms_normalize_endings_and_skip_stop_words():
+    assert terms('Антибіотики та грипу') == ('антибіотик', 'грип')
+    assert terms(None) == ()
+    assert terms('') == ()
+
+
+def test_not_is_explicit():
+    # "не" - стоп-слово, а не заперечення
+    fracture, allergy, broken = map(normalize_word, ('перелом', 'алергія', 'зламано'))
+    assert parse_query('не зламано') == ([[(broken, False)]], [])
+    assert parse_query('перелом NOT алергія') == ([[(fracture, False)]], [(allergy, False)])
+    assert parse_query('перелом -алергія') == ([[(fracture, False)]], [(allergy, False)])
+
+
+def test_search(index):
+    assert ids(index.search('грві АБО грип')) == [2, 1]
+    assert ids(index.search('антибіотик')) == [2, 1]
+    assert ids(index.search('антибіот* -грип')) == [1]
+    assert ids(index.search('не зламано')) == [3]
+    assert ids(index.search('огляд')) == [5]
+
+
+def test_search_filters(index):
+    assert ids(index.search('антибіот* OR антигіст*', doctor_id=102)) == [4]
+    assert ids(index.search('антибіот*', start=datetime.date(2025, 6, 2))) == [2]
+    assert ids(index.search('грип', field='treatment')) == []
+    page = index.search('антибіот* OR спокій OR алергія').page(1, 2)
+    assert len(page) == 2
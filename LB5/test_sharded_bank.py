@@ -0,0 +1,86 @@
+"""Тести банку з рахунками в процесах-шардах (sharded_bank.py)."""
+
+import decimal
+
+import pytest
+
+from events import NullSink
+from sharded_bank import ShardedBank, shard_of
+
+SHARDS = 2
+
+
+def accounts_on(shard, count):
+    """Перші count номерів рахунків, що належать шарду."""
+    numbers = (str(number) for number in range(1000, 100000))
+    return [number for number in numbers if shard_of(number, SHARDS) == shard][:count]
+
+
+@pytest.fixture
+def bank():
+    bank = ShardedBank("Тест", shards=SHARDS, events=NullSink())
+    yield bank
+    bank.close()
+
+
+def test_cross_shard_transfers(bank):
+    (first,), (second,) = accounts_on(0, 1), accounts_on(1, 1)
+    assert bank.add_account(first, 100) and bank.add_account(second, 0)
+
+    assert bank.perform_transfer(first, second, 60)
+    # Друге списання бачить баланс після першого переказу; нестача коштів - abort
+    assert not bank.perform_transfer(first, second, 60)
+    assert bank.balances() == {first: decimal.Decimal('40.00'), second: decimal.Decimal('60.00')}
+
+    # Резерви знято: кошти доступні для наступних операцій, рахунок можна видалити
+    assert bank.withdraw(first, 40)
+    assert bank.delete_account(first)
+    assert bank.get_balance(first) is None
+    history = bank.get_transaction_history(second)
+    assert [(t.type, t.amount) for t in history] == [('deposit', 60)]
+
+
+def test_run_many_reserves_within_batch(bank):
+    first, other = accounts_on(0, 2)
+    (second,) = accounts_on(1, 1)
+    for number in (first, other, second):
+        bank.add_account(number, 50)
+    results = bank.run_many([
+        ('perform_transfer', first, second, 30),
+        ('perform_transfer', first, second, 30),  # резерв першого переказу вже врахований
+        ('perform_transfer', first, other, 20),
+        ('deposit', second, -1),
+        ('get_balance', first),
+    ])
+    assert results[:3] == [True, False, True]
+    assert isinstance(results[3], ValueError)
+    # Баланс у пакеті - до другої фази: резерв переказу між шардами ще не списано
+    assert results[4] == 30
+    assert bank.get_balance(first) == 0
+    assert sum(bank.balances().values()) == 150
+
+    with pytest.raises(ValueError):
+        bank.run_many([('perform_transfer', other, second, 5), ('deposit', second, -1)], raise_errors=True)
+    # Переказ пакета завершено другою фазою ще до винятку
+    assert bank.get_balance(second) == 85
+
+
+def test_transaction_ids_are_unique_across_shards(bank):
+    numbers = accounts_on(0, 3) + accounts_on(1, 3)
+    for number in numbers:
+        bank.add_account(number, 10)
+    bank.run_many([('perform_transfer', numbers[i], numbers[-1 - i], 1) for i in range(3)])
+    ids = [t.transaction_id for number in numbers for t in bank.get_transaction_history(number)]
+    assert len(ids) == len(set(ids)) == 6
+
+
+def test_broken_shard_raises_the_original_error(bank):
+    (first,), (second,) = accounts_on(0, 1), accounts_on(1, 1)
+    bank.add_account(first, 100)
+    bank.add_account(second, 0)
+    bank._processes[1].kill()
+    bank._processes[1].join()
+    with pytest.raises((OSError, EOFError)) as excinfo:
+        bank.perform_transfer(first, second, 10)
+    # Друга фаза не надсилалась, тож виняток не підмінено новим
+    assert excinfo.value.__context__ is None